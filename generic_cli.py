@@ -1,8 +1,10 @@
 import os
+import sys
 import argparse
 import json
+import requests
 from dotenv import load_dotenv
-from servicenow_mcp.tools.generic_tools import get_table_record, query_table, GetTableRecordParams, QueryTableParams
+from servicenow_mcp.tools.generic_tools import aggregate_table, get_table_record, iter_table_records, query_table, AggregateTableParams, GetTableRecordParams, QueryTableParams
 from servicenow_mcp.utils.config import ServerConfig, AuthConfig, BasicAuthConfig, AuthType
 from servicenow_mcp.auth.auth_manager import AuthManager
 
@@ -19,6 +21,22 @@ def main():
     query_parser = subparsers.add_parser("query-table", help="Query a table.")
     query_parser.add_argument("--table-name", required=True, help="The name of the table.")
     query_parser.add_argument("--query", required=True, help="The query to filter the records.")
+    query_parser.add_argument("--fields", help="Comma-separated list of fields to return.")
+    query_parser.add_argument("--page-size", type=int, default=100, help="Records fetched per request.")
+    query_parser.add_argument("--max-rows", type=int, help="Stop after this many records.")
+    query_parser.add_argument("--max-bytes", type=int, help="Stop after receiving this many bytes.")
+    query_parser.add_argument("--keyset", action="store_true", help="Page by sys_id instead of offset.")
+    query_parser.add_argument("--ndjson", action="store_true", help="Stream records as newline-delimited JSON.")
+
+    # Sub-parser for the 'aggregate' command
+    aggregate_parser = subparsers.add_parser("aggregate", help="Count and aggregate the records of a table.")
+    aggregate_parser.add_argument("--table-name", required=True, help="The name of the table.")
+    aggregate_parser.add_argument("--query", help="The query selecting the records to aggregate.")
+    aggregate_parser.add_argument("--group-by", help="Comma-separated list of fields to group by.")
+    aggregate_parser.add_argument("--no-count", action="store_true", help="Do not count the records.")
+    for aggregate in ("avg", "sum", "min", "max"):
+        aggregate_parser.add_argument(f"--{aggregate}", help=f"Comma-separated list of fields to {aggregate}.")
+    aggregate_parser.add_argument("--having", help="Filter on the aggregates, e.g. 'count^*^>^10'.")
 
     args = parser.parse_args()
 
@@ -53,8 +71,37 @@ def main():
         params = QueryTableParams(
             table_name=args.table_name,
             query=args.query,
+            fields=args.fields.split(",") if args.fields else None,
+            page_size=args.page_size,
+            max_rows=args.max_rows,
+            max_bytes=args.max_bytes,
+            pagination="keyset" if args.keyset else "offset",
+        )
+        if args.ndjson:
+            try:
+                for record in iter_table_records(config, auth_manager, params):
+                    sys.stdout.write(json.dumps(record) + "\n")
+                    sys.stdout.flush()
+            except requests.RequestException as e:
+                print(json.dumps({"success": False, "message": f"Failed to query table: {str(e)}"}), file=sys.stderr)
+                sys.exit(1)
+        else:
+            result = query_table(config, auth_manager, params)
+            print(json.dumps(result, indent=2))
+    elif args.command == "aggregate":
+        split = lambda value: value.split(",") if value else None
+        params = AggregateTableParams(
+            table_name=args.table_name,
+            query=args.query,
+            count=not args.no_count,
+            group_by=split(args.group_by),
+            avg_fields=split(args.avg),
+            sum_fields=split(args.sum),
+            min_fields=split(args.min),
+            max_fields=split(args.max),
+            having=args.having,
         )
-        result = query_table(config, auth_manager, params)
+        result = aggregate_table(config, auth_manager, params)
         print(json.dumps(result, indent=2))
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+import os
+import argparse
+import json
+from dotenv import load_dotenv
+from servicenow_mcp.utils.config import ServerConfig, AuthConfig, BasicAuthConfig, AuthType, MirrorConfig
+from servicenow_mcp.utils.mirror import TableMirror
+from servicenow_mcp.auth.auth_manager import AuthManager
+
+def main():
+    parser = argparse.ArgumentParser(description="ServiceNow Table Mirror CLI")
+    parser.add_argument("--path", help="Path of the SQLite mirror file.")
+    parser.add_argument("--tables", help="Comma-separated list of tables (default: the configured tables).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("sync", help="Fetch the records changed since the last sync.")
+    subparsers.add_parser("reconcile", help="Drop mirrored records deleted on the instance.")
+    subparsers.add_parser("status", help="Show the age of each mirrored table.")
+    subparsers.add_parser("reset", help="Drop the mirrored records so the next sync starts over.")
+
+    args = parser.parse_args()
+
+    load_dotenv()
+
+    instance_url = os.getenv("SERVICENOW_INSTANCE_URL")
+    username = os.getenv("SERVICENOW_USERNAME")
+    password = os.getenv("SERVICENOW_PASSWORD")
+
+    if not all([instance_url, username, password]):
+        print(json.dumps({"success": False, "message": "SERVICENOW_INSTANCE_URL, SERVICENOW_USERNAME and SERVICENOW_PASSWORD must be set."}))
+        return
+
+    mirror_settings = {"enabled": True}
+    path = args.path or os.getenv("SERVICENOW_MIRROR_PATH")
+    if path:
+        mirror_settings["sqlite_path"] = path
+    tables = args.tables or os.getenv("SERVICENOW_MIRROR_TABLES")
+    if tables:
+        mirror_settings["tables"] = tables.split(",")
+
+    config = ServerConfig(
+        instance_url=instance_url,
+        auth=AuthConfig(type=AuthType.BASIC, basic=BasicAuthConfig(username=username, password=password)),
+        mirror=MirrorConfig(**mirror_settings),
+    )
+    auth_manager = AuthManager(config.auth, config.instance_url)
+    mirror = TableMirror.from_config(config)
+
+    if args.command == "sync":
+        result = {"success": True, "fetched": mirror.sync_all(config, auth_manager)}
+    elif args.command == "reconcile":
+        result = {
+            "success": True,
+            "deleted": {table: mirror.reconcile_table(config, auth_manager, table) for table in config.mirror.tables},
+        }
+    elif args.command == "status":
+        result = {
+            "success": True,
+            "age_seconds": {table: mirror.age(table) for table in config.mirror.tables},
+        }
+    else:
+        for table in config.mirror.tables:
+            mirror.reset(table)
+        result = {"success": True, "reset": config.mirror.tables}
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Catalog Optimization Benchmark
+
+This script runs the low usage, high abandonment and slow fulfillment analyses
+of get_optimization_recommendations against a local stub of the Table and
+Aggregate APIs serving a synthetic catalog, and prints the time and number of
+requests of a cold run (metrics fetched) and a warm run (metrics cached).
+
+Usage:
+    python scripts/benchmark_catalog_optimization.py [--items 10000] [--seed 1]
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add the project source to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from servicenow_mcp.auth.auth_manager import AuthManager  # noqa: E402
+from servicenow_mcp.tools.catalog_optimization import (  # noqa: E402
+    OptimizationRecommendationsParams,
+    get_optimization_recommendations,
+)
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig  # noqa: E402
+from servicenow_mcp.utils.http_client import ServiceNowHttpClient  # noqa: E402
+
+
+def synthetic_catalog(items: int, seed: int) -> dict:
+    """Build catalog items and their per-item statistics."""
+    rng = random.Random(seed)
+    catalog, orders, closed, carts = [], [], [], []
+    for i in range(items):
+        sys_id = f"{i:032x}"
+        catalog.append({
+            "sys_id": sys_id,
+            "name": f"Catalog item {i}",
+            "short_description": f"Synthetic catalog item number {i}",
+            "category": f"{i % 25:032x}",
+        })
+        order_count = int(rng.paretovariate(1.2)) - 1
+        if order_count:
+            orders.append((sys_id, order_count, None))
+            days = rng.lognormvariate(0.8, 0.7)
+            offset = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(days * 86400))
+            closed.append((sys_id, max(1, order_count * 4 // 5), offset))
+        abandoned = rng.randint(0, 12) if rng.random() < 0.3 else 0
+        if abandoned:
+            carts.append((sys_id, abandoned, None))
+    return {"catalog": catalog, "orders": orders, "closed": closed, "carts": carts}
+
+
+def stats_body(groups: list) -> bytes:
+    """Encode per-item statistics as an Aggregate API response grouped by cat_item."""
+    return json.dumps({
+        "result": [
+            {
+                "groupby_fields": [{"field": "cat_item", "value": sys_id}],
+                "stats": {"count": str(count), "avg": {"calendar_duration": avg}},
+            }
+            for sys_id, count, avg in groups
+        ]
+    }).encode()
+
+
+def make_handler(data: dict, counter: list):
+    """Build a handler serving the catalog by keyset pages and the precomputed statistics."""
+    catalog = data["catalog"]
+    bodies = {
+        "orders": stats_body(data["orders"]),
+        "closed": stats_body(data["closed"]),
+        "carts": stats_body(data["carts"]),
+    }
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            counter[0] += 1
+            url = urlparse(self.path)
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            query = params.get("sysparm_query", "")
+
+            if url.path.endswith("/table/sc_cat_item"):
+                after = ""
+                for condition in query.split("^"):
+                    if condition.startswith("sys_id>"):
+                        after = condition[len("sys_id>"):]
+                limit = int(params.get("sysparm_limit", 100))
+                page = [item for item in catalog if item["sys_id"] > after][:limit]
+                body = json.dumps({"result": page}).encode()
+            elif url.path.endswith("/stats/sc_cart_item"):
+                body = bodies["carts"]
+            elif "closed_atISNOTEMPTY" in query:
+                body = bodies["closed"]
+            else:
+                body = bodies["orders"]
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the catalog optimization analyses")
+    parser.add_argument("--items", type=int, default=10000, help="Number of catalog items")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic catalog")
+    args = parser.parse_args()
+
+    counter = [0]
+    data = synthetic_catalog(args.items, args.seed)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(data, counter))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    config = ServerConfig(
+        instance_url=f"http://127.0.0.1:{server.server_address[1]}",
+        auth=AuthConfig(
+            type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+        ),
+    )
+    auth_manager = AuthManager(
+        config.auth, config.instance_url, http_client=ServiceNowHttpClient(config.http)
+    )
+    params = OptimizationRecommendationsParams(
+        recommendation_types=["low_usage", "high_abandonment", "slow_fulfillment"]
+    )
+
+    print(f"Synthetic catalog of {args.items} items")
+    for label in ("cold (metrics fetched)", "warm (metrics cached)"):
+        counter[0] = 0
+        start = time.perf_counter()
+        result = get_optimization_recommendations(config, auth_manager, params)
+        elapsed = (time.perf_counter() - start) * 1000
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+        found = ", ".join(f"{rec['type']}={len(rec['items'])}" for rec in result["recommendations"])
+        print(f"  {label:<24} {elapsed:>9.1f}ms {counter[0]:>4} requests  {found}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
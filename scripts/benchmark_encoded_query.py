@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Encoded Query Benchmark
+
+This script fills a table mirror with synthetic incidents and times a few
+encoded queries three ways: the compiled Python predicate over records held in
+memory, the compiled SQL over the mirror's SQLite table (TableMirror.query),
+and the same with a page limit. It checks that all give the same records.
+
+Usage:
+    python scripts/benchmark_encoded_query.py [--rows 1000000] [--seed 1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the project source to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from servicenow_mcp.utils.config import MirrorConfig  # noqa: E402
+from servicenow_mcp.utils.encoded_query import parse  # noqa: E402
+from servicenow_mcp.utils.mirror import TableMirror  # noqa: E402
+
+# TableMirror.query resolves relative dates against the current time
+NOW = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+STATES = [("1", "New"), ("2", "In Progress"), ("3", "On Hold"), ("6", "Resolved"), ("7", "Closed")]
+WORDS = ["email", "server", "VPN", "laptop", "printer", "down", "slow", "password", "access"]
+QUERIES = [
+    "active=true^priority<=2",
+    "short_descriptionLIKEvpn^ORshort_descriptionLIKEemail^stateIN1,2",
+    "opened_at>=javascript:gs.daysAgoStart(7)^ORDERBYDESCopened_at",
+    "assigned_toISEMPTY^NQpriority=1^state!=7",
+]
+
+
+def value(raw: str, display: str = None) -> dict:
+    return {"value": raw, "display_value": raw if display is None else display}
+
+
+# Values drawn from small pools are shared between records to keep a million in memory
+STATE_VALUES = [value(*state) for state in STATES]
+ACTIVE_VALUES = {active: value(active) for active in ("true", "false")}
+ASSIGNEE_VALUES = [value("", ""), value("u1", "Beth Anglin"), value("u2", "David Loo")]
+PRIORITY_VALUES = [value(str(priority)) for priority in range(1, 6)]
+
+
+def synthetic_incident(rng: random.Random, i: int) -> dict:
+    """An incident as returned with sysparm_display_value=all."""
+    state = rng.choice(STATE_VALUES)
+    opened = value(
+        (NOW - timedelta(minutes=rng.randint(0, 60 * 24 * 90))).strftime("%Y-%m-%d %H:%M:%S")
+    )
+    return {
+        "sys_id": value(f"{i:032x}"),
+        "number": value(f"INC{i:07d}"),
+        "short_description": value(" ".join(rng.choice(WORDS) for _ in range(3))),
+        "priority": rng.choice(PRIORITY_VALUES),
+        "state": state,
+        "active": ACTIVE_VALUES["false" if state["value"] in ("6", "7") else "true"],
+        "assigned_to": rng.choice(ASSIGNEE_VALUES),
+        "opened_at": opened,
+        "sys_updated_on": opened,
+    }
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark encoded query evaluation")
+    parser.add_argument("--rows", type=int, default=1000000, help="Number of mirrored records")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the synthetic records")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = [synthetic_incident(rng, i) for i in range(args.rows)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        mirror = TableMirror(MirrorConfig(sqlite_path=os.path.join(directory, "mirror.sqlite")))
+        _, elapsed = timed(lambda: mirror._store("incident", records))
+        print(f"{args.rows} synthetic incidents, stored in {elapsed / 1000:.1f}s")
+
+        for text in QUERIES:
+            query = parse(text, now=NOW)
+            predicate = query.predicate()
+            in_memory, python_ms = timed(
+                lambda: query.sort([record for record in records if predicate(record)])
+            )
+            mirrored, sql_ms = timed(lambda: mirror.query("incident", text))
+            page, page_ms = timed(lambda: mirror.query("incident", text, limit=20))
+            # Mirrored records tie-break on sys_id, which is the insertion order here
+            if [r["sys_id"] for r in mirrored] != [r["sys_id"] for r in in_memory]:
+                raise RuntimeError(f"SQL and predicate results differ for {text!r}")
+            if page != mirrored[:20]:
+                raise RuntimeError(f"Paged results differ for {text!r}")
+
+            print(f"  {text}")
+            print(
+                f"    {len(in_memory):>8} rows  predicate {python_ms:>8.1f}ms"
+                f"  SQL {sql_ms:>8.1f}ms  SQL limit 20 {page_ms:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+HTTP Connection Pool Benchmark
+
+This script measures the latency of sequential get_incident_by_number calls
+against a local stub of the ServiceNow Table API, once with the module-level
+requests API (a new connection per call) and once with the pooled
+ServiceNowHttpClient used by the MCP server, and prints p50/p99 for both.
+
+Usage:
+    python scripts/benchmark_http_pool.py [--calls 1000] [--handshake-delay 0.0]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add the project source to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from servicenow_mcp.auth.auth_manager import AuthManager  # noqa: E402
+from servicenow_mcp.tools.incident_tools import (  # noqa: E402
+    GetIncidentByNumberParams,
+    get_incident_by_number,
+)
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig  # noqa: E402
+from servicenow_mcp.utils.http_client import ServiceNowHttpClient  # noqa: E402
+
+INCIDENT = {
+    "sys_id": "9d385017c611228701d22104cc95c371",
+    "number": "INC0010001",
+    "short_description": "Benchmark incident",
+    "description": "Stub incident served by the benchmark",
+    "state": "New",
+    "priority": "3 - Moderate",
+    "assigned_to": "Beth Anglin",
+    "category": "Software",
+    "subcategory": "Email",
+    "sys_created_on": "2025-01-01 00:00:00",
+    "sys_updated_on": "2025-01-01 00:00:00",
+}
+
+
+def make_handler(handshake_delay: float):
+    """Build a keep-alive request handler that simulates connection setup cost."""
+    body = json.dumps({"result": [INCIDENT]}).encode()
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; avoid delayed-ACK stalls on reuse.
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            # Runs once per TCP connection, so it models the TCP+TLS handshake.
+            if handshake_delay:
+                time.sleep(handshake_delay)
+            super().setup()
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+def run(config: ServerConfig, auth_manager: AuthManager, calls: int) -> list:
+    """Run sequential get_incident_by_number calls and return latencies in ms."""
+    params = GetIncidentByNumberParams(incident_number="INC0010001")
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = get_incident_by_number(config, auth_manager, params)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+    return latencies
+
+
+def percentile(values: list, pct: float) -> float:
+    """Return the given percentile of a list of values."""
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs unpooled HTTP calls")
+    parser.add_argument("--calls", type=int, default=1000, help="Number of sequential calls")
+    parser.add_argument(
+        "--handshake-delay",
+        type=float,
+        default=0.0,
+        help="Seconds of simulated TLS handshake cost per new connection",
+    )
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.handshake_delay))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    instance_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    config = ServerConfig(
+        instance_url=instance_url,
+        auth=AuthConfig(
+            type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+        ),
+    )
+
+    unpooled = AuthManager(config.auth, config.instance_url)
+    pooled = AuthManager(
+        config.auth, config.instance_url, http_client=ServiceNowHttpClient(config.http)
+    )
+
+    print(f"{args.calls} sequential get_incident_by_number calls against {instance_url}")
+    for label, auth_manager in (("before (unpooled)", unpooled), ("after (pooled)", pooled)):
+        latencies = run(config, auth_manager, args.calls)
+        print(
+            f"  {label:<18} p50={percentile(latencies, 50):.3f}ms "
+            f"p99={percentile(latencies, 99):.3f}ms"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
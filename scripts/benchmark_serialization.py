@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Tool Result Serialization Benchmark
+
+This script fetches list_incidents results of increasing size from a mock
+ServiceNow instance (servicenow_mcp.testing) and serializes each of them with
+every serialization mode of the server: indented and compact, with the json
+and orjson backends (the latter only if orjson is installed). It also times
+the re-serialization of a result the tool has already returned as a string.
+For every mode it reports the median time per result and the size of the text
+returned to the client.
+
+Usage:
+    python scripts/benchmark_serialization.py [--limits 10,100,1000] [--repeat 50]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+# Add the project source to the Python path
+sys.path.insert(0, str(ROOT / "src"))
+
+from servicenow_mcp.auth.auth_manager import AuthManager  # noqa: E402
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread  # noqa: E402
+from servicenow_mcp.tools.incident_tools import ListIncidentsParams, list_incidents  # noqa: E402
+from servicenow_mcp.utils.config import (  # noqa: E402
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    SerializationConfig,
+    ServerConfig,
+)
+from servicenow_mcp.utils.serialization import ToolOutputSerializer  # noqa: E402
+
+
+def serializers() -> List[Tuple[str, ToolOutputSerializer]]:
+    """Every available serialization mode, by name."""
+    modes = []
+    for backend in ("json", "orjson"):
+        for compact in (False, True):
+            try:
+                serializer = ToolOutputSerializer(
+                    SerializationConfig(compact=compact, backend=backend)
+                )
+            except ImportError:
+                print(f"Skipping the {backend} backend: orjson is not installed")
+                break
+            modes.append((f"{'compact' if compact else 'indented'} ({backend})", serializer))
+    return modes
+
+
+def median_ms(func: Callable[[], Any], repeat: int) -> float:
+    """Median wall time of a function, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the serialization of tool results")
+    parser.add_argument(
+        "--limits",
+        default="10,100,1000",
+        help="Comma-separated numbers of incidents per result (default: 10,100,1000)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=50, help="Serializations per mode and result (default: 50)"
+    )
+    args = parser.parse_args()
+    limits = [int(limit) for limit in args.limits.split(",")]
+
+    instance = MockInstance(MockInstanceConfig(incidents=max(limits)))
+    modes = serializers()
+    with serve_in_thread(instance) as url:
+        config = ServerConfig(
+            instance_url=url,
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+            ),
+        )
+        auth_manager = AuthManager(config.auth, config.instance_url)
+        results = [
+            (limit, list_incidents(config, auth_manager, ListIncidentsParams(limit=limit)))
+            for limit in limits
+        ]
+
+    print(f"{'incidents':>9}  {'mode':<24} {'median ms':>10} {'bytes':>10} {'vs indented':>11}")
+    for limit, result in results:
+        baseline = None
+        for name, serializer in modes:
+            text = serializer.serialize(result, "list_incidents")
+            size = len(text.encode())
+            baseline = baseline or size
+            elapsed = median_ms(lambda: serializer.serialize(result, "list_incidents"), args.repeat)
+            print(f"{limit:>9}  {name:<24} {elapsed:>10.3f} {size:>10} {size / baseline:>10.0%}")
+        # A tool returning its result already serialized, e.g. from the result cache
+        text = modes[1][1].serialize(result, "list_incidents")
+        for name, serializer in modes[:2]:
+            elapsed = median_ms(lambda: serializer.serialize(text, "list_incidents"), args.repeat)
+            print(f"{limit:>9}  {'string, ' + name:<24} {elapsed:>10.3f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
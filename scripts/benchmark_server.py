@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+"""
+End-to-end Server Benchmark
+
+This script serves a mock ServiceNow instance (servicenow_mcp.testing), starts
+the MCP server against it over the stdio and/or SSE transport, and calls a
+fixed mix of read and write tools through an MCP client session. For every
+tool it reports the latency percentiles seen by the client, the instance
+requests and bytes (sent and received) per call, and the size of the tool
+result. Everything runs locally, so the benchmark can run offline in CI.
+
+Usage:
+    python scripts/benchmark_server.py [--transport both] [--iterations 20]
+        [--latency-ms 0] [--error-rate 0] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+# Add the project source to the Python path
+sys.path.insert(0, str(ROOT / "src"))
+
+from mcp import ClientSession, StdioServerParameters  # noqa: E402
+from mcp.client.sse import sse_client  # noqa: E402
+from mcp.client.stdio import stdio_client  # noqa: E402
+
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread  # noqa: E402
+
+Workload = List[Tuple[str, Callable[[int], Dict[str, Any]]]]
+
+
+def workload(instance: MockInstance) -> Workload:
+    """Tool calls made on each iteration, with arguments varying by iteration."""
+    incidents = instance.records("incident")
+    articles = instance.records("kb_knowledge")
+    users = instance.records("sys_user")
+    items = instance.records("sc_cat_item")
+
+    def page(records: list, size: int, i: int) -> Dict[str, int]:
+        # A different page per iteration, so the result cache does not answer
+        return {"limit": size, "offset": (i * size) % max(len(records), 1)}
+
+    return [
+        ("list_incidents", lambda i: page(incidents, 20, i)),
+        (
+            "get_incident_by_number",
+            lambda i: {"incident_number": incidents[i % len(incidents)]["number"]["value"]},
+        ),
+        ("list_users", lambda i: page(users, 20, i)),
+        ("list_catalog_items", lambda i: page(items, 20, i)),
+        ("list_articles", lambda i: page(articles, 10, i)),
+        ("get_article", lambda i: {"article_id": articles[i % len(articles)]["sys_id"]["value"]}),
+        (
+            "aggregate_table",
+            lambda i: {
+                "table_name": "incident",
+                "group_by": ["state"],
+                "query": f"priority={i % 5 + 1}",
+            },
+        ),
+        ("create_incident", lambda i: {"short_description": f"Benchmark incident {i}"}),
+    ]
+
+
+def server_env(instance_url: str, package: str, metrics: bool) -> Dict[str, str]:
+    """Environment of the MCP server process."""
+    env = dict(os.environ)
+    env.update(
+        {
+            "SERVICENOW_INSTANCE_URL": instance_url,
+            "SERVICENOW_AUTH_TYPE": "basic",
+            "SERVICENOW_USERNAME": "admin",
+            "SERVICENOW_PASSWORD": "admin",
+            "MCP_TOOL_PACKAGE": package,
+            "SERVICENOW_METRICS": str(metrics).lower(),
+            "TOOL_PACKAGE_CONFIG_PATH": str(ROOT / "config" / "tool_packages.yaml"),
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")])
+            ),
+        }
+    )
+    return env
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"SSE server exited with status {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("SSE server did not start")
+
+
+def is_error(result: Any) -> bool:
+    """Whether a tool call failed, either as an MCP error or a ``success: false`` result."""
+    if result.isError:
+        return True
+    try:
+        payload = json.loads(result.content[0].text)
+    except (IndexError, AttributeError, ValueError):
+        return False
+    return isinstance(payload, dict) and payload.get("success") is False
+
+
+async def drive(
+    session: ClientSession,
+    instance: MockInstance,
+    calls: Workload,
+    iterations: int,
+    warmup: int,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Run the workload over a session, sampling each call after the warm-up iterations."""
+    await session.initialize()
+    samples: Dict[str, List[Dict[str, Any]]] = {name: [] for name, _ in calls}
+    for i in range(warmup + iterations):
+        for name, arguments in calls:
+            before = dict(instance.stats)
+            start = time.perf_counter()
+            result = await session.call_tool(name, arguments(i))
+            elapsed = (time.perf_counter() - start) * 1000
+            if i < warmup:
+                continue
+            stats = instance.stats
+            samples[name].append(
+                {
+                    "ms": elapsed,
+                    "error": is_error(result),
+                    "requests": stats["requests"] - before["requests"],
+                    "bytes": stats["bytes_in"] + stats["bytes_out"]
+                    - before["bytes_in"] - before["bytes_out"],
+                    "result_bytes": sum(len(getattr(c, "text", "")) for c in result.content),
+                }
+            )
+    return samples
+
+
+async def run_stdio(instance_url: str, args, instance: MockInstance, calls: Workload):
+    parameters = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "servicenow_mcp.cli"],
+        env=server_env(instance_url, args.package, args.metrics),
+    )
+    async with stdio_client(parameters) as (read, write):
+        async with ClientSession(read, write) as session:
+            return await drive(session, instance, calls, args.iterations, args.warmup)
+
+
+async def run_sse(instance_url: str, args, instance: MockInstance, calls: Workload):
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "servicenow_mcp.server_sse",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+        ],
+        env=server_env(instance_url, args.package, args.metrics),
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port, process)
+        async with sse_client(f"http://127.0.0.1:{port}/sse") as (read, write):
+            async with ClientSession(read, write) as session:
+                return await drive(session, instance, calls, args.iterations, args.warmup)
+    finally:
+        # uvicorn waits for open SSE streams to end before exiting
+        process.terminate()
+        try:
+            process.wait(5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def summarize(samples: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    summary = {}
+    for name, calls in samples.items():
+        latencies = [call["ms"] for call in calls]
+        summary[name] = {
+            "calls": len(calls),
+            "errors": sum(call["error"] for call in calls),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "requests_per_call": round(sum(c["requests"] for c in calls) / len(calls), 2),
+            "bytes_per_call": round(sum(c["bytes"] for c in calls) / len(calls)),
+            "result_bytes_per_call": round(sum(c["result_bytes"] for c in calls) / len(calls)),
+        }
+    return summary
+
+
+def print_summary(transport: str, summary: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n{transport}")
+    print(
+        f"  {'tool':<24} {'calls':>5} {'err':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        f" {'req/call':>8} {'KB/call':>8} {'result KB':>9}"
+    )
+    for name, row in summary.items():
+        print(
+            f"  {name:<24} {row['calls']:>5} {row['errors']:>4} {row['p50_ms']:>8.1f}"
+            f" {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['requests_per_call']:>8.2f}"
+            f" {row['bytes_per_call'] / 1024:>8.1f} {row['result_bytes_per_call'] / 1024:>9.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MCP server end to end")
+    parser.add_argument(
+        "--transport", choices=["stdio", "sse", "both"], default="both", help="Transports to run"
+    )
+    parser.add_argument("--iterations", type=int, default=20, help="Measured calls per tool")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured calls per tool first")
+    parser.add_argument("--package", default="full", help="Tool package the server loads")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Mock instance latency")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0, help="Extra random latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of failed requests")
+    parser.add_argument("--incidents", type=int, default=1000, help="Generated incidents")
+    parser.add_argument("--articles", type=int, default=500, help="Generated knowledge articles")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the generated data")
+    parser.add_argument(
+        "--metrics", action="store_true", help="Enable the server's per-tool metrics"
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    instance = MockInstance(
+        MockInstanceConfig(
+            seed=args.seed,
+            incidents=args.incidents,
+            articles=args.articles,
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            error_rate=args.error_rate,
+        )
+    )
+    calls = workload(instance)
+    transports = ["stdio", "sse"] if args.transport == "both" else [args.transport]
+    runners = {"stdio": run_stdio, "sse": run_sse}
+
+    results = {}
+    with serve_in_thread(instance) as instance_url:
+        print(f"Mock instance at {instance_url}, {args.iterations} calls per tool")
+        for transport in transports:
+            samples = asyncio.run(runners[transport](instance_url, args, instance, calls))
+            results[transport] = summarize(samples)
+            print_summary(transport, results[transport])
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
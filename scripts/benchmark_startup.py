@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Server Startup Benchmark
+
+This script measures how long the MCP server takes to start with each tool
+package: importing servicenow_mcp.server, then constructing ServiceNowMCP,
+which loads the tool modules of the package and generates the tool schemas.
+Every run is a fresh interpreter started with ``python -X importtime``, whose
+report gives the number of modules imported and the slowest of them.
+
+Tool modules are imported with importlib, which -X importtime does not
+report, so the tool modules loaded are listed from sys.modules instead.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5] [--package service_desk] [--top 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+ROOT = Path(__file__).parent.parent
+
+# Run in the child interpreter; prints its timings as JSON on the last line of stdout
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+imported = time.perf_counter()
+server = ServiceNowMCP(
+    ServerConfig(
+        instance_url="https://dev12345.service-now.com",
+        auth=AuthConfig(
+            type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+        ),
+    )
+)
+constructed = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "init_ms": (constructed - imported) * 1000,
+    "tools": len(server.tool_list),
+    "tool_modules": sorted(
+        name.rsplit(".", 1)[1] for name in sys.modules
+        if name.startswith("servicenow_mcp.tools.")
+    ),
+}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """Get the (module, self time in microseconds) pairs of a -X importtime report."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(self_us)))
+    return modules
+
+
+def run_once(package: str) -> Dict[str, Any]:
+    """Start the server once in a fresh interpreter."""
+    env = dict(os.environ, MCP_TOOL_PACKAGE=package)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        check=True,
+    )
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    result["imports"] = parse_importtime(process.stderr)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MCP server startup")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per package (default: 5)")
+    parser.add_argument(
+        "--package", action="append", help="Tool package to start (default: every package)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="Slowest modules to list (default: 10)"
+    )
+    args = parser.parse_args()
+
+    with open(ROOT / "config" / "tool_packages.yaml") as f:
+        packages = args.package or [
+            name for name, tools in yaml.safe_load(f).items() if isinstance(tools, list)
+        ]
+
+    print(
+        f"{'package':<20} {'tools':>5} {'modules':>7} {'tool modules':>12} "
+        f"{'import ms':>10} {'init ms':>8} {'total ms':>9}"
+    )
+    slowest: Dict[str, List[int]] = {}
+    for package in packages:
+        runs = [run_once(package) for _ in range(args.runs)]
+        import_ms = statistics.median(run["import_ms"] for run in runs)
+        init_ms = statistics.median(run["init_ms"] for run in runs)
+        print(
+            f"{package:<20} {runs[0]['tools']:>5} {len(runs[0]['imports']):>7} "
+            f"{len(runs[0]['tool_modules']):>12} {import_ms:>10.1f} {init_ms:>8.1f} "
+            f"{import_ms + init_ms:>9.1f}"
+        )
+        for run in runs:
+            for name, self_us in run["imports"]:
+                slowest.setdefault(name, []).append(self_us)
+
+    print(f"\nSlowest modules to import (median self time over all runs, ms):")
+    medians = sorted(
+        ((statistics.median(times), name) for name, times in slowest.items()), reverse=True
+    )
+    for self_us, name in medians[: args.top]:
+        print(f"  {self_us / 1000:>8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Field Projection Payload Measurement
+
+This script compares the size of the recorded Table API responses in
+tests/fixtures/table_api with the size of the same responses when the read
+tools ask only for the fields they use (sysparm_fields). Tools that format
+their records use their TOOL_FIELDS manifest entry; tools that return whole
+records are measured with a typical ``fields`` selection.
+
+Usage:
+    python scripts/measure_field_projection.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add the project source to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from servicenow_mcp.utils.fields import sysparm_fields  # noqa: E402
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures" / "table_api"
+
+# Tool -> (table read, fields requested by the caller or None for the manifest)
+MEASURED_TOOLS = {
+    "list_incidents": ("incident", None),
+    "get_incident_by_number": ("incident", None),
+    "list_catalog_items": ("sc_cat_item", None),
+    "get_catalog_item": ("sc_cat_item", None),
+    "list_catalog_categories": ("sc_category", None),
+    "list_knowledge_bases": ("kb_knowledge_base", None),
+    "list_articles": ("kb_knowledge", None),
+    "get_article": ("kb_knowledge", None),
+    "list_categories": ("kb_category", None),
+    "list_group_members": ("sys_user_grmember", None),
+    "list_script_includes": ("sys_script_include", None),
+    "get_script_include": ("sys_script_include", None),
+    "list_requests": ("sc_req_item", ["number", "short_description", "stage", "requested_for"]),
+    "list_change_requests": ("change_request", ["number", "short_description", "state", "risk"]),
+    "list_stories": ("rm_story", ["number", "short_description", "state", "story_points"]),
+}
+
+
+def payload_size(records, fields=None):
+    """Size in bytes of a Table API response body holding the records."""
+    if fields is not None:
+        records = [{k: v for k, v in record.items() if k in fields} for record in records]
+    return len(json.dumps({"result": records}).encode())
+
+
+def main():
+    """Print the full and projected payload size per tool."""
+    print(f"{'tool':<26} {'table':<20} {'fields':>6} {'full B/rec':>11} {'projected':>10} {'saved':>7}")
+    for tool_name, (table, requested) in MEASURED_TOOLS.items():
+        records = json.loads((FIXTURES / f"{table}.json").read_text())["result"]
+        fields = sysparm_fields(tool_name, requested).split(",")
+        full = payload_size(records) / len(records)
+        projected = payload_size(records, fields) / len(records)
+        print(
+            f"{tool_name:<26} {table:<20} {len(fields):>6} {full:>11.0f} {projected:>10.0f} "
+            f"{1 - projected / full:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
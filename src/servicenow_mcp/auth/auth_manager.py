@@ -5,13 +5,19 @@ Authentication manager for the ServiceNow MCP server.
 import base64
 import logging
 import os
-from typing import Dict, Optional
+import threading
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
 
 import requests
 from requests.auth import HTTPBasicAuth
 
+from servicenow_mcp.auth.token_cache import EncryptedTokenCache
 from servicenow_mcp.utils.config import AuthConfig, AuthType
 
+if TYPE_CHECKING:
+    from servicenow_mcp.utils.http_client import AsyncServiceNowHttpClient, ServiceNowHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -24,23 +30,81 @@ class AuthManager:
     different authentication methods.
     """
     
-    def __init__(self, config: AuthConfig, instance_url: str = None):
+    def __init__(
+        self,
+        config: AuthConfig,
+        instance_url: str = None,
+        http_client: Optional["ServiceNowHttpClient"] = None,
+        async_http_client: Optional["AsyncServiceNowHttpClient"] = None,
+    ):
         """
         Initialize the authentication manager.
         
         Args:
             config: Authentication configuration.
             instance_url: ServiceNow instance URL.
+            http_client: Pooled HTTP client shared with the tools. If omitted,
+                requests are sent with the module-level requests API.
+            async_http_client: Pooled async HTTP client shared with async tools.
         """
         self.config = config
         self.instance_url = instance_url
+        self.http_client = http_client
+        self.async_http_client = async_http_client
+        # Reference data cache, created on first use by utils.cache.get_reference_cache
+        self.reference_cache: Optional[Any] = None
         self.token: Optional[str] = None
         self.token_type: Optional[str] = None
+        self.token_expires_at: Optional[float] = None
+
+        # Read-only headers for the current credentials, rebuilt on token rotation
+        self._headers_template: Optional[Mapping[str, str]] = None
+        self._headers_key: Optional[Tuple[Optional[str], Optional[str]]] = None
+
+        # Serialises token fetches so concurrent callers share a single request
+        self._token_lock = threading.RLock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        self._token_cache: Optional[EncryptedTokenCache] = None
+        if config.type == AuthType.OAUTH and config.oauth and config.oauth.token_cache_path:
+            self._token_cache = EncryptedTokenCache(
+                config.oauth.token_cache_path,
+                f"{config.oauth.client_id}:{config.oauth.client_secret}",
+            )
+
+        # Let the HTTP clients ask for fresh credentials when a request gets a 401
+        for client in (http_client, async_http_client):
+            if client is not None:
+                client.auth_manager = self
     
     def get_headers(self) -> Dict[str, str]:
         """
         Get the authentication headers for API requests.
         
+        The headers are built once per credential or token generation and
+        returned as a fresh copy on each call, so callers may modify them.
+
+        Returns:
+            Dict[str, str]: Headers to include in API requests.
+        """
+        if self.config.type == AuthType.OAUTH:
+            self._ensure_oauth_token()
+            headers_key = (self.token_type, self.token)
+        else:
+            headers_key = None
+
+        template = self._headers_template
+        if template is None or self._headers_key != headers_key:
+            template = MappingProxyType(self._build_headers())
+            self._headers_template = template
+            self._headers_key = headers_key
+
+        return template.copy()
+
+    def _build_headers(self) -> Dict[str, str]:
+        """
+        Build the authentication headers for the current credentials.
+        
         Returns:
             Dict[str, str]: Headers to include in API requests.
         """
@@ -58,9 +122,6 @@ class AuthManager:
             headers["Authorization"] = f"Basic {encoded}"
         
         elif self.config.type == AuthType.OAUTH:
-            if not self.token:
-                self._get_oauth_token()
-            
             headers["Authorization"] = f"{self.token_type} {self.token}"
         
         elif self.config.type == AuthType.API_KEY:
@@ -71,6 +132,133 @@ class AuthManager:
         
         return headers
     
+    @property
+    def _refresh_margin(self) -> int:
+        """Seconds before expiry at which the OAuth token is refreshed."""
+        return self.config.oauth.refresh_margin if self.config.oauth else 0
+
+    def _token_expires_within(self, seconds: float) -> bool:
+        """Check whether the current token expires within the given number of seconds."""
+        if not self.token:
+            return True
+        if self.token_expires_at is None:
+            return False
+        return time.time() + seconds >= self.token_expires_at
+
+    def _ensure_oauth_token(self):
+        """
+        Make sure a valid OAuth token is available.
+
+        Expired or missing tokens are fetched synchronously; concurrent callers
+        wait for a single in-flight request instead of each requesting a token.
+        Tokens close to expiry are still used while a replacement is fetched in
+        the background.
+        """
+        if not self._token_expires_within(0):
+            if self._token_expires_within(self._refresh_margin):
+                self._start_background_refresh()
+            return
+
+        with self._token_lock:
+            # Another thread may have fetched a token while we were waiting
+            if not self._token_expires_within(0):
+                return
+            if self._load_cached_token():
+                return
+            self._get_oauth_token()
+
+    def _start_background_refresh(self):
+        """Start a background token refresh unless one is already running."""
+        with self._token_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh, name="servicenow-oauth-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _background_refresh(self):
+        """Refresh the OAuth token ahead of its expiry."""
+        with self._token_lock:
+            if not self._token_expires_within(self._refresh_margin):
+                return
+            try:
+                self._get_oauth_token()
+            except Exception as e:
+                # The current token is still valid; the next call will try again
+                logger.warning(f"Background OAuth token refresh failed: {e}")
+
+    def _load_cached_token(self) -> bool:
+        """
+        Load an unexpired token from the on-disk cache, if one is configured.
+
+        Returns:
+            bool: True if a token was loaded.
+        """
+        if self._token_cache is None:
+            return False
+        token_data = self._token_cache.load()
+        if not token_data:
+            return False
+        expires_at = token_data.get("expires_at")
+        if expires_at is not None and time.time() + self._refresh_margin >= expires_at:
+            return False
+        self.token = token_data.get("access_token")
+        self.token_type = token_data.get("token_type", "Bearer")
+        self.token_expires_at = expires_at
+        logger.info("Using cached OAuth token")
+        return bool(self.token)
+
+    def _store_token(self, token_data: Dict[str, Any]):
+        """Store a token returned by the token endpoint and update the on-disk cache."""
+        self.token = token_data.get("access_token")
+        self.token_type = token_data.get("token_type", "Bearer")
+        expires_in = token_data.get("expires_in")
+        self.token_expires_at = time.time() + float(expires_in) if expires_in else None
+
+        if self._token_cache is not None:
+            self._token_cache.save(
+                {
+                    "access_token": self.token,
+                    "token_type": self.token_type,
+                    "expires_at": self.token_expires_at,
+                }
+            )
+
+    def handle_unauthorized(self, rejected_authorization: Optional[str]) -> Optional[str]:
+        """
+        Get a new Authorization header value after a request was rejected with 401.
+
+        If the rejected value is the current OAuth token, the token is discarded
+        and a new one is fetched (once, even if several requests fail together).
+        If another caller has already replaced it, the current token is returned.
+
+        Args:
+            rejected_authorization: Authorization header of the rejected request.
+
+        Returns:
+            Optional[str]: Authorization header value to retry with, or None if
+            retrying would not help (non-OAuth auth or a non-token request).
+        """
+        if self.config.type != AuthType.OAUTH or not rejected_authorization:
+            return None
+
+        with self._token_lock:
+            current = f"{self.token_type} {self.token}" if self.token else None
+            if rejected_authorization == current:
+                logger.info("OAuth token rejected, requesting a new one")
+                self.token = None
+                self.token_expires_at = None
+                if self._token_cache is not None:
+                    self._token_cache.clear()
+                self._get_oauth_token()
+            elif not self.token_type or not rejected_authorization.startswith(
+                f"{self.token_type} "
+            ):
+                # Not a token we issued (e.g. the token request itself)
+                return None
+            return f"{self.token_type} {self.token}"
+
     def _get_oauth_token(self):
         """
         Get an OAuth token from ServiceNow.
@@ -106,16 +294,16 @@ class AuthManager:
             "grant_type": "client_credentials"
         }
         
+        http = self.http_client or requests
+
         logger.info("Attempting client_credentials grant...")
-        response = requests.post(token_url, headers=headers, data=data_client_credentials)
+        response = http.post(token_url, headers=headers, data=data_client_credentials)
         
         logger.info(f"client_credentials response status: {response.status_code}")
         logger.info(f"client_credentials response body: {response.text}")
         
         if response.status_code == 200:
-            token_data = response.json()
-            self.token = token_data.get("access_token")
-            self.token_type = token_data.get("token_type", "Bearer")
+            self._store_token(response.json())
             return
 
         # Try password grant if client_credentials failed
@@ -127,15 +315,13 @@ class AuthManager:
             }
             
             logger.info("Attempting password grant...")
-            response = requests.post(token_url, headers=headers, data=data_password)
+            response = http.post(token_url, headers=headers, data=data_password)
             
             logger.info(f"password grant response status: {response.status_code}")
             logger.info(f"password grant response body: {response.text}")
             
             if response.status_code == 200:
-                token_data = response.json()
-                self.token = token_data.get("access_token")
-                self.token_type = token_data.get("token_type", "Bearer")
+                self._store_token(response.json())
                 return
 
         raise ValueError("Failed to get OAuth token using both client_credentials and password grants.")
@@ -143,4 +329,6 @@ class AuthManager:
     def refresh_token(self):
         """Refresh the OAuth token if using OAuth authentication."""
         if self.config.type == AuthType.OAUTH:
-            self._get_oauth_token() 
\ No newline at end of file
+            with self._token_lock:
+                self._get_oauth_token()
+ 
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Encrypted on-disk OAuth token cache for the ServiceNow MCP server.
+
+Short-lived CLI processes can share an OAuth token through this cache instead
+of requesting a new one on every invocation. The token is encrypted with a key
+derived from the OAuth client credentials, so only processes that already hold
+those credentials can read it.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_KDF_ITERATIONS = 200_000
+
+
+class EncryptedTokenCache:
+    """
+    File-backed OAuth token cache encrypted with Fernet.
+
+    Requires the optional ``cryptography`` package
+    (``pip install servicenow-mcp[token-cache]``).
+    """
+
+    def __init__(self, path: str, secret: str):
+        """
+        Initialize the token cache.
+
+        Args:
+            path: Path of the cache file.
+            secret: Secret the encryption key is derived from (the client credentials).
+
+        Raises:
+            ImportError: If the cryptography package is not installed.
+        """
+        try:
+            from cryptography.fernet import Fernet  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "The encrypted token cache requires the 'cryptography' package. "
+                "Install it with: pip install servicenow-mcp[token-cache]"
+            ) from e
+
+        self.path = os.path.expanduser(path)
+        self._secret = secret.encode()
+
+    def _fernet(self, salt: bytes) -> Any:
+        """Create a Fernet instance for the given salt."""
+        from cryptography.fernet import Fernet
+
+        key = hashlib.pbkdf2_hmac("sha256", self._secret, salt, _KDF_ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached token.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached token data (access_token, token_type,
+            expires_at), or None if there is no usable unexpired token.
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            with open(self.path, "r") as f:
+                envelope = json.load(f)
+            salt = base64.b64decode(envelope["salt"])
+            payload = self._fernet(salt).decrypt(envelope["token"].encode())
+            token_data = json.loads(payload)
+        except FileNotFoundError:
+            return None
+        except (InvalidToken, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable token cache {self.path}: {e}")
+            return None
+
+        expires_at = token_data.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return token_data
+
+    def save(self, token_data: Dict[str, Any]) -> None:
+        """
+        Save a token to the cache, readable only by the current user.
+
+        Args:
+            token_data: Token data (access_token, token_type, expires_at).
+        """
+        salt = os.urandom(16)
+        envelope = {
+            "salt": base64.b64encode(salt).decode(),
+            "token": self._fernet(salt).encrypt(json.dumps(token_data).encode()).decode(),
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(envelope, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write token cache {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Remove the cached token."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -17,8 +17,14 @@ from servicenow_mcp.utils.config import (
     AuthConfig,
     AuthType,
     BasicAuthConfig,
+    CacheConfig,
+    HttpClientConfig,
+    MetricsConfig,
+    MirrorConfig,
     OAuthConfig,
+    SerializationConfig,
     ServerConfig,
+    TracingConfig,
 )
 
 # Configure logging
@@ -51,6 +57,115 @@ def parse_args():
         help="Request timeout in seconds",
         default=int(os.environ.get("SERVICENOW_TIMEOUT", "30")),
     )
+    parser.add_argument(
+        "--tool-schema-cache",
+        help="JSON file caching the tool schemas, so that startup skips generating them",
+        default=os.environ.get("SERVICENOW_TOOL_SCHEMA_CACHE"),
+    )
+    parser.add_argument(
+        "--compact-output",
+        action="store_true",
+        help="Return tool results as unindented JSON, and string results unchanged",
+        default=os.environ.get("SERVICENOW_COMPACT_OUTPUT", "false").lower() == "true",
+    )
+    parser.add_argument(
+        "--json-backend",
+        choices=["json", "orjson"],
+        help="JSON encoder of tool results ('orjson' requires the orjson extra)",
+        default=os.environ.get("SERVICENOW_JSON_BACKEND", "json"),
+    )
+
+    # HTTP connection pool
+    http_group = parser.add_argument_group("HTTP Connection Pool")
+    http_group.add_argument(
+        "--http-pool-connections",
+        type=int,
+        help="Number of per-host connection pools to keep",
+        default=int(os.environ.get("SERVICENOW_HTTP_POOL_CONNECTIONS", "10")),
+    )
+    http_group.add_argument(
+        "--http-pool-maxsize",
+        type=int,
+        help="Maximum keep-alive connections per host",
+        default=int(os.environ.get("SERVICENOW_HTTP_POOL_MAXSIZE", "10")),
+    )
+    http_group.add_argument(
+        "--http-idle-timeout",
+        type=float,
+        help="Seconds after which idle pooled connections are recycled",
+        default=float(os.environ.get("SERVICENOW_HTTP_IDLE_TIMEOUT", "60")),
+    )
+
+    # Reference data cache
+    cache_group = parser.add_argument_group("Reference Data Cache")
+    cache_group.add_argument(
+        "--cache-backend",
+        choices=["memory", "sqlite", "none"],
+        help="Where cached reference data is kept ('none' disables the cache)",
+        default=os.environ.get("SERVICENOW_CACHE_BACKEND", "memory"),
+    )
+    cache_group.add_argument(
+        "--cache-path",
+        help="Path of the SQLite cache file shared between processes",
+        default=os.environ.get("SERVICENOW_CACHE_PATH", "~/.cache/servicenow-mcp/cache.sqlite"),
+    )
+
+    # Local table mirror
+    mirror_group = parser.add_argument_group("Table Mirror")
+    mirror_group.add_argument(
+        "--mirror",
+        action="store_true",
+        help="Mirror tables into a local SQLite file and serve reads from it",
+        default=os.environ.get("SERVICENOW_MIRROR", "false").lower() == "true",
+    )
+    mirror_group.add_argument(
+        "--mirror-path",
+        help="Path of the SQLite mirror file",
+        default=os.environ.get("SERVICENOW_MIRROR_PATH", "~/.cache/servicenow-mcp/mirror.sqlite"),
+    )
+    mirror_group.add_argument(
+        "--mirror-tables",
+        help="Comma-separated list of tables to mirror",
+        default=os.environ.get("SERVICENOW_MIRROR_TABLES"),
+    )
+    mirror_group.add_argument(
+        "--mirror-sync-interval",
+        type=float,
+        help="Seconds between incremental syncs of the mirror",
+        default=float(os.environ.get("SERVICENOW_MIRROR_SYNC_INTERVAL", "60")),
+    )
+    mirror_group.add_argument(
+        "--mirror-max-staleness",
+        type=float,
+        help="Serve reads from the mirror only if synced at most this many seconds ago",
+        default=float(os.environ.get("SERVICENOW_MIRROR_MAX_STALENESS", "300")),
+    )
+
+    # Metrics and tracing
+    observability_group = parser.add_argument_group("Metrics and Tracing")
+    observability_group.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Record per-tool latency and ServiceNow request metrics (see get_server_metrics)",
+        default=os.environ.get("SERVICENOW_METRICS", "false").lower() == "true",
+    )
+    observability_group.add_argument(
+        "--tracing",
+        action="store_true",
+        help="Record OpenTelemetry spans of tool calls and ServiceNow requests",
+        default=os.environ.get("SERVICENOW_TRACING", "false").lower() == "true",
+    )
+    observability_group.add_argument(
+        "--tracing-exporter",
+        choices=["otlp-file", "console", "otlp"],
+        help="Write spans to an OTLP/JSON lines file, stderr, or an OTLP/HTTP collector",
+        default=os.environ.get("SERVICENOW_TRACING_EXPORTER", "otlp-file"),
+    )
+    observability_group.add_argument(
+        "--tracing-path",
+        help="File written by the otlp-file trace exporter",
+        default=os.environ.get("SERVICENOW_TRACING_PATH", "~/.cache/servicenow-mcp/traces.jsonl"),
+    )
 
     # Authentication
     auth_group = parser.add_argument_group("Authentication")
@@ -91,6 +206,11 @@ def parse_args():
         help="OAuth token URL",
         default=os.environ.get("SERVICENOW_TOKEN_URL"),
     )
+    oauth_group.add_argument(
+        "--token-cache",
+        help="Path of an encrypted OAuth token cache shared between processes",
+        default=os.environ.get("SERVICENOW_TOKEN_CACHE"),
+    )
 
     # API Key
     api_key_group = parser.add_argument_group("API Key Authentication")
@@ -187,6 +307,7 @@ def create_config(args) -> ServerConfig:
             username=username,
             password=password,
             token_url=token_url,
+            token_cache_path=args.token_cache,
         )
         # Create the main AuthConfig wrapper
         final_auth_config = AuthConfig(type=auth_type, oauth=oauth_cfg)
@@ -228,6 +349,29 @@ def create_config(args) -> ServerConfig:
         # Include other server config fields if they exist on ServerConfig model
         debug=args.debug,
         timeout=args.timeout,
+        http=HttpClientConfig(
+            pool_connections=args.http_pool_connections,
+            pool_maxsize=args.http_pool_maxsize,
+            idle_timeout=args.http_idle_timeout,
+        ),
+        cache=CacheConfig(
+            enabled=args.cache_backend != "none",
+            backend="sqlite" if args.cache_backend == "sqlite" else "memory",
+            sqlite_path=args.cache_path,
+        ),
+        mirror=MirrorConfig(
+            enabled=args.mirror,
+            sqlite_path=args.mirror_path,
+            sync_interval=args.mirror_sync_interval,
+            max_staleness=args.mirror_max_staleness,
+            **({"tables": args.mirror_tables.split(",")} if args.mirror_tables else {}),
+        ),
+        tool_schema_cache=args.tool_schema_cache,
+        serialization=SerializationConfig(compact=args.compact_output, backend=args.json_backend),
+        metrics=MetricsConfig(enabled=args.metrics),
+        tracing=TracingConfig(
+            enabled=args.tracing, exporter=args.tracing_exporter, file_path=args.tracing_path
+        ),
         script_execution_api_resource_path=script_execution_api_resource_path,
     )
 
@@ -4,25 +4,33 @@ ServiceNow MCP Server
 This module provides the main implementation of the ServiceNow MCP server.
 """
 
-import json
+import functools
+import inspect
 import logging
 import os
-from typing import Any, Dict, List, Union
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import anyio
 import mcp.types as types
 import yaml
 from mcp.server.lowlevel import Server
 from pydantic import ValidationError
 
 from servicenow_mcp.auth.auth_manager import AuthManager
-from servicenow_mcp.tools.knowledge_base import (
-    create_category as create_kb_category_tool,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    list_categories as list_kb_categories_tool,
-)
 from servicenow_mcp.utils.config import ServerConfig
-from servicenow_mcp.utils.tool_utils import get_tool_definitions
+from servicenow_mcp.utils.http_client import AsyncServiceNowHttpClient, ServiceNowHttpClient
+from servicenow_mcp.utils.metrics import ServerMetrics, ToolCall
+from servicenow_mcp.utils.mirror import MirrorSyncer, get_mirror
+from servicenow_mcp.utils.response_budget import ResponseBudget
+from servicenow_mcp.utils.result_cache import ToolResultCache
+from servicenow_mcp.utils.serialization import (  # noqa: F401 (serialize_tool_output re-exported)
+    ToolOutputSerializer,
+    serialize_tool_output,
+)
+from servicenow_mcp.utils.tool_schemas import ToolSchemaCache, generate_tool_schemas
+from servicenow_mcp.utils.tool_utils import TOOL_SPECS, get_tool_definitions
+from servicenow_mcp.utils.tracing import Tracing
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -32,46 +40,11 @@ logger = logging.getLogger(__name__)
 TOOL_PACKAGE_CONFIG_PATH = os.getenv("TOOL_PACKAGE_CONFIG_PATH", "config/tool_packages.yaml")
 
 
-def serialize_tool_output(result: Any, tool_name: str) -> str:
-    """Serializes tool output to a string, preferably JSON indented."""
-    try:
-        if isinstance(result, str):
-            # If it's already a string, assume it's intended as such
-            # Try to parse/re-dump JSON for consistent formatting if it looks like JSON
-            try:
-                parsed = json.loads(result)
-                return json.dumps(parsed, indent=2)
-            except json.JSONDecodeError:
-                return result  # Return as is if not valid JSON
-        elif isinstance(result, dict):
-            # Dump dicts to JSON
-            return json.dumps(result, indent=2)
-        elif hasattr(result, "model_dump_json"):  # Pydantic v2
-            # Prefer Pydantic v2 model_dump_json
-            # The indent argument might not be supported by all versions/models,
-            # so we might need to dump to dict first if indent is crucial.
-            try:
-                return result.model_dump_json(indent=2)
-            except TypeError:  # Handle case where indent is not supported
-                return json.dumps(result.model_dump(), indent=2)
-        elif hasattr(result, "model_dump"):  # Pydantic v2 fallback
-            # Fallback to Pydantic v2 model_dump -> dict -> json
-            return json.dumps(result.model_dump(), indent=2)
-        elif hasattr(result, "dict"):  # Pydantic v1
-            # Fallback to Pydantic v1 dict -> json
-            return json.dumps(result.dict(), indent=2)
-        else:
-            # Absolute fallback: convert to string
-            logger.warning(
-                f"Could not serialize result for tool '{tool_name}' to JSON, falling back to str(). Type: {type(result)}"
-            )
-            return str(result)
-    except Exception as e:
-        logger.error(f"Error during serialization for tool '{tool_name}': {e}", exc_info=True)
-        # Return an error message string formatted as JSON
-        return json.dumps(
-            {"error": f"Serialization failed for tool {tool_name}", "details": str(e)}, indent=2
-        )
+def _is_successful(result: Any) -> bool:
+    """Check whether a tool result does not report a failure."""
+    if isinstance(result, dict):
+        return result.get("success", True) is not False
+    return getattr(result, "success", True) is not False
 
 
 class ServiceNowMCP:
@@ -95,20 +68,49 @@ class ServiceNowMCP:
         else:
             self.config = config
 
-        self.auth_manager = AuthManager(self.config.auth, self.config.instance_url)
+        # A single pooled HTTP client is shared by every tool call so connections
+        # to the instance are reused; it travels to the tools on the auth manager.
+        self.http_client = ServiceNowHttpClient(self.config.http)
+        self.async_http_client = AsyncServiceNowHttpClient(self.config.http)
+        self.auth_manager = AuthManager(
+            self.config.auth,
+            self.config.instance_url,
+            http_client=self.http_client,
+            async_http_client=self.async_http_client,
+        )
+        # Local copy of the configured tables, kept up to date in the background
+        self.mirror = get_mirror(self.config, self.auth_manager)
+        self.mirror_syncer = (
+            MirrorSyncer(self.mirror, self.config, self.auth_manager) if self.mirror else None
+        )
+        # Created lazily so it belongs to the event loop that runs the server.
+        self._tool_thread_limiter: Optional[anyio.CapacityLimiter] = None
         self.mcp_server = Server("ServiceNow")  # Use low-level Server
         self.name = "ServiceNow"
 
         self.package_definitions: Dict[str, List[str]] = {}
+        self.result_cache = ToolResultCache()
+        self.response_budget = ResponseBudget()
+        # Per-tool timings and upstream requests, and OpenTelemetry spans of
+        # the same; the HTTP clients report every request to both
+        self.metrics = ServerMetrics(self.config.metrics, cache_stats=self._cache_stats)
+        self.tracing = Tracing(self.config.tracing)
+        self.serializer = ToolOutputSerializer(self.config.serialization)
+        for client in (self.http_client, self.async_http_client):
+            if self.metrics.enabled:
+                client.metrics = self.metrics
+            if self.tracing.enabled:
+                client.tracing = self.tracing
         self.enabled_tool_names: List[str] = []
         self.current_package_name: str = "none"
         self._load_package_config()
         self._determine_enabled_tools()
 
-        # Get tool definitions, passing the aliased KB tool functions if needed
-        self.tool_definitions = get_tool_definitions(
-            create_kb_category_tool, list_kb_categories_tool
-        )
+        # Definitions of the enabled tools only, so that the modules of the
+        # other tools are never imported
+        self.tool_definitions = get_tool_definitions(self.enabled_tool_names)
+        # Tools listed by list_tools, with their schemas generated once
+        self.tool_list = self._build_tool_list()
 
         self._register_handlers()
 
@@ -129,6 +131,14 @@ class ServiceNowMCP:
             with open(config_path, "r") as f:
                 loaded_config = yaml.safe_load(f)
                 if isinstance(loaded_config, dict):
+                    # Not a package: caching policy for read tool results
+                    self.result_cache = ToolResultCache.from_package_config(
+                        loaded_config.pop("result_cache", None)
+                    )
+                    # Nor is the size limit of tool results
+                    self.response_budget = ResponseBudget.from_package_config(
+                        loaded_config.pop("response_budget", None)
+                    )
                     self.package_definitions = loaded_config
                     logger.info(f"Successfully loaded tool package config from {config_path}")
                 else:
@@ -176,8 +186,12 @@ class ServiceNowMCP:
             f"Loading package '{self.current_package_name}' with {len(self.enabled_tool_names)} tools."
         )
 
-    async def _list_tools_impl(self) -> List[types.Tool]:
-        """Implementation for the list_tools MCP endpoint."""
+    def _build_tool_list(self) -> List[types.Tool]:
+        """
+        Build the Tool objects of the enabled tools, generating their schemas once.
+
+        Schemas come from the tool schema cache if one is configured.
+        """
         tool_list: List[types.Tool] = []
 
         # Add the introspection tool if not 'none' package
@@ -199,25 +213,75 @@ class ServiceNowMCP:
                 )
             )
 
-        # Iterate through defined tools and add enabled ones
-        for tool_name, definition in self.tool_definitions.items():
-            if tool_name in self.enabled_tool_names:
-                _impl_func, params_model, _return_annotation, description, _serialization = (
-                    definition
+            tool_list.append(
+                types.Tool(
+                    name="get_server_metrics",
+                    description=(
+                        "Reports per-tool call counts, latency, argument validation and "
+                        "serialization time, ServiceNow requests made and bytes transferred, "
+                        "and cache hit rates, since the server started."
+                    ),
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "tool": {
+                                "type": "string",
+                                "description": "Only report this tool",
+                            }
+                        },
+                    },
                 )
-                try:
-                    schema = params_model.model_json_schema()
-                    tool_list.append(
-                        types.Tool(name=tool_name, description=description, inputSchema=schema)
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to generate schema for tool '{tool_name}': {e}", exc_info=True
+            )
+
+            if self.response_budget.enabled:
+                tool_list.append(
+                    types.Tool(
+                        name="get_more_results",
+                        description=(
+                            "Returns the next records of a tool result that was cut to fit "
+                            "its response budget, given the cursor of its continuation entry."
+                        ),
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "cursor": {
+                                    "type": "string",
+                                    "description": "Cursor from the continuation entry",
+                                }
+                            },
+                            "required": ["cursor"],
+                        },
                     )
+                )
 
-        logger.debug(f"Listing {len(tool_list)} tools for package '{self.current_package_name}'.")
+        # Add the enabled tools, in definition order
+        cache = (
+            ToolSchemaCache(self.config.tool_schema_cache)
+            if self.config.tool_schema_cache
+            else None
+        )
+        enabled_names = set(self.enabled_tool_names)
+        enabled = [name for name in self.tool_definitions if name in enabled_names]
+        schemas = generate_tool_schemas(self.tool_definitions, enabled, cache)
+        for tool_name in enabled:
+            if tool_name in schemas:
+                _impl_func, _params_model, _return_annotation, description, _serialization = (
+                    self.tool_definitions[tool_name]
+                )
+                tool_list.append(
+                    types.Tool(
+                        name=tool_name, description=description, inputSchema=schemas[tool_name]
+                    )
+                )
         return tool_list
 
+    async def _list_tools_impl(self) -> List[types.Tool]:
+        """Implementation for the list_tools MCP endpoint."""
+        logger.debug(
+            f"Listing {len(self.tool_list)} tools for package '{self.current_package_name}'."
+        )
+        return list(self.tool_list)
+
     async def _call_tool_impl(self, name: str, arguments: dict) -> list[types.TextContent]:
         """
         Implementation for the call_tool MCP endpoint.
@@ -236,21 +300,48 @@ class ServiceNowMCP:
             RuntimeError: If tool execution or serialization fails.
         """
         logger.info(f"Received call_tool request for tool '{name}'")
-        # Handle the introspection tool separately
-        if name == "list_tool_packages":
+        # Handle the introspection tools separately
+        if name in ("list_tool_packages", "get_server_metrics", "get_more_results"):
             if self.current_package_name == "none":
-                raise ValueError(
-                    "Tool 'list_tool_packages' is not available in the 'none' package."
-                )
-            result_dict = self._list_tool_packages_impl()
-            serialized_string = json.dumps(result_dict, indent=2)
+                raise ValueError(f"Tool '{name}' is not available in the 'none' package.")
+            if name == "list_tool_packages":
+                result_dict = self._list_tool_packages_impl()
+            elif name == "get_server_metrics":
+                result_dict = self.metrics.snapshot((arguments or {}).get("tool"))
+            else:
+                result_dict = self.response_budget.next_page((arguments or {}).get("cursor"))
+            serialized_string = self.serializer.serialize(result_dict, name)
             # Return a list with a TextContent object
             return [types.TextContent(type="text", text=serialized_string)]
 
+        with self.tracing.span(f"call_tool {name}", {"mcp.tool.name": name}) as span:
+            call = self.metrics.start(name)
+            if call is None:
+                return await self._call_tool(name, arguments, call, span)
+            token = self.metrics.activate(call)
+            try:
+                return await self._call_tool(name, arguments, call, span)
+            except Exception:
+                call.status = "exception"
+                raise
+            finally:
+                self.metrics.deactivate(token)
+                self.metrics.finish(call)
+
+    async def _call_tool(
+        self, name: str, arguments: dict, call: Optional[ToolCall], span: Any
+    ) -> list[types.TextContent]:
+        """
+        Validate the arguments of a tool call, run the tool and serialize its result.
+
+        ``call`` and ``span`` record the call's metrics and trace; each is None
+        when disabled.
+        """
+
         # Check if the tool exists and is enabled
-        if name not in self.tool_definitions:
+        if name not in TOOL_SPECS:
             raise ValueError(f"Unknown tool: {name}")
-        if name not in self.enabled_tool_names:
+        if name not in self.enabled_tool_names or name not in self.tool_definitions:
             raise ValueError(
                 f"Tool '{name}' is not enabled in the current package '{self.current_package_name}'."
             )
@@ -260,8 +351,12 @@ class ServiceNowMCP:
         impl_func, params_model, _return_annotation, _description, _serialization = definition
 
         # Validate and parse arguments using the Pydantic model
+        started = time.perf_counter()
         try:
-            params = params_model(**arguments)
+            with self.tracing.span("validate_params"):
+                params = params_model(**arguments)
+            if call is not None:
+                call.validation_seconds = time.perf_counter() - started
             logger.debug(f"Parsed arguments for tool '{name}': {params}")
         except ValidationError as e:
             logger.error(f"Invalid arguments for tool '{name}': {e}", exc_info=True)
@@ -272,21 +367,100 @@ class ServiceNowMCP:
             )
             raise ValueError(f"Failed to parse arguments for tool '{name}': {e}")
 
+        # Serve repeated calls of cached read tools without contacting the instance
+        cache_key = None
+        if self.result_cache.is_cached(name):
+            cache_key = self.result_cache.key(name, params)
+            cached = self.result_cache.get(name, cache_key)
+            if cached is not None:
+                logger.debug(f"Serving cached result for tool '{name}'")
+                if call is not None:
+                    call.status = "cached"
+                    call.response_bytes = len(cached.encode())
+                if span is not None:
+                    span.set_attribute("mcp.tool.status", "cached")
+                return [types.TextContent(type="text", text=cached)]
+            cache_generation = self.result_cache.generation()
+
         # Execute the tool implementation function
         try:
-            result = impl_func(self.config, self.auth_manager, params)
+            result = await self._run_tool(impl_func, params)
             logger.debug(f"Raw result type from tool '{name}': {type(result)}")
         except Exception as e:
             logger.error(f"Error executing tool '{name}': {e}", exc_info=True)
             raise RuntimeError(f"Error during execution of tool '{name}': {e}") from e
+        finally:
+            # Write tools drop cached results for the tables they modify
+            self.result_cache.invalidate_for(name)
+            if self.mirror is not None:
+                for table in self.result_cache.config.writes.get(name, []):
+                    self.mirror.mark_written(table)
 
         # Serialize the result to a string (preferably JSON) using the helper
-        serialized_string = serialize_tool_output(result, name)
+        started = time.perf_counter()
+        with self.tracing.span("serialize_tool_output"):
+            serialized_string = self.serializer.serialize(result, name)
+        # Results over the tool's response budget are cut down and serialized again
+        shaped = None
+        if self.response_budget.budget(name) is not None:
+            with self.tracing.span("shape_response"):
+                shaped = self.response_budget.shape(
+                    name, result, len(serialized_string.encode())
+                )
+                if shaped is not None:
+                    serialized_string = self.serializer.serialize(shaped, name)
+        if call is not None:
+            call.serialization_seconds = time.perf_counter() - started
+            call.response_bytes = len(serialized_string.encode())
+            if not _is_successful(result):
+                call.status = "error"
+        if span is not None:
+            span.set_attribute("mcp.tool.status", "ok" if _is_successful(result) else "error")
         logger.debug(f"Serialized value for tool '{name}': {serialized_string[:500]}...")
 
+        # Cut results are not cached, as their continuation expires
+        continued = shaped is not None and "continuation" in shaped
+        if cache_key is not None and _is_successful(result) and not continued:
+            self.result_cache.set(name, cache_key, serialized_string, cache_generation)
+
         # Return a list with a TextContent object
         return [types.TextContent(type="text", text=serialized_string)]
 
+    async def _run_tool(self, impl_func: Callable, params: Any) -> Any:
+        """
+        Run a tool implementation without blocking the event loop.
+
+        Async tools are awaited directly. Legacy synchronous tools are run in a
+        worker thread, bounded by ``max_tool_threads``, so that a slow ServiceNow
+        request does not stall calls from other sessions.
+
+        Args:
+            impl_func: The tool implementation function.
+            params: The validated tool parameters.
+
+        Returns:
+            The raw result of the tool.
+        """
+        if inspect.iscoroutinefunction(impl_func):
+            return await impl_func(self.config, self.auth_manager, params)
+
+        if self._tool_thread_limiter is None:
+            self._tool_thread_limiter = anyio.CapacityLimiter(self.config.max_tool_threads)
+        return await anyio.to_thread.run_sync(
+            functools.partial(impl_func, self.config, self.auth_manager, params),
+            limiter=self._tool_thread_limiter,
+        )
+
+    def _cache_stats(self) -> Dict[str, Any]:
+        """Hit and miss counters of the result cache and the reference data cache."""
+        stats: Dict[str, Any] = {
+            "result_cache": {"hits": self.result_cache.hits, "misses": self.result_cache.misses}
+        }
+        reference_cache = self.auth_manager.reference_cache
+        if reference_cache is not None:
+            stats["reference_cache"] = reference_cache.stats()
+        return stats
+
     def _list_tool_packages_impl(self) -> Dict[str, Any]:
         """Implementation logic for the list_tool_packages tool."""
         available_packages = list(self.package_definitions.keys())
@@ -313,6 +487,8 @@ class ServiceNowMCP:
         logger.info(
             "ServiceNowMCP instance configured. Returning low-level server instance for external execution."
         )
+        if self.mirror_syncer is not None:
+            self.mirror_syncer.start()
         # The actual running of the server (server.run(...)) must happen
         # within an async context managed by the caller (e.g., using anyio
         # and a specific transport like stdio_server or SseServerTransport).
@@ -6,7 +6,7 @@ This module provides the main implementation of the ServiceNow MCP server.
 
 import argparse
 import os
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
 import uvicorn
 from dotenv import load_dotenv
@@ -15,14 +15,32 @@ from mcp.server.fastmcp import FastMCP
 from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 from starlette.routing import Mount, Route
 
 from servicenow_mcp.server import ServiceNowMCP
-from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
-
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    MetricsConfig,
+    ServerConfig,
+    TracingConfig,
+)
+from servicenow_mcp.utils.metrics import ServerMetrics
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def create_starlette_app(
+    mcp_server: Server, *, debug: bool = False, metrics: Optional[ServerMetrics] = None
+) -> Starlette:
+    """
+    Create a Starlette application that can serve the provided mcp server with SSE.
 
-def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
-    """Create a Starlette application that can serve the provided mcp server with SSE."""
+    If enabled metrics are given, they are also served at /metrics for Prometheus.
+    """
     sse = SseServerTransport("/messages/")
 
     async def handle_sse(request: Request) -> None:
@@ -37,13 +55,17 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
                 mcp_server.create_initialization_options(),
             )
 
-    return Starlette(
-        debug=debug,
-        routes=[
-            Route("/sse", endpoint=handle_sse),
-            Mount("/messages/", app=sse.handle_post_message),
-        ],
-    )
+    async def handle_metrics(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(metrics.prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    routes = [
+        Route("/sse", endpoint=handle_sse),
+        Mount("/messages/", app=sse.handle_post_message),
+    ]
+    if metrics is not None and metrics.enabled:
+        routes.append(Route("/metrics", endpoint=handle_metrics))
+
+    return Starlette(debug=debug, routes=routes)
 
 
 class ServiceNowSSEMCP(ServiceNowMCP):
@@ -71,14 +93,19 @@ class ServiceNowSSEMCP(ServiceNowMCP):
             host: Host address to bind to
             port: Port to listen on
         """
+        if self.mirror_syncer is not None:
+            self.mirror_syncer.start()
+
         # Create Starlette app with SSE transport
-        starlette_app = create_starlette_app(self.mcp_server, debug=True)
+        starlette_app = create_starlette_app(self.mcp_server, debug=True, metrics=self.metrics)
 
         # Run using uvicorn
         uvicorn.run(starlette_app, host=host, port=port)
 
 
-def create_servicenow_mcp(instance_url: str, username: str, password: str):
+def create_servicenow_mcp(
+    instance_url: str, username: str, password: str, metrics: bool = False, tracing: bool = False
+):
     """
     Create a ServiceNow MCP server with minimal configuration.
 
@@ -89,6 +116,8 @@ def create_servicenow_mcp(instance_url: str, username: str, password: str):
         instance_url: ServiceNow instance URL
         username: ServiceNow username
         password: ServiceNow password
+        metrics: Record per-tool metrics and serve them at /metrics
+        tracing: Record OpenTelemetry spans (see TracingConfig for the exporter)
 
     Returns:
         A configured ServiceNowMCP instance ready to use
@@ -115,7 +144,16 @@ def create_servicenow_mcp(instance_url: str, username: str, password: str):
     )
 
     # Create server config
-    config = ServerConfig(instance_url=instance_url, auth=auth_config)
+    config = ServerConfig(
+        instance_url=instance_url,
+        auth=auth_config,
+        metrics=MetricsConfig(enabled=metrics),
+        tracing=TracingConfig(
+            enabled=tracing,
+            exporter=os.getenv("SERVICENOW_TRACING_EXPORTER", "otlp-file"),
+            file_path=os.getenv("SERVICENOW_TRACING_PATH", "~/.cache/servicenow-mcp/traces.jsonl"),
+        ),
+    )
 
     # Create and return server
     return ServiceNowSSEMCP(config)
@@ -128,12 +166,26 @@ def main():
     parser = argparse.ArgumentParser(description="Run ServiceNow MCP SSE-based server")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Record per-tool metrics and serve them at /metrics",
+        default=os.getenv("SERVICENOW_METRICS", "false").lower() == "true",
+    )
+    parser.add_argument(
+        "--tracing",
+        action="store_true",
+        help="Record OpenTelemetry spans of tool calls and ServiceNow requests",
+        default=os.getenv("SERVICENOW_TRACING", "false").lower() == "true",
+    )
     args = parser.parse_args()
 
     server = create_servicenow_mcp(
         instance_url=os.getenv("SERVICENOW_INSTANCE_URL"),
         username=os.getenv("SERVICENOW_USERNAME"),
         password=os.getenv("SERVICENOW_PASSWORD"),
+        metrics=args.metrics,
+        tracing=args.tracing,
     )
     server.start(host=args.host, port=args.port)
 
@@ -0,0 +1,15 @@
+"""
+Testing support for the ServiceNow MCP server.
+"""
+
+from servicenow_mcp.testing.mock_instance import (
+    MockInstance,
+    MockInstanceConfig,
+    serve_in_thread,
+)
+
+__all__ = [
+    "MockInstance",
+    "MockInstanceConfig",
+    "serve_in_thread",
+]
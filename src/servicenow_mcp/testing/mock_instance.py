@@ -0,0 +1,659 @@
+"""
+Mock ServiceNow instance.
+
+A local stand-in for the Table, Aggregate (stats) and Batch APIs of a
+ServiceNow instance, serving generated incidents, users, groups, catalog
+items, requested items and knowledge articles. It lets the server be run
+and benchmarked end to end without an instance: requests go over real HTTP,
+so connection pooling, serialization and transfer sizes are exercised.
+
+The data is generated from a seed, so runs are repeatable. Latency and
+errors can be injected per request, and the requests served and bytes
+transferred are counted (see MockInstance.stats, also served at
+``/_mock/stats``).
+
+Run standalone with::
+
+    python -m servicenow_mcp.testing.mock_instance --port 8089 --latency-ms 20
+
+or in a background thread with serve_in_thread. Any credentials are accepted.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import uvicorn
+from pydantic import BaseModel, Field
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from servicenow_mcp.utils.encoded_query import UnsupportedQueryError, parse
+
+DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Reference fields of the generated tables and the tables they point to
+REFERENCES: Dict[str, Dict[str, str]] = {
+    "incident": {
+        "caller_id": "sys_user",
+        "assigned_to": "sys_user",
+        "assignment_group": "sys_user_group",
+        "opened_by": "sys_user",
+    },
+    "sys_user": {"manager": "sys_user"},
+    "sys_user_group": {"manager": "sys_user"},
+    "sc_cat_item": {"category": "sc_category"},
+    "sc_req_item": {"cat_item": "sc_cat_item", "requested_for": "sys_user"},
+    "sc_cart_item": {"cat_item": "sc_cat_item"},
+    "kb_category": {"kb_knowledge_base": "kb_knowledge_base"},
+    "kb_knowledge": {
+        "kb_knowledge_base": "kb_knowledge_base",
+        "kb_category": "kb_category",
+        "author": "sys_user",
+    },
+}
+
+# Field shown as the display value of references to a table
+DISPLAY_FIELDS = {
+    "sys_user": "name",
+    "sys_user_group": "name",
+    "sc_category": "title",
+    "sc_cat_item": "name",
+    "kb_knowledge_base": "title",
+    "kb_category": "label",
+}
+
+# Labels of choice values
+_LEVELS = {"1": "1 - High", "2": "2 - Medium", "3": "3 - Low"}
+CHOICES: Dict[str, Dict[str, Dict[str, str]]] = {
+    "incident": {
+        "state": {
+            "1": "New",
+            "2": "In Progress",
+            "3": "On Hold",
+            "6": "Resolved",
+            "7": "Closed",
+            "8": "Canceled",
+        },
+        "priority": {
+            "1": "1 - Critical",
+            "2": "2 - High",
+            "3": "3 - Moderate",
+            "4": "4 - Low",
+            "5": "5 - Planning",
+        },
+        "impact": _LEVELS,
+        "urgency": _LEVELS,
+    },
+    "sc_req_item": {
+        "state": {
+            "1": "Open",
+            "2": "Work in Progress",
+            "3": "Closed Complete",
+            "4": "Closed Incomplete",
+        },
+    },
+    "kb_knowledge": {
+        "workflow_state": {"draft": "Draft", "published": "Published", "retired": "Retired"},
+    },
+}
+
+# Prefixes of the numbers given to new records
+NUMBER_PREFIXES = {
+    "incident": "INC",
+    "kb_knowledge": "KB",
+    "sc_request": "REQ",
+    "sc_req_item": "RITM",
+    "change_request": "CHG",
+    "problem": "PRB",
+}
+
+_WORDS = (
+    "email outlook vpn laptop printer password network server access account login "
+    "slow down error update install license monitor phone wifi database backup "
+    "portal report disk memory certificate browser meeting calendar share drive"
+).split()
+_FIRST_NAMES = "Abel Beth Carol David Fred Greta Hank Irene Jack Kate Luke Mia".split()
+_LAST_NAMES = "Tuter Anglin Loo Luddy Hudson Wong Bell Adams Ryan Stone".split()
+_DEPARTMENTS = ("IT", "Finance", "HR", "Sales", "Development")
+
+_TABLE_PATH = re.compile(r"/api/now/(?:v\d+/)?table/(?P<table>\w+)(?:/(?P<sys_id>\w+))?$")
+_STATS_PATH = re.compile(r"/api/now/(?:v\d+/)?stats/(?P<table>\w+)$")
+_BATCH_PATH = re.compile(r"/api/now/(?:v\d+/)?batch$")
+_VERSION = re.compile(r"v\d+")
+# Dot-walks to a reference's sys_id, e.g. kb_category.sys_id=..., compare the reference itself
+_SYS_ID_WALK = re.compile(r"\b(\w+)\.sys_id(?=[!=<>A-Z])")
+
+EMPTY = {"value": "", "display_value": ""}
+
+
+class MockInstanceConfig(BaseModel):
+    """Configuration of the mock instance: generated data, latency and errors."""
+
+    seed: int = Field(1, description="Seed of the generated data and of injected errors")
+    users: int = Field(200, ge=1, description="Number of generated users")
+    groups: int = Field(20, ge=1, description="Number of generated assignment groups")
+    incidents: int = Field(1000, ge=0, description="Number of generated incidents")
+    catalog_items: int = Field(200, ge=0, description="Number of generated catalog items")
+    requested_items: int = Field(1000, ge=0, description="Number of generated requested items")
+    articles: int = Field(500, ge=0, description="Number of generated knowledge articles")
+    latency_ms: float = Field(0.0, ge=0, description="Latency added to every API request")
+    latency_jitter_ms: float = Field(0.0, ge=0, description="Random extra latency, up to this much")
+    error_rate: float = Field(0.0, ge=0, le=1, description="Fraction of API requests that fail")
+    error_status: int = Field(503, description="HTTP status of injected errors")
+    epoch: datetime = Field(
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+        description="Time the generated data is as of; the instance's clock starts there",
+    )
+
+
+class _Record(dict):
+    """A stored record: fields as ``{"value", "display_value"}``, missing fields empty."""
+
+    def __missing__(self, key: str) -> Dict[str, str]:
+        return EMPTY
+
+
+class MockInstance:
+    """The mock instance: generated tables and the Starlette app serving them."""
+
+    def __init__(self, config: Optional[MockInstanceConfig] = None):
+        """
+        Initialize the mock instance and generate its data.
+
+        Args:
+            config: Mock configuration; the defaults if omitted.
+        """
+        self.config = config or MockInstanceConfig()
+        self.tables: Dict[str, Dict[str, _Record]] = {}
+        self.base_url = ""
+        self._rng = random.Random(self.config.seed)
+        self._error_rng = random.Random(self.config.seed)
+        self._numbers: Dict[str, int] = {}
+        # Generated timestamps count back from a fixed epoch rather than the
+        # current time, so that the same seed always generates the same records
+        self._epoch = self.config.epoch
+        if self._epoch.tzinfo is None:
+            self._epoch = self._epoch.replace(tzinfo=timezone.utc)
+        self._started: Optional[float] = None
+        self.stats: Dict[str, Any] = {}
+        self.reset_stats()
+        self._generate()
+        self._started = time.monotonic()
+        self.app = Starlette(
+            routes=[
+                Route("/_mock/stats", self._stats_endpoint, methods=["GET"]),
+                Route("/_mock/stats/reset", self._reset_stats_endpoint, methods=["POST"]),
+                Route(
+                    "/api/now/{path:path}",
+                    self._api_endpoint,
+                    methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+                ),
+            ]
+        )
+
+    # --- Data ---
+
+    def _sys_id(self) -> str:
+        return f"{self._rng.getrandbits(128):032x}"
+
+    def now(self) -> datetime:
+        """
+        Current time of the instance: the epoch while the data is generated, then
+        the epoch plus the time elapsed since. Relative dates in queries, such as
+        ``javascript:gs.daysAgoStart(7)``, are resolved against it.
+        """
+        if self._started is None:
+            return self._epoch
+        return self._epoch + timedelta(seconds=time.monotonic() - self._started)
+
+    def _timestamp(self, max_days_ago: int) -> str:
+        moment = self._epoch - timedelta(
+            seconds=self._rng.randint(0, max_days_ago * 86400)
+        )
+        return moment.strftime(DATE_TIME_FORMAT)
+
+    def _pick(self, table: str) -> str:
+        return self._rng.choice(list(self.tables[table]))
+
+    def _words(self, count: int) -> str:
+        return " ".join(self._rng.choice(_WORDS) for _ in range(count))
+
+    def _generate(self) -> None:
+        rng, config = self._rng, self.config
+        for i in range(config.users):
+            first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+            self.insert("sys_user", {
+                "user_name": f"{first}.{last}{i}".lower(),
+                "first_name": first,
+                "last_name": last,
+                "name": f"{first} {last}",
+                "email": f"{first}.{last}{i}@example.com".lower(),
+                "department": rng.choice(_DEPARTMENTS),
+                "active": "true" if rng.random() < 0.9 else "false",
+            })
+        for i in range(config.groups):
+            self.insert("sys_user_group", {
+                "name": f"{rng.choice(_DEPARTMENTS)} Support {i}",
+                "manager": self._pick("sys_user"),
+                "active": "true",
+            })
+        for i in range(config.incidents):
+            state = rng.choice(list(CHOICES["incident"]["state"]))
+            self.insert("incident", {
+                "short_description": self._words(4).capitalize(),
+                "description": self._words(30),
+                "state": state,
+                "active": "false" if state in ("6", "7", "8") else "true",
+                "priority": rng.choice("12345"),
+                "impact": rng.choice("123"),
+                "urgency": rng.choice("123"),
+                "category": rng.choice(("software", "hardware", "network", "inquiry")),
+                "caller_id": self._pick("sys_user"),
+                "opened_by": self._pick("sys_user"),
+                "assigned_to": self._pick("sys_user") if rng.random() < 0.7 else "",
+                "assignment_group": self._pick("sys_user_group"),
+                "opened_at": self._timestamp(180),
+            })
+
+        for title in ("Hardware", "Software", "Services", "Office"):
+            self.insert("sc_category", {"title": title, "active": "true"})
+        for i in range(config.catalog_items):
+            self.insert("sc_cat_item", {
+                "name": f"{self._words(2).title()} {i}",
+                "short_description": self._words(8),
+                "description": self._words(40),
+                "category": self._pick("sc_category"),
+                "price": f"{rng.randint(0, 2000)}.00",
+                "active": "true" if rng.random() < 0.9 else "false",
+                "order": str(i),
+            })
+        if config.catalog_items:
+            for _ in range(config.requested_items):
+                self.insert("sc_req_item", {
+                    "cat_item": self._pick("sc_cat_item"),
+                    "requested_for": self._pick("sys_user"),
+                    "state": rng.choice("1234"),
+                    "opened_at": self._timestamp(90),
+                })
+
+        for title in ("IT", "HR", "Facilities"):
+            self.insert("kb_knowledge_base", {"title": title, "active": "true"})
+        for kb in list(self.tables["kb_knowledge_base"]):
+            for label in ("How to", "Troubleshooting", "Policies"):
+                self.insert("kb_category", {"label": label, "kb_knowledge_base": kb})
+        for _ in range(config.articles):
+            category = self.tables["kb_category"][self._pick("kb_category")]
+            paragraphs = "".join(f"<p>{self._words(40)}.</p>" for _ in range(5))
+            self.insert("kb_knowledge", {
+                "short_description": self._words(5).capitalize(),
+                "text": paragraphs,
+                "keywords": self._words(3),
+                "kb_knowledge_base": category["kb_knowledge_base"]["value"],
+                "kb_category": category["sys_id"]["value"],
+                "author": self._pick("sys_user"),
+                "workflow_state": rng.choice(("published", "published", "draft", "retired")),
+                "view_count": str(rng.randint(0, 5000)),
+            })
+
+    def _field(self, table: str, name: str, value: Any) -> Dict[str, str]:
+        """Store a written value with its display value."""
+        if isinstance(value, dict):
+            value = value.get("value", "")
+        value = "" if value is None else str(value)
+        display = value
+        reference = REFERENCES.get(table, {}).get(name)
+        if reference and value:
+            target = self.tables.get(reference, {}).get(value)
+            if target is not None:
+                display = target[DISPLAY_FIELDS.get(reference, "number")]["value"]
+        choices = CHOICES.get(table, {}).get(name)
+        if choices:
+            display = choices.get(value, value)
+        return {"value": value, "display_value": display}
+
+    def insert(self, table: str, values: Dict[str, Any]) -> _Record:
+        """Create a record, as a POST to the Table API would, and return it."""
+        now = self.now().strftime(DATE_TIME_FORMAT)
+        record = _Record()
+        sys_id = str(values.get("sys_id") or self._sys_id())
+        record["sys_id"] = {"value": sys_id, "display_value": sys_id}
+        if table in NUMBER_PREFIXES:
+            self._numbers[table] = self._numbers.get(table, 0) + 1
+            number = f"{NUMBER_PREFIXES[table]}{self._numbers[table]:07d}"
+            record["number"] = {"value": number, "display_value": number}
+        for name in ("sys_created_on", "sys_updated_on"):
+            record[name] = {"value": now, "display_value": now}
+        for name in ("sys_created_by", "sys_updated_by"):
+            record[name] = {"value": "admin", "display_value": "admin"}
+        for name, value in values.items():
+            if name != "sys_id":
+                record[name] = self._field(table, name, value)
+        self.tables.setdefault(table, {})[sys_id] = record
+        return record
+
+    def update(self, table: str, sys_id: str, values: Dict[str, Any]) -> Optional[_Record]:
+        """Update a record, as a PATCH to the Table API would. None if it does not exist."""
+        record = self.tables.get(table, {}).get(sys_id)
+        if record is None:
+            return None
+        for name, value in values.items():
+            if name not in ("sys_id", "number"):
+                record[name] = self._field(table, name, value)
+        now = self.now().strftime(DATE_TIME_FORMAT)
+        record["sys_updated_on"] = {"value": now, "display_value": now}
+        return record
+
+    def records(self, table: str) -> List[_Record]:
+        """The records of a table, in insertion order."""
+        return list(self.tables.get(table, {}).values())
+
+    # --- Table and Aggregate APIs ---
+
+    def _select(self, table: str, query: Optional[str]) -> List[_Record]:
+        """Records of a table matching an encoded query, in the query's order."""
+        parsed = parse(
+            _SYS_ID_WALK.sub(r"\1", query or ""), now=self.now().replace(tzinfo=None)
+        )
+        matches = parsed.predicate()
+        return parsed.sort([record for record in self.records(table) if matches(record)])
+
+    def _render_value(
+        self, table: str, record: _Record, name: str, display: str, links: bool
+    ) -> Any:
+        if "." in name:
+            reference, _, rest = name.partition(".")
+            target_table = REFERENCES.get(table, {}).get(reference)
+            target = self.tables.get(target_table or "", {}).get(record[reference]["value"])
+            if target is None:
+                return "" if display != "all" else dict(EMPTY)
+            return self._render_value(target_table, target, rest, display, False)
+
+        field = record[name]
+        rendered: Any
+        if display == "all":
+            rendered = dict(field)
+        else:
+            rendered = field["display_value" if display == "true" else "value"]
+        reference = REFERENCES.get(table, {}).get(name)
+        if links and reference and field["value"]:
+            link = f"{self.base_url}/api/now/table/{reference}/{field['value']}"
+            if isinstance(rendered, dict):
+                rendered["link"] = link
+            else:
+                key = "display_value" if display == "true" else "value"
+                rendered = {key: rendered, "link": link}
+        return rendered
+
+    def render(self, table: str, record: _Record, params: Dict[str, str]) -> Dict[str, Any]:
+        """Shape a record as the Table API returns it for the given sysparm parameters."""
+        display = params.get("sysparm_display_value", "false").lower()
+        links = params.get("sysparm_exclude_reference_link", "false").lower() != "true"
+        fields = [f for f in params.get("sysparm_fields", "").split(",") if f] or list(record)
+        return {name: self._render_value(table, record, name, display, links) for name in fields}
+
+    def _table(
+        self, method: str, table: str, sys_id: Optional[str], params: Dict[str, str], body: Any
+    ) -> Tuple[int, Any, Dict[str, str]]:
+        if method == "GET" and sys_id is None:
+            records = self._select(table, params.get("sysparm_query"))
+            offset = int(params.get("sysparm_offset") or 0)
+            limit = int(params.get("sysparm_limit") or 10000)
+            page = records[offset : offset + limit]
+            result = [self.render(table, record, params) for record in page]
+            return 200, {"result": result}, {"X-Total-Count": str(len(records))}
+
+        if method == "POST" and sys_id is None:
+            record = self.insert(table, body or {})
+            return 201, {"result": self.render(table, record, params)}, {}
+
+        if sys_id is None:
+            return 405, _error("Method not allowed"), {}
+        if method == "GET":
+            record = self.tables.get(table, {}).get(sys_id)
+        elif method in ("PATCH", "PUT"):
+            record = self.update(table, sys_id, body or {})
+        elif method == "DELETE":
+            record = self.tables.get(table, {}).pop(sys_id, None)
+            if record is not None:
+                return 204, None, {}
+        else:
+            return 405, _error("Method not allowed"), {}
+        if record is None:
+            return 404, _error("No Record found", "Record doesn't exist or ACL restricts"), {}
+        return 200, {"result": self.render(table, record, params)}, {}
+
+    def _stats(self, table: str, params: Dict[str, str]) -> Tuple[int, Any, Dict[str, str]]:
+        records = self._select(table, params.get("sysparm_query"))
+        group_by = [f for f in params.get("sysparm_group_by", "").split(",") if f]
+
+        groups: Dict[Tuple[str, ...], List[_Record]] = {}
+        for record in records:
+            groups.setdefault(tuple(record[f]["value"] for f in group_by), []).append(record)
+        if not group_by:
+            groups = {(): records}
+
+        results = []
+        for key, members in groups.items():
+            stats: Dict[str, Any] = {}
+            if params.get("sysparm_count", "false").lower() == "true":
+                stats["count"] = str(len(members))
+            for aggregate in ("avg", "sum", "min", "max"):
+                names = params.get(f"sysparm_{aggregate}_fields", "").split(",")
+                for name in filter(None, names):
+                    stats.setdefault(aggregate, {})[name] = _aggregate(aggregate, members, name)
+            group: Dict[str, Any] = {"stats": stats}
+            if group_by:
+                group["groupby_fields"] = [
+                    {
+                        "field": name,
+                        "value": members[0][name]["value"],
+                        "display_value": members[0][name]["display_value"],
+                    }
+                    for name in group_by
+                ]
+            results.append(group)
+        return 200, {"result": results if group_by else results[0]}, {}
+
+    def _batch(self, body: Any) -> Tuple[int, Any, Dict[str, str]]:
+        serviced = []
+        for rest_request in (body or {}).get("rest_requests", []):
+            start = time.perf_counter()
+            url = urlsplit(rest_request.get("url", ""))
+            encoded = rest_request.get("body")
+            sub_body = json.loads(base64.b64decode(encoded)) if encoded else None
+            status, payload, _ = self.handle(
+                rest_request.get("method", "GET").upper(),
+                url.path,
+                dict(parse_qsl(url.query)),
+                sub_body,
+            )
+            serviced.append({
+                "id": rest_request.get("id"),
+                "status_code": status,
+                "status_text": "OK" if status < 400 else "Error",
+                "headers": [{"name": "Content-Type", "value": "application/json"}],
+                "body": base64.b64encode(json.dumps(payload).encode()).decode()
+                if payload is not None
+                else "",
+                "execution_time": round((time.perf_counter() - start) * 1000),
+            })
+        return 200, {
+            "batch_request_id": (body or {}).get("batch_request_id"),
+            "serviced_requests": serviced,
+            "unserviced_requests": [],
+        }, {}
+
+    def handle(
+        self, method: str, path: str, params: Dict[str, str], body: Any = None
+    ) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Serve one REST API call.
+
+        Returns:
+            Tuple[int, Any, Dict[str, str]]: Status code, JSON payload (None for no
+            content) and response headers.
+        """
+        try:
+            match = _TABLE_PATH.match(path)
+            if match:
+                return self._table(method, match["table"], match["sys_id"], params, body)
+            match = _STATS_PATH.match(path)
+            if match and method == "GET":
+                return self._stats(match["table"], params)
+            if _BATCH_PATH.match(path) and method == "POST":
+                return self._batch(body)
+        except UnsupportedQueryError as e:
+            return 400, _error("Unsupported query", str(e)), {}
+        except (TypeError, ValueError) as e:
+            return 400, _error("Invalid request", str(e)), {}
+        return 400, _error("Requested URI does not represent any resource", path), {}
+
+    # --- HTTP ---
+
+    def reset_stats(self) -> None:
+        """Zero the request and byte counters."""
+        self.stats = {
+            "requests": 0,
+            "errors_injected": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "by_api": {},
+        }
+
+    def _count(self, api: str, bytes_in: int, bytes_out: int) -> None:
+        self.stats["requests"] += 1
+        self.stats["bytes_in"] += bytes_in
+        self.stats["bytes_out"] += bytes_out
+        by_api = self.stats["by_api"].setdefault(api, {"requests": 0, "bytes_out": 0})
+        by_api["requests"] += 1
+        by_api["bytes_out"] += bytes_out
+
+    async def _api_endpoint(self, request: Request) -> Response:
+        if not self.base_url:
+            self.base_url = str(request.base_url).rstrip("/")
+        raw_body = await request.body()
+        path = request.url.path
+        api = next(part for part in path.split("/")[3:] + [""] if not _VERSION.fullmatch(part))
+
+        delay = self.config.latency_ms + self._error_rng.random() * self.config.latency_jitter_ms
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if self.config.error_rate and self._error_rng.random() < self.config.error_rate:
+            self.stats["errors_injected"] += 1
+            response: Response = JSONResponse(
+                _error("Injected error"), status_code=self.config.error_status
+            )
+        else:
+            try:
+                body = json.loads(raw_body) if raw_body else None
+            except ValueError:
+                body = None
+            status, payload, headers = self.handle(
+                request.method, path, dict(request.query_params), body
+            )
+            if payload is None:
+                response = Response(status_code=status, headers=headers)
+            else:
+                response = JSONResponse(payload, status_code=status, headers=headers)
+        self._count(api, len(raw_body), len(response.body))
+        return response
+
+    async def _stats_endpoint(self, request: Request) -> Response:
+        return JSONResponse(self.stats)
+
+    async def _reset_stats_endpoint(self, request: Request) -> Response:
+        self.reset_stats()
+        return Response(status_code=204)
+
+
+def _error(message: str, detail: str = "") -> Dict[str, Any]:
+    return {"error": {"message": message, "detail": detail}, "status": "failure"}
+
+
+def _aggregate(aggregate: str, records: List[_Record], name: str) -> str:
+    numbers = []
+    for record in records:
+        try:
+            numbers.append(float(record[name]["value"]))
+        except ValueError:
+            continue
+    if not numbers:
+        return ""
+    value = {
+        "avg": lambda: sum(numbers) / len(numbers),
+        "sum": lambda: sum(numbers),
+        "min": lambda: min(numbers),
+        "max": lambda: max(numbers),
+    }[aggregate]()
+    return str(int(value)) if aggregate != "avg" and value.is_integer() else f"{value:.4f}"
+
+
+@contextmanager
+def serve_in_thread(
+    instance: MockInstance, host: str = "127.0.0.1", port: int = 0
+) -> Iterator[str]:
+    """
+    Serve a mock instance with uvicorn in a background thread.
+
+    Args:
+        instance: The mock instance to serve.
+        host: Address to listen on.
+        port: Port to listen on; a free one by default.
+
+    Yields:
+        str: The instance URL, e.g. ``http://127.0.0.1:50123``.
+    """
+    server = uvicorn.Server(
+        uvicorn.Config(instance.app, host=host, port=port, log_level="warning", lifespan="off")
+    )
+    thread = threading.Thread(target=server.run, name="mock-instance", daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError("Mock instance failed to start")
+        time.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    instance.base_url = f"http://{host}:{bound_port}"
+    try:
+        yield instance.base_url
+    finally:
+        server.should_exit = True
+        thread.join(10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a mock ServiceNow instance")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
+    parser.add_argument("--port", type=int, default=8089, help="Port to listen on")
+    for name, field in MockInstanceConfig.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+            help=field.description,
+        )
+    args = parser.parse_args()
+
+    config = MockInstanceConfig(
+        **{name: getattr(args, name) for name in MockInstanceConfig.model_fields}
+    )
+    instance = MockInstance(config)
+    instance.base_url = f"http://{args.host}:{args.port}"
+    uvicorn.run(instance.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,118 +2,100 @@
 Tools module for the ServiceNow MCP server.
 """
 
-# Import tools as they are implemented
-from servicenow_mcp.tools.catalog_optimization import (
-    get_optimization_recommendations,
-    update_catalog_item,
-)
-from servicenow_mcp.tools.catalog_tools import (
-    create_catalog_category,
-    get_catalog_item,
-    list_catalog_categories,
-    list_catalog_items,
-    move_catalog_items,
-    update_catalog_category,
-)
-from servicenow_mcp.tools.catalog_variables import (
-    create_catalog_item_variable,
-    list_catalog_item_variables,
-    update_catalog_item_variable,
-)
-from servicenow_mcp.tools.change_tools import (
-    add_change_task,
-    approve_change,
-    create_change_request,
-    get_change_request_details,
-    list_change_requests,
-    reject_change,
-    submit_change_for_approval,
-    update_change_request,
-)
-from servicenow_mcp.tools.changeset_tools import (
-    add_file_to_changeset,
-    commit_changeset,
-    create_changeset,
-    get_changeset_details,
-    list_changesets,
-    publish_changeset,
-    update_changeset,
-)
-from servicenow_mcp.tools.incident_tools import (
-    add_comment,
-    create_incident,
-    list_incidents,
-    resolve_incident,
-    update_incident,
-)
-from servicenow_mcp.tools.knowledge_base import (
-    create_article,
-    create_category,
-    create_knowledge_base,
-    get_article,
-    list_articles,
-    list_knowledge_bases,
-    publish_article,
-    update_article,
-    list_categories,
-)
-from servicenow_mcp.tools.script_include_tools import (
-    create_script_include,
-    delete_script_include,
-    get_script_include,
-    list_script_includes,
-    update_script_include,
-)
-from servicenow_mcp.tools.user_tools import (
-    create_user,
-    update_user,
-    get_user,
-    list_users,
-    create_group,
-    update_group,
-    add_group_members,
-    remove_group_members,
-    list_groups,
-)
-from servicenow_mcp.tools.workflow_tools import (
-    activate_workflow,
-    add_workflow_activity,
-    create_workflow,
-    deactivate_workflow,
-    delete_workflow_activity,
-    get_workflow_activities,
-    get_workflow_details,
-    list_workflow_versions,
-    list_workflows,
-    reorder_workflow_activities,
-    update_workflow,
-    update_workflow_activity,
-)
-from servicenow_mcp.tools.story_tools import (
-    create_story,
-    update_story,
-    list_stories,
-    list_story_dependencies,
-    create_story_dependency,
-    delete_story_dependency,
-)
-from servicenow_mcp.tools.epic_tools import (
-    create_epic,
-    update_epic,
-    list_epics,
-)
-from servicenow_mcp.tools.scrum_task_tools import (
-    create_scrum_task,
-    update_scrum_task,
-    list_scrum_tasks,
-)
-from servicenow_mcp.tools.project_tools import (
-    create_project,
-    update_project,
-    list_projects,
-)
-# from servicenow_mcp.tools.problem_tools import create_problem, update_problem
-# from servicenow_mcp.tools.request_tools import create_request, update_request
+import importlib
+from typing import Any, List
+
+# Tools are imported on first access, so that importing this package does not
+# import every tool module: the server loads only those of its tool package
+_TOOL_MODULES = {
+    "get_optimization_recommendations": "catalog_optimization",
+    "update_catalog_item": "catalog_optimization",
+    "create_catalog_category": "catalog_tools",
+    "get_catalog_item": "catalog_tools",
+    "list_catalog_categories": "catalog_tools",
+    "list_catalog_items": "catalog_tools",
+    "move_catalog_items": "catalog_tools",
+    "update_catalog_category": "catalog_tools",
+    "create_catalog_item_variable": "catalog_variables",
+    "list_catalog_item_variables": "catalog_variables",
+    "update_catalog_item_variable": "catalog_variables",
+    "add_change_task": "change_tools",
+    "approve_change": "change_tools",
+    "create_change_request": "change_tools",
+    "get_change_request_details": "change_tools",
+    "list_change_requests": "change_tools",
+    "reject_change": "change_tools",
+    "submit_change_for_approval": "change_tools",
+    "update_change_request": "change_tools",
+    "add_file_to_changeset": "changeset_tools",
+    "commit_changeset": "changeset_tools",
+    "create_changeset": "changeset_tools",
+    "get_changeset_details": "changeset_tools",
+    "list_changesets": "changeset_tools",
+    "publish_changeset": "changeset_tools",
+    "update_changeset": "changeset_tools",
+    "aggregate_table": "generic_tools",
+    "add_comment": "incident_tools",
+    "create_incident": "incident_tools",
+    "list_incidents": "incident_tools",
+    "resolve_incident": "incident_tools",
+    "update_incident": "incident_tools",
+    "create_article": "knowledge_base",
+    "create_category": "knowledge_base",
+    "create_knowledge_base": "knowledge_base",
+    "get_article": "knowledge_base",
+    "list_articles": "knowledge_base",
+    "list_knowledge_bases": "knowledge_base",
+    "publish_article": "knowledge_base",
+    "search_articles": "knowledge_base",
+    "update_article": "knowledge_base",
+    "list_categories": "knowledge_base",
+    "create_script_include": "script_include_tools",
+    "delete_script_include": "script_include_tools",
+    "get_script_include": "script_include_tools",
+    "list_script_includes": "script_include_tools",
+    "update_script_include": "script_include_tools",
+    "create_user": "user_tools",
+    "update_user": "user_tools",
+    "get_user": "user_tools",
+    "list_users": "user_tools",
+    "create_group": "user_tools",
+    "update_group": "user_tools",
+    "add_group_members": "user_tools",
+    "remove_group_members": "user_tools",
+    "list_groups": "user_tools",
+    "activate_workflow": "workflow_tools",
+    "add_workflow_activity": "workflow_tools",
+    "create_workflow": "workflow_tools",
+    "deactivate_workflow": "workflow_tools",
+    "delete_workflow_activity": "workflow_tools",
+    "get_workflow_activities": "workflow_tools",
+    "get_workflow_details": "workflow_tools",
+    "list_workflow_versions": "workflow_tools",
+    "list_workflows": "workflow_tools",
+    "reorder_workflow_activities": "workflow_tools",
+    "update_workflow": "workflow_tools",
+    "update_workflow_activity": "workflow_tools",
+    "create_story": "story_tools",
+    "update_story": "story_tools",
+    "list_stories": "story_tools",
+    "list_story_dependencies": "story_tools",
+    "create_story_dependency": "story_tools",
+    "delete_story_dependency": "story_tools",
+    "create_epic": "epic_tools",
+    "update_epic": "epic_tools",
+    "list_epics": "epic_tools",
+    "create_scrum_task": "scrum_task_tools",
+    "update_scrum_task": "scrum_task_tools",
+    "list_scrum_tasks": "scrum_task_tools",
+    "create_project": "project_tools",
+    "update_project": "project_tools",
+    "list_projects": "project_tools",
+    # "create_problem": "problem_tools",
+    # "update_problem": "problem_tools",
+    # "create_request": "request_tools",
+    # "update_request": "request_tools",
+}
 
 __all__ = [
     # Incident tools
@@ -123,6 +105,9 @@ __all__ = [
     "resolve_incident",
     "list_incidents",
     
+    # Generic table tools
+    "aggregate_table",
+    
     # Catalog tools
     "list_catalog_items",
     "get_catalog_item",
@@ -186,6 +171,7 @@ __all__ = [
     "publish_article",
     "list_articles",
     "get_article",
+    "search_articles",
     
     # User management tools
     "create_user",
@@ -227,4 +213,17 @@ __all__ = [
     # "update_problem",
     # "create_request",
     # "update_request",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_TOOL_MODULES))
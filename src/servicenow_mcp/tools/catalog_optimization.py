@@ -4,27 +4,70 @@ Tools for optimizing the ServiceNow Service Catalog.
 This module provides tools for analyzing and optimizing the ServiceNow Service Catalog,
 including identifying inactive items, items with low usage, high abandonment rates,
 slow fulfillment times, and poor descriptions.
+
+Usage, abandonment and fulfilment are measured from the instance's request and
+cart data with the Aggregate API, so the cost of an analysis does not grow with
+the number of requests. The metrics of a category are cached in the reference
+cache (table "catalog_metrics") and shared by the analyses.
 """
 
 import logging
-import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.generic_tools import (
+    AggregateTableParams,
+    QueryTableParams,
+    aggregate_table,
+    iter_table_records,
+)
+from servicenow_mcp.utils.cache import get_reference_cache
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.metrics import bind_current_call
 
 logger = logging.getLogger(__name__)
 
+# Reference cache "table" holding the catalog metrics, keyed by category
+METRICS_CACHE_TABLE = "catalog_metrics"
+# Orders, carts and fulfilments are analysed over this many days
+ANALYSIS_DAYS = 90
+# Items ordered at most this many times in the analysis window have low usage
+LOW_USAGE_MAX_ORDERS = 5
+# Abandonment rate (percent of cart adds) from which an item is reported
+HIGH_ABANDONMENT_RATE = 40
+MIN_CART_ADDS = 5
+# Items fulfilled this many times slower than the catalog average are reported
+SLOW_FULFILLMENT_RATIO = 1.5
+MIN_CLOSED_REQUESTS = 3
+MAX_RECOMMENDED_ITEMS = 20
+
+# Serialize metrics fetches per (instance, category) so concurrent analyses share one
+_metrics_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_metrics_locks_guard = threading.Lock()
+
 
 class OptimizationRecommendationsParams(BaseModel):
     """Parameters for getting optimization recommendations."""
 
     recommendation_types: List[str]
     category_id: Optional[str] = None
+    timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        description=(
+            "Seconds to wait for the analyses, which run concurrently. Analyses still "
+            "running are reported in timed_out. Defaults to the server request timeout."
+        ),
+    )
 
 
 class UpdateCatalogItemParams(BaseModel):
@@ -40,98 +83,124 @@ class UpdateCatalogItemParams(BaseModel):
     order: Optional[int] = None
 
 
+# Presentation of each recommendation type
+RECOMMENDATIONS = {
+    "inactive_items": {
+        "title": "Inactive Catalog Items",
+        "description": "Items that are currently inactive in the catalog",
+        "impact": "medium",
+        "effort": "low",
+        "action": "Review and either update or remove these items",
+    },
+    "low_usage": {
+        "title": "Low Usage Catalog Items",
+        "description": "Items that have very few orders",
+        "impact": "medium",
+        "effort": "medium",
+        "action": "Consider promoting these items or removing them if no longer needed",
+    },
+    "high_abandonment": {
+        "title": "High Abandonment Rate Items",
+        "description": "Items that are frequently added to cart but not ordered",
+        "impact": "high",
+        "effort": "medium",
+        "action": "Simplify the request process or improve the item description",
+    },
+    "slow_fulfillment": {
+        "title": "Slow Fulfillment Items",
+        "description": "Items that take longer than average to fulfill",
+        "impact": "high",
+        "effort": "high",
+        "action": "Review the fulfillment process and identify bottlenecks",
+    },
+    "description_quality": {
+        "title": "Poor Description Quality",
+        "description": "Items with missing, short, or low-quality descriptions",
+        "impact": "medium",
+        "effort": "low",
+        "action": "Improve the descriptions to better explain the item's purpose and benefits",
+    },
+}
+
+
+def _analyses() -> Dict[str, Callable[..., List[Dict]]]:
+    """Map each recommendation type to the analysis finding its items."""
+    return {
+        "inactive_items": _get_inactive_items,
+        "low_usage": _get_low_usage_items,
+        "high_abandonment": _get_high_abandonment_items,
+        "slow_fulfillment": _get_slow_fulfillment_items,
+        "description_quality": _get_poor_description_items,
+    }
+
+
+def _timed(analysis: Callable[..., List[Dict]], *args) -> Tuple[List[Dict], float]:
+    """Run an analysis and measure its duration in seconds."""
+    start = time.perf_counter()
+    items = analysis(*args)
+    return items, time.perf_counter() - start
+
+
 def get_optimization_recommendations(
     config: ServerConfig, auth_manager: AuthManager, params: OptimizationRecommendationsParams
 ) -> Dict:
     """
     Get optimization recommendations for the ServiceNow Service Catalog.
 
+    The requested analyses run concurrently under a shared deadline. Analyses
+    still running when it expires are listed in ``timed_out`` and the
+    recommendations of the others are returned.
+
     Args:
         config: The server configuration
         auth_manager: The authentication manager
         params: The parameters for getting optimization recommendations
 
     Returns:
-        A dictionary containing the optimization recommendations
+        A dictionary containing the optimization recommendations and the
+        duration of each analysis in seconds
     """
     logger.info("Getting catalog optimization recommendations")
-    
+
+    analyses = _analyses()
+    rec_types = [
+        rec_type for rec_type in dict.fromkeys(params.recommendation_types) if rec_type in analyses
+    ]
+    if not rec_types:
+        return {"success": True, "recommendations": [], "timings": {}, "timed_out": []}
+    deadline = params.timeout if params.timeout is not None else config.timeout
+
     recommendations = []
-    category_id = params.category_id
-    
+    timings: Dict[str, float] = {}
+    timed_out: List[str] = []
+
+    executor = ThreadPoolExecutor(
+        max_workers=len(rec_types), thread_name_prefix="catalog-optimization"
+    )
     try:
-        # Get recommendations based on the requested types
-        for rec_type in params.recommendation_types:
-            if rec_type == "inactive_items":
-                items = _get_inactive_items(config, auth_manager, category_id)
-                if items:
-                    recommendations.append({
-                        "type": "inactive_items",
-                        "title": "Inactive Catalog Items",
-                        "description": "Items that are currently inactive in the catalog",
-                        "items": items,
-                        "impact": "medium",
-                        "effort": "low",
-                        "action": "Review and either update or remove these items",
-                    })
-            
-            elif rec_type == "low_usage":
-                items = _get_low_usage_items(config, auth_manager, category_id)
-                if items:
-                    recommendations.append({
-                        "type": "low_usage",
-                        "title": "Low Usage Catalog Items",
-                        "description": "Items that have very few orders",
-                        "items": items,
-                        "impact": "medium",
-                        "effort": "medium",
-                        "action": "Consider promoting these items or removing them if no longer needed",
-                    })
-            
-            elif rec_type == "high_abandonment":
-                items = _get_high_abandonment_items(config, auth_manager, category_id)
-                if items:
-                    recommendations.append({
-                        "type": "high_abandonment",
-                        "title": "High Abandonment Rate Items",
-                        "description": "Items that are frequently added to cart but not ordered",
-                        "items": items,
-                        "impact": "high",
-                        "effort": "medium",
-                        "action": "Simplify the request process or improve the item description",
-                    })
-            
-            elif rec_type == "slow_fulfillment":
-                items = _get_slow_fulfillment_items(config, auth_manager, category_id)
-                if items:
-                    recommendations.append({
-                        "type": "slow_fulfillment",
-                        "title": "Slow Fulfillment Items",
-                        "description": "Items that take longer than average to fulfill",
-                        "items": items,
-                        "impact": "high",
-                        "effort": "high",
-                        "action": "Review the fulfillment process and identify bottlenecks",
-                    })
-            
-            elif rec_type == "description_quality":
-                items = _get_poor_description_items(config, auth_manager, category_id)
-                if items:
-                    recommendations.append({
-                        "type": "description_quality",
-                        "title": "Poor Description Quality",
-                        "description": "Items with missing, short, or low-quality descriptions",
-                        "items": items,
-                        "impact": "medium",
-                        "effort": "low",
-                        "action": "Improve the descriptions to better explain the item's purpose and benefits",
-                    })
-        
-        return {
-            "success": True,
-            "recommendations": recommendations,
+        futures = {
+            rec_type: executor.submit(
+                bind_current_call(_timed),
+                analyses[rec_type],
+                config,
+                auth_manager,
+                params.category_id,
+            )
+            for rec_type in rec_types
         }
-    
+        wait(futures.values(), timeout=deadline)
+
+        for rec_type, future in futures.items():
+            if not future.done():
+                timed_out.append(rec_type)
+                continue
+            items, elapsed = future.result()
+            timings[rec_type] = round(elapsed, 3)
+            if items:
+                recommendations.append(
+                    {"type": rec_type, **RECOMMENDATIONS[rec_type], "items": items}
+                )
+
     except Exception as e:
         logger.error(f"Error getting optimization recommendations: {e}")
         return {
@@ -140,6 +209,20 @@ def get_optimization_recommendations(
             "recommendations": [],
         }
 
+    finally:
+        # Analyses past the deadline finish in the background; their results are dropped
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if timed_out:
+        logger.warning(f"Catalog analyses timed out after {deadline}s: {', '.join(timed_out)}")
+
+    return {
+        "success": True,
+        "recommendations": recommendations,
+        "timings": timings,
+        "timed_out": timed_out,
+    }
+
 
 def update_catalog_item(
     config: ServerConfig, auth_manager: AuthManager, params: UpdateCatalogItemParams
@@ -180,8 +263,9 @@ def update_catalog_item(
         headers = auth_manager.get_headers()
         headers["Content-Type"] = "application/json"
         
-        response = requests.patch(url, headers=headers, json=body)
+        response = get_http_client(auth_manager).patch(url, headers=headers, json=body)
         response.raise_for_status()
+        get_reference_cache(config, auth_manager).invalidate(METRICS_CACHE_TABLE)
         
         return {
             "success": True,
@@ -227,7 +311,9 @@ def _get_inactive_items(
             "sysparm_limit": "50",
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(
+            url, headers=headers, params=params, timeout=config.timeout
+        )
         response.raise_for_status()
         
         return response.json()["result"]
@@ -237,6 +323,163 @@ def _get_inactive_items(
         return []
 
 
+def _duration_days(value) -> Optional[float]:
+    """
+    Convert an averaged duration field to days.
+
+    The Aggregate API reports duration averages as a date-time offset from the
+    epoch ("1970-01-03 12:00:00" is 2.5 days); plain numbers are seconds.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return value / 86400
+    try:
+        offset = datetime.strptime(value, "%Y-%m-%d %H:%M:%S") - datetime(1970, 1, 1)
+    except (TypeError, ValueError):
+        logger.warning(f"Unexpected duration value: {value!r}")
+        return None
+    return offset.total_seconds() / 86400
+
+
+def _aggregate_by_item(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    table: str,
+    query: str,
+    avg_fields: Optional[List[str]] = None,
+) -> Dict[str, List]:
+    """Run one Aggregate API query grouped by catalog item; map item sys_id to its stats."""
+    result = aggregate_table(
+        config,
+        auth_manager,
+        AggregateTableParams(
+            table_name=table,
+            query=query,
+            group_by=["cat_item"],
+            avg_fields=avg_fields,
+            display_value=False,
+        ),
+    )
+    if not result["success"]:
+        raise requests.RequestException(result["message"])
+    return {row[0]: row[1:] for row in result["rows"] if row[0]}
+
+
+def _fetch_catalog_metrics(
+    config: ServerConfig, auth_manager: AuthManager, category_id: Optional[str] = None
+) -> Dict:
+    """
+    Compute the usage metrics of every active catalog item.
+
+    Makes one paged catalog fetch and three Aggregate API requests (orders and
+    fulfilment durations from sc_req_item, abandoned carts from sc_cart_item),
+    whatever the number of items, then derives the metrics of all items in a
+    single pass.
+
+    Raises:
+        requests.RequestException: If the catalog or a statistic cannot be fetched.
+    """
+    item_query = "active=true"
+    request_query = f"sys_created_on>=javascript:gs.daysAgoStart({ANALYSIS_DAYS})"
+    if category_id:
+        item_query += f"^category={category_id}"
+        request_query += f"^cat_item.category={category_id}"
+
+    items = iter_table_records(
+        config,
+        auth_manager,
+        QueryTableParams(
+            table_name="sc_cat_item",
+            query=item_query,
+            fields=["sys_id", "name", "short_description", "category"],
+            page_size=1000,
+            max_rows=None,
+            pagination="keyset",
+        ),
+    )
+    orders = _aggregate_by_item(config, auth_manager, "sc_req_item", request_query)
+    fulfilments = _aggregate_by_item(
+        config,
+        auth_manager,
+        "sc_req_item",
+        f"{request_query}^active=false^closed_atISNOTEMPTY",
+        avg_fields=["calendar_duration"],
+    )
+    # Items still sitting in a cart a day after they were added were abandoned; only
+    # carts of the same window as the orders count, so that the rate compares like with like
+    cart_query = (
+        f"sys_updated_on>=javascript:gs.daysAgoStart({ANALYSIS_DAYS})"
+        "^sys_updated_on<javascript:gs.daysAgoStart(1)"
+    )
+    if category_id:
+        cart_query += f"^cat_item.category={category_id}"
+    abandoned = _aggregate_by_item(config, auth_manager, "sc_cart_item", cart_query)
+
+    durations = {}
+    total_days = 0.0
+    total_closed = 0
+    for sys_id, (closed, avg_duration) in fulfilments.items():
+        days = _duration_days(avg_duration)
+        if days is not None and closed:
+            durations[sys_id] = (closed, days)
+            total_days += days * closed
+            total_closed += closed
+    catalog_avg = total_days / total_closed if total_closed else None
+
+    metrics = []
+    for item in items:
+        sys_id = item.get("sys_id")
+        order_count = orders.get(sys_id, [0])[0]
+        abandoned_carts = abandoned.get(sys_id, [0])[0]
+        cart_adds = order_count + abandoned_carts
+        closed, days = durations.get(sys_id, (0, None))
+
+        item["order_count"] = order_count
+        item["cart_adds"] = cart_adds
+        item["abandonment_rate"] = (
+            round(abandoned_carts / cart_adds * 100) if cart_adds else None
+        )
+        item["closed_count"] = closed
+        item["avg_fulfillment_time"] = round(days, 1) if days is not None else None
+        item["avg_fulfillment_time_vs_catalog"] = (
+            round(days / catalog_avg, 1) if days is not None and catalog_avg else None
+        )
+        metrics.append(item)
+
+    return {
+        "items": metrics,
+        "catalog_avg_fulfillment_time": round(catalog_avg, 1) if catalog_avg else None,
+    }
+
+
+def _get_catalog_metrics(
+    config: ServerConfig, auth_manager: AuthManager, category_id: Optional[str] = None
+) -> Dict:
+    """
+    Get the usage metrics of the active catalog items, cached per category.
+
+    The low usage, abandonment and fulfilment analyses all read these metrics,
+    so a recommendations call fetches them at most once, even when the
+    analyses run concurrently.
+    """
+    key = (config.instance_url, category_id or "")
+    with _metrics_locks_guard:
+        lock = _metrics_locks.setdefault(key, threading.Lock())
+    with lock:
+        return get_reference_cache(config, auth_manager).get_or_fetch(
+            METRICS_CACHE_TABLE,
+            category_id or "",
+            lambda: _fetch_catalog_metrics(config, auth_manager, category_id),
+        )
+
+
+def _item_summary(item: Dict, *keys: str) -> Dict:
+    """Reduce item metrics to the item fields and the given metrics."""
+    fields = ("sys_id", "name", "short_description", "category") + keys
+    return {key: item.get(key) for key in fields}
+
+
 def _get_low_usage_items(
     config: ServerConfig, auth_manager: AuthManager, category_id: Optional[str] = None
 ) -> List[Dict]:
@@ -249,39 +492,18 @@ def _get_low_usage_items(
         category_id: Optional category ID to filter by
 
     Returns:
-        A list of catalog items with low usage
+        A list of catalog items with low usage, fewest orders first
     """
     try:
-        # Build the query
-        query = "active=true"
-        if category_id:
-            query += f"^category={category_id}"
-        
-        # Make the API request
-        url = f"{config.instance_url}/api/now/table/sc_cat_item"
-        headers = auth_manager.get_headers()
-        params = {
-            "sysparm_query": query,
-            "sysparm_fields": "sys_id,name,short_description,category",
-            "sysparm_limit": "50",
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        # In a real implementation, we would query the request table to get actual usage data
-        # For this example, we'll simulate low usage with random data
-        items = response.json()["result"]
-        
-        # Select a random subset of items to mark as low usage
-        low_usage_items = random.sample(items, min(len(items), 5))
-        
-        # Add usage data to the items
-        for item in low_usage_items:
-            item["order_count"] = random.randint(1, 5)  # Low number of orders
-        
-        return low_usage_items
-    
+        items = _get_catalog_metrics(config, auth_manager, category_id)["items"]
+        low_usage_items = [item for item in items if item["order_count"] <= LOW_USAGE_MAX_ORDERS]
+        low_usage_items.sort(key=lambda item: (item["order_count"], item.get("name") or ""))
+
+        return [
+            _item_summary(item, "order_count")
+            for item in low_usage_items[:MAX_RECOMMENDED_ITEMS]
+        ]
+
     except Exception as e:
         logger.error(f"Error getting low usage items: {e}")
         return []
@@ -299,45 +521,26 @@ def _get_high_abandonment_items(
         category_id: Optional category ID to filter by
 
     Returns:
-        A list of catalog items with high abandonment rates
+        A list of catalog items with high abandonment rates, highest rate first
     """
     try:
-        # Build the query
-        query = "active=true"
-        if category_id:
-            query += f"^category={category_id}"
-        
-        # Make the API request
-        url = f"{config.instance_url}/api/now/table/sc_cat_item"
-        headers = auth_manager.get_headers()
-        params = {
-            "sysparm_query": query,
-            "sysparm_fields": "sys_id,name,short_description,category",
-            "sysparm_limit": "50",
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        # In a real implementation, we would query the request table to get actual abandonment data
-        # For this example, we'll simulate high abandonment with random data
-        items = response.json()["result"]
-        
-        # Select a random subset of items to mark as high abandonment
-        high_abandonment_items = random.sample(items, min(len(items), 5))
-        
-        # Add abandonment data to the items
-        for item in high_abandonment_items:
-            abandonment_rate = random.randint(40, 80)  # High abandonment rate (40-80%)
-            cart_adds = random.randint(20, 100)  # Number of cart adds
-            orders = int(cart_adds * (1 - abandonment_rate / 100))  # Number of completed orders
-            
-            item["abandonment_rate"] = abandonment_rate
-            item["cart_adds"] = cart_adds
-            item["orders"] = orders
-        
-        return high_abandonment_items
-    
+        items = _get_catalog_metrics(config, auth_manager, category_id)["items"]
+        high_abandonment_items = [
+            item
+            for item in items
+            if item["cart_adds"] >= MIN_CART_ADDS
+            and item["abandonment_rate"] >= HIGH_ABANDONMENT_RATE
+        ]
+        high_abandonment_items.sort(key=lambda item: -item["abandonment_rate"])
+
+        return [
+            dict(
+                _item_summary(item, "abandonment_rate", "cart_adds"),
+                orders=item["order_count"],
+            )
+            for item in high_abandonment_items[:MAX_RECOMMENDED_ITEMS]
+        ]
+
     except Exception as e:
         logger.error(f"Error getting high abandonment items: {e}")
         return []
@@ -355,45 +558,23 @@ def _get_slow_fulfillment_items(
         category_id: Optional category ID to filter by
 
     Returns:
-        A list of catalog items with slow fulfillment times
+        A list of catalog items with slow fulfillment times, slowest first
     """
     try:
-        # Build the query
-        query = "active=true"
-        if category_id:
-            query += f"^category={category_id}"
-        
-        # Make the API request
-        url = f"{config.instance_url}/api/now/table/sc_cat_item"
-        headers = auth_manager.get_headers()
-        params = {
-            "sysparm_query": query,
-            "sysparm_fields": "sys_id,name,short_description,category",
-            "sysparm_limit": "50",
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        # In a real implementation, we would query the request table to get actual fulfillment data
-        # For this example, we'll simulate slow fulfillment with random data
-        items = response.json()["result"]
-        
-        # Select a random subset of items to mark as slow fulfillment
-        slow_fulfillment_items = random.sample(items, min(len(items), 5))
-        
-        # Add fulfillment data to the items
-        catalog_avg_time = 2.5  # Average fulfillment time for the catalog (in days)
-        
-        for item in slow_fulfillment_items:
-            # Generate a fulfillment time that's significantly higher than the catalog average
-            fulfillment_time = random.uniform(5.0, 10.0)  # 5-10 days
-            
-            item["avg_fulfillment_time"] = fulfillment_time
-            item["avg_fulfillment_time_vs_catalog"] = round(fulfillment_time / catalog_avg_time, 1)
-        
-        return slow_fulfillment_items
-    
+        items = _get_catalog_metrics(config, auth_manager, category_id)["items"]
+        slow_fulfillment_items = [
+            item
+            for item in items
+            if item["closed_count"] >= MIN_CLOSED_REQUESTS
+            and (item["avg_fulfillment_time_vs_catalog"] or 0) >= SLOW_FULFILLMENT_RATIO
+        ]
+        slow_fulfillment_items.sort(key=lambda item: -item["avg_fulfillment_time_vs_catalog"])
+
+        return [
+            _item_summary(item, "avg_fulfillment_time", "avg_fulfillment_time_vs_catalog")
+            for item in slow_fulfillment_items[:MAX_RECOMMENDED_ITEMS]
+        ]
+
     except Exception as e:
         logger.error(f"Error getting slow fulfillment items: {e}")
         return []
@@ -428,7 +609,9 @@ def _get_poor_description_items(
             "sysparm_limit": "50",
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(
+            url, headers=headers, params=params, timeout=config.timeout
+        )
         response.raise_for_status()
         
         items = response.json()["result"]
@@ -11,7 +11,11 @@ import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.batch import BatchRequest, execute_batch
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields, project_record
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +25,23 @@ class ListCatalogItemsParams(BaseModel):
     
     limit: int = Field(10, description="Maximum number of catalog items to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     category: Optional[str] = Field(None, description="Filter by category")
     query: Optional[str] = Field(None, description="Search query for catalog items")
     active: bool = Field(True, description="Whether to only return active catalog items")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw catalog item fields to return instead of the default summary"
+    )
 
 
 class GetCatalogItemParams(BaseModel):
     """Parameters for getting a specific service catalog item."""
     
     item_id: str = Field(..., description="Catalog item ID or sys_id")
+    fields: Optional[List[FieldName]] = Field(
+        None,
+        description="Raw catalog item fields to return instead of the default details; variables are then not included",
+    )
 
 
 class ListCatalogCategoriesParams(BaseModel):
@@ -37,8 +49,12 @@ class ListCatalogCategoriesParams(BaseModel):
     
     limit: int = Field(10, description="Maximum number of categories to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     query: Optional[str] = Field(None, description="Search query for categories")
     active: bool = Field(True, description="Whether to only return active categories")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw category fields to return instead of the default summary"
+    )
 
 
 class CatalogResponse(BaseModel):
@@ -119,13 +135,15 @@ def list_catalog_items(
     
     if filters:
         query_params["sysparm_query"] = "^".join(filters)
+    apply_fields(query_params, "list_catalog_items", params.fields)
+    page = CursorPage(query_params, params.cursor)
     
     # Make the API request
     headers = auth_manager.get_headers()
     headers["Accept"] = "application/json"
     
     try:
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         # Process the response
@@ -135,6 +153,9 @@ def list_catalog_items(
         # Format the response
         formatted_items = []
         for item in items:
+            if params.fields:
+                formatted_items.append(project_record(item, params.fields))
+                continue
             formatted_items.append({
                 "sys_id": item.get("sys_id", ""),
                 "name": item.get("name", ""),
@@ -153,6 +174,7 @@ def list_catalog_items(
             "total": len(formatted_items),
             "limit": params.limit,
             "offset": params.offset,
+            **page.cursor_fields(items),
         }
     
     except requests.exceptions.RequestException as e:
@@ -193,13 +215,14 @@ def get_catalog_item(
         "sysparm_display_value": "true",
         "sysparm_exclude_reference_link": "true",
     }
+    apply_fields(query_params, "get_catalog_item", params.fields)
     
     # Make the API request
     headers = auth_manager.get_headers()
     headers["Accept"] = "application/json"
     
     try:
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         # Process the response
@@ -213,6 +236,13 @@ def get_catalog_item(
                 data=None,
             )
         
+        if params.fields:
+            return CatalogResponse(
+                success=True,
+                message=f"Retrieved catalog item: {item.get('name') or params.item_id}",
+                data=project_record(item, params.fields),
+            )
+        
         # Format the response
         formatted_item = {
             "sys_id": item.get("sys_id", ""),
@@ -277,7 +307,7 @@ def get_catalog_item_variables(
     headers["Accept"] = "application/json"
     
     try:
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         # Process the response
@@ -343,13 +373,15 @@ def list_catalog_categories(
     
     if filters:
         query_params["sysparm_query"] = "^".join(filters)
+    apply_fields(query_params, "list_catalog_categories", params.fields)
+    page = CursorPage(query_params, params.cursor)
     
     # Make the API request
     headers = auth_manager.get_headers()
     headers["Accept"] = "application/json"
     
     try:
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         # Process the response
@@ -359,6 +391,9 @@ def list_catalog_categories(
         # Format the response
         formatted_categories = []
         for category in categories:
+            if params.fields:
+                formatted_categories.append(project_record(category, params.fields))
+                continue
             formatted_categories.append({
                 "sys_id": category.get("sys_id", ""),
                 "title": category.get("title", ""),
@@ -376,6 +411,7 @@ def list_catalog_categories(
             "total": len(formatted_categories),
             "limit": params.limit,
             "offset": params.offset,
+            **page.cursor_fields(categories),
         }
     
     except requests.exceptions.RequestException as e:
@@ -433,7 +469,7 @@ def create_catalog_category(
     headers["Content-Type"] = "application/json"
     
     try:
-        response = requests.post(url, headers=headers, json=body)
+        response = get_http_client(auth_manager).post(url, headers=headers, json=body)
         response.raise_for_status()
         
         # Process the response
@@ -508,7 +544,7 @@ def update_catalog_category(
     headers["Content-Type"] = "application/json"
     
     try:
-        response = requests.patch(url, headers=headers, json=body)
+        response = get_http_client(auth_manager).patch(url, headers=headers, json=body)
         response.raise_for_status()
         
         # Process the response
@@ -559,31 +595,26 @@ def move_catalog_items(
     """
     logger.info(f"Moving {len(params.item_ids)} catalog items to category: {params.target_category_id}")
     
-    # Build the API URL
-    url = f"{config.instance_url}/api/now/table/sc_cat_item"
-    
-    # Make the API request for each item
-    headers = auth_manager.get_headers()
-    headers["Accept"] = "application/json"
-    headers["Content-Type"] = "application/json"
+    batch_requests = [
+        BatchRequest(
+            method="PATCH",
+            path=f"/api/now/table/sc_cat_item/{item_id}",
+            body={"category": params.target_category_id},
+        )
+        for item_id in params.item_ids
+    ]
     
     success_count = 0
     failed_items = []
     
     try:
-        for item_id in params.item_ids:
-            item_url = f"{url}/{item_id}"
-            body = {
-                "category": params.target_category_id
-            }
-            
-            try:
-                response = requests.patch(item_url, headers=headers, json=body)
-                response.raise_for_status()
+        results = execute_batch(config, auth_manager, batch_requests)
+        for item_id, result in zip(params.item_ids, results):
+            if result.success:
                 success_count += 1
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error moving catalog item {item_id}: {str(e)}")
-                failed_items.append({"item_id": item_id, "error": str(e)})
+            else:
+                logger.error(f"Error moving catalog item {item_id}: {result.error}")
+                failed_items.append({"item_id": item_id, "error": result.error})
         
         # Prepare the response
         if success_count == len(params.item_ids):
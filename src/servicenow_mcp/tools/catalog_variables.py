@@ -12,6 +12,9 @@ from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,10 @@ class ListCatalogItemVariablesParams(BaseModel):
     include_details: bool = Field(True, description="Whether to include detailed information about each variable")
     limit: Optional[int] = Field(None, description="Maximum number of variables to return")
     offset: Optional[int] = Field(None, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw variable fields to return; replaces include_details if given"
+    )
 
 
 class ListCatalogItemVariablesResponse(BaseModel):
@@ -60,6 +67,12 @@ class ListCatalogItemVariablesResponse(BaseModel):
     message: str = Field(..., description="Message describing the result")
     variables: List[Dict[str, Any]] = Field([], description="List of variables")
     count: int = Field(0, description="Total number of variables found")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, if there are more variables"
+    )
+    cursor_stable: Optional[bool] = Field(
+        None, description="False if next_cursor is an offset, which added or removed records shift"
+    )
 
 
 class UpdateCatalogItemVariableParams(BaseModel):
@@ -126,7 +139,7 @@ def create_catalog_item_variable(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_http_client(auth_manager).post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -183,12 +196,14 @@ def list_catalog_item_variables(
         query_params["sysparm_exclude_reference_link"] = "false"
     else:
         query_params["sysparm_fields"] = "sys_id,name,type,question_text,order,mandatory"
+    apply_fields(query_params, "list_catalog_item_variables", params.fields)
+    page = CursorPage(query_params, params.cursor)
 
     api_url = f"{config.instance_url}/api/now/table/item_option_new"
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -203,6 +218,7 @@ def list_catalog_item_variables(
             message=f"Retrieved {len(result)} variables for catalog item",
             variables=result,
             count=len(result),
+            **page.cursor_fields(result),
         )
 
     except requests.RequestException as e:
@@ -264,7 +280,7 @@ def update_catalog_item_variable(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_http_client(auth_manager).patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -13,6 +13,10 @@ from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client, order_auth_and_config
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
+from servicenow_mcp.utils.resolver import resolve_identifiers
 
 logger = logging.getLogger(__name__)
 
@@ -56,18 +60,25 @@ class ListChangeRequestsParams(BaseModel):
 
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     state: Optional[str] = Field(None, description="Filter by state")
     type: Optional[str] = Field(None, description="Filter by type (normal, standard, emergency)")
     category: Optional[str] = Field(None, description="Filter by category")
     assignment_group: Optional[str] = Field(None, description="Filter by assignment group")
     timeframe: Optional[str] = Field(None, description="Filter by timeframe (upcoming, in-progress, completed)")
     query: Optional[str] = Field(None, description="Additional query string")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw change request fields to return; all fields if omitted"
+    )
 
 
 class GetChangeRequestDetailsParams(BaseModel):
     """Parameters for getting change request details."""
 
     change_id: str = Field(..., description="Change request ID or sys_id")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw change request fields to return; all fields if omitted"
+    )
 
 
 class AddChangeTaskParams(BaseModel):
@@ -222,6 +233,7 @@ def create_change_request(
     Returns:
         The created change request.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -281,7 +293,7 @@ def create_change_request(
     url = f"{instance_url}/api/now/table/change_request"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -315,6 +327,7 @@ def update_change_request(
     Returns:
         The updated change request.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -327,6 +340,12 @@ def update_change_request(
     
     validated_params = result["params"]
     
+    # Accept a record number as well as a sys_id
+    resolved = resolve_identifiers(server_config, auth_manager, "change_request", [validated_params.change_id])
+    if not resolved["success"]:
+        return resolved
+    validated_params.change_id = resolved["sys_ids"][0]
+    
     # Prepare the request data
     data = {}
     
@@ -375,7 +394,7 @@ def update_change_request(
     url = f"{instance_url}/api/now/table/change_request/{validated_params.change_id}"
     
     try:
-        response = requests.put(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).put(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -409,6 +428,7 @@ def list_change_requests(
     Returns:
         A list of change requests.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -474,9 +494,16 @@ def list_change_requests(
         "sysparm_query": query,
         "sysparm_display_value": "true",
     }
+    apply_fields(params, "list_change_requests", validated_params.fields)
+    # Timeframe conditions change with the time of the call: cursors are tied to the filters
+    page = CursorPage(
+        params,
+        validated_params.cursor,
+        key=validated_params.model_dump_json(exclude={"limit", "offset", "cursor", "fields"}),
+    )
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=params)
         response.raise_for_status()
         
         result = response.json()
@@ -490,6 +517,7 @@ def list_change_requests(
             "change_requests": change_requests,
             "count": count,
             "total": count,  # Use count as total if total is not provided
+            **page.cursor_fields(change_requests),
         }
     except requests.exceptions.RequestException as e:
         logger.error(f"Error listing change requests: {e}")
@@ -515,6 +543,7 @@ def get_change_request_details(
     Returns:
         The change request details.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -527,6 +556,12 @@ def get_change_request_details(
     
     validated_params = result["params"]
     
+    # Accept a record number as well as a sys_id
+    resolved = resolve_identifiers(server_config, auth_manager, "change_request", [validated_params.change_id])
+    if not resolved["success"]:
+        return resolved
+    validated_params.change_id = resolved["sys_ids"][0]
+    
     # Get the instance URL
     instance_url = _get_instance_url(auth_manager, server_config)
     if not instance_url:
@@ -549,9 +584,10 @@ def get_change_request_details(
     params = {
         "sysparm_display_value": "true",
     }
+    apply_fields(params, "get_change_request_details", validated_params.fields)
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=params)
         response.raise_for_status()
         
         result = response.json()
@@ -563,7 +599,7 @@ def get_change_request_details(
             "sysparm_display_value": "true",
         }
         
-        tasks_response = requests.get(tasks_url, headers=headers, params=tasks_params)
+        tasks_response = get_http_client(auth_manager).get(tasks_url, headers=headers, params=tasks_params)
         tasks_response.raise_for_status()
         
         tasks_result = tasks_response.json()
@@ -597,6 +633,7 @@ def add_change_task(
     Returns:
         The created change task.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -609,6 +646,12 @@ def add_change_task(
     
     validated_params = result["params"]
     
+    # Accept a record number as well as a sys_id
+    resolved = resolve_identifiers(server_config, auth_manager, "change_request", [validated_params.change_id])
+    if not resolved["success"]:
+        return resolved
+    validated_params.change_id = resolved["sys_ids"][0]
+    
     # Prepare the request data
     data = {
         "change_request": validated_params.change_id,
@@ -648,7 +691,7 @@ def add_change_task(
     url = f"{instance_url}/api/now/table/change_task"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -682,6 +725,7 @@ def submit_change_for_approval(
     Returns:
         The result of the submission.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -694,6 +738,12 @@ def submit_change_for_approval(
     
     validated_params = result["params"]
     
+    # Accept a record number as well as a sys_id
+    resolved = resolve_identifiers(server_config, auth_manager, "change_request", [validated_params.change_id])
+    if not resolved["success"]:
+        return resolved
+    validated_params.change_id = resolved["sys_ids"][0]
+    
     # Prepare the request data
     data = {
         "state": "assess",  # Set state to "assess" to submit for approval
@@ -726,7 +776,7 @@ def submit_change_for_approval(
     url = f"{instance_url}/api/now/table/change_request/{validated_params.change_id}"
     
     try:
-        response = requests.patch(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).patch(url, json=data, headers=headers)
         response.raise_for_status()
         
         # Now, create an approval request
@@ -737,7 +787,7 @@ def submit_change_for_approval(
             "state": "requested",
         }
         
-        approval_response = requests.post(approval_url, json=approval_data, headers=headers)
+        approval_response = get_http_client(auth_manager).post(approval_url, json=approval_data, headers=headers)
         approval_response.raise_for_status()
         
         approval_result = approval_response.json()
@@ -771,6 +821,7 @@ def approve_change(
     Returns:
         The result of the approval.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -783,6 +834,12 @@ def approve_change(
     
     validated_params = result["params"]
     
+    # Accept a record number as well as a sys_id
+    resolved = resolve_identifiers(server_config, auth_manager, "change_request", [validated_params.change_id])
+    if not resolved["success"]:
+        return resolved
+    validated_params.change_id = resolved["sys_ids"][0]
+    
     # Get the instance URL
     instance_url = _get_instance_url(auth_manager, server_config)
     if not instance_url:
@@ -808,7 +865,7 @@ def approve_change(
     }
     
     try:
-        approval_response = requests.get(approval_query_url, headers=headers, params=query_params)
+        approval_response = get_http_client(auth_manager).get(approval_query_url, headers=headers, params=query_params)
         approval_response.raise_for_status()
         
         approval_result = approval_response.json()
@@ -832,7 +889,7 @@ def approve_change(
         if validated_params.approval_comments:
             approval_data["comments"] = validated_params.approval_comments
         
-        approval_update_response = requests.patch(approval_update_url, json=approval_data, headers=headers)
+        approval_update_response = get_http_client(auth_manager).patch(approval_update_url, json=approval_data, headers=headers)
         approval_update_response.raise_for_status()
         
         # Finally, update the change request state to "implement"
@@ -842,7 +899,7 @@ def approve_change(
             "state": "implement",  # This may vary depending on ServiceNow configuration
         }
         
-        change_response = requests.patch(change_url, json=change_data, headers=headers)
+        change_response = get_http_client(auth_manager).patch(change_url, json=change_data, headers=headers)
         change_response.raise_for_status()
         
         return {
@@ -873,6 +930,7 @@ def reject_change(
     Returns:
         The result of the rejection.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -885,6 +943,12 @@ def reject_change(
     
     validated_params = result["params"]
     
+    # Accept a record number as well as a sys_id
+    resolved = resolve_identifiers(server_config, auth_manager, "change_request", [validated_params.change_id])
+    if not resolved["success"]:
+        return resolved
+    validated_params.change_id = resolved["sys_ids"][0]
+    
     # Get the instance URL
     instance_url = _get_instance_url(auth_manager, server_config)
     if not instance_url:
@@ -910,7 +974,7 @@ def reject_change(
     }
     
     try:
-        approval_response = requests.get(approval_query_url, headers=headers, params=query_params)
+        approval_response = get_http_client(auth_manager).get(approval_query_url, headers=headers, params=query_params)
         approval_response.raise_for_status()
         
         approval_result = approval_response.json()
@@ -932,7 +996,7 @@ def reject_change(
             "comments": validated_params.rejection_reason,
         }
         
-        approval_update_response = requests.patch(approval_update_url, json=approval_data, headers=headers)
+        approval_update_response = get_http_client(auth_manager).patch(approval_update_url, json=approval_data, headers=headers)
         approval_update_response.raise_for_status()
         
         # Finally, update the change request state to "canceled"
@@ -943,7 +1007,7 @@ def reject_change(
             "work_notes": f"Change request rejected: {validated_params.rejection_reason}",
         }
         
-        change_response = requests.patch(change_url, json=change_data, headers=headers)
+        change_response = get_http_client(auth_manager).patch(change_url, json=change_data, headers=headers)
         change_response.raise_for_status()
         
         return {
@@ -12,6 +12,9 @@ from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client, order_auth_and_config
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -24,17 +27,24 @@ class ListChangesetsParams(BaseModel):
 
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     state: Optional[str] = Field(None, description="Filter by state")
     application: Optional[str] = Field(None, description="Filter by application")
     developer: Optional[str] = Field(None, description="Filter by developer")
     timeframe: Optional[str] = Field(None, description="Filter by timeframe (recent, last_week, last_month)")
     query: Optional[str] = Field(None, description="Additional query string")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw update set fields to return; all fields if omitted"
+    )
 
 
 class GetChangesetDetailsParams(BaseModel):
     """Parameters for getting changeset details."""
 
     changeset_id: str = Field(..., description="Changeset ID or sys_id")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw update set fields to return; all fields if omitted"
+    )
 
 
 class CreateChangesetParams(BaseModel):
@@ -205,6 +215,7 @@ def list_changesets(
     Returns:
         A list of changesets.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(params, ListChangesetsParams)
     
@@ -260,12 +271,14 @@ def list_changesets(
     
     if query_parts:
         query_params["sysparm_query"] = "^".join(query_parts)
+    apply_fields(query_params, "list_changesets", validated_params.fields)
+    page = CursorPage(query_params, validated_params.cursor)
     
     # Make the API request
     url = f"{instance_url}/api/now/table/sys_update_set"
     
     try:
-        response = requests.get(url, params=query_params, headers=headers)
+        response = get_http_client(auth_manager).get(url, params=query_params, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -274,6 +287,7 @@ def list_changesets(
             "success": True,
             "changesets": result.get("result", []),
             "count": len(result.get("result", [])),
+            **page.cursor_fields(result.get("result", [])),
         }
     except requests.exceptions.RequestException as e:
         logger.error(f"Error listing changesets: {e}")
@@ -299,6 +313,7 @@ def get_changeset_details(
     Returns:
         Detailed information about the changeset.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -329,9 +344,10 @@ def get_changeset_details(
     
     # Make the API request
     url = f"{instance_url}/api/now/table/sys_update_set/{validated_params.changeset_id}"
+    query_params = apply_fields({}, "get_changeset_details", validated_params.fields)
     
     try:
-        response = requests.get(url, headers=headers)
+        response = get_http_client(auth_manager).get(url, params=query_params, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -345,7 +361,7 @@ def get_changeset_details(
             "sysparm_query": f"update_set={validated_params.changeset_id}",
         }
         
-        changes_response = requests.get(changes_url, params=changes_params, headers=headers)
+        changes_response = get_http_client(auth_manager).get(changes_url, params=changes_params, headers=headers)
         changes_response.raise_for_status()
         
         changes_result = changes_response.json()
@@ -381,6 +397,7 @@ def create_changeset(
     Returns:
         The created changeset.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -428,7 +445,7 @@ def create_changeset(
     url = f"{instance_url}/api/now/table/sys_update_set"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -462,6 +479,7 @@ def update_changeset(
     Returns:
         The updated changeset.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -517,7 +535,7 @@ def update_changeset(
     url = f"{instance_url}/api/now/table/sys_update_set/{validated_params.changeset_id}"
     
     try:
-        response = requests.patch(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).patch(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -551,6 +569,7 @@ def commit_changeset(
     Returns:
         The committed changeset.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -595,7 +614,7 @@ def commit_changeset(
     url = f"{instance_url}/api/now/table/sys_update_set/{validated_params.changeset_id}"
     
     try:
-        response = requests.patch(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).patch(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -629,6 +648,7 @@ def publish_changeset(
     Returns:
         The published changeset.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -673,7 +693,7 @@ def publish_changeset(
     url = f"{instance_url}/api/now/table/sys_update_set/{validated_params.changeset_id}"
     
     try:
-        response = requests.patch(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).patch(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -707,6 +727,7 @@ def add_file_to_changeset(
     Returns:
         The result of the add file operation.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -750,7 +771,7 @@ def add_file_to_changeset(
     url = f"{instance_url}/api/now/table/sys_update_xml"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -13,6 +13,10 @@ from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client, order_auth_and_config
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
+from servicenow_mcp.utils.resolver import resolve_identifiers
 
 logger = logging.getLogger(__name__)
 
@@ -47,10 +51,14 @@ class ListEpicsParams(BaseModel):
 
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     priority: Optional[str] = Field(None, description="Filter by priority")
     assignment_group: Optional[str] = Field(None, description="Filter by assignment group")
     timeframe: Optional[str] = Field(None, description="Filter by timeframe (upcoming, in-progress, completed)")
     query: Optional[str] = Field(None, description="Additional query string")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw epic fields to return; all fields if omitted"
+    )
 
 
 def _unwrap_and_validate_params(params: Any, model_class: Type[T], required_fields: List[str] = None) -> Dict[str, Any]:
@@ -170,6 +178,7 @@ def create_epic(
     Returns:
         The created epic.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
 
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
@@ -223,7 +232,7 @@ def create_epic(
     url = f"{instance_url}/api/now/table/rm_epic"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -256,6 +265,7 @@ def update_epic(
     Returns:
         The updated epic.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -268,6 +278,12 @@ def update_epic(
     
     validated_params = result["params"]
     
+    # Accept a record number as well as a sys_id
+    resolved = resolve_identifiers(server_config, auth_manager, "rm_epic", [validated_params.epic_id])
+    if not resolved["success"]:
+        return resolved
+    validated_params.epic_id = resolved["sys_ids"][0]
+    
     # Prepare the request data
     data = {}
     
@@ -308,7 +324,7 @@ def update_epic(
     url = f"{instance_url}/api/now/table/rm_epic/{validated_params.epic_id}"
     
     try:
-        response = requests.put(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).put(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -341,6 +357,7 @@ def list_epics(
     Returns:
         A list of epics.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -402,9 +419,16 @@ def list_epics(
         "sysparm_query": query,
         "sysparm_display_value": "true",
     }
+    apply_fields(params, "list_epics", validated_params.fields)
+    # The timeframe dates move with every call, so cursors carry the filters instead
+    page = CursorPage(
+        params,
+        validated_params.cursor,
+        key=validated_params.model_dump_json(exclude={"limit", "offset", "cursor", "fields"}),
+    )
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=params)
         response.raise_for_status()
         
         result = response.json()
@@ -418,6 +442,7 @@ def list_epics(
             "epics": epics,
             "count": count,
             "total": count,  # Use count as total if total is not provided
+            **page.cursor_fields(epics),
         }
     except requests.exceptions.RequestException as e:
         logger.error(f"Error listing epics: {e}")
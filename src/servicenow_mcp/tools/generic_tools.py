@@ -1,19 +1,75 @@
+import json
 import logging
+import math
+from typing import Any, Dict, Iterator, List, Literal, Optional
+
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.mirror import read_from_mirror
+from servicenow_mcp.utils.pagination import CursorPage
 
 logger = logging.getLogger(__name__)
 
 class GetTableRecordParams(BaseModel):
     table_name: str = Field(..., description="The name of the table.")
     sys_id: str = Field(..., description="The sys_id of the record.")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Fields to return. Returns all fields if omitted."
+    )
 
 class QueryTableParams(BaseModel):
     table_name: str = Field(..., description="The name of the table.")
     query: str = Field(..., description="The query to filter the records.")
+    fields: Optional[List[str]] = Field(
+        None, description="Fields to return for each record. Returns all fields if omitted."
+    )
+    page_size: int = Field(100, ge=1, description="Number of records fetched per request.")
+    max_rows: Optional[int] = Field(
+        1000,
+        ge=1,
+        description="Stop after this many records. None walks every matching record.",
+    )
+    max_bytes: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Stop fetching pages once this many response bytes were received.",
+    )
+    pagination: Literal["offset", "keyset"] = Field(
+        "offset",
+        description=(
+            "How to walk the pages: 'offset' uses sysparm_offset and keeps the query's own "
+            "ordering, 'keyset' orders by the query's ORDERBY field, if any, then sys_id and "
+            "resumes after the last record seen, which stays fast and consistent on large or "
+            "changing tables. Keyset queries may have at most one ORDERBY."
+        ),
+    )
+
+class AggregateTableParams(BaseModel):
+    table_name: str = Field(..., description="The name of the table.")
+    query: Optional[str] = Field(None, description="Encoded query selecting the records to aggregate.")
+    count: bool = Field(True, description="Include the number of records (per group).")
+    group_by: Optional[List[FieldName]] = Field(
+        None, description="Fields to group by, e.g. [\"assignment_group\", \"priority\"]."
+    )
+    avg_fields: Optional[List[FieldName]] = Field(None, description="Numeric fields to average.")
+    sum_fields: Optional[List[FieldName]] = Field(None, description="Numeric fields to sum.")
+    min_fields: Optional[List[FieldName]] = Field(None, description="Fields to take the minimum of.")
+    max_fields: Optional[List[FieldName]] = Field(None, description="Fields to take the maximum of.")
+    having: Optional[str] = Field(
+        None,
+        description=(
+            "Filter on the aggregates of each group as aggregate^field^operator^value, "
+            "e.g. 'count^*^>^10' keeps groups with more than 10 records."
+        ),
+    )
+    display_value: bool = Field(
+        True, description="Show display values instead of raw values for the group-by fields."
+    )
 
 def get_table_record(
     config: ServerConfig,
@@ -24,10 +80,12 @@ def get_table_record(
     Get a single record from a specified table by its sys_id.
     """
     api_url = f"{config.api_url}/table/{params.table_name}/{params.sys_id}"
+    query_params = apply_fields({}, "get_table_record", params.fields)
 
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
+            params=query_params,
             headers=auth_manager.get_headers(),
             timeout=config.timeout,
         )
@@ -44,29 +102,123 @@ def get_table_record(
             "message": f"Failed to get table record: {str(e)}",
         }
 
-def query_table(
+def iter_table_records(
     config: ServerConfig,
     auth_manager: AuthManager,
     params: QueryTableParams,
-) -> dict:
+) -> Iterator[Dict[str, Any]]:
     """
-    Query a table with a given query.
+    Iterate over the records matching a query, one page at a time.
+
+    Only the current page is held in memory, so arbitrarily large tables can
+    be streamed. Iteration stops when the records run out or when the
+    max_rows or max_bytes limit of the params is reached. Keyset pages are
+    positioned by CursorPage, as those of the list tools.
+
+    Raises:
+        requests.RequestException: If a page cannot be fetched.
+        ValueError: If keyset pagination is asked for a query ordered by several fields.
     """
     api_url = f"{config.api_url}/table/{params.table_name}"
-    query_params = {"sysparm_query": params.query}
 
-    try:
-        response = requests.get(
+    rows = 0
+    received_bytes = 0
+    offset = 0
+    cursor = None
+
+    while True:
+        limit = params.page_size
+        if params.max_rows is not None:
+            limit = min(limit, params.max_rows - rows)
+
+        query_params = {"sysparm_query": params.query, "sysparm_limit": limit}
+        fields = list(params.fields or [])
+        if params.pagination == "keyset":
+            page = _keyset_page(query_params, cursor)
+            # Keyset cursors need the sys_id and ordering field of the last record
+            for field in (page.order_field, "sys_id"):
+                if field not in fields:
+                    fields.append(field)
+        else:
+            query_params["sysparm_offset"] = offset
+        if params.fields:
+            query_params["sysparm_fields"] = ",".join(fields)
+
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
             timeout=config.timeout,
         )
         response.raise_for_status()
-        data = response.json()
+        received_bytes += len(response.content)
+        records = response.json().get("result", [])
+
+        for record in records:
+            yield record
+        rows += len(records)
+        offset += len(records)
+        if params.pagination == "keyset":
+            cursor = page.next_cursor(records)
+
+        if len(records) < limit:
+            return
+        if params.max_rows is not None and rows >= params.max_rows:
+            return
+        if params.max_bytes is not None and received_bytes >= params.max_bytes:
+            logger.info(f"Stopped querying {params.table_name} after {received_bytes} bytes")
+            return
+
+
+def _keyset_page(query_params: Dict[str, Any], cursor: Optional[str]) -> CursorPage:
+    """
+    Position query parameters by keyset.
+
+    Raises:
+        ValueError: If the query is ordered by several fields.
+    """
+    page = CursorPage(query_params, cursor)
+    if not page.keyset:
+        raise ValueError(
+            "Keyset pagination supports queries ordered by at most one field; "
+            "use pagination='offset' for other orderings"
+        )
+    return page
+
+
+def query_table(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: QueryTableParams,
+) -> dict:
+    """
+    Query a table with a given query.
+
+    Pages are fetched with iter_table_records and collected into one list; use
+    iter_table_records directly to process large result sets incrementally.
+    Mirrored tables are read from the local mirror when it is fresh enough, and
+    cut to the pages an instance walk would have fetched within max_bytes.
+    """
+    query_params = {"sysparm_query": params.query, "sysparm_limit": params.max_rows}
+    if params.fields:
+        query_params["sysparm_fields"] = ",".join(params.fields)
+    try:
+        if params.pagination == "keyset":
+            # Records in the order keyset pages would return them
+            _keyset_page(query_params, None)
+    except ValueError as e:
+        return {"success": False, "message": str(e)}
+    records = read_from_mirror(config, auth_manager, params.table_name, query_params)
+    if records is not None:
+        records = _within_max_bytes(records, params)
+        return {"success": True, "records": records, "count": len(records)}
+
+    try:
+        records = list(iter_table_records(config, auth_manager, params))
         return {
             "success": True,
-            "records": data.get("result", []),
+            "records": records,
+            "count": len(records),
         }
     except requests.RequestException as e:
         logger.error(f"Failed to query table: {e}")
@@ -74,3 +226,116 @@ def query_table(
             "success": False,
             "message": f"Failed to query table: {str(e)}",
         }
+
+
+def _within_max_bytes(
+    records: List[Dict[str, Any]], params: QueryTableParams
+) -> List[Dict[str, Any]]:
+    """Records of the pages fetched before reaching max_bytes, as iter_table_records stops."""
+    if params.max_bytes is None:
+        return records
+    received_bytes = 0
+    for start in range(0, len(records), params.page_size):
+        end = start + params.page_size
+        received_bytes += len(json.dumps({"result": records[start:end]}).encode())
+        if received_bytes >= params.max_bytes:
+            return records[:end]
+    return records
+
+
+# Aggregate API parameter and result key per aggregate function
+AGGREGATES = ("avg", "sum", "min", "max")
+
+
+def _stat_value(value: Any) -> Any:
+    """Convert an aggregate from the Aggregate API (always a string) to a number where possible."""
+    if not isinstance(value, str) or value == "":
+        return value
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    if not math.isfinite(number):
+        return value
+    return int(number) if number.is_integer() and "." not in value else number
+
+
+def aggregate_table(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: AggregateTableParams,
+) -> dict:
+    """
+    Count and aggregate the records of a table with the Aggregate API (/api/now/stats).
+
+    The instance computes the aggregates, so questions like "how many P1
+    incidents per group" cost one request whatever the number of records.
+    The result is a compact table: one column per group-by field followed
+    by one per aggregate, and one row per group.
+    """
+    api_url = f"{config.api_url}/stats/{params.table_name}"
+
+    query_params: Dict[str, Any] = {
+        "sysparm_count": str(params.count).lower(),
+        "sysparm_display_value": str(params.display_value).lower(),
+    }
+    if params.query:
+        query_params["sysparm_query"] = params.query
+    if params.group_by:
+        query_params["sysparm_group_by"] = ",".join(params.group_by)
+    for aggregate in AGGREGATES:
+        fields = getattr(params, f"{aggregate}_fields")
+        if fields:
+            query_params[f"sysparm_{aggregate}_fields"] = ",".join(fields)
+    if params.having:
+        query_params["sysparm_having"] = params.having
+
+    columns = list(params.group_by or [])
+    if params.count:
+        columns.append("count")
+    for aggregate in AGGREGATES:
+        columns.extend(f"{aggregate}({field})" for field in getattr(params, f"{aggregate}_fields") or [])
+
+    try:
+        response = get_http_client(auth_manager).get(
+            api_url,
+            params=query_params,
+            headers=auth_manager.get_headers(),
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+        result = response.json().get("result", [])
+    except requests.RequestException as e:
+        logger.error(f"Failed to aggregate table: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to aggregate table: {str(e)}",
+        }
+
+    # Without group_by the API returns a single stats object instead of a list of groups
+    groups = result if isinstance(result, list) else [result]
+    rows = []
+    for group in groups:
+        group_values = {
+            item.get("field"): item.get("display_value", item.get("value"))
+            if params.display_value
+            else item.get("value")
+            for item in group.get("groupby_fields", [])
+        }
+        stats = group.get("stats", {})
+        row = [group_values.get(field) for field in params.group_by or []]
+        if params.count:
+            row.append(_stat_value(stats.get("count", "0")))
+        for aggregate in AGGREGATES:
+            values = stats.get(aggregate, {})
+            row.extend(
+                _stat_value(values.get(field)) for field in getattr(params, f"{aggregate}_fields") or []
+            )
+        rows.append(row)
+
+    return {
+        "success": True,
+        "columns": columns,
+        "rows": rows,
+        "row_count": len(rows),
+    }
@@ -7,11 +7,19 @@ This module provides tools for managing incidents in ServiceNow.
 import logging
 from typing import Optional, List
 
+import anyio
+import httpx
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.cache import get_reference_cache
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields, project_record
+from servicenow_mcp.utils.http_client import get_async_http_client, get_http_client
+from servicenow_mcp.utils.mirror import read_from_mirror
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
+from servicenow_mcp.utils.resolver import resolve_sys_id
 
 logger = logging.getLogger(__name__)
 
@@ -86,17 +94,26 @@ class ListIncidentsParams(BaseModel):
     
     limit: int = Field(10, description="Maximum number of incidents to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     display_value: bool = Field(True, description="Return display values for reference fields.")
     state: Optional[str] = Field(None, description="Filter by incident state")
     assigned_to: Optional[str] = Field(None, description="Filter by assigned user")
     category: Optional[str] = Field(None, description="Filter by category")
     query: Optional[str] = Field(None, description="A ServiceNow encoded query string for filtering incidents. Overrides other filter parameters if provided.")
+    fields: Optional[List[FieldName]] = Field(
+        None,
+        description="Raw incident fields to return instead of the default summary, e.g. [\"number\", \"caller_id\"]",
+    )
 
 
 class GetIncidentByNumberParams(BaseModel):
     """Parameters for fetching an incident by its number."""
 
     incident_number: str = Field(..., description="The number of the incident to fetch")
+    fields: Optional[List[FieldName]] = Field(
+        None,
+        description="Raw incident fields to return instead of the default summary, e.g. [\"number\", \"caller_id\"]",
+    )
 
 
 class IncidentResponse(BaseModel):
@@ -156,7 +173,7 @@ def create_incident(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_http_client(auth_manager).post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -197,45 +214,21 @@ def update_incident(
     Returns:
         Response with the updated incident details.
     """
-    # Determine if incident_id is a number or sys_id
-    incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
-        # This is likely a sys_id
-        api_url = f"{config.api_url}/table/incident/{incident_id}"
-    else:
-        # This is likely an incident number
-        # First, we need to get the sys_id
-        try:
-            query_url = f"{config.api_url}/table/incident"
-            query_params = {
-                "sysparm_query": f"number={incident_id}",
-                "sysparm_limit": 1,
-            }
-
-            response = requests.get(
-                query_url,
-                params=query_params,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            response.raise_for_status()
-
-            result = response.json().get("result", [])
-            if not result:
-                return IncidentResponse(
-                    success=False,
-                    message=f"Incident not found: {incident_id}",
-                )
-
-            incident_id = result[0].get("sys_id")
-            api_url = f"{config.api_url}/table/incident/{incident_id}"
-
-        except requests.RequestException as e:
-            logger.error(f"Failed to find incident: {e}")
-            return IncidentResponse(
-                success=False,
-                message=f"Failed to find incident: {str(e)}",
-            )
+    # Resolve the incident number to a sys_id if necessary
+    try:
+        incident_id = resolve_sys_id(config, auth_manager, "incident", params.incident_id)
+    except requests.RequestException as e:
+        logger.error(f"Failed to find incident: {e}")
+        return IncidentResponse(
+            success=False,
+            message=f"Failed to find incident: {str(e)}",
+        )
+    if not incident_id:
+        return IncidentResponse(
+            success=False,
+            message=f"Incident not found: {params.incident_id}",
+        )
+    api_url = f"{config.api_url}/table/incident/{incident_id}"
 
     # Build request data
     data = {}
@@ -285,7 +278,7 @@ def update_incident(
 
     # Make request
     try:
-        response = requests.put(
+        response = get_http_client(auth_manager).put(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -294,6 +287,7 @@ def update_incident(
         response.raise_for_status()
 
         result = response.json().get("result", {})
+        get_reference_cache(config, auth_manager).invalidate("incident")
 
         return IncidentResponse(
             success=True,
@@ -326,45 +320,21 @@ def add_comment(
     Returns:
         Response with the result of the operation.
     """
-    # Determine if incident_id is a number or sys_id
-    incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
-        # This is likely a sys_id
-        api_url = f"{config.api_url}/table/incident/{incident_id}"
-    else:
-        # This is likely an incident number
-        # First, we need to get the sys_id
-        try:
-            query_url = f"{config.api_url}/table/incident"
-            query_params = {
-                "sysparm_query": f"number={incident_id}",
-                "sysparm_limit": 1,
-            }
-
-            response = requests.get(
-                query_url,
-                params=query_params,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            response.raise_for_status()
-
-            result = response.json().get("result", [])
-            if not result:
-                return IncidentResponse(
-                    success=False,
-                    message=f"Incident not found: {incident_id}",
-                )
-
-            incident_id = result[0].get("sys_id")
-            api_url = f"{config.api_url}/table/incident/{incident_id}"
-
-        except requests.RequestException as e:
-            logger.error(f"Failed to find incident: {e}")
-            return IncidentResponse(
-                success=False,
-                message=f"Failed to find incident: {str(e)}",
-            )
+    # Resolve the incident number to a sys_id if necessary
+    try:
+        incident_id = resolve_sys_id(config, auth_manager, "incident", params.incident_id)
+    except requests.RequestException as e:
+        logger.error(f"Failed to find incident: {e}")
+        return IncidentResponse(
+            success=False,
+            message=f"Failed to find incident: {str(e)}",
+        )
+    if not incident_id:
+        return IncidentResponse(
+            success=False,
+            message=f"Incident not found: {params.incident_id}",
+        )
+    api_url = f"{config.api_url}/table/incident/{incident_id}"
 
     # Build request data
     data = {}
@@ -376,7 +346,7 @@ def add_comment(
 
     # Make request
     try:
-        response = requests.put(
+        response = get_http_client(auth_manager).put(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -385,6 +355,7 @@ def add_comment(
         response.raise_for_status()
 
         result = response.json().get("result", {})
+        get_reference_cache(config, auth_manager).invalidate("incident")
 
         return IncidentResponse(
             success=True,
@@ -417,45 +388,21 @@ def resolve_incident(
     Returns:
         Response with the result of the operation.
     """
-    # Determine if incident_id is a number or sys_id
-    incident_id = params.incident_id
-    if len(incident_id) == 32 and all(c in "0123456789abcdef" for c in incident_id):
-        # This is likely a sys_id
-        api_url = f"{config.api_url}/table/incident/{incident_id}"
-    else:
-        # This is likely an incident number
-        # First, we need to get the sys_id
-        try:
-            query_url = f"{config.api_url}/table/incident"
-            query_params = {
-                "sysparm_query": f"number={incident_id}",
-                "sysparm_limit": 1,
-            }
-
-            response = requests.get(
-                query_url,
-                params=query_params,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            response.raise_for_status()
-
-            result = response.json().get("result", [])
-            if not result:
-                return IncidentResponse(
-                    success=False,
-                    message=f"Incident not found: {incident_id}",
-                )
-
-            incident_id = result[0].get("sys_id")
-            api_url = f"{config.api_url}/table/incident/{incident_id}"
-
-        except requests.RequestException as e:
-            logger.error(f"Failed to find incident: {e}")
-            return IncidentResponse(
-                success=False,
-                message=f"Failed to find incident: {str(e)}",
-            )
+    # Resolve the incident number to a sys_id if necessary
+    try:
+        incident_id = resolve_sys_id(config, auth_manager, "incident", params.incident_id)
+    except requests.RequestException as e:
+        logger.error(f"Failed to find incident: {e}")
+        return IncidentResponse(
+            success=False,
+            message=f"Failed to find incident: {str(e)}",
+        )
+    if not incident_id:
+        return IncidentResponse(
+            success=False,
+            message=f"Incident not found: {params.incident_id}",
+        )
+    api_url = f"{config.api_url}/table/incident/{incident_id}"
 
     # Build request data
     data = {
@@ -467,7 +414,7 @@ def resolve_incident(
 
     # Make request
     try:
-        response = requests.put(
+        response = get_http_client(auth_manager).put(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -476,6 +423,7 @@ def resolve_incident(
         response.raise_for_status()
 
         result = response.json().get("result", {})
+        get_reference_cache(config, auth_manager).invalidate("incident")
 
         return IncidentResponse(
             success=True,
@@ -508,16 +456,22 @@ def resolve_incident_with_all_fields(
         Response with the result of the operation.
     """
     # First, get the incident details to check if a caller_id is present
-    get_params = GetIncidentByNumberParams(incident_number=params.incident_id)
-    incident_details = get_incident_by_number(config, auth_manager, get_params)
+    cache = get_reference_cache(config, auth_manager)
+    incident_query = f"number={params.incident_id}"
+    incident = cache.get("incident", incident_query)
+    if incident is None:
+        get_params = GetIncidentByNumberParams(incident_number=params.incident_id)
+        incident_details = get_incident_by_number(config, auth_manager, get_params)
+
+        if not incident_details.get("success"):
+            return IncidentResponse(
+                success=False,
+                message=f"Failed to get incident details: {incident_details.get('message')}",
+            )
 
-    if not incident_details.get("success"):
-        return IncidentResponse(
-            success=False,
-            message=f"Failed to get incident details: {incident_details.get('message')}",
-        )
+        incident = incident_details.get("incident")
+        cache.set("incident", incident_query, incident)
 
-    incident = incident_details.get("incident")
     caller_id = incident.get("caller_id")
 
     # If caller_id is not present, use the one from the params
@@ -525,7 +479,8 @@ def resolve_incident_with_all_fields(
         caller_id = params.caller_id
 
     update_params = UpdateIncidentParams(
-        incident_id=params.incident_id,
+        # The sys_id is already known, so update_incident does not look the number up again
+        incident_id=incident.get("sys_id") or params.incident_id,
         state="6",  # Resolved
         close_code=params.resolution_code,
         close_notes=params.resolution_notes,
@@ -537,25 +492,8 @@ def resolve_incident_with_all_fields(
     return update_incident(config, auth_manager, update_params)
 
 
-def list_incidents(
-    config: ServerConfig,
-    auth_manager: AuthManager,
-    params: ListIncidentsParams,
-) -> dict:
-    """
-    List incidents from ServiceNow.
-
-    Args:
-        config: Server configuration.
-        auth_manager: Authentication manager.
-        params: Parameters for listing incidents.
-
-    Returns:
-        Dictionary with list of incidents.
-    """
-    api_url = f"{config.api_url}/table/incident"
-
-    # Build query parameters
+def _list_incidents_query_params(params: ListIncidentsParams) -> dict:
+    """Build the Table API query parameters for listing incidents."""
     query_params = {
         "sysparm_limit": params.limit,
         "sysparm_offset": params.offset,
@@ -577,10 +515,84 @@ def list_incidents(
 
     if filters:
         query_params["sysparm_query"] = "^".join(filters)
+
+    return apply_fields(query_params, "list_incidents", params.fields)
+
+
+def _format_incident_list(
+    data: dict, fields: Optional[List[str]] = None, page: Optional[CursorPage] = None
+) -> dict:
+    """Convert a Table API incident list response into the list_incidents result."""
+    incidents = []
+    
+    for incident_data in data.get("result", []):
+        if fields:
+            incidents.append(project_record(incident_data, fields))
+            continue
+
+        # Handle assigned_to field which could be a string or a dictionary
+        assigned_to = incident_data.get("assigned_to")
+        if isinstance(assigned_to, dict):
+            assigned_to = assigned_to.get("display_value")
+
+        assignment_group = incident_data.get("assignment_group")
+        if isinstance(assignment_group, dict):
+            assignment_group = assignment_group.get("display_value")
+        
+        incident = {
+            "sys_id": incident_data.get("sys_id"),
+            "number": incident_data.get("number"),
+            "short_description": incident_data.get("short_description"),
+            "description": incident_data.get("description"),
+            "state": incident_data.get("state"),
+            "priority": incident_data.get("priority"),
+            "assigned_to": assigned_to,
+            "assignment_group": assignment_group,
+            "category": incident_data.get("category"),
+            "subcategory": incident_data.get("subcategory"),
+            "u_record_producer": incident_data.get("u_record_producer"),
+            "created_on": incident_data.get("sys_created_on"),
+            "updated_on": incident_data.get("sys_updated_on"),
+        }
+        incidents.append(incident)
+    
+    result = {
+        "success": True,
+        "message": f"Found {len(incidents)} incidents",
+        "incidents": incidents
+    }
+    if page is not None:
+        result.update(page.cursor_fields(data.get("result", [])))
+    return result
+
+
+def list_incidents(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: ListIncidentsParams,
+) -> dict:
+    """
+    List incidents from ServiceNow.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for listing incidents.
+
+    Returns:
+        Dictionary with list of incidents.
+    """
+    api_url = f"{config.api_url}/table/incident"
+    query_params = _list_incidents_query_params(params)
+    page = CursorPage(query_params, params.cursor)
+
+    mirrored = read_from_mirror(config, auth_manager, "incident", query_params)
+    if mirrored is not None:
+        return _format_incident_list({"result": mirrored}, params.fields, page)
     
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -588,41 +600,7 @@ def list_incidents(
         )
         response.raise_for_status()
         
-        data = response.json()
-        incidents = []
-        
-        for incident_data in data.get("result", []):
-            # Handle assigned_to field which could be a string or a dictionary
-            assigned_to = incident_data.get("assigned_to")
-            if isinstance(assigned_to, dict):
-                assigned_to = assigned_to.get("display_value")
-
-            assignment_group = incident_data.get("assignment_group")
-            if isinstance(assignment_group, dict):
-                assignment_group = assignment_group.get("display_value")
-            
-            incident = {
-                "sys_id": incident_data.get("sys_id"),
-                "number": incident_data.get("number"),
-                "short_description": incident_data.get("short_description"),
-                "description": incident_data.get("description"),
-                "state": incident_data.get("state"),
-                "priority": incident_data.get("priority"),
-                "assigned_to": assigned_to,
-                "assignment_group": assignment_group,
-                "category": incident_data.get("category"),
-                "subcategory": incident_data.get("subcategory"),
-                "u_record_producer": incident_data.get("u_record_producer"),
-                "created_on": incident_data.get("sys_created_on"),
-                "updated_on": incident_data.get("sys_updated_on"),
-            }
-            incidents.append(incident)
-        
-        return {
-            "success": True,
-            "message": f"Found {len(incidents)} incidents",
-            "incidents": incidents
-        }
+        return _format_incident_list(response.json(), params.fields, page)
         
     except requests.RequestException as e:
         logger.error(f"Failed to list incidents: {e}")
@@ -633,35 +611,140 @@ def list_incidents(
         }
 
 
-def get_incident_by_number(
+async def list_incidents_async(
     config: ServerConfig,
     auth_manager: AuthManager,
-    params: GetIncidentByNumberParams,
+    params: ListIncidentsParams,
 ) -> dict:
     """
-    Fetch a single incident from ServiceNow by its number.
+    List incidents from ServiceNow without blocking the event loop.
+
+    Async variant of list_incidents used by the MCP server.
 
     Args:
         config: Server configuration.
         auth_manager: Authentication manager.
-        params: Parameters for fetching the incident.
+        params: Parameters for listing incidents.
 
     Returns:
-        Dictionary with the incident details.
+        Dictionary with list of incidents.
     """
     api_url = f"{config.api_url}/table/incident"
+    query_params = _list_incidents_query_params(params)
+    page = CursorPage(query_params, params.cursor)
+
+    # Mirror reads (SQLite) and token fetches block: keep them off the event loop
+    mirrored = await anyio.to_thread.run_sync(
+        read_from_mirror, config, auth_manager, "incident", query_params
+    )
+    if mirrored is not None:
+        return _format_incident_list({"result": mirrored}, params.fields, page)
+
+    try:
+        headers = await anyio.to_thread.run_sync(auth_manager.get_headers)
+        response = await get_async_http_client(auth_manager).get(
+            api_url,
+            params=query_params,
+            headers=headers,
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+
+        return _format_incident_list(response.json(), params.fields, page)
+
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to list incidents: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to list incidents: {str(e)}",
+            "incidents": []
+        }
 
-    # Build query parameters
+
+def _get_incident_by_number_query_params(params: GetIncidentByNumberParams) -> dict:
+    """Build the Table API query parameters for fetching an incident by number."""
     query_params = {
         "sysparm_query": f"number={params.incident_number}",
         "sysparm_limit": 1,
         "sysparm_display_value": "true",
         "sysparm_exclude_reference_link": "true",
     }
+    return apply_fields(query_params, "get_incident_by_number", params.fields)
+
+
+def _format_incident_by_number(
+    data: dict, incident_number: str, fields: Optional[List[str]] = None
+) -> dict:
+    """Convert a Table API incident lookup response into the get_incident_by_number result."""
+    result = data.get("result", [])
+
+    if not result:
+        return {
+            "success": False,
+            "message": f"Incident not found: {incident_number}",
+        }
+
+    incident_data = result[0]
+    if fields:
+        return {
+            "success": True,
+            "message": f"Incident {incident_number} found",
+            "incident": project_record(incident_data, fields),
+        }
+
+    assigned_to = incident_data.get("assigned_to")
+    if isinstance(assigned_to, dict):
+        assigned_to = assigned_to.get("display_value")
+
+    incident = {
+        "sys_id": incident_data.get("sys_id"),
+        "number": incident_data.get("number"),
+        "short_description": incident_data.get("short_description"),
+        "description": incident_data.get("description"),
+        "state": incident_data.get("state"),
+        "priority": incident_data.get("priority"),
+        "assigned_to": assigned_to,
+        "category": incident_data.get("category"),
+        "subcategory": incident_data.get("subcategory"),
+        "created_on": incident_data.get("sys_created_on"),
+        "updated_on": incident_data.get("sys_updated_on"),
+    }
+
+    return {
+        "success": True,
+        "message": f"Incident {incident_number} found",
+        "incident": incident,
+    }
+
+
+def get_incident_by_number(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: GetIncidentByNumberParams,
+) -> dict:
+    """
+    Fetch a single incident from ServiceNow by its number.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for fetching the incident.
+
+    Returns:
+        Dictionary with the incident details.
+    """
+    api_url = f"{config.api_url}/table/incident"
+    query_params = _get_incident_by_number_query_params(params)
+
+    mirrored = read_from_mirror(config, auth_manager, "incident", query_params)
+    if mirrored is not None:
+        return _format_incident_by_number(
+            {"result": mirrored}, params.incident_number, params.fields
+        )
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -669,43 +752,60 @@ def get_incident_by_number(
         )
         response.raise_for_status()
 
-        data = response.json()
-        result = data.get("result", [])
+        return _format_incident_by_number(response.json(), params.incident_number, params.fields)
 
-        if not result:
-            return {
-                "success": False,
-                "message": f"Incident not found: {params.incident_number}",
-            }
+    except requests.RequestException as e:
+        logger.error(f"Failed to fetch incident: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to fetch incident: {str(e)}",
+        }
 
-        incident_data = result[0]
-        assigned_to = incident_data.get("assigned_to")
-        if isinstance(assigned_to, dict):
-            assigned_to = assigned_to.get("display_value")
 
-        incident = {
-            "sys_id": incident_data.get("sys_id"),
-            "number": incident_data.get("number"),
-            "short_description": incident_data.get("short_description"),
-            "description": incident_data.get("description"),
-            "state": incident_data.get("state"),
-            "priority": incident_data.get("priority"),
-            "assigned_to": assigned_to,
-            "category": incident_data.get("category"),
-            "subcategory": incident_data.get("subcategory"),
-            "created_on": incident_data.get("sys_created_on"),
-            "updated_on": incident_data.get("sys_updated_on"),
-        }
+async def get_incident_by_number_async(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: GetIncidentByNumberParams,
+) -> dict:
+    """
+    Fetch a single incident from ServiceNow by its number without blocking the event loop.
 
-        return {
-            "success": True,
-            "message": f"Incident {params.incident_number} found",
-            "incident": incident,
-        }
+    Async variant of get_incident_by_number used by the MCP server.
 
-    except requests.RequestException as e:
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for fetching the incident.
+
+    Returns:
+        Dictionary with the incident details.
+    """
+    api_url = f"{config.api_url}/table/incident"
+    query_params = _get_incident_by_number_query_params(params)
+
+    mirrored = await anyio.to_thread.run_sync(
+        read_from_mirror, config, auth_manager, "incident", query_params
+    )
+    if mirrored is not None:
+        return _format_incident_by_number(
+            {"result": mirrored}, params.incident_number, params.fields
+        )
+
+    try:
+        headers = await anyio.to_thread.run_sync(auth_manager.get_headers)
+        response = await get_async_http_client(auth_manager).get(
+            api_url,
+            params=query_params,
+            headers=headers,
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+
+        return _format_incident_by_number(response.json(), params.incident_number, params.fields)
+
+    except httpx.HTTPError as e:
         logger.error(f"Failed to fetch incident: {e}")
         return {
             "success": False,
             "message": f"Failed to fetch incident: {str(e)}",
-        }
\ No newline at end of file
+        }
@@ -5,16 +5,32 @@ This module provides tools for managing knowledge bases, categories, and article
 """
 
 import logging
-from typing import Any, Dict, Optional
+import sqlite3
+from typing import Any, Dict, List, Optional
 
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.article_index import get_article_index
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields, project_record
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
+# Article fields search_articles reads from the instance; article bodies are left out
+SEARCH_FIELDS = (
+    "sys_id",
+    "number",
+    "short_description",
+    "kb_knowledge_base",
+    "kb_category",
+    "workflow_state",
+    "sys_updated_on",
+)
+
 
 class CreateKnowledgeBaseParams(BaseModel):
     """Parameters for creating a knowledge base."""
@@ -32,8 +48,12 @@ class ListKnowledgeBasesParams(BaseModel):
     
     limit: int = Field(10, description="Maximum number of knowledge bases to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     active: Optional[bool] = Field(None, description="Filter by active status")
     query: Optional[str] = Field(None, description="Search query for knowledge bases")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw knowledge base fields to return instead of the default summary"
+    )
 
 
 class CreateCategoryParams(BaseModel):
@@ -83,16 +103,38 @@ class ListArticlesParams(BaseModel):
     
     limit: int = Field(10, description="Maximum number of articles to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     knowledge_base: Optional[str] = Field(None, description="Filter by knowledge base")
     category: Optional[str] = Field(None, description="Filter by category")
     query: Optional[str] = Field(None, description="Search query for articles")
     workflow_state: Optional[str] = Field(None, description="Filter by workflow state")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw article fields to return instead of the default summary"
+    )
 
 
 class GetArticleParams(BaseModel):
     """Parameters for getting a knowledge article."""
 
     article_id: str = Field(..., description="ID of the article to get")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw article fields to return instead of the default details"
+    )
+
+
+class SearchArticlesParams(BaseModel):
+    """Parameters for searching knowledge articles."""
+
+    query: str = Field(..., description="Words to search for in article titles, keywords and text")
+    limit: int = Field(10, description="Maximum number of articles to return")
+    offset: int = Field(0, description="Offset for pagination")
+    knowledge_base: Optional[str] = Field(
+        None, description="Filter by knowledge base sys_id or name"
+    )
+    category: Optional[str] = Field(None, description="Filter by category sys_id or name")
+    workflow_state: Optional[str] = Field(
+        None, description="Filter by workflow state (e.g. published)"
+    )
 
 
 class KnowledgeBaseResponse(BaseModel):
@@ -130,8 +172,12 @@ class ListCategoriesParams(BaseModel):
     parent_category: Optional[str] = Field(None, description="Filter by parent category ID")
     limit: int = Field(10, description="Maximum number of categories to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     active: Optional[bool] = Field(None, description="Filter by active status")
     query: Optional[str] = Field(None, description="Search query for categories")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw category fields to return instead of the default summary"
+    )
 
 
 def create_knowledge_base(
@@ -170,7 +216,7 @@ def create_knowledge_base(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_http_client(auth_manager).post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -229,10 +275,12 @@ def list_knowledge_bases(
 
     if query_parts:
         query_params["sysparm_query"] = "^".join(query_parts)
+    apply_fields(query_params, "list_knowledge_bases", params.fields)
+    page = CursorPage(query_params, params.cursor)
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -266,6 +314,9 @@ def list_knowledge_bases(
                 if not isinstance(kb_item, dict):
                     logger.warning("Skipping non-dictionary KB item: %s", kb_item)
                     continue
+                if params.fields:
+                    knowledge_bases.append(project_record(kb_item, params.fields))
+                    continue
                     
                 # Safely extract values
                 kb_id = kb_item.get("sys_id", "")
@@ -308,6 +359,7 @@ def list_knowledge_bases(
             "count": len(knowledge_bases),
             "limit": params.limit,
             "offset": params.offset,
+            **page.cursor_fields(result),
         }
 
     except requests.RequestException as e:
@@ -360,7 +412,7 @@ def create_category(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_http_client(auth_manager).post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -428,7 +480,7 @@ def create_article(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_http_client(auth_manager).post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -488,7 +540,7 @@ def update_article(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_http_client(auth_manager).patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -542,7 +594,7 @@ def publish_article(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_http_client(auth_manager).patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -608,13 +660,15 @@ def list_articles(
         query_string = "^".join(query_parts)
         logger.debug(f"Constructed article query string: {query_string}")
         query_params["sysparm_query"] = query_string
+    apply_fields(query_params, "list_articles", params.fields)
+    page = CursorPage(query_params, params.cursor)
     
     # Log the query parameters for debugging
     logger.debug(f"Listing articles with query params: {query_params}")
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -649,6 +703,9 @@ def list_articles(
                 if not isinstance(article_item, dict):
                     logger.warning("Skipping non-dictionary article item: %s", article_item)
                     continue
+                if params.fields:
+                    articles.append(project_record(article_item, params.fields))
+                    continue
                     
                 # Safely extract values
                 article_id = article_item.get("sys_id", "")
@@ -689,6 +746,7 @@ def list_articles(
             "count": len(articles),
             "limit": params.limit,
             "offset": params.offset,
+            **page.cursor_fields(result),
         }
 
     except requests.RequestException as e:
@@ -725,10 +783,11 @@ def get_article(
     query_params = {
         "sysparm_display_value": "true",
     }
+    apply_fields(query_params, "get_article", params.fields)
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -755,6 +814,13 @@ def get_article(
                 "message": f"Article with ID {params.article_id} not found",
             }
 
+        if params.fields:
+            return {
+                "success": True,
+                "message": "Article retrieved successfully",
+                "article": project_record(result, params.fields),
+            }
+
         # Extract values safely
         article_id = result.get("sys_id", "")
         title = result.get("short_description", "")
@@ -812,6 +878,128 @@ def get_article(
         }
 
 
+def search_articles(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: SearchArticlesParams,
+) -> Dict[str, Any]:
+    """
+    Search knowledge articles, best matches first.
+
+    Searches the local full-text index of the mirrored articles when it is
+    fresh, returning BM25-ranked summaries with a snippet of the matching text.
+    Otherwise searches the instance, without ranking or snippets. Article
+    bodies are not returned; use get_article for the article chosen.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for searching articles.
+
+    Returns:
+        Dictionary with the matching articles and metadata.
+    """
+    try:
+        # Raises sqlite3.OperationalError if SQLite was built without FTS5
+        index = get_article_index(config, auth_manager)
+    except sqlite3.Error as e:
+        logger.warning(f"Article index unavailable, searching the instance: {e}")
+        index = None
+    if index is not None and index.is_available():
+        try:
+            articles = index.search(
+                params.query,
+                limit=params.limit,
+                offset=params.offset,
+                knowledge_base=params.knowledge_base,
+                category=params.category,
+                workflow_state=params.workflow_state,
+            )
+            return {
+                "success": True,
+                "message": f"Found {len(articles)} articles",
+                "articles": articles,
+                "count": len(articles),
+                "limit": params.limit,
+                "offset": params.offset,
+                "source": "index",
+            }
+        except sqlite3.Error as e:
+            logger.warning(f"Article index search failed, searching the instance: {e}")
+
+    query_parts = [f"short_descriptionLIKE{params.query}^ORtextLIKE{params.query}"]
+    if params.knowledge_base:
+        query_parts.append(
+            f"kb_knowledge_base.sys_id={params.knowledge_base}"
+            f"^ORkb_knowledge_base.title={params.knowledge_base}"
+        )
+    if params.category:
+        query_parts.append(
+            f"kb_category.sys_id={params.category}^ORkb_category.label={params.category}"
+        )
+    if params.workflow_state:
+        query_parts.append(f"workflow_state={params.workflow_state}")
+    query_params = {
+        "sysparm_query": "^".join(query_parts),
+        "sysparm_limit": params.limit,
+        "sysparm_offset": params.offset,
+        "sysparm_display_value": "all",
+        "sysparm_fields": ",".join(SEARCH_FIELDS),
+        "sysparm_exclude_reference_link": "true",
+    }
+
+    try:
+        response = get_http_client(auth_manager).get(
+            f"{config.api_url}/table/kb_knowledge",
+            params=query_params,
+            headers=auth_manager.get_headers(),
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+        result = response.json().get("result", [])
+    except requests.RequestException as e:
+        logger.error(f"Failed to search articles: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to search articles: {str(e)}",
+            "articles": [],
+            "count": 0,
+            "limit": params.limit,
+            "offset": params.offset,
+        }
+
+    def value(article: Dict[str, Any], field: str, key: str = "value") -> str:
+        field_value = article.get(field)
+        if isinstance(field_value, dict):
+            field_value = field_value.get(key)
+        return field_value or ""
+
+    articles = [
+        {
+            "id": value(article, "sys_id"),
+            "number": value(article, "number"),
+            "title": value(article, "short_description"),
+            "knowledge_base": value(article, "kb_knowledge_base", "display_value"),
+            "category": value(article, "kb_category", "display_value"),
+            "workflow_state": value(article, "workflow_state"),
+            "updated": value(article, "sys_updated_on"),
+            "score": None,
+            "snippet": "",
+        }
+        for article in result
+        if isinstance(article, dict)
+    ]
+    return {
+        "success": True,
+        "message": f"Found {len(articles)} articles",
+        "articles": articles,
+        "count": len(articles),
+        "limit": params.limit,
+        "offset": params.offset,
+        "source": "instance",
+    }
+
+
 def list_categories(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -853,13 +1041,15 @@ def list_categories(
         query_string = "^".join(query_parts)
         logger.debug(f"Constructed query string: {query_string}")
         query_params["sysparm_query"] = query_string
+    apply_fields(query_params, "list_categories", params.fields)
+    page = CursorPage(query_params, params.cursor)
     
     # Log the query parameters for debugging
     logger.debug(f"Listing categories with query params: {query_params}")
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -893,6 +1083,9 @@ def list_categories(
                 if not isinstance(category_item, dict):
                     logger.warning("Skipping non-dictionary category item: %s", category_item)
                     continue
+                if params.fields:
+                    categories.append(project_record(category_item, params.fields))
+                    continue
                     
                 # Safely extract values
                 category_id = category_item.get("sys_id", "")
@@ -960,6 +1153,7 @@ def list_categories(
             "count": len(categories),
             "limit": params.limit,
             "offset": params.offset,
+            **page.cursor_fields(result),
         }
 
     except requests.RequestException as e:
@@ -4,7 +4,9 @@ import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.cache import get_reference_cache
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,10 +25,10 @@ def get_field_choices(
     """
     api_url = f"{config.api_url}/table/sys_choice"
     query = f"name={params.table_name}^element={params.field_name}^language={params.language}^inactive=false"
-    query_params = {"sysparm_query": query}
+    query_params = {"sysparm_query": query, "sysparm_fields": "label,value"}
 
-    try:
-        response = requests.get(
+    def fetch_choices() -> List[dict]:
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -34,10 +36,15 @@ def get_field_choices(
         )
         response.raise_for_status()
         data = response.json()
-        choices = [
+        return [
             {"label": choice.get("label"), "value": choice.get("value")}
             for choice in data.get("result", [])
         ]
+
+    try:
+        choices = get_reference_cache(config, auth_manager).get_or_fetch(
+            "sys_choice", query, fetch_choices, fields="label,value"
+        )
         return {
             "success": True,
             "choices": choices,
@@ -13,6 +13,9 @@ from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -53,10 +56,14 @@ class ListProjectsParams(BaseModel):
 
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     state: Optional[str] = Field(None, description="Filter by state")
     assignment_group: Optional[str] = Field(None, description="Filter by assignment group")
     timeframe: Optional[str] = Field(None, description="Filter by timeframe (upcoming, in-progress, completed)")
     query: Optional[str] = Field(None, description="Additional query string")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw project fields to return; all fields if omitted"
+    )
 
 
 def _unwrap_and_validate_params(params: Any, model_class: Type[T], required_fields: List[str] = None) -> Dict[str, Any]:
@@ -237,7 +244,7 @@ def create_project(
     url = f"{instance_url}/api/now/table/pm_project"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -330,7 +337,7 @@ def update_project(
     url = f"{instance_url}/api/now/table/pm_project/{validated_params.project_id}"
     
     try:
-        response = requests.put(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).put(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -424,9 +431,16 @@ def list_projects(
         "sysparm_query": query,
         "sysparm_display_value": "true",
     }
+    apply_fields(params, "list_projects", validated_params.fields)
+    # start_date and end_date are compared to now; cursors are keyed by the filters
+    page = CursorPage(
+        params,
+        validated_params.cursor,
+        key=validated_params.model_dump_json(exclude={"limit", "offset", "cursor", "fields"}),
+    )
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=params)
         response.raise_for_status()
         
         result = response.json()
@@ -440,6 +454,7 @@ def list_projects(
             "projects": projects,
             "count": count,
             "total": count,  # Use count as total if total is not provided
+            **page.cursor_fields(projects),
         }
     except requests.exceptions.RequestException as e:
         logger.error(f"Error listing projects: {e}")
@@ -4,13 +4,16 @@ Request tools for the ServiceNow MCP server.
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
 
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +22,10 @@ class ListRequestsParams(BaseModel):
     """Parameters for listing requests."""    
     limit: int = Field(10, description="Maximum number of requests to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     display_value: bool = Field(True, description="Return display values for reference fields.")
     query: Optional[str] = Field(None, description="A ServiceNow encoded query string for filtering requests.")
+    fields: Optional[List[FieldName]] = Field(None, description="Raw requested item fields to return; all fields if omitted")
 
 class CountRequestsParams(BaseModel):
     """Parameters for counting requests."""
@@ -55,7 +60,7 @@ def update_request(
         data["u_close_code"] = params.u_close_code
 
     try:
-        response = requests.put(
+        response = get_http_client(auth_manager).put(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -94,9 +99,11 @@ def list_requests(
     
     if params.query:
         query_params["sysparm_query"] = params.query
+    apply_fields(query_params, "list_requests", params.fields)
+    page = CursorPage(query_params, params.cursor)
     
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -117,7 +124,8 @@ def list_requests(
         return {
             "success": True,
             "message": f"Found {len(requests_list)} requests",
-            "requests": requests_list
+            "requests": requests_list,
+            **page.cursor_fields(data.get("result", [])),
         }
         
     except requests.RequestException as e:
@@ -145,7 +153,7 @@ def count_requests(
         query_params["sysparm_query"] = params.query
 
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -5,13 +5,16 @@ This module provides tools for managing script includes in ServiceNow.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields, project_record
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +24,22 @@ class ListScriptIncludesParams(BaseModel):
     
     limit: int = Field(10, description="Maximum number of script includes to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     active: Optional[bool] = Field(None, description="Filter by active status")
     client_callable: Optional[bool] = Field(None, description="Filter by client callable status")
     query: Optional[str] = Field(None, description="Search query for script includes")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw script include fields to return instead of the default summary"
+    )
 
 
 class GetScriptIncludeParams(BaseModel):
     """Parameters for getting a script include."""
     
     script_include_id: str = Field(..., description="Script include ID or name")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw script include fields to return instead of the default details"
+    )
 
 
 class CreateScriptIncludeParams(BaseModel):
@@ -96,8 +106,8 @@ def list_script_includes(
             "sysparm_offset": params.offset,
             "sysparm_display_value": "true",
             "sysparm_exclude_reference_link": "true",
-            "sysparm_fields": "sys_id,name,script,description,api_name,client_callable,active,access,sys_created_on,sys_updated_on,sys_created_by,sys_updated_by"
         }
+        apply_fields(query_params, "list_script_includes", params.fields)
         
         # Add filters if provided
         query_parts = []
@@ -113,11 +123,12 @@ def list_script_includes(
             
         if query_parts:
             query_params["sysparm_query"] = "^".join(query_parts)
+        page = CursorPage(query_params, params.cursor)
             
         # Make the request
         headers = auth_manager.get_headers()
         
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             url,
             params=query_params,
             headers=headers,
@@ -130,6 +141,9 @@ def list_script_includes(
         script_includes = []
         
         for item in data.get("result", []):
+            if params.fields:
+                script_includes.append(project_record(item, params.fields))
+                continue
             script_include = {
                 "sys_id": item.get("sys_id"),
                 "name": item.get("name"),
@@ -152,6 +166,7 @@ def list_script_includes(
             "total": len(script_includes),
             "limit": params.limit,
             "offset": params.offset,
+            **page.cursor_fields(data.get("result", [])),
         }
         
     except Exception as e:
@@ -186,8 +201,8 @@ def get_script_include(
         query_params = {
             "sysparm_display_value": "true",
             "sysparm_exclude_reference_link": "true",
-            "sysparm_fields": "sys_id,name,script,description,api_name,client_callable,active,access,sys_created_on,sys_updated_on,sys_created_by,sys_updated_by"
         }
+        apply_fields(query_params, "get_script_include", params.fields)
         
         # Determine if we're querying by sys_id or name
         if params.script_include_id.startswith("sys_id:"):
@@ -201,7 +216,7 @@ def get_script_include(
         # Make the request
         headers = auth_manager.get_headers()
         
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             url,
             params=query_params,
             headers=headers,
@@ -230,6 +245,13 @@ def get_script_include(
         else:
             item = result
             
+        if params.fields:
+            return {
+                "success": True,
+                "message": f"Found script include: {item.get('name') or params.script_include_id}",
+                "script_include": project_record(item, params.fields),
+            }
+            
         script_include = {
             "sys_id": item.get("sys_id"),
             "name": item.get("name"),
@@ -296,7 +318,7 @@ def create_script_include(
     headers = auth_manager.get_headers()
     
     try:
-        response = requests.post(
+        response = get_http_client(auth_manager).post(
             url,
             json=body,
             headers=headers,
@@ -395,7 +417,7 @@ def update_script_include(
     headers = auth_manager.get_headers()
     
     try:
-        response = requests.patch(
+        response = get_http_client(auth_manager).patch(
             url,
             json=body,
             headers=headers,
@@ -465,7 +487,7 @@ def delete_script_include(
     headers = auth_manager.get_headers()
     
     try:
-        response = requests.delete(
+        response = get_http_client(auth_manager).delete(
             url,
             headers=headers,
             timeout=30,
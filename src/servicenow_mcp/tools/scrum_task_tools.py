@@ -13,6 +13,9 @@ from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client, order_auth_and_config
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -56,10 +59,14 @@ class ListScrumTasksParams(BaseModel):
 
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     state: Optional[str] = Field(None, description="Filter by state")
     assignment_group: Optional[str] = Field(None, description="Filter by assignment group")
     timeframe: Optional[str] = Field(None, description="Filter by timeframe (upcoming, in-progress, completed)")
     query: Optional[str] = Field(None, description="Additional query string")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw scrum task fields to return; all fields if omitted"
+    )
 
 
 def _unwrap_and_validate_params(params: Any, model_class: Type[T], required_fields: List[str] = None) -> Dict[str, Any]:
@@ -179,6 +186,7 @@ def create_scrum_task(
     Returns:
         The created scrum task.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
 
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
@@ -243,7 +251,7 @@ def create_scrum_task(
     url = f"{instance_url}/api/now/table/rm_scrum_task"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -276,6 +284,7 @@ def update_scrum_task(
     Returns:
         The updated scrum task.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -338,7 +347,7 @@ def update_scrum_task(
     url = f"{instance_url}/api/now/table/rm_scrum_task/{validated_params.scrum_task_id}"
     
     try:
-        response = requests.put(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).put(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -371,6 +380,7 @@ def list_scrum_tasks(
     Returns:
         A list of scrum tasks.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -432,9 +442,16 @@ def list_scrum_tasks(
         "sysparm_query": query,
         "sysparm_display_value": "true",
     }
+    apply_fields(params, "list_scrum_tasks", validated_params.fields)
+    # Timeframes compare dates to the current time, so cursors are keyed by the filters
+    page = CursorPage(
+        params,
+        validated_params.cursor,
+        key=validated_params.model_dump_json(exclude={"limit", "offset", "cursor", "fields"}),
+    )
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=params)
         response.raise_for_status()
         
         result = response.json()
@@ -448,6 +465,7 @@ def list_scrum_tasks(
             "scrum_tasks": scrum_tasks,
             "count": count,
             "total": count,  # Use count as total if total is not provided
+            **page.cursor_fields(scrum_tasks),
         }
     except requests.exceptions.RequestException as e:
         logger.error(f"Error listing stories: {e}")
@@ -13,6 +13,10 @@ from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client, order_auth_and_config
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
+from servicenow_mcp.utils.resolver import resolve_identifiers
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +40,7 @@ class CreateStoryParams(BaseModel):
 class UpdateStoryParams(BaseModel):
     """Parameters for updating a story."""
 
-    story_id: str = Field(..., description="Story IDNumber or sys_id. You will need to fetch the story to get the sys_id if you only have the story number")
+    story_id: str = Field(..., description="Story number or sys_id")
     short_description: Optional[str] = Field(None, description="Short description of the story")
     acceptance_criteria: Optional[str] = Field(None, description="Acceptance criteria for the story")
     description: Optional[str] = Field(None, description="Detailed description of the story")
@@ -53,25 +57,33 @@ class ListStoriesParams(BaseModel):
 
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     state: Optional[str] = Field(None, description="Filter by state")
     assignment_group: Optional[str] = Field(None, description="Filter by assignment group")
     timeframe: Optional[str] = Field(None, description="Filter by timeframe (upcoming, in-progress, completed)")
     query: Optional[str] = Field(None, description="Additional query string")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw story fields to return; all fields if omitted"
+    )
 
 class ListStoryDependenciesParams(BaseModel):
     """Parameters for listing story dependencies."""
 
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     query: Optional[str] = Field(None, description="Additional query string")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw story dependency fields to return; all fields if omitted"
+    )
     dependent_story: Optional[str] = Field(None, description="Sys_id of the dependent story is required")
     prerequisite_story: Optional[str] = Field(None, description="Sys_id that this story depends on is required")
 
 class CreateStoryDependencyParams(BaseModel):
     """Parameters for creating a story dependency."""
 
-    dependent_story: str = Field(..., description="Sys_id of the dependent story is required")
-    prerequisite_story: str = Field(..., description="Sys_id that this story depends on is required")
+    dependent_story: str = Field(..., description="Number or sys_id of the dependent story")
+    prerequisite_story: str = Field(..., description="Number or sys_id of the story it depends on")
 
 class DeleteStoryDependencyParams(BaseModel):
     """Parameters for deleting a story dependency."""
@@ -195,6 +207,7 @@ def create_story(
     Returns:
         The created story.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
 
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
@@ -255,7 +268,7 @@ def create_story(
     url = f"{instance_url}/api/now/table/rm_story"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -288,6 +301,7 @@ def update_story(
     Returns:
         The updated story.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -300,6 +314,12 @@ def update_story(
     
     validated_params = result["params"]
     
+    # Accept a record number as well as a sys_id
+    resolved = resolve_identifiers(server_config, auth_manager, "rm_story", [validated_params.story_id])
+    if not resolved["success"]:
+        return resolved
+    validated_params.story_id = resolved["sys_ids"][0]
+    
     # Prepare the request data
     data = {}
     
@@ -348,7 +368,7 @@ def update_story(
     url = f"{instance_url}/api/now/table/rm_story/{validated_params.story_id}"
     
     try:
-        response = requests.put(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).put(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -381,6 +401,7 @@ def list_stories(
     Returns:
         A list of stories.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -442,9 +463,16 @@ def list_stories(
         "sysparm_query": query,
         "sysparm_display_value": "true",
     }
+    apply_fields(params, "list_stories", validated_params.fields)
+    # Cursors are checked against the filters: the timeframe query changes with the time
+    page = CursorPage(
+        params,
+        validated_params.cursor,
+        key=validated_params.model_dump_json(exclude={"limit", "offset", "cursor", "fields"}),
+    )
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=params)
         response.raise_for_status()
         
         result = response.json()
@@ -458,6 +486,7 @@ def list_stories(
             "stories": stories,
             "count": count,
             "total": count,  # Use count as total if total is not provided
+            **page.cursor_fields(stories),
         }
     except requests.exceptions.RequestException as e:
         logger.error(f"Error listing stories: {e}")
@@ -482,6 +511,7 @@ def list_story_dependencies(
     Returns:
         A list of story dependencies.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters
     result = _unwrap_and_validate_params(
         params, 
@@ -533,9 +563,11 @@ def list_story_dependencies(
         "sysparm_query": query,
         "sysparm_display_value": "true",
     }
+    apply_fields(params, "list_story_dependencies", validated_params.fields)
+    page = CursorPage(params, validated_params.cursor)
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=params)
         response.raise_for_status()
         
         result = response.json()
@@ -549,6 +581,7 @@ def list_story_dependencies(
             "story_dependencies": story_dependencies,
             "count": count,
             "total": count,  # Use count as total if total is not provided
+            **page.cursor_fields(story_dependencies),
         }
     except requests.exceptions.RequestException as e:
         logger.error(f"Error listing story dependencies: {e}")
@@ -573,6 +606,7 @@ def create_story_dependency(
     Returns:
         The created story dependency.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters    
     result = _unwrap_and_validate_params(
         params, 
@@ -585,6 +619,18 @@ def create_story_dependency(
     
     validated_params = result["params"]
     
+    # Accept record numbers as well as sys_ids
+    resolved = resolve_identifiers(
+        server_config,
+        auth_manager,
+        "rm_story",
+        [validated_params.dependent_story, validated_params.prerequisite_story],
+    )
+    if not resolved["success"]:
+        return resolved
+    validated_params.dependent_story = resolved["sys_ids"][0]
+    validated_params.prerequisite_story = resolved["sys_ids"][1]
+    
     # Prepare the request data
     data = {
         "dependent_story": validated_params.dependent_story,
@@ -614,7 +660,7 @@ def create_story_dependency(
     url = f"{instance_url}/api/now/table/m2m_story_dependencies"
     
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_client(auth_manager).post(url, json=data, headers=headers)
         response.raise_for_status()
         
         result = response.json()    
@@ -645,6 +691,7 @@ def delete_story_dependency(
     Returns:
         The deleted story dependency.
     """
+    auth_manager, server_config = order_auth_and_config(auth_manager, server_config)
     # Unwrap and validate parameters    
     result = _unwrap_and_validate_params(
         params, 
@@ -677,7 +724,7 @@ def delete_story_dependency(
     url = f"{instance_url}/api/now/table/m2m_story_dependencies/{validated_params.dependency_id}"
     
     try:
-        response = requests.delete(url, headers=headers)
+        response = get_http_client(auth_manager).delete(url, headers=headers)
         response.raise_for_status()
         
         return {
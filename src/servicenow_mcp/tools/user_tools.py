@@ -5,13 +5,18 @@ This module provides tools for managing users and groups in ServiceNow.
 """
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.batch import BatchRequest, execute_batch
+from servicenow_mcp.utils.cache import get_reference_cache
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields, project_record
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +64,9 @@ class GetUserParams(BaseModel):
     user_id: Optional[str] = Field(None, description="User ID or sys_id")
     user_name: Optional[str] = Field(None, description="Username of the user")
     email: Optional[str] = Field(None, description="Email address of the user")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw user fields to return; all fields if omitted"
+    )
 
 
 class ListUsersParams(BaseModel):
@@ -66,12 +74,16 @@ class ListUsersParams(BaseModel):
 
     limit: int = Field(10, description="Maximum number of users to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     active: Optional[bool] = Field(None, description="Filter by active status")
     department: Optional[str] = Field(None, description="Filter by department")
     query: Optional[str] = Field(
         None,
         description="Case-insensitive search term that matches against name, username, or email fields. Uses ServiceNow's LIKE operator for partial matching.",
     )
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw user fields to return; all fields if omitted"
+    )
 
 
 class CreateGroupParams(BaseModel):
@@ -125,12 +137,16 @@ class ListGroupsParams(BaseModel):
 
     limit: int = Field(10, description="Maximum number of groups to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     active: Optional[bool] = Field(None, description="Filter by active status")
     query: Optional[str] = Field(
         None,
         description="Case-insensitive search term that matches against group name or description fields. Uses ServiceNow's LIKE operator for partial matching.",
     )
     type: Optional[str] = Field(None, description="Filter by group type")
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw group fields to return; all fields if omitted"
+    )
 
 
 class ListGroupMembersParams(BaseModel):
@@ -139,6 +155,10 @@ class ListGroupMembersParams(BaseModel):
     group_id: str = Field(..., description="Group ID or sys_id")
     limit: int = Field(100, description="Maximum number of members to return")
     offset: int = Field(0, description="Offset for pagination")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
+    fields: Optional[List[FieldName]] = Field(
+        None, description="Raw group membership fields to return instead of the member summary"
+    )
 
 
 class UserResponse(BaseModel):
@@ -159,6 +179,21 @@ class GroupResponse(BaseModel):
     group_name: Optional[str] = Field(None, description="Name of the affected group")
 
 
+def _find_group_id(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    group_name: str,
+) -> Optional[str]:
+    """Get the sys_id of the group with exactly the given name, or None."""
+    group_info = list_groups(
+        config, auth_manager, ListGroupsParams(query=group_name, fields=["sys_id", "name"])
+    )
+    for group in group_info.get("groups") or []:
+        if group.get("name") == group_name:
+            return group.get("sys_id")
+    return None
+
+
 def list_group_members(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -171,19 +206,13 @@ def list_group_members(
     group_id = params.group_id
     if not all(c in "0123456789abcdef" for c in group_id) or len(group_id) != 32:
         # It's a name, not a sys_id, so get the sys_id
-        group_info = list_groups(config, auth_manager, ListGroupsParams(query=params.group_id))
-        if group_info.get("success") and group_info.get("groups"):
-            found_group = None
-            for group in group_info["groups"]:
-                if group.get("name") == params.group_id:
-                    found_group = group
-                    break
-            
-            if found_group:
-                group_id = found_group.get("sys_id")
-            else:
-                return {"success": False, "message": f"Group '{params.group_id}' not found."}
-        else:
+        group_id = get_reference_cache(config, auth_manager).get_or_fetch(
+            "sys_user_group",
+            f"name={params.group_id}",
+            lambda: _find_group_id(config, auth_manager, params.group_id),
+            fields="sys_id",
+        )
+        if not group_id:
             return {"success": False, "message": f"Group '{params.group_id}' not found."}
     api_url = f"{config.api_url}/table/sys_user_grmember"
     query_params = {
@@ -192,9 +221,11 @@ def list_group_members(
         "sysparm_offset": str(params.offset),
         "sysparm_display_value": "true",
     }
+    apply_fields(query_params, "list_group_members", params.fields)
+    page = CursorPage(query_params, params.cursor)
 
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -206,6 +237,9 @@ def list_group_members(
         
         members = []
         for member_data in result:
+            if params.fields:
+                members.append(project_record(member_data, params.fields))
+                continue
             user_info = member_data.get("user", {})
             members.append({
                 "user_name": user_info.get("display_value"),
@@ -216,6 +250,7 @@ def list_group_members(
             "success": True,
             "message": f"Found {len(members)} members in group",
             "members": members,
+            **page.cursor_fields(result),
         }
 
     except requests.RequestException as e:
@@ -269,7 +304,7 @@ def create_user(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_http_client(auth_manager).post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -345,7 +380,7 @@ def update_user(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_http_client(auth_manager).patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -405,10 +440,11 @@ def get_user(
 
     query_params["sysparm_limit"] = "1"
     query_params["sysparm_display_value"] = "true"
+    apply_fields(query_params, "get_user", params.fields)
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -463,10 +499,12 @@ def list_users(
 
     if query_parts:
         query_params["sysparm_query"] = "^".join(query_parts)
+    apply_fields(query_params, "list_users", params.fields)
+    page = CursorPage(query_params, params.cursor)
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -481,6 +519,7 @@ def list_users(
             "message": f"Found {len(result)} users",
             "users": result,
             "count": len(result),
+            **page.cursor_fields(result),
         }
 
     except requests.RequestException as e:
@@ -522,10 +561,12 @@ def list_groups(
 
     if query_parts:
         query_params["sysparm_query"] = "^".join(query_parts)
+    apply_fields(query_params, "list_groups", params.fields)
+    page = CursorPage(query_params, params.cursor)
 
     # Make request
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -540,6 +581,7 @@ def list_groups(
             "message": f"Found {len(result)} groups",
             "groups": result,
             "count": len(result),
+            **page.cursor_fields(result),
         }
 
     except requests.RequestException as e:
@@ -565,38 +607,84 @@ def assign_roles_to_user(
     Returns:
         Boolean indicating success.
     """
-    # For each role, create a user_role record
-    api_url = f"{config.api_url}/table/sys_user_has_role"
+    if not roles:
+        return True
+
+    headers = auth_manager.get_headers()
+
+    # Resolve all role names in one query
+    role_query = f"nameIN{','.join(sorted(set(roles)))}"
+
+    def fetch_role_ids() -> Dict[str, str]:
+        response = get_http_client(auth_manager).get(
+            f"{config.api_url}/table/sys_user_role",
+            params={
+                "sysparm_query": role_query,
+                "sysparm_fields": "sys_id,name",
+                "sysparm_limit": str(len(roles)),
+            },
+            headers=headers,
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+        return {
+            role.get("name"): role.get("sys_id") for role in response.json().get("result", [])
+        }
 
-    success = True
+    try:
+        role_ids = get_reference_cache(config, auth_manager).get_or_fetch(
+            "sys_user_role", role_query, fetch_role_ids, fields="sys_id,name"
+        )
+
+        # Find the roles the user already has in one query
+        existing = set()
+        if role_ids:
+            response = get_http_client(auth_manager).get(
+                f"{config.api_url}/table/sys_user_has_role",
+                params={
+                    "sysparm_query": f"user={user_id}^roleIN{','.join(role_ids.values())}",
+                    "sysparm_fields": "role",
+                    "sysparm_limit": str(len(role_ids)),
+                },
+                headers=headers,
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+            for assignment in response.json().get("result", []):
+                role = assignment.get("role")
+                existing.add(role.get("value") if isinstance(role, dict) else role)
+    except requests.RequestException as e:
+        logger.error(f"Failed to look up roles for assignment: {e}")
+        return False
+
+    to_assign = []
     for role in roles:
-        # First check if the role exists
-        role_id = get_role_id(config, auth_manager, role)
+        role_id = role_ids.get(role)
         if not role_id:
             logger.warning(f"Role '{role}' not found, skipping assignment")
-            continue
-
-        # Check if the user already has this role
-        if check_user_has_role(config, auth_manager, user_id, role_id):
+        elif role_id in existing:
             logger.info(f"User already has role '{role}', skipping assignment")
-            continue
-
-        # Create the user role assignment
-        data = {
-            "user": user_id,
-            "role": role_id,
-        }
-
-        try:
-            response = requests.post(
-                api_url,
-                json=data,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
+        else:
+            to_assign.append(role)
+
+    # Create the user role assignments
+    results = execute_batch(
+        config,
+        auth_manager,
+        [
+            BatchRequest(
+                method="POST",
+                path="/api/now/table/sys_user_has_role",
+                body={"user": user_id, "role": role_ids[role]},
             )
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Failed to assign role '{role}' to user: {e}")
+            for role in to_assign
+        ],
+    )
+
+    success = True
+    for role, result in zip(to_assign, results):
+        if not result.success:
+            logger.error(f"Failed to assign role '{role}' to user: {result.error}")
             success = False
 
     return success
@@ -621,11 +709,12 @@ def get_role_id(
     api_url = f"{config.api_url}/table/sys_user_role"
     query_params = {
         "sysparm_query": f"name={role_name}",
+        "sysparm_fields": "sys_id",
         "sysparm_limit": "1",
     }
 
-    try:
-        response = requests.get(
+    def fetch_role_id() -> Optional[str]:
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -639,6 +728,11 @@ def get_role_id(
 
         return result[0].get("sys_id")
 
+    try:
+        return get_reference_cache(config, auth_manager).get_or_fetch(
+            "sys_user_role", query_params["sysparm_query"], fetch_role_id, fields="sys_id"
+        )
+
     except requests.RequestException as e:
         logger.error(f"Failed to get role ID: {e}")
         return None
@@ -669,7 +763,7 @@ def check_user_has_role(
     }
 
     try:
-        response = requests.get(
+        response = get_http_client(auth_manager).get(
             api_url,
             params=query_params,
             headers=auth_manager.get_headers(),
@@ -722,7 +816,7 @@ def create_group(
 
     # Make request
     try:
-        response = requests.post(
+        response = get_http_client(auth_manager).post(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -793,7 +887,7 @@ def update_group(
 
     # Make request
     try:
-        response = requests.patch(
+        response = get_http_client(auth_manager).patch(
             api_url,
             json=data,
             headers=auth_manager.get_headers(),
@@ -818,6 +912,34 @@ def update_group(
         )
 
 
+def _resolve_member_user_id(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    member: str,
+) -> Optional[str]:
+    """
+    Resolve a group member given as user name, email or sys_id to a user sys_id.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        member: User name, email or "sys_id:" prefixed value.
+
+    Returns:
+        The user ID, or None if the user could not be found.
+    """
+    if member.startswith("sys_id:"):
+        return member
+
+    user = get_user(config, auth_manager, GetUserParams(user_name=member))
+    if not user.get("success"):
+        user = get_user(config, auth_manager, GetUserParams(email=member))
+
+    if user.get("success"):
+        return user.get("user", {}).get("sys_id")
+    return None
+
+
 def add_group_members(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -834,42 +956,34 @@ def add_group_members(
     Returns:
         Response with the result of the operation.
     """
-    api_url = f"{config.api_url}/table/sys_user_grmember"
-
     success = True
     failed_members = []
+    members_to_add = []
 
     for member in params.members:
-        # Get user ID if username is provided
-        user_id = member
-        if not member.startswith("sys_id:"):
-            user = get_user(config, auth_manager, GetUserParams(user_name=member))
-            if not user.get("success"):
-                user = get_user(config, auth_manager, GetUserParams(email=member))
-
-            if user.get("success"):
-                user_id = user.get("user", {}).get("sys_id")
-            else:
-                success = False
-                failed_members.append(member)
-                continue
-
-        # Create group membership
-        data = {
-            "group": params.group_id,
-            "user": user_id,
-        }
-
-        try:
-            response = requests.post(
-                api_url,
-                json=data,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
+        user_id = _resolve_member_user_id(config, auth_manager, member)
+        if user_id is None:
+            success = False
+            failed_members.append(member)
+        else:
+            members_to_add.append((member, user_id))
+
+    # Create the group memberships
+    results = execute_batch(
+        config,
+        auth_manager,
+        [
+            BatchRequest(
+                method="POST",
+                path="/api/now/table/sys_user_grmember",
+                body={"group": params.group_id, "user": user_id},
             )
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Failed to add member '{member}' to group: {e}")
+            for _, user_id in members_to_add
+        ],
+    )
+    for (member, _), result in zip(members_to_add, results):
+        if not result.success:
+            logger.error(f"Failed to add member '{member}' to group: {result.error}")
             success = False
             failed_members.append(member)
 
@@ -903,58 +1017,59 @@ def remove_group_members(
     """
     success = True
     failed_members = []
+    members_to_remove = []
 
     for member in params.members:
-        # Get user ID if username is provided
-        user_id = member
-        if not member.startswith("sys_id:"):
-            user = get_user(config, auth_manager, GetUserParams(user_name=member))
-            if not user.get("success"):
-                user = get_user(config, auth_manager, GetUserParams(email=member))
-
-            if user.get("success"):
-                user_id = user.get("user", {}).get("sys_id")
-            else:
-                success = False
-                failed_members.append(member)
-                continue
-
-        # Find and delete the group membership
-        api_url = f"{config.api_url}/table/sys_user_grmember"
-        query_params = {
-            "sysparm_query": f"group={params.group_id}^user={user_id}",
-            "sysparm_limit": "1",
-        }
+        user_id = _resolve_member_user_id(config, auth_manager, member)
+        if user_id is None:
+            success = False
+            failed_members.append(member)
+        else:
+            members_to_remove.append((member, user_id))
 
+    # Find all the membership records in one query
+    membership_ids = {}
+    if members_to_remove:
+        user_ids = ",".join(user_id for _, user_id in members_to_remove)
         try:
-            # First find the membership record
-            response = requests.get(
-                api_url,
-                params=query_params,
+            response = get_http_client(auth_manager).get(
+                f"{config.api_url}/table/sys_user_grmember",
+                params={
+                    "sysparm_query": f"group={params.group_id}^userIN{user_ids}",
+                    "sysparm_fields": "sys_id,user",
+                    "sysparm_limit": str(len(members_to_remove)),
+                },
                 headers=auth_manager.get_headers(),
                 timeout=config.timeout,
             )
             response.raise_for_status()
+            for membership in response.json().get("result", []):
+                user = membership.get("user")
+                user_id = user.get("value") if isinstance(user, dict) else user
+                membership_ids[user_id] = membership.get("sys_id")
+        except requests.RequestException as e:
+            logger.error(f"Failed to find group memberships: {e}")
 
-            result = response.json().get("result", [])
-            if not result:
-                success = False
-                failed_members.append(member)
-                continue
-
-            # Then delete the membership record
-            membership_id = result[0].get("sys_id")
-            delete_url = f"{api_url}/{membership_id}"
-
-            response = requests.delete(
-                delete_url,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            response.raise_for_status()
+    to_delete = []
+    for member, user_id in members_to_remove:
+        if user_id in membership_ids:
+            to_delete.append((member, membership_ids[user_id]))
+        else:
+            success = False
+            failed_members.append(member)
 
-        except requests.RequestException as e:
-            logger.error(f"Failed to remove member '{member}' from group: {e}")
+    # Delete the membership records
+    results = execute_batch(
+        config,
+        auth_manager,
+        [
+            BatchRequest(method="DELETE", path=f"/api/now/table/sys_user_grmember/{membership_id}")
+            for _, membership_id in to_delete
+        ],
+    )
+    for (member, _), result in zip(to_delete, results):
+        if not result.success:
+            logger.error(f"Failed to remove member '{member}' from group: {result.error}")
             success = False
             failed_members.append(member)
 
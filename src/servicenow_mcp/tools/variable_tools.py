@@ -1,15 +1,28 @@
 import logging
-from typing import List
+from typing import List, Optional
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, project_record
+from servicenow_mcp.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of sys_ids in one sys_idIN query, keeping request URLs well
+# below the length limits of the instance and any proxies in between
+SYS_ID_IN_CHUNK_SIZE = 100
+
 class GetRITMVariablesParams(BaseModel):
     ritm_sys_id: str = Field(..., description="The sys_id of the Requested Item.")
+    fields: Optional[List[FieldName]] = Field(
+        None,
+        description=(
+            "Raw sc_item_option fields to return for each variable, instead of its "
+            "question and value."
+        ),
+    )
 
 def get_ritm_variables(
     config: ServerConfig,
@@ -18,14 +31,18 @@ def get_ritm_variables(
 ) -> dict:
     """
     Get the variables for a specific Requested Item (RITM).
+
+    The number of round trips does not grow with the number of variables: one
+    query for the variable mappings, then one query per SYS_ID_IN_CHUNK_SIZE
+    variables.
     """
     # Step 1: Get the list of variable sys_ids from the sc_item_option_mtom table
     mtom_api_url = f"{config.api_url}/table/sc_item_option_mtom"
     mtom_query = f"request_item={params.ritm_sys_id}"
-    mtom_query_params = {"sysparm_query": mtom_query}
+    mtom_query_params = {"sysparm_query": mtom_query, "sysparm_fields": "sc_item_option"}
 
     try:
-        mtom_response = requests.get(
+        mtom_response = get_http_client(auth_manager).get(
             mtom_api_url,
             params=mtom_query_params,
             headers=auth_manager.get_headers(),
@@ -33,7 +50,10 @@ def get_ritm_variables(
         )
         mtom_response.raise_for_status()
         mtom_data = mtom_response.json()
-        option_sys_ids = [item.get("sc_item_option") for item in mtom_data.get("result", [])]
+        option_sys_ids = [
+            _reference_value(item.get("sc_item_option")) for item in mtom_data.get("result", [])
+        ]
+        option_sys_ids = [sys_id for sys_id in option_sys_ids if sys_id]
 
     except requests.RequestException as e:
         logger.error(f"Failed to get RITM variable mappings: {e}")
@@ -42,65 +62,63 @@ def get_ritm_variables(
             "message": f"Failed to get RITM variable mappings: {str(e)}",
         }
 
-    # Step 2 & 3: Get the details for each variable
-    variables = []
+    # Step 2: Get all the sc_item_option records, with the question text dot-walked
+    # from item_option_new, in one query per chunk of sys_ids
+    options = {}
     option_api_url = f"{config.api_url}/table/sc_item_option"
-    question_api_url = f"{config.api_url}/table/item_option_new"
+    option_fields = ["sys_id", "value", "item_option_new", "item_option_new.question_text"]
+    if params.fields:
+        # The variables are matched by sys_id and skipped without item_option_new
+        option_fields = list(dict.fromkeys(["sys_id", "item_option_new", *params.fields]))
 
-    for option_sys_id in option_sys_ids:
-        if not option_sys_id:
-            continue
-        
-        # Get the sc_item_option record
-        option_query = f"sys_id={option_sys_id.get('value')}"
-        option_query_params = {"sysparm_query": option_query}
+    for start in range(0, len(option_sys_ids), SYS_ID_IN_CHUNK_SIZE):
+        chunk = option_sys_ids[start : start + SYS_ID_IN_CHUNK_SIZE]
+        option_query_params = {
+            "sysparm_query": f"sys_idIN{','.join(chunk)}",
+            "sysparm_fields": ",".join(option_fields),
+            "sysparm_limit": str(len(chunk)),
+        }
 
         try:
-            option_response = requests.get(
+            option_response = get_http_client(auth_manager).get(
                 option_api_url,
                 params=option_query_params,
                 headers=auth_manager.get_headers(),
                 timeout=config.timeout,
             )
             option_response.raise_for_status()
-            option_data = option_response.json()
-            option_result = option_data.get("result", [])
-            if not option_result:
-                continue
-
-            item_option = option_result[0]
-            value = item_option.get("value")
-            item_option_new_sys_id = item_option.get("item_option_new", {}).get("value")
-
-            if not item_option_new_sys_id:
-                continue
-
-            # Get the item_option_new record (the question)
-            question_query = f"sys_id={item_option_new_sys_id}"
-            question_query_params = {"sysparm_query": question_query}
-            question_response = requests.get(
-                question_api_url,
-                params=question_query_params,
-                headers=auth_manager.get_headers(),
-                timeout=config.timeout,
-            )
-            question_response.raise_for_status()
-            question_data = question_response.json()
-            question_result = question_data.get("result", [])
-            if question_result:
-                question_item = question_result[0]
-                question_text = question_item.get("question_text")
-                variables.append({
-                    "question": question_text,
-                    "value": value,
-                })
+            for item_option in option_response.json().get("result", []):
+                options[item_option.get("sys_id")] = item_option
 
         except requests.RequestException as e:
             logger.error(f"Failed to get RITM variable details: {e}")
-            # Continue to next variable if one fails
+            return {
+                "success": False,
+                "message": f"Failed to get RITM variable details: {str(e)}",
+            }
+
+    # Keep the order of the variable mappings
+    variables = []
+    for option_sys_id in option_sys_ids:
+        item_option = options.get(option_sys_id)
+        if not item_option or not _reference_value(item_option.get("item_option_new")):
             continue
+        if params.fields:
+            variables.append(project_record(item_option, params.fields))
+            continue
+        variables.append({
+            "question": item_option.get("item_option_new.question_text"),
+            "value": item_option.get("value"),
+        })
 
     return {
         "success": True,
         "variables": variables,
     }
+
+
+def _reference_value(reference) -> Optional[str]:
+    """Get the sys_id from a reference field, returned either as a link object or a string."""
+    if isinstance(reference, dict):
+        return reference.get("value")
+    return reference or None
@@ -6,13 +6,17 @@ This module provides tools for viewing and managing workflows in ServiceNow.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import requests
 from pydantic import BaseModel, Field
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.batch import BatchRequest, execute_batch
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.fields import FieldName, apply_fields
+from servicenow_mcp.utils.http_client import get_http_client, order_auth_and_config
+from servicenow_mcp.utils.pagination import CURSOR_DESCRIPTION, CursorPage
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +29,11 @@ class ListWorkflowsParams(BaseModel):
     
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
     active: Optional[bool] = Field(None, description="Filter by active status")
     name: Optional[str] = Field(None, description="Filter by name (contains)")
     query: Optional[str] = Field(None, description="Additional query string")
+    fields: Optional[List[FieldName]] = Field(None, description="Raw workflow fields to return; all fields if omitted")
 
 
 class GetWorkflowDetailsParams(BaseModel):
@@ -35,6 +41,7 @@ class GetWorkflowDetailsParams(BaseModel):
     
     workflow_id: str = Field(..., description="Workflow ID or sys_id")
     include_versions: Optional[bool] = Field(False, description="Include workflow versions")
+    fields: Optional[List[FieldName]] = Field(None, description="Raw workflow fields to return; all fields if omitted")
 
 
 class ListWorkflowVersionsParams(BaseModel):
@@ -43,6 +50,8 @@ class ListWorkflowVersionsParams(BaseModel):
     workflow_id: str = Field(..., description="Workflow ID or sys_id")
     limit: Optional[int] = Field(10, description="Maximum number of records to return")
     offset: Optional[int] = Field(0, description="Offset to start from")
+    cursor: Optional[str] = Field(None, description=CURSOR_DESCRIPTION)
+    fields: Optional[List[FieldName]] = Field(None, description="Raw workflow version fields to return; all fields if omitted")
 
 
 class GetWorkflowActivitiesParams(BaseModel):
@@ -50,6 +59,7 @@ class GetWorkflowActivitiesParams(BaseModel):
     
     workflow_id: str = Field(..., description="Workflow ID or sys_id")
     version: Optional[str] = Field(None, description="Specific version to get activities for")
+    fields: Optional[List[FieldName]] = Field(None, description="Raw workflow activity fields to return; all fields if omitted")
 
 
 class CreateWorkflowParams(BaseModel):
@@ -135,51 +145,6 @@ def _unwrap_params(params: Any, param_class: Type[T]) -> Dict[str, Any]:
     return params
 
 
-def _get_auth_and_config(
-    auth_manager_or_config: Union[AuthManager, ServerConfig],
-    server_config_or_auth: Union[ServerConfig, AuthManager],
-) -> tuple[AuthManager, ServerConfig]:
-    """
-    Get the correct auth_manager and server_config objects.
-    
-    This function handles the case where the parameters might be swapped.
-    
-    Args:
-        auth_manager_or_config: Either an AuthManager or a ServerConfig.
-        server_config_or_auth: Either a ServerConfig or an AuthManager.
-        
-    Returns:
-        tuple[AuthManager, ServerConfig]: The correct auth_manager and server_config.
-        
-    Raises:
-        ValueError: If the parameters are not of the expected types.
-    """
-    # Check if the parameters are in the correct order
-    if isinstance(auth_manager_or_config, AuthManager) and isinstance(server_config_or_auth, ServerConfig):
-        return auth_manager_or_config, server_config_or_auth
-    
-    # Check if the parameters are swapped
-    if isinstance(auth_manager_or_config, ServerConfig) and isinstance(server_config_or_auth, AuthManager):
-        return server_config_or_auth, auth_manager_or_config
-    
-    # If we get here, at least one of the parameters is not of the expected type
-    if hasattr(auth_manager_or_config, "get_headers"):
-        auth_manager = auth_manager_or_config
-    elif hasattr(server_config_or_auth, "get_headers"):
-        auth_manager = server_config_or_auth
-    else:
-        raise ValueError("Cannot find get_headers method in either auth_manager or server_config")
-    
-    if hasattr(auth_manager_or_config, "instance_url"):
-        server_config = auth_manager_or_config
-    elif hasattr(server_config_or_auth, "instance_url"):
-        server_config = server_config_or_auth
-    else:
-        raise ValueError("Cannot find instance_url attribute in either auth_manager or server_config")
-    
-    return auth_manager, server_config
-
-
 def list_workflows(
     auth_manager: AuthManager,
     server_config: ServerConfig,
@@ -200,7 +165,9 @@ def list_workflows(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -225,13 +192,18 @@ def list_workflows(
     
     if query_parts:
         query_params["sysparm_query"] = "^".join(query_parts)
+    apply_fields(query_params, "list_workflows", params.get("fields"))
+    try:
+        page = CursorPage(query_params, params.get("cursor"))
+    except ValueError as e:
+        return {"error": str(e)}
     
     # Make the API request
     try:
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow"
         
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         result = response.json()
@@ -239,6 +211,7 @@ def list_workflows(
             "workflows": result.get("result", []),
             "count": len(result.get("result", [])),
             "total": int(response.headers.get("X-Total-Count", 0)),
+            **page.cursor_fields(result.get("result", [])),
         }
     except requests.RequestException as e:
         logger.error(f"Error listing workflows: {e}")
@@ -268,7 +241,9 @@ def get_workflow_details(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -281,8 +256,9 @@ def get_workflow_details(
     try:
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
+        query_params = apply_fields({}, "get_workflow_details", params.get("fields"))
         
-        response = requests.get(url, headers=headers)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         result = response.json()
@@ -318,7 +294,9 @@ def list_workflow_versions(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -333,13 +311,18 @@ def list_workflow_versions(
         "sysparm_limit": params.get("limit", 10),
         "sysparm_offset": params.get("offset", 0),
     }
+    apply_fields(query_params, "list_workflow_versions", params.get("fields"))
+    try:
+        page = CursorPage(query_params, params.get("cursor"))
+    except ValueError as e:
+        return {"error": str(e)}
     
     # Make the API request
     try:
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow_version"
         
-        response = requests.get(url, headers=headers, params=query_params)
+        response = get_http_client(auth_manager).get(url, headers=headers, params=query_params)
         response.raise_for_status()
         
         result = response.json()
@@ -347,6 +330,7 @@ def list_workflow_versions(
             "versions": result.get("result", []),
             "count": len(result.get("result", [])),
             "total": int(response.headers.get("X-Total-Count", 0)),
+            **page.cursor_fields(result.get("result", [])),
             "workflow_id": workflow_id,
         }
     except requests.RequestException as e:
@@ -378,7 +362,9 @@ def get_workflow_activities(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -400,7 +386,7 @@ def get_workflow_activities(
                 "sysparm_orderby": "version DESC",
             }
             
-            version_response = requests.get(version_url, headers=headers, params=version_params)
+            version_response = get_http_client(auth_manager).get(version_url, headers=headers, params=version_params)
             version_response.raise_for_status()
             
             version_result = version_response.json()
@@ -428,8 +414,9 @@ def get_workflow_activities(
             "sysparm_query": f"workflow_version={version_id}",
             "sysparm_orderby": "order",
         }
+        apply_fields(activities_params, "get_workflow_activities", params.get("fields"))
         
-        activities_response = requests.get(activities_url, headers=headers, params=activities_params)
+        activities_response = get_http_client(auth_manager).get(activities_url, headers=headers, params=activities_params)
         activities_response.raise_for_status()
         
         activities_result = activities_response.json()
@@ -468,7 +455,9 @@ def create_workflow(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -500,7 +489,7 @@ def create_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow"
         
-        response = requests.post(url, headers=headers, json=data)
+        response = get_http_client(auth_manager).post(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -537,7 +526,9 @@ def update_workflow(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -573,7 +564,7 @@ def update_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = get_http_client(auth_manager).patch(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -610,7 +601,9 @@ def activate_workflow(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -629,7 +622,7 @@ def activate_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = get_http_client(auth_manager).patch(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -666,7 +659,9 @@ def deactivate_workflow(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -685,7 +680,7 @@ def deactivate_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = get_http_client(auth_manager).patch(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -722,7 +717,9 @@ def add_workflow_activity(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -757,7 +754,7 @@ def add_workflow_activity(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_activity"
         
-        response = requests.post(url, headers=headers, json=data)
+        response = get_http_client(auth_manager).post(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -794,7 +791,9 @@ def update_workflow_activity(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -824,7 +823,7 @@ def update_workflow_activity(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_activity/{activity_id}"
         
-        response = requests.patch(url, headers=headers, json=data)
+        response = get_http_client(auth_manager).patch(url, headers=headers, json=data)
         response.raise_for_status()
         
         result = response.json()
@@ -861,7 +860,9 @@ def delete_workflow_activity(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -875,7 +876,7 @@ def delete_workflow_activity(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_activity/{activity_id}"
         
-        response = requests.delete(url, headers=headers)
+        response = get_http_client(auth_manager).delete(url, headers=headers)
         response.raise_for_status()
         
         return {
@@ -911,7 +912,9 @@ def reorder_workflow_activities(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -924,32 +927,33 @@ def reorder_workflow_activities(
     if not activity_ids:
         return {"error": "Activity IDs are required"}
     
-    # Make the API requests to update the order of each activity
+    # Update the order of every activity in as few round trips as possible
     try:
-        headers = auth_manager.get_headers()
+        # New order values are 100, 200, 300, etc.
+        new_orders = [(i + 1) * 100 for i in range(len(activity_ids))]
+        batch_requests = [
+            BatchRequest(
+                method="PATCH",
+                path=f"/api/now/table/wf_activity/{activity_id}",
+                body={"order": new_order},
+            )
+            for activity_id, new_order in zip(activity_ids, new_orders)
+        ]
         results = []
         
-        for i, activity_id in enumerate(activity_ids):
-            # Calculate the new order value (100, 200, 300, etc.)
-            new_order = (i + 1) * 100
-            
-            url = f"{server_config.instance_url}/api/now/table/wf_activity/{activity_id}"
-            data = {"order": new_order}
-            
-            try:
-                response = requests.patch(url, headers=headers, json=data)
-                response.raise_for_status()
-                
+        batch_results = execute_batch(server_config, auth_manager, batch_requests)
+        for activity_id, new_order, result in zip(activity_ids, new_orders, batch_results):
+            if result.success:
                 results.append({
                     "activity_id": activity_id,
                     "new_order": new_order,
                     "success": True,
                 })
-            except requests.RequestException as e:
-                logger.error(f"Error updating activity order: {e}")
+            else:
+                logger.error(f"Error updating activity order: {result.error}")
                 results.append({
                     "activity_id": activity_id,
-                    "error": str(e),
+                    "error": result.error,
                     "success": False,
                 })
         
@@ -984,7 +988,9 @@ def delete_workflow(
     
     # Get the correct auth_manager and server_config
     try:
-        auth_manager, server_config = _get_auth_and_config(auth_manager, server_config)
+        auth_manager, server_config = order_auth_and_config(
+            auth_manager, server_config, strict=True
+        )
     except ValueError as e:
         logger.error(f"Error getting auth and config: {e}")
         return {"error": str(e)}
@@ -998,7 +1004,7 @@ def delete_workflow(
         headers = auth_manager.get_headers()
         url = f"{server_config.instance_url}/api/now/table/wf_workflow/{workflow_id}"
         
-        response = requests.delete(url, headers=headers)
+        response = get_http_client(auth_manager).delete(url, headers=headers)
         response.raise_for_status()
         
         return {
@@ -7,6 +7,10 @@ from servicenow_mcp.utils.config import (
     AuthConfig,
     AuthType,
     BasicAuthConfig,
+    BatchConfig,
+    CacheConfig,
+    HttpClientConfig,
+    MirrorConfig,
     OAuthConfig,
     ServerConfig,
 )
@@ -16,6 +20,10 @@ __all__ = [
     "AuthConfig",
     "AuthType",
     "BasicAuthConfig",
+    "BatchConfig",
+    "CacheConfig",
+    "HttpClientConfig",
+    "MirrorConfig",
     "OAuthConfig",
     "ServerConfig",
 ] 
\ No newline at end of file
@@ -0,0 +1,270 @@
+"""
+Local full-text index of knowledge articles.
+
+Searching kb_knowledge on the instance with ``short_descriptionLIKE...^ORtextLIKE...``
+scans every article and returns whole article bodies. ArticleIndex keeps an
+SQLite FTS5 index of the articles held by the table mirror, in the mirror's
+database, and answers searches with BM25-ranked results and short snippets.
+Full article text is then fetched with get_article for the article chosen.
+
+The index is refreshed from the mirror, not from the instance: after each
+mirror sync, MirrorSyncer has the articles whose ``sys_updated_on`` changed
+re-indexed and those no longer mirrored dropped.
+"""
+
+import html
+import json
+import logging
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.mirror import TableMirror, get_mirror
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_TABLE = "kb_knowledge"
+
+# BM25 weights of the indexed columns: title, keywords, body
+_WEIGHTS = (10.0, 5.0, 1.0)
+_SNIPPET_TOKENS = 16
+
+_SCRIPTS = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAGS = re.compile(r"<[^>]*>")
+_SPACES = re.compile(r"\s+")
+_WORDS = re.compile(r"\w+")
+
+
+def html_to_text(value: Optional[str]) -> str:
+    """Strip the markup of an article body, leaving its text."""
+    if not value:
+        return ""
+    text = _TAGS.sub(" ", _SCRIPTS.sub(" ", value))
+    return _SPACES.sub(" ", html.unescape(text)).strip()
+
+
+def _match_expression(query: str) -> str:
+    """FTS5 query matching any word of a search, with FTS5 syntax characters dropped."""
+    return " OR ".join(f'"{word}"' for word in dict.fromkeys(_WORDS.findall(query.lower())))
+
+
+def _value(record: Dict[str, Any], field: str, key: str = "value") -> str:
+    value = record.get(field)
+    if isinstance(value, dict):
+        value = value.get(key)
+    return "" if value is None else str(value)
+
+
+class ArticleIndex:
+    """FTS5 index of the knowledge articles in a table mirror."""
+
+    def __init__(self, mirror: TableMirror):
+        """
+        Initialize the index, creating its tables in the mirror database if necessary.
+
+        Args:
+            mirror: The mirror holding the kb_knowledge records.
+        """
+        self.mirror = mirror
+        self.instance_url = mirror.instance_url
+        self._lock = threading.Lock()
+        # synced_at of the mirror sync the index was last refreshed after
+        self._refreshed_for: Optional[float] = None
+        self._connection = sqlite3.connect(mirror.path, timeout=5, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS article_docs ("
+                "id INTEGER PRIMARY KEY, instance TEXT NOT NULL, sys_id TEXT NOT NULL, "
+                "number TEXT, title TEXT, knowledge_base TEXT, knowledge_base_id TEXT, "
+                "category TEXT, category_id TEXT, workflow_state TEXT, updated TEXT, "
+                "UNIQUE (instance, sys_id))"
+            )
+            self._connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS article_fts USING fts5("
+                "title, keywords, body, tokenize = 'porter unicode61 remove_diacritics 2')"
+            )
+
+    def is_available(self) -> bool:
+        """
+        Check whether searches may be answered from the index, as for mirror reads.
+
+        The index must also have been refreshed since the server started, so that
+        searches made before the first sync completes go to the instance.
+        """
+        return self._refreshed_for is not None and self.mirror.is_fresh(ARTICLE_TABLE)
+
+    def _synced_at(self) -> Optional[float]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT synced_at FROM sync_state WHERE instance = ? AND tbl = ?",
+                (self.instance_url, ARTICLE_TABLE),
+            ).fetchone()
+        return row[0] if row else None
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Bring the index up to date with the mirrored articles.
+
+        Does nothing unless the mirror synced kb_knowledge since the last refresh,
+        or ``force`` is set.
+
+        Returns:
+            int: Number of articles indexed or dropped.
+        """
+        synced_at = self._synced_at()
+        if not force and (synced_at is None or synced_at == self._refreshed_for):
+            return 0
+
+        with self._lock, self._connection:
+            changed = self._connection.execute(
+                "SELECT r.data, d.id FROM records r LEFT JOIN article_docs d "
+                "ON d.instance = r.instance AND d.sys_id = r.sys_id "
+                "WHERE r.instance = ? AND r.tbl = ? "
+                "AND (d.id IS NULL OR d.updated IS NOT r.sys_updated_on)",
+                (self.instance_url, ARTICLE_TABLE),
+            ).fetchall()
+            for data, doc_id in changed:
+                self._index(json.loads(data), doc_id)
+
+            deleted = [
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT id FROM article_docs d WHERE instance = ? AND NOT EXISTS ("
+                    "SELECT 1 FROM records r WHERE r.instance = d.instance AND r.tbl = ? "
+                    "AND r.sys_id = d.sys_id)",
+                    (self.instance_url, ARTICLE_TABLE),
+                )
+            ]
+            for doc_id in deleted:
+                self._connection.execute("DELETE FROM article_fts WHERE rowid = ?", (doc_id,))
+                self._connection.execute("DELETE FROM article_docs WHERE id = ?", (doc_id,))
+
+        self._refreshed_for = synced_at
+        if changed or deleted:
+            logger.info(f"Article index: {len(changed)} indexed, {len(deleted)} dropped")
+        return len(changed) + len(deleted)
+
+    def _index(self, record: Dict[str, Any], doc_id: Optional[int]) -> None:
+        doc = (
+            _value(record, "number"),
+            _value(record, "short_description"),
+            _value(record, "kb_knowledge_base", "display_value"),
+            _value(record, "kb_knowledge_base"),
+            _value(record, "kb_category", "display_value"),
+            _value(record, "kb_category"),
+            _value(record, "workflow_state"),
+            _value(record, "sys_updated_on"),
+        )
+        if doc_id is None:
+            doc_id = self._connection.execute(
+                "INSERT INTO article_docs (instance, sys_id, number, title, knowledge_base, "
+                "knowledge_base_id, category, category_id, workflow_state, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.instance_url, _value(record, "sys_id")) + doc,
+            ).lastrowid
+        else:
+            self._connection.execute(
+                "UPDATE article_docs SET number = ?, title = ?, knowledge_base = ?, "
+                "knowledge_base_id = ?, category = ?, category_id = ?, workflow_state = ?, "
+                "updated = ? WHERE id = ?",
+                doc + (doc_id,),
+            )
+            self._connection.execute("DELETE FROM article_fts WHERE rowid = ?", (doc_id,))
+        self._connection.execute(
+            "INSERT INTO article_fts (rowid, title, keywords, body) VALUES (?, ?, ?, ?)",
+            (
+                doc_id,
+                _value(record, "short_description"),
+                _value(record, "keywords"),
+                html_to_text(_value(record, "text")),
+            ),
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        knowledge_base: Optional[str] = None,
+        category: Optional[str] = None,
+        workflow_state: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the indexed articles, best matches first.
+
+        Args:
+            query: Words to look for in article titles, keywords and text. Articles
+                matching any word are returned, ranked by BM25.
+            limit: Maximum number of articles to return.
+            offset: Number of articles to skip.
+            knowledge_base: Knowledge base sys_id or name to restrict the search to.
+            category: Category sys_id or name to restrict the search to.
+            workflow_state: Workflow state (e.g. "published") to restrict the search to.
+
+        Returns:
+            List[Dict[str, Any]]: Article summaries with their score and a snippet
+            of the best matching column, matches marked with ``**``.
+        """
+        expression = _match_expression(query)
+        if not expression:
+            return []
+
+        sql = (
+            f"SELECT d.sys_id, d.number, d.title, d.knowledge_base, d.category, "
+            f"d.workflow_state, d.updated, bm25(article_fts, {', '.join(map(str, _WEIGHTS))}), "
+            f"snippet(article_fts, -1, '**', '**', '...', {_SNIPPET_TOKENS}) "
+            f"FROM article_fts JOIN article_docs d ON d.id = article_fts.rowid "
+            f"WHERE article_fts MATCH ? AND d.instance = ?"
+        )
+        args: List[Any] = [expression, self.instance_url]
+        for column, value in (("knowledge_base", knowledge_base), ("category", category)):
+            if value:
+                sql += f" AND (d.{column}_id = ? OR d.{column} = ? COLLATE NOCASE)"
+                args.extend([value, value])
+        if workflow_state:
+            sql += " AND d.workflow_state = ? COLLATE NOCASE"
+            args.append(workflow_state)
+        sql += " ORDER BY 8 LIMIT ? OFFSET ?"
+        args.extend([limit, offset])
+
+        with self._lock:
+            rows = self._connection.execute(sql, args).fetchall()
+        return [
+            {
+                "id": sys_id,
+                "number": number,
+                "title": title,
+                "knowledge_base": kb,
+                "category": category_name,
+                "workflow_state": state,
+                "updated": updated,
+                # bm25() is lower for better matches
+                "score": round(-score, 3),
+                "snippet": snippet,
+            }
+            for sys_id, number, title, kb, category_name, state, updated, score, snippet in rows
+        ]
+
+
+def get_article_index(config: ServerConfig, auth_manager: Any) -> Optional[ArticleIndex]:
+    """
+    Get the article index for requests made on behalf of an auth manager.
+
+    Like the mirror, the index is created on first use and attached to the auth
+    manager. None if the mirror is disabled or does not mirror kb_knowledge.
+    """
+    if ARTICLE_TABLE not in config.mirror.tables:
+        return None
+    mirror = get_mirror(config, auth_manager)
+    if mirror is None:
+        return None
+    index = getattr(auth_manager, "article_index", None)
+    if not isinstance(index, ArticleIndex) or index.mirror is not mirror:
+        index = ArticleIndex(mirror)
+        try:
+            auth_manager.article_index = index
+        except AttributeError:
+            logger.debug("Cannot attach article index to %r", auth_manager)
+    return index
@@ -0,0 +1,283 @@
+"""
+Batch API support for the ServiceNow MCP server.
+
+Bulk write tools describe each REST call as a BatchRequest and hand the list
+to execute_batch, which packs them into as few /api/now/v1/batch round trips
+as the configured chunk size allows. Instances without the Batch API get the
+same results from individual calls issued in parallel.
+
+A batch call that fails once the instance may have received it (a read
+timeout, a 5xx, an unreadable response) is not replayed as individual calls,
+since the instance may already have applied its writes and replaying them
+would duplicate creates. Its requests, and those of the chunks not yet sent,
+are reported as failed instead.
+"""
+
+import base64
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set
+
+import requests
+from pydantic import BaseModel, Field
+from urllib3.exceptions import NewConnectionError
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http_client import get_http_client
+from servicenow_mcp.utils.metrics import bind_current_call
+
+logger = logging.getLogger(__name__)
+
+BATCH_API_PATH = "/api/now/v1/batch"
+
+# Status codes returned by the batch endpoint when the Batch API is not available
+_BATCH_UNAVAILABLE_STATUS_CODES = {403, 404, 405, 501}
+
+# Instances on which the Batch API was found to be unavailable
+_batch_unavailable_instances: Set[str] = set()
+
+
+class _BatchFailed(Exception):
+    """A batch call failed after the instance may have received it."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class BatchRequest(BaseModel):
+    """A single REST call to be sent as part of a batch."""
+
+    method: str = Field(..., description="HTTP method, e.g. POST, PATCH or DELETE")
+    path: str = Field(..., description="Instance-relative URL, e.g. /api/now/table/incident")
+    body: Optional[Dict[str, Any]] = Field(None, description="JSON request body")
+
+
+class BatchResult(BaseModel):
+    """Outcome of a single call sent through execute_batch."""
+
+    success: bool = Field(..., description="Whether the call returned a 2xx status")
+    status_code: Optional[int] = Field(None, description="HTTP status code of the call")
+    body: Optional[Any] = Field(None, description="Decoded JSON response body")
+    error: Optional[str] = Field(None, description="Error message if the call failed")
+
+
+def execute_batch(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    batch_requests: List[BatchRequest],
+) -> List[BatchResult]:
+    """
+    Execute REST calls through the ServiceNow Batch API.
+
+    Calls are sent in chunks of ``config.batch.chunk_size``. If the Batch API is
+    disabled in the config or unavailable on the instance, the calls are made
+    individually, ``config.batch.max_parallel`` at a time. If a batch call fails
+    once the instance may have received it, its calls and all later ones fail
+    without being retried.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        batch_requests: The calls to execute.
+
+    Returns:
+        List[BatchResult]: One result per request, in the same order.
+    """
+    if not batch_requests:
+        return []
+
+    headers = auth_manager.get_headers()
+    if not config.batch.enabled or config.instance_url in _batch_unavailable_instances:
+        return _execute_individually(config, auth_manager, batch_requests, headers)
+
+    results: List[BatchResult] = []
+    chunk_size = config.batch.chunk_size
+    for start in range(0, len(batch_requests), chunk_size):
+        chunk = batch_requests[start : start + chunk_size]
+        try:
+            chunk_results = _send_batch(config, auth_manager, chunk, headers)
+        except _BatchFailed as e:
+            logger.error(f"Batch request failed, not retrying its requests: {e}")
+            error = f"Batch request failed: {e}; the instance may have applied it"
+            results.extend(
+                BatchResult(success=False, status_code=e.status_code, error=error) for _ in chunk
+            )
+            results.extend(
+                BatchResult(success=False, error=f"Not sent after a failed batch: {e}")
+                for _ in batch_requests[start + chunk_size :]
+            )
+            break
+        if chunk_results is None:
+            # No Batch API, or the call never reached it: fall back for everything not yet sent
+            results.extend(
+                _execute_individually(config, auth_manager, batch_requests[start:], headers)
+            )
+            break
+        results.extend(chunk_results)
+    return results
+
+
+def _send_batch(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    chunk: List[BatchRequest],
+    headers: Dict[str, str],
+) -> Optional[List[BatchResult]]:
+    """
+    Send one chunk of requests as a single batch call.
+
+    Returns:
+        Optional[List[BatchResult]]: Results in request order, or None if the
+        Batch API is unavailable or the call failed before reaching the instance,
+        and the requests should be sent individually.
+
+    Raises:
+        _BatchFailed: If the call failed once the instance may have received it.
+    """
+    sub_request_headers = [
+        {"name": "Accept", "value": "application/json"},
+        {"name": "Content-Type", "value": "application/json"},
+    ]
+    rest_requests = []
+    for index, batch_request in enumerate(chunk):
+        rest_request = {
+            "id": str(index),
+            "method": batch_request.method,
+            "url": batch_request.path,
+            "headers": sub_request_headers,
+        }
+        if batch_request.body is not None:
+            rest_request["body"] = base64.b64encode(
+                json.dumps(batch_request.body).encode()
+            ).decode()
+        rest_requests.append(rest_request)
+
+    try:
+        response = get_http_client(auth_manager).post(
+            f"{config.instance_url}{BATCH_API_PATH}",
+            json={"batch_request_id": "1", "rest_requests": rest_requests},
+            headers=headers,
+            timeout=config.timeout,
+        )
+    except requests.RequestException as e:
+        if not _failed_before_sending(e):
+            raise _BatchFailed(str(e)) from e
+        logger.error(f"Batch request failed, falling back to individual calls: {e}")
+        return None
+
+    if response.status_code in _BATCH_UNAVAILABLE_STATUS_CODES:
+        logger.warning(
+            f"Batch API unavailable on {config.instance_url} (HTTP {response.status_code}), "
+            "using individual calls"
+        )
+        _batch_unavailable_instances.add(config.instance_url)
+        return None
+
+    try:
+        response.raise_for_status()
+        data = response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise _BatchFailed(str(e), response.status_code) from e
+
+    results: List[Optional[BatchResult]] = [None] * len(chunk)
+    for serviced in data.get("serviced_requests", []):
+        try:
+            index = int(serviced.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < len(chunk):
+            results[index] = _parse_serviced_request(serviced)
+
+    # Requests the instance did not get to (e.g. batch timeout) are sent individually
+    unserviced = [index for index, result in enumerate(results) if result is None]
+    if unserviced:
+        logger.info(f"{len(unserviced)} batched requests were not serviced, retrying individually")
+        retried = _execute_individually(
+            config, auth_manager, [chunk[index] for index in unserviced], headers
+        )
+        for index, result in zip(unserviced, retried):
+            results[index] = result
+
+    return results
+
+
+def _failed_before_sending(error: requests.RequestException) -> bool:
+    """Whether a request failed before the instance could receive it: no connection was made."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, requests.ConnectionError):
+        # requests wraps urllib3's MaxRetryError, whose reason is the underlying error
+        reason = error.args[0] if error.args else None
+        return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+    return False
+
+
+def _parse_serviced_request(serviced: Dict[str, Any]) -> BatchResult:
+    """Convert a serviced_requests entry of a batch response into a BatchResult."""
+    status_code = serviced.get("status_code")
+    body = None
+    encoded_body = serviced.get("body")
+    if encoded_body:
+        try:
+            body = json.loads(base64.b64decode(encoded_body))
+        except ValueError:
+            body = None
+
+    success = status_code is not None and 200 <= int(status_code) < 300
+    error = None
+    if not success:
+        error = f"{status_code} {serviced.get('status_text', '')}".strip()
+        if isinstance(body, dict) and isinstance(body.get("error"), dict):
+            message = body["error"].get("message")
+            if message:
+                error = f"{error}: {message}"
+
+    return BatchResult(success=success, status_code=status_code, body=body, error=error)
+
+
+def _execute_individually(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    batch_requests: List[BatchRequest],
+    headers: Dict[str, str],
+) -> List[BatchResult]:
+    """Execute requests as individual calls, in parallel, preserving order."""
+
+    def execute(batch_request: BatchRequest) -> BatchResult:
+        return _execute_one(config, auth_manager, batch_request, headers)
+
+    max_workers = min(config.batch.max_parallel, len(batch_requests))
+    if max_workers <= 1:
+        return [execute(batch_request) for batch_request in batch_requests]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(bind_current_call(execute), batch_requests))
+
+
+def _execute_one(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    batch_request: BatchRequest,
+    headers: Dict[str, str],
+) -> BatchResult:
+    """Execute a single request outside of the Batch API."""
+    http = get_http_client(auth_manager)
+    send = getattr(http, batch_request.method.lower())
+    kwargs: Dict[str, Any] = {"headers": headers, "timeout": config.timeout}
+    if batch_request.body is not None:
+        kwargs["json"] = batch_request.body
+
+    try:
+        response = send(f"{config.instance_url}{batch_request.path}", **kwargs)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        return BatchResult(success=False, error=str(e))
+
+    try:
+        body = response.json() if response.content else None
+    except ValueError:
+        body = None
+    return BatchResult(success=True, status_code=response.status_code, body=body)
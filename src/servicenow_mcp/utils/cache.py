@@ -0,0 +1,271 @@
+"""
+Read-through cache for reference data lookups.
+
+Tools look up nearly static records (choice lists, roles, group names) over
+and over. ReferenceCache keeps the results of those lookups for a per-table
+TTL, keyed by instance, table, query and fields. Entries are stored by a
+pluggable backend: an in-process LRU, or a SQLite file shared by all
+processes on the machine (useful for the short-lived CLI scripts).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from servicenow_mcp.utils.config import CacheConfig, ServerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries. Values are JSON-encoded strings."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Get an unexpired value, or None."""
+
+    @abstractmethod
+    def set(self, key: str, table: str, value: str, ttl: float) -> None:
+        """Store a value for ttl seconds."""
+
+    @abstractmethod
+    def invalidate(self, table: Optional[str] = None) -> None:
+        """Remove all entries of a table, or all entries if no table is given."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the memory backend.
+
+        Args:
+            max_entries: Number of entries after which the least recently used are evicted.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            _, value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, table: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (table, value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+                return
+            for key in [key for key, entry in self._entries.items() if entry[0] == table]:
+                del self._entries[key]
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache stored in a SQLite file, shared by all processes that use the same path."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the SQLite backend, creating the database if necessary.
+
+        Args:
+            path: Path of the SQLite database file.
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, tbl TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS cache_tbl ON cache (tbl)")
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, table: str, value: str, ttl: float) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, tbl, value, expires_at) VALUES (?, ?, ?, ?)",
+                (key, table, value, time.time() + ttl),
+            )
+            self._connection.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        with self._lock, self._connection:
+            if table is None:
+                self._connection.execute("DELETE FROM cache")
+            else:
+                self._connection.execute("DELETE FROM cache WHERE tbl = ?", (table,))
+
+
+class ReferenceCache:
+    """
+    Read-through cache for Table API lookups with per-table TTLs and hit/miss counters.
+    """
+
+    def __init__(self, config: CacheConfig, backend: CacheBackend, instance_url: str = ""):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Cache configuration (TTL policy).
+            backend: Storage for the cache entries.
+            instance_url: Instance the cached records belong to; part of every key.
+        """
+        self.config = config
+        self.backend = backend
+        self.instance_url = instance_url
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_config(cls, config: ServerConfig) -> "ReferenceCache":
+        """Create a cache with the backend selected in the server configuration."""
+        cache_config = config.cache
+        if cache_config.backend == "sqlite":
+            backend: CacheBackend = SQLiteCacheBackend(cache_config.sqlite_path)
+        else:
+            backend = MemoryCacheBackend(cache_config.max_entries)
+        return cls(cache_config, backend, config.instance_url)
+
+    def _key(self, table: str, query: str, fields: Optional[str]) -> str:
+        return json.dumps([self.instance_url, table, query, fields or ""])
+
+    def _count(self, table: str, outcome: str) -> None:
+        with self._lock:
+            counters = self._stats.setdefault(table, {"hits": 0, "misses": 0})
+            counters[outcome] += 1
+
+    def _ttl(self, table: str, ttl: Optional[int]) -> int:
+        if not self.config.enabled:
+            return 0
+        return self.config.ttl_for(table) if ttl is None else ttl
+
+    def get(
+        self,
+        table: str,
+        query: str,
+        fields: Optional[str] = None,
+        ttl: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Get a cached lookup result.
+
+        Args:
+            table: Table the lookup reads.
+            query: Encoded query of the lookup.
+            fields: Fields selected by the lookup.
+            ttl: TTL overriding the table's TTL policy; 0 bypasses the cache.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        if self._ttl(table, ttl) <= 0:
+            return None
+        value = self.backend.get(self._key(table, query, fields))
+        self._count(table, "misses" if value is None else "hits")
+        return None if value is None else json.loads(value)
+
+    def set(
+        self,
+        table: str,
+        query: str,
+        value: Any,
+        fields: Optional[str] = None,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """
+        Store a lookup result. None values are not cached.
+
+        Args:
+            table: Table the lookup reads.
+            query: Encoded query of the lookup.
+            value: JSON-serializable result of the lookup.
+            fields: Fields selected by the lookup.
+            ttl: TTL overriding the table's TTL policy; 0 bypasses the cache.
+        """
+        ttl = self._ttl(table, ttl)
+        if ttl <= 0 or value is None:
+            return
+        self.backend.set(self._key(table, query, fields), table, json.dumps(value), ttl)
+
+    def get_or_fetch(
+        self,
+        table: str,
+        query: str,
+        fetch: Callable[[], Any],
+        fields: Optional[str] = None,
+    ) -> Any:
+        """
+        Get a cached lookup result, calling fetch and caching its result on a miss.
+
+        Exceptions raised by fetch propagate and nothing is cached.
+        """
+        value = self.get(table, query, fields)
+        if value is None:
+            value = fetch()
+            self.set(table, query, value, fields)
+        return value
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        """Drop the cached entries of a table, or of all tables."""
+        self.backend.invalidate(table)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the hit and miss counts per table."""
+        with self._lock:
+            return {table: dict(counters) for table, counters in self._stats.items()}
+
+
+def get_reference_cache(config: ServerConfig, auth_manager: Any) -> ReferenceCache:
+    """
+    Get the reference cache for requests made on behalf of an auth manager.
+
+    The cache is created on first use and attached to the auth manager, so it
+    lives as long as the server (or CLI process) that owns the auth manager.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager passed to the tool.
+
+    Returns:
+        ReferenceCache: The cache to use.
+    """
+    cache = getattr(auth_manager, "reference_cache", None)
+    if not isinstance(cache, ReferenceCache):
+        cache = ReferenceCache.from_config(config)
+        try:
+            auth_manager.reference_cache = cache
+        except AttributeError:
+            logger.debug("Cannot attach reference cache to %r", auth_manager)
+    return cache
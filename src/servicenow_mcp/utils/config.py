@@ -3,7 +3,7 @@ Configuration module for the ServiceNow MCP server.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -31,6 +31,12 @@ class OAuthConfig(BaseModel):
     username: str
     password: str
     token_url: Optional[str] = None
+    refresh_margin: int = Field(
+        60, ge=0, description="Seconds before expiry at which the token is refreshed"
+    )
+    token_cache_path: Optional[str] = Field(
+        None, description="Path of an encrypted on-disk token cache shared between processes"
+    )
 
 
 class ApiKeyConfig(BaseModel):
@@ -49,6 +55,163 @@ class AuthConfig(BaseModel):
     api_key: Optional[ApiKeyConfig] = None
 
 
+class HttpClientConfig(BaseModel):
+    """Configuration for the pooled HTTP client shared by all tools."""
+
+    pool_connections: int = Field(10, ge=1, description="Number of per-host pools to keep")
+    pool_maxsize: int = Field(10, ge=1, description="Maximum keep-alive connections per host")
+    pool_block: bool = Field(False, description="Block when a host pool is exhausted")
+    idle_timeout: float = Field(
+        60.0, ge=0, description="Seconds after which idle pooled connections are recycled"
+    )
+
+
+class BatchConfig(BaseModel):
+    """Configuration for sending bulk writes through the ServiceNow Batch API."""
+
+    enabled: bool = Field(True, description="Send bulk writes through /api/now/v1/batch")
+    chunk_size: int = Field(50, ge=1, description="Maximum sub-requests per batch call")
+    max_parallel: int = Field(
+        4, ge=1, description="Concurrent individual calls when the Batch API is unavailable"
+    )
+
+
+def _default_cache_table_ttls() -> Dict[str, int]:
+    """Default cache TTLs, in seconds, for tables holding reference data."""
+    return {
+        "sys_choice": 3600,
+        "sys_user_role": 3600,
+        "sys_user_group": 600,
+        "incident": 30,
+        "catalog_metrics": 900,
+    }
+
+
+class CacheConfig(BaseModel):
+    """Configuration for the read-through cache of reference data lookups."""
+
+    enabled: bool = Field(True, description="Cache reference data lookups")
+    backend: Literal["memory", "sqlite"] = Field(
+        "memory", description="Cache storage: in-process LRU or a SQLite file shared by processes"
+    )
+    sqlite_path: str = Field(
+        "~/.cache/servicenow-mcp/cache.sqlite", description="Path of the SQLite cache file"
+    )
+    max_entries: int = Field(1024, ge=1, description="Maximum entries kept by the memory backend")
+    default_ttl: int = Field(
+        300, ge=0, description="TTL in seconds for tables without an entry in table_ttls"
+    )
+    table_ttls: Dict[str, int] = Field(
+        default_factory=_default_cache_table_ttls,
+        description="TTL in seconds per table; 0 disables caching for the table",
+    )
+    number_ttl: int = Field(
+        86400, ge=0, description="TTL in seconds for record number to sys_id mappings"
+    )
+
+    def ttl_for(self, table: str) -> int:
+        """Get the TTL in seconds for entries of a table."""
+        return self.table_ttls.get(table, self.default_ttl)
+
+
+def _default_mirror_tables() -> List[str]:
+    """Tables mirrored by default: those read most by the tools."""
+    return [
+        "incident",
+        "sc_req_item",
+        "change_request",
+        "kb_knowledge",
+        "sys_user",
+        "sys_user_group",
+    ]
+
+
+class MirrorConfig(BaseModel):
+    """Configuration for the local SQLite mirror of ServiceNow tables."""
+
+    enabled: bool = Field(
+        False, description="Mirror tables locally and serve reads from the mirror"
+    )
+    sqlite_path: str = Field(
+        "~/.cache/servicenow-mcp/mirror.sqlite", description="Path of the SQLite mirror file"
+    )
+    tables: List[str] = Field(
+        default_factory=_default_mirror_tables, description="Tables to mirror"
+    )
+    sync_interval: float = Field(
+        60, gt=0, description="Seconds between incremental syncs of the mirrored tables"
+    )
+    max_staleness: float = Field(
+        300,
+        ge=0,
+        description=(
+            "Reads are served from the mirror only if its last sync started at most this "
+            "many seconds ago; otherwise they go to the instance"
+        ),
+    )
+    page_size: int = Field(1000, ge=1, description="Records fetched per request while syncing")
+    reconcile_interval: float = Field(
+        3600,
+        ge=0,
+        description="Seconds between checks for records deleted on the instance; 0 disables them",
+    )
+
+
+def _default_duration_buckets() -> List[float]:
+    """Histogram bucket bounds, in seconds, for tool and upstream request durations."""
+    return [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+
+class MetricsConfig(BaseModel):
+    """Configuration for the per-tool latency and upstream request metrics."""
+
+    enabled: bool = Field(
+        False, description="Record per-tool timings and the ServiceNow requests each tool makes"
+    )
+    duration_buckets: List[float] = Field(
+        default_factory=_default_duration_buckets,
+        description="Upper bounds, in seconds, of the duration histogram buckets",
+    )
+
+
+class TracingConfig(BaseModel):
+    """Configuration for OpenTelemetry tracing of tool calls and ServiceNow requests."""
+
+    enabled: bool = Field(
+        False, description="Record OpenTelemetry spans (requires the 'tracing' extra)"
+    )
+    exporter: Literal["otlp-file", "console", "otlp"] = Field(
+        "otlp-file",
+        description="Where spans go: an OTLP/JSON lines file, stderr, or an OTLP/HTTP collector",
+    )
+    file_path: str = Field(
+        "~/.cache/servicenow-mcp/traces.jsonl", description="File written by the otlp-file exporter"
+    )
+    otlp_endpoint: Optional[str] = Field(
+        None,
+        description=(
+            "Traces endpoint of the otlp exporter; defaults to OTEL_EXPORTER_OTLP_TRACES_ENDPOINT "
+            "or http://localhost:4318/v1/traces"
+        ),
+    )
+    service_name: str = Field("servicenow-mcp", description="service.name of the spans")
+
+
+class SerializationConfig(BaseModel):
+    """Configuration for the serialization of tool results."""
+
+    compact: bool = Field(
+        False,
+        description=(
+            "Serialize results without indentation, and return results that are already "
+            "strings unchanged"
+        ),
+    )
+    backend: Literal["json", "orjson"] = Field(
+        "json", description="JSON encoder of dict and list results ('orjson' requires orjson)"
+    )
+
+
 class ServerConfig(BaseModel):
     """Server configuration."""
 
@@ -56,6 +219,23 @@ class ServerConfig(BaseModel):
     auth: AuthConfig
     debug: bool = False
     timeout: int = 30
+    http: HttpClientConfig = Field(default_factory=HttpClientConfig)
+    batch: BatchConfig = Field(default_factory=BatchConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    mirror: MirrorConfig = Field(default_factory=MirrorConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
+    serialization: SerializationConfig = Field(default_factory=SerializationConfig)
+    max_tool_threads: int = Field(
+        8, ge=1, description="Maximum synchronous tool calls run concurrently in worker threads"
+    )
+    tool_schema_cache: Optional[str] = Field(
+        None,
+        description=(
+            "JSON file the tool parameter schemas are loaded from and stored in, so that "
+            "startup skips generating them; none if unset"
+        ),
+    )
 
     @property
     def api_url(self) -> str:
@@ -0,0 +1,620 @@
+"""
+ServiceNow encoded queries.
+
+Parses the encoded query strings passed as ``sysparm_query`` (for example
+``active=true^priority<=2^ORDERBYDESCsys_updated_on``) so that they can be
+evaluated against records stored locally, such as those of the table mirror.
+A parsed query is either evaluated in memory (EncodedQuery.predicate, matches
+and sort) or compiled to parameterised SQL (EncodedQuery.to_sql); both select
+and order records the same way.
+
+Supported syntax:
+
+- conditions joined with ``^`` (and), ``^OR`` (or) and ``^NQ`` (or of whole
+  queries), ``ORDERBY``/``ORDERBYDESC``; ``^EQ`` is ignored
+- ``=``, ``!=``, ``LIKE``, ``NOT LIKE``, ``STARTSWITH``, ``ENDSWITH``, ``IN``,
+  ``NOT IN``, ``ISEMPTY``, ``ISNOTEMPTY``, ``EMPTYSTRING``, ``ANYTHING``,
+  ``SAMEAS`` and ``NSAMEAS``
+- ``>``, ``>=``, ``<``, ``<=`` and ``BETWEEN``, numeric when the value is a
+  number and otherwise on the raw string, which orders date-times correctly
+- the date operators ``ON``, ``NOTON`` and ``RELATIVEGT``/``GE``/``LT``/``LE``,
+  and ``javascript:gs.<function>()`` date values such as ``gs.daysAgoStart(7)``
+  or ``gs.beginningOfThisMonth()``. These are resolved when the query is parsed,
+  against the current UTC time, as raw date-time values are stored in UTC.
+
+String conditions are case-insensitive for ASCII letters, as SQLite's lower()
+is, and for ``{"value", "display_value"}`` fields match either value. parse
+raises UnsupportedQueryError for anything else (dot-walked fields, other
+operators or scripts) so callers can fall back to asking the instance.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+# Longest first, so that e.g. "NOT LIKE" is not read as "NOTON" or ">=" as ">"
+OPERATORS = (
+    "ISNOTEMPTY",
+    "ISEMPTY",
+    "EMPTYSTRING",
+    "ANYTHING",
+    "NOT LIKE",
+    "NOT IN",
+    "NOTON",
+    "NSAMEAS",
+    "SAMEAS",
+    "STARTSWITH",
+    "ENDSWITH",
+    "BETWEEN",
+    "RELATIVE",
+    "LIKE",
+    "IN",
+    "ON",
+    "!=",
+    ">=",
+    "<=",
+    "=",
+    ">",
+    "<",
+)
+_VALUELESS_OPERATORS = ("ISNOTEMPTY", "ISEMPTY", "EMPTYSTRING", "ANYTHING")
+_COMPARISONS = (">", ">=", "<", "<=")
+_NEGATED_OPERATORS = ("!=", "NOT LIKE", "NOT IN")
+# Operators that share a prefix with a supported one
+_UNSUPPORTED_OPERATORS = ("INSTANCEOF",)
+
+# Field names are lower case, so the operator that follows (e.g. LIKE) ends the name
+_FIELD = re.compile(r"[a-z0-9_]+")
+_NUMBER = re.compile(r"-?[0-9]+(\.[0-9]+)?")
+_SCRIPT = re.compile(r"javascript:\s*gs\.(\w+)\(([^()]*)\)\s*;?")
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class UnsupportedQueryError(ValueError):
+    """Raised for encoded queries that cannot be evaluated locally."""
+
+
+@dataclass(frozen=True)
+class Condition:
+    """
+    A single ``<field><operator><value>`` condition.
+
+    Date operators are normalised by parse: ``ON`` becomes ``BETWEEN``, ``NOTON``
+    ``NOT BETWEEN`` and ``RELATIVE*`` a comparison, all with resolved date-time
+    values. ``BETWEEN`` values are ``<low>@<high>``.
+    """
+
+    field: str
+    operator: str
+    value: str = ""
+
+
+@dataclass(frozen=True)
+class SqlQuery:
+    """An encoded query compiled to SQL: a WHERE expression, its parameters and ORDER BY terms."""
+
+    where: str
+    params: Tuple[Any, ...]
+    order_by: str
+
+
+@dataclass
+class EncodedQuery:
+    """
+    A parsed encoded query.
+
+    ``branches`` holds one query per ``^NQ``-separated part, each an AND of
+    OR-groups of conditions; a record matches if it matches any of them.
+    """
+
+    branches: List[List[List[Condition]]] = field(default_factory=list)
+    order_by: List[Tuple[str, bool]] = field(default_factory=list)
+
+    @property
+    def fields(self) -> Set[str]:
+        """Names of the fields the query reads."""
+        names = {name for name, _ in self.order_by}
+        for branch in self.branches:
+            for group in branch:
+                for condition in group:
+                    names.add(condition.field)
+                    if condition.operator in ("SAMEAS", "NSAMEAS"):
+                        names.add(condition.value)
+        return names
+
+    def predicate(self) -> Callable[[Mapping[str, Any]], bool]:
+        """
+        Compile the query's conditions to a function of a record.
+
+        Records map field names to plain strings or to ``{"value", "display_value"}``
+        dicts as returned with ``sysparm_display_value=all``. The function raises
+        UnsupportedQueryError for records lacking a field the query reads.
+        """
+        branches = [
+            [[_compile(condition) for condition in group] for group in branch]
+            for branch in self.branches
+        ]
+        if not branches:
+            return lambda record: True
+
+        def matches(record: Mapping[str, Any]) -> bool:
+            return any(
+                all(any(test(record) for test in group) for group in branch)
+                for branch in branches
+            )
+
+        return matches
+
+    def matches(self, record: Mapping[str, Any]) -> bool:
+        """
+        Check whether a record satisfies the query.
+
+        Use predicate instead to test many records.
+
+        Raises:
+            UnsupportedQueryError: If the query references a field the record lacks.
+        """
+        return self.predicate()(record)
+
+    def sort(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sort records by the query's ORDERBY fields, in place, and return them."""
+        for name, descending in reversed(self.order_by):
+            records.sort(key=lambda record: _sort_key(_raw(record.get(name))), reverse=descending)
+        return records
+
+    def to_sql(
+        self,
+        column: Callable[[str], str],
+        display_column: Optional[Callable[[str], str]] = None,
+    ) -> SqlQuery:
+        """
+        Compile the query to SQL for SQLite.
+
+        Args:
+            column: Maps a field name to the SQL expression of its raw value.
+            display_column: Maps a field name to the SQL expression of its display
+                value, for rows storing both; string conditions then match either.
+
+        Returns:
+            SqlQuery: The WHERE expression ("1" without conditions) with its
+            parameters, and the ORDER BY terms ("" without ORDERBY). Rows with
+            equal sort keys are in no particular order; append a tie-breaker.
+        """
+        compiler = _SqlCompiler(column, display_column)
+        where = " OR ".join(
+            "(" + " AND ".join(
+                "(" + " OR ".join(compiler.condition(condition) for condition in group) + ")"
+                for group in branch
+            ) + ")"
+            for branch in self.branches
+        )
+        order_by = ", ".join(
+            compiler.order_terms(name, descending) for name, descending in self.order_by
+        )
+        return SqlQuery(where or "1", tuple(compiler.params), order_by)
+
+
+def parse(query: Optional[str], now: Optional[datetime] = None) -> EncodedQuery:
+    """
+    Parse an encoded query.
+
+    Args:
+        query: The encoded query.
+        now: The (naive, UTC) time relative dates are resolved against; by default
+            the current time.
+
+    Raises:
+        UnsupportedQueryError: If the query uses syntax outside the supported subset.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = now.replace(microsecond=0)
+
+    parsed = EncodedQuery()
+    branch: List[List[Condition]] = []
+    for term in (query or "").split("^"):
+        if term.startswith("NQ"):
+            if branch:
+                parsed.branches.append(branch)
+            branch = []
+            term = term[len("NQ"):]
+        if not term or term == "EQ":
+            continue
+        if term.startswith("ORDERBYDESC"):
+            parsed.order_by.append((_field_name(term[len("ORDERBYDESC"):]), True))
+        elif term.startswith("ORDERBY"):
+            parsed.order_by.append((_field_name(term[len("ORDERBY"):]), False))
+        elif term.startswith("OR"):
+            if not branch:
+                raise UnsupportedQueryError(f"^OR without a preceding condition: {term!r}")
+            branch[-1].append(_condition(term[len("OR"):], now))
+        else:
+            branch.append([_condition(term, now)])
+    if branch:
+        parsed.branches.append(branch)
+    return parsed
+
+
+def _field_name(name: str) -> str:
+    if not _FIELD.fullmatch(name):
+        raise UnsupportedQueryError(f"Unsupported field: {name!r}")
+    return name
+
+
+def _condition(term: str, now: datetime) -> Condition:
+    match = _FIELD.match(term)
+    if not match:
+        raise UnsupportedQueryError(f"Unsupported condition: {term!r}")
+    name, rest = match.group(), term[match.end():]
+    operator = next((op for op in OPERATORS if rest.startswith(op)), None)
+    if operator is None or rest.startswith(_UNSUPPORTED_OPERATORS):
+        raise UnsupportedQueryError(f"Unsupported condition: {term!r}")
+    value = rest[len(operator):]
+
+    if operator in _VALUELESS_OPERATORS:
+        if value:
+            raise UnsupportedQueryError(f"Unsupported condition: {term!r}")
+        return Condition(name, operator)
+    if operator in ("ON", "NOTON"):
+        low, high = _day_bounds(value, now)
+        return Condition(name, "BETWEEN" if operator == "ON" else "NOT BETWEEN", f"{low}@{high}")
+    if operator == "BETWEEN":
+        bounds = value.split("@")
+        if len(bounds) != 2:
+            raise UnsupportedQueryError(f"Unsupported BETWEEN value: {value!r}")
+        return Condition(name, operator, "@".join(_resolve(bound, now) for bound in bounds))
+    if operator == "RELATIVE":
+        return Condition(name, *_relative(value, now))
+    if operator in ("SAMEAS", "NSAMEAS"):
+        return Condition(name, operator, _field_name(value))
+    if operator in ("=", "!=") + _COMPARISONS:
+        return Condition(name, operator, _resolve(value, now))
+    if "javascript:" in value:
+        raise UnsupportedQueryError(f"Unsupported value: {value!r}")
+    return Condition(name, operator, value)
+
+
+# --- Dates ---
+
+
+def _format(moment: datetime) -> str:
+    return moment.strftime(DATE_TIME_FORMAT)
+
+
+def _first_of_month(moment: datetime, months: int = 0) -> datetime:
+    """The first day of the month ``months`` from the one of ``moment``."""
+    years, month = divmod(moment.month - 1 + months, 12)
+    return moment.replace(year=moment.year + years, month=month + 1, day=1)
+
+
+def _day_start(moment: datetime) -> datetime:
+    return moment.replace(hour=0, minute=0, second=0)
+
+
+def _period_start(now: datetime, unit: str, offset: int) -> datetime:
+    """Start of the week (from Monday), month, quarter or year ``offset`` periods from now."""
+    today = _day_start(now)
+    if unit == "Week":
+        return today - timedelta(days=today.weekday()) + timedelta(weeks=offset)
+    if unit == "Month":
+        return _first_of_month(today, offset)
+    if unit == "Quarter":
+        return _first_of_month(today, offset * 3 - (today.month - 1) % 3)
+    return today.replace(year=today.year + offset, month=1, day=1)
+
+
+def _period_end(now: datetime, unit: str, offset: int) -> datetime:
+    return _period_start(now, unit, offset + 1) - timedelta(seconds=1)
+
+
+# gs date functions without arguments
+_DATE_FUNCTIONS: Dict[str, Callable[[datetime], datetime]] = {
+    "nowDateTime": lambda now: now,
+    "beginningOfToday": lambda now: _day_start(now),
+    "endOfToday": lambda now: _day_start(now) + timedelta(days=1, seconds=-1),
+    "beginningOfYesterday": lambda now: _day_start(now) - timedelta(days=1),
+    "endOfYesterday": lambda now: _day_start(now) - timedelta(seconds=1),
+    "beginningOfTomorrow": lambda now: _day_start(now) + timedelta(days=1),
+    "endOfTomorrow": lambda now: _day_start(now) + timedelta(days=2, seconds=-1),
+}
+for _unit in ("Week", "Month", "Quarter", "Year"):
+    for _period, _offset in (("This", 0), ("Last", -1), ("Next", 1)):
+        _DATE_FUNCTIONS[f"beginningOf{_period}{_unit}"] = (
+            lambda now, unit=_unit, offset=_offset: _period_start(now, unit, offset)
+        )
+        _DATE_FUNCTIONS[f"endOf{_period}{_unit}"] = (
+            lambda now, unit=_unit, offset=_offset: _period_end(now, unit, offset)
+        )
+
+# gs date functions taking a number of units ago
+_AGO_FUNCTIONS: Dict[str, Callable[[datetime, int], datetime]] = {
+    "daysAgo": lambda now, n: now - timedelta(days=n),
+    "daysAgoStart": lambda now, n: _day_start(now - timedelta(days=n)),
+    "daysAgoEnd": lambda now, n: _day_start(now - timedelta(days=n - 1)) - timedelta(seconds=1),
+    "hoursAgo": lambda now, n: now - timedelta(hours=n),
+    "hoursAgoStart": lambda now, n: (now - timedelta(hours=n)).replace(minute=0, second=0),
+    "hoursAgoEnd": lambda now, n: (now - timedelta(hours=n)).replace(minute=59, second=59),
+    "minutesAgo": lambda now, n: now - timedelta(minutes=n),
+    "minutesAgoStart": lambda now, n: (now - timedelta(minutes=n)).replace(second=0),
+    "minutesAgoEnd": lambda now, n: (now - timedelta(minutes=n)).replace(second=59),
+    "monthsAgoStart": lambda now, n: _period_start(now, "Month", -n),
+    "monthsAgoEnd": lambda now, n: _period_end(now, "Month", -n),
+}
+
+
+def _resolve(value: str, now: datetime) -> str:
+    """Replace a ``javascript:gs.<date function>()`` value by the date-time it denotes."""
+    if "javascript:" not in value:
+        return value
+    match = _SCRIPT.fullmatch(value.strip())
+    if not match:
+        raise UnsupportedQueryError(f"Unsupported value: {value!r}")
+    function, arguments = match.group(1), [
+        argument.strip().strip("'\"") for argument in match.group(2).split(",") if argument.strip()
+    ]
+
+    if function in _DATE_FUNCTIONS and not arguments:
+        return _format(_DATE_FUNCTIONS[function](now))
+    if function in _AGO_FUNCTIONS and len(arguments) == 1 and arguments[0].isdigit():
+        return _format(_AGO_FUNCTIONS[function](now, int(arguments[0])))
+    if function == "dateGenerate" and len(arguments) == 2:
+        date, time = arguments
+        time = {"start": "00:00:00", "end": "23:59:59"}.get(time, time)
+        try:
+            return _format(datetime.strptime(f"{date} {time}", DATE_TIME_FORMAT))
+        except ValueError:
+            pass
+    raise UnsupportedQueryError(f"Unsupported value: {value!r}")
+
+
+def _day_bounds(value: str, now: datetime) -> Tuple[str, str]:
+    """The bounds of an ON value: ``<label>@<start>@<end>`` or a ``YYYY-MM-DD`` date."""
+    parts = value.split("@")
+    if len(parts) == 3:
+        return _resolve(parts[1], now), _resolve(parts[2], now)
+    try:
+        day = datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise UnsupportedQueryError(f"Unsupported ON value: {value!r}") from None
+    return _format(day), _format(day + timedelta(days=1, seconds=-1))
+
+
+_RELATIVE_COMPARISONS = {"GT": ">", "GE": ">=", "LT": "<", "LE": "<="}
+_RELATIVE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+_RELATIVE_MONTHS = {"month": 1, "quarter": 3, "year": 12}
+
+
+def _relative(value: str, now: datetime) -> Tuple[str, str]:
+    """The comparison and date-time of a RELATIVE value such as ``GT@hour@ago@3``."""
+    parts = value.split("@")
+    if (
+        len(parts) != 4
+        or parts[0] not in _RELATIVE_COMPARISONS
+        or parts[1] not in {**_RELATIVE_UNITS, **_RELATIVE_MONTHS}
+        or parts[2] not in ("ago", "ahead")
+        or not parts[3].isdigit()
+    ):
+        raise UnsupportedQueryError(f"Unsupported RELATIVE value: {value!r}")
+    comparison, unit, direction, count = parts
+    amount = int(count) if direction == "ahead" else -int(count)
+    if unit in _RELATIVE_UNITS:
+        return _RELATIVE_COMPARISONS[comparison], _format(now + _RELATIVE_UNITS[unit] * amount)
+
+    # Same day of the month, or the last day of shorter months
+    month = _first_of_month(now, amount * _RELATIVE_MONTHS[unit])
+    last_day = (_first_of_month(month, 1) - timedelta(days=1)).day
+    point = month.replace(day=min(now.day, last_day))
+    return _RELATIVE_COMPARISONS[comparison], _format(point)
+
+
+# --- In-memory evaluation ---
+
+
+def _raw(value: Any) -> str:
+    if isinstance(value, dict):
+        value = value.get("value")
+    return "" if value is None else str(value)
+
+
+def _fold(value: str) -> str:
+    return value.lower() if value.isascii() else value.translate(_ASCII_LOWER)
+
+
+def _candidates(value: Any) -> Tuple[str, ...]:
+    """The raw value and, for reference and choice fields, the display value, case-folded."""
+    if isinstance(value, dict):
+        return (_fold(_raw(value)), _fold(_raw({"value": value.get("display_value")})))
+    return (_fold(_raw(value)),)
+
+
+def _is_number(value: str) -> bool:
+    return _NUMBER.fullmatch(value) is not None
+
+
+def _sort_key(value: str) -> Tuple[int, Any]:
+    return (0, float(value)) if _is_number(value) else (1, _fold(value))
+
+
+_COMPARE: Dict[str, Callable[[Any, Any], bool]] = {
+    ">": lambda left, right: left > right,
+    ">=": lambda left, right: left >= right,
+    "<": lambda left, right: left < right,
+    "<=": lambda left, right: left <= right,
+}
+
+
+def _compile_comparison(operator: str, value: str) -> Callable[[str], bool]:
+    """Numeric comparison with numbers, string comparison of non-empty values otherwise."""
+    compare = _COMPARE[operator]
+    if _is_number(value):
+        number = float(value)
+        return lambda raw: _is_number(raw) and compare(float(raw), number)
+    return lambda raw: raw != "" and compare(raw, value)
+
+
+def _compile_between(value: str) -> Callable[[str], bool]:
+    low, high = value.split("@")
+    if _is_number(low) and _is_number(high):
+        low_number, high_number = float(low), float(high)
+        return lambda raw: _is_number(raw) and low_number <= float(raw) <= high_number
+    return lambda raw: raw != "" and low <= raw <= high
+
+
+_STRING_TESTS: Dict[str, Callable[[str], Callable[[str], bool]]] = {
+    "=": lambda expected: lambda candidate: candidate == expected,
+    "LIKE": lambda expected: lambda candidate: expected in candidate,
+    "STARTSWITH": lambda expected: lambda candidate: candidate.startswith(expected),
+    "ENDSWITH": lambda expected: lambda candidate: candidate.endswith(expected),
+    "IN": lambda expected: set(expected.split(",")).__contains__,
+}
+_STRING_TESTS["!="] = _STRING_TESTS["="]
+_STRING_TESTS["NOT LIKE"] = _STRING_TESTS["LIKE"]
+_STRING_TESTS["NOT IN"] = _STRING_TESTS["IN"]
+
+
+def _compile(condition: Condition) -> Callable[[Mapping[str, Any]], bool]:
+    name, operator = condition.field, condition.operator
+
+    def get(record: Mapping[str, Any]) -> Any:
+        try:
+            return record[name]
+        except KeyError:
+            raise UnsupportedQueryError(f"Unknown field: {name}") from None
+
+    if operator == "ANYTHING":
+        return lambda record: True
+    if operator in ("ISEMPTY", "EMPTYSTRING"):
+        return lambda record: _raw(get(record)) == ""
+    if operator == "ISNOTEMPTY":
+        return lambda record: _raw(get(record)) != ""
+    if operator in ("SAMEAS", "NSAMEAS"):
+        other, same = condition.value, operator == "SAMEAS"
+
+        def compare_fields(record: Mapping[str, Any]) -> bool:
+            if other not in record:
+                raise UnsupportedQueryError(f"Unknown field: {other}")
+            return (_raw(get(record)) == _raw(record[other])) == same
+
+        return compare_fields
+    if operator in _COMPARISONS:
+        compare = _compile_comparison(operator, condition.value)
+        return lambda record: compare(_raw(get(record)))
+    if operator in ("BETWEEN", "NOT BETWEEN"):
+        between, inside = _compile_between(condition.value), operator == "BETWEEN"
+        return lambda record: between(_raw(get(record))) == inside
+
+    test = _STRING_TESTS[operator](_fold(condition.value))
+    negated = operator in _NEGATED_OPERATORS
+    return lambda record: any(map(test, _candidates(get(record)))) != negated
+
+
+# --- SQL compilation ---
+
+
+class _SqlCompiler:
+    """Compiles the conditions and sort terms of a query, collecting their parameters."""
+
+    def __init__(
+        self, column: Callable[[str], str], display_column: Optional[Callable[[str], str]]
+    ):
+        self.column = column
+        self.display_column = display_column
+        self.params: List[Any] = []
+
+    def param(self, value: Any) -> str:
+        self.params.append(value)
+        return "?"
+
+    def raw(self, name: str) -> str:
+        return f"COALESCE({self.column(name)}, '')"
+
+    def candidates(self, name: str) -> List[str]:
+        expressions = [self.raw(name)]
+        if self.display_column is not None:
+            expressions.append(f"COALESCE({self.display_column(name)}, '')")
+        return [f"lower({expression})" for expression in expressions]
+
+    @staticmethod
+    def is_number(expression: str) -> str:
+        """SQL equivalent of _is_number: an optional "-" and digits with at most one inner "."."""
+        digits = f"ltrim({expression}, '-')"
+        return (
+            f"(length({expression}) - length({digits}) <= 1 AND {digits} <> ''"
+            f" AND {digits} NOT GLOB '*[^0-9.]*' AND {digits} NOT GLOB '.*'"
+            f" AND {digits} NOT GLOB '*.' AND {digits} NOT GLOB '*.*.*')"
+        )
+
+    def comparison(self, raw: str, operator: str, value: str) -> str:
+        if _is_number(value):
+            return (
+                f"({self.is_number(raw)} AND CAST({raw} AS REAL) {operator}"
+                f" {self.param(float(value))})"
+            )
+        return f"({raw} <> '' AND {raw} {operator} {self.param(value)})"
+
+    def between(self, raw: str, value: str) -> str:
+        low, high = value.split("@")
+        if _is_number(low) and _is_number(high):
+            return (
+                f"({self.is_number(raw)} AND CAST({raw} AS REAL)"
+                f" BETWEEN {self.param(float(low))} AND {self.param(float(high))})"
+            )
+        return f"({raw} <> '' AND {raw} BETWEEN {self.param(low)} AND {self.param(high)})"
+
+    def string_test(self, candidate: str, operator: str, expected: str) -> str:
+        if operator in ("IN", "NOT IN"):
+            values = dict.fromkeys(expected.split(","))
+            return f"{candidate} IN ({', '.join(self.param(value) for value in values)})"
+        if operator in ("=", "!="):
+            return f"{candidate} = {self.param(expected)}"
+        if not expected:
+            # Every string contains, starts and ends with the empty string
+            return "1"
+        if operator in ("LIKE", "NOT LIKE"):
+            return f"instr({candidate}, {self.param(expected)}) > 0"
+        if operator == "STARTSWITH":
+            return f"substr({candidate}, 1, {len(expected)}) = {self.param(expected)}"
+        return f"substr({candidate}, -{len(expected)}) = {self.param(expected)}"
+
+    def condition(self, condition: Condition) -> str:
+        name, operator = condition.field, condition.operator
+        raw = self.raw(name)
+
+        if operator == "ANYTHING":
+            return "1"
+        if operator in ("ISEMPTY", "EMPTYSTRING"):
+            return f"{raw} = ''"
+        if operator == "ISNOTEMPTY":
+            return f"{raw} <> ''"
+        if operator in ("SAMEAS", "NSAMEAS"):
+            return f"{raw} {'=' if operator == 'SAMEAS' else '<>'} {self.raw(condition.value)}"
+        if operator in _COMPARISONS:
+            return self.comparison(raw, operator, condition.value)
+        if operator in ("BETWEEN", "NOT BETWEEN"):
+            between = self.between(raw, condition.value)
+            return between if operator == "BETWEEN" else f"NOT {between}"
+
+        expected = _fold(condition.value)
+        tests = " OR ".join(
+            self.string_test(candidate, operator, expected) for candidate in self.candidates(name)
+        )
+        return f"NOT ({tests})" if operator in _NEGATED_OPERATORS else f"({tests})"
+
+    def order_terms(self, name: str, descending: bool) -> str:
+        """ORDER BY terms equivalent to _sort_key: numbers, by value, before other strings."""
+        raw = self.raw(name)
+        is_number = self.is_number(raw)
+        direction = " DESC" if descending else ""
+        return (
+            f"CASE WHEN {is_number} THEN 0 ELSE 1 END{direction},"
+            f" CASE WHEN {is_number} THEN CAST({raw} AS REAL) END{direction},"
+            f" lower({raw}){direction}"
+        )
@@ -0,0 +1,166 @@
+"""
+Field projection for the read tools of the ServiceNow MCP server.
+
+The Table API returns every column of a record unless ``sysparm_fields`` is
+given, while most tools only return a handful of them. TOOL_FIELDS lists the
+raw fields each formatting tool reads, so the instance only serialises and
+transfers those. Tools that return records unchanged have no manifest entry
+and keep fetching whole records by default.
+
+Every list and get tool also accepts an optional ``fields`` parameter. When
+given, it becomes ``sysparm_fields`` and the tool returns records reduced to
+exactly those raw fields instead of its usual summary.
+"""
+
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+
+from pydantic import Field
+
+# A raw field name, optionally dot-walked (e.g. assigned_to.email)
+FieldName = Annotated[str, Field(pattern=r"^[A-Za-z0-9_]+(\.[A-Za-z0-9_]+)*$")]
+
+_INCIDENT_FIELDS = (
+    "sys_id",
+    "number",
+    "short_description",
+    "description",
+    "state",
+    "priority",
+    "assigned_to",
+    "category",
+    "subcategory",
+    "sys_created_on",
+    "sys_updated_on",
+)
+
+_SCRIPT_INCLUDE_FIELDS = (
+    "sys_id",
+    "name",
+    "description",
+    "api_name",
+    "client_callable",
+    "active",
+    "access",
+    "sys_created_on",
+    "sys_updated_on",
+    "sys_created_by",
+    "sys_updated_by",
+)
+
+# Raw fields read by each tool that formats its records
+TOOL_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "list_incidents": _INCIDENT_FIELDS + ("assignment_group", "u_record_producer"),
+    "get_incident_by_number": _INCIDENT_FIELDS,
+    "list_catalog_items": (
+        "sys_id",
+        "name",
+        "short_description",
+        "category",
+        "price",
+        "picture",
+        "active",
+        "order",
+    ),
+    "get_catalog_item": (
+        "sys_id",
+        "name",
+        "short_description",
+        "description",
+        "category",
+        "price",
+        "picture",
+        "active",
+        "order",
+        "delivery_time",
+        "availability",
+    ),
+    "list_catalog_categories": (
+        "sys_id",
+        "title",
+        "description",
+        "parent",
+        "icon",
+        "active",
+        "order",
+    ),
+    "list_knowledge_bases": (
+        "sys_id",
+        "title",
+        "description",
+        "owner",
+        "kb_managers",
+        "active",
+        "sys_created_on",
+        "sys_updated_on",
+    ),
+    "list_articles": (
+        "sys_id",
+        "short_description",
+        "kb_knowledge_base",
+        "kb_category",
+        "workflow_state",
+        "sys_created_on",
+        "sys_updated_on",
+    ),
+    "get_article": (
+        "sys_id",
+        "short_description",
+        "text",
+        "kb_knowledge_base",
+        "kb_category",
+        "workflow_state",
+        "author",
+        "keywords",
+        "article_type",
+        "view_count",
+        "sys_created_on",
+        "sys_updated_on",
+    ),
+    "list_categories": (
+        "sys_id",
+        "label",
+        "description",
+        "kb_knowledge_base",
+        "parent",
+        "active",
+        "sys_created_on",
+        "sys_updated_on",
+    ),
+    # sys_id keeps the cursor of list_group_members a keyset cursor
+    "list_group_members": ("sys_id", "user"),
+    "list_script_includes": _SCRIPT_INCLUDE_FIELDS,
+    "get_script_include": _SCRIPT_INCLUDE_FIELDS + ("script",),
+}
+
+
+def sysparm_fields(tool_name: str, fields: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Get the sysparm_fields value for a read tool.
+
+    Args:
+        tool_name: Name of the tool.
+        fields: Raw fields requested by the caller, if any.
+
+    Returns:
+        Optional[str]: The requested fields, or else the tool's manifest entry, comma
+        separated. None if the tool returns whole records and no fields were requested.
+    """
+    if fields:
+        return ",".join(dict.fromkeys(fields))
+    manifest = TOOL_FIELDS.get(tool_name)
+    return ",".join(manifest) if manifest else None
+
+
+def apply_fields(
+    query_params: Dict[str, Any], tool_name: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Add sysparm_fields for a read tool to its Table API query parameters, if any apply."""
+    value = sysparm_fields(tool_name, fields)
+    if value:
+        query_params["sysparm_fields"] = value
+    return query_params
+
+
+def project_record(record: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Reduce a raw record to the requested fields, in the requested order."""
+    return {field: record.get(field) for field in dict.fromkeys(fields)}
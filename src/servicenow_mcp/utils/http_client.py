@@ -0,0 +1,393 @@
+"""
+Pooled HTTP client for the ServiceNow MCP server.
+
+All tool modules issue their ServiceNow requests through a single
+ServiceNowHttpClient so that TCP and TLS connections to the instance are
+kept alive and reused instead of being re-established on every call.
+Async tools use the httpx-based AsyncServiceNowHttpClient, which applies
+the same pool configuration without blocking the event loop.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import anyio
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from servicenow_mcp.utils.config import HttpClientConfig, ServerConfig
+from servicenow_mcp.utils.tracing import record_response, request_span
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceNowHttpClient:
+    """
+    Keep-alive HTTP client backed by a pooled requests.Session.
+
+    The client mirrors the module-level requests API (get, post, put, patch,
+    delete, request) so it can be used as a drop-in replacement by the tools.
+    """
+
+    def __init__(self, config: Optional[HttpClientConfig] = None):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            config: Connection pool configuration. Defaults are used if omitted.
+        """
+        self.config = config or HttpClientConfig()
+        # Set by the AuthManager the client is attached to; used to retry on 401
+        self.auth_manager: Optional[Any] = None
+        # Set by the server when metrics or tracing are enabled; record every request
+        self.metrics: Optional[Any] = None
+        self.tracing: Optional[Any] = None
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._last_used = 0.0
+        # Requests being sent, which keep the session from being recycled
+        self._in_flight = 0
+
+    def _create_session(self) -> requests.Session:
+        """Create a session with pooled adapters for http and https."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Get the underlying session, recycling it if it has been idle too long.
+
+        Instances and load balancers silently drop idle keep-alive connections,
+        so connections unused for longer than ``idle_timeout`` are discarded
+        rather than risking a reset on the next request. A session is never
+        recycled while requests are in flight, however long they run.
+        """
+        with self._lock:
+            return self._current_session()
+
+    def _current_session(self) -> requests.Session:
+        """Get the session, recycling it if idle; the caller holds the lock."""
+        now = time.monotonic()
+        idle_timeout = self.config.idle_timeout
+        if (
+            self._session is not None
+            and idle_timeout
+            and not self._in_flight
+            and now - self._last_used > idle_timeout
+        ):
+            logger.debug("Recycling HTTP session after %.1fs idle", now - self._last_used)
+            self._session.close()
+            self._session = None
+        if self._session is None:
+            self._session = self._create_session()
+        self._last_used = now
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request using the pooled session.
+
+        A request rejected with 401 is retried once with fresh credentials from
+        the attached auth manager (e.g. after an OAuth token was revoked).
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Keyword arguments accepted by requests.Session.request.
+
+        Returns:
+            requests.Response: The response object.
+        """
+        with self._lock:
+            session = self._current_session()
+            self._in_flight += 1
+        try:
+            response = self._send(session, method, url, **kwargs)
+            if response.status_code == 401:
+                retry_kwargs = _retry_kwargs_after_unauthorized(self.auth_manager, kwargs)
+                if retry_kwargs is not None:
+                    logger.info(f"Retrying {method} {url} with refreshed credentials after 401")
+                    response = self._send(session, method, url, **retry_kwargs)
+            return response
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used = time.monotonic()
+
+    def _send(
+        self, session: requests.Session, method: str, url: str, **kwargs: Any
+    ) -> requests.Response:
+        """Send a single request, timing and tracing it if metrics or tracing are enabled."""
+        if self.metrics is None and self.tracing is None:
+            return session.request(method, url, **kwargs)
+        streamed = kwargs.get("stream")
+        with request_span(self.tracing, method, url) as span:
+            start = time.perf_counter()
+            response = session.request(method, url, **kwargs)
+            elapsed = time.perf_counter() - start
+            if self.metrics is not None:
+                self.metrics.record_upstream(elapsed, _response_size(response, streamed))
+            if span is not None:
+                content = None if streamed else response.content
+                record_response(span, response.status_code, response.headers, content)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a PUT request."""
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a PATCH request."""
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a DELETE request."""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class AsyncServiceNowHttpClient:
+    """
+    Keep-alive HTTP client for async tools, backed by httpx.AsyncClient.
+
+    The underlying httpx client is created lazily on first use so that it is
+    bound to the event loop that runs the server.
+    """
+
+    def __init__(self, config: Optional[HttpClientConfig] = None, pooled: bool = True):
+        """
+        Initialize the async HTTP client.
+
+        Args:
+            config: Connection pool configuration. Defaults are used if omitted.
+            pooled: Keep connections open between requests. When False, every
+                request uses a short-lived httpx client that is closed afterwards.
+        """
+        self.config = config or HttpClientConfig()
+        self.pooled = pooled
+        # Set by the AuthManager the client is attached to; used to retry on 401
+        self.auth_manager: Optional[Any] = None
+        # Set by the server when metrics or tracing are enabled; record every request
+        self.metrics: Optional[Any] = None
+        self.tracing: Optional[Any] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create an httpx client with the configured connection limits."""
+        limits = httpx.Limits(
+            max_connections=self.config.pool_connections * self.config.pool_maxsize,
+            max_keepalive_connections=self.config.pool_maxsize,
+            keepalive_expiry=self.config.idle_timeout or None,
+        )
+        return httpx.AsyncClient(limits=limits)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request without blocking the event loop.
+
+        A request rejected with 401 is retried once with fresh credentials from
+        the attached auth manager.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Keyword arguments accepted by httpx.AsyncClient.request.
+
+        Returns:
+            httpx.Response: The response object.
+        """
+        response = await self._send(method, url, **kwargs)
+        if response.status_code == 401 and self.auth_manager is not None:
+            # Fetching a token blocks, so do it off the event loop
+            retry_kwargs = await anyio.to_thread.run_sync(
+                _retry_kwargs_after_unauthorized, self.auth_manager, kwargs
+            )
+            if retry_kwargs is not None:
+                logger.info(f"Retrying {method} {url} with refreshed credentials after 401")
+                response = await self._send(method, url, **retry_kwargs)
+        return response
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a single request, timing and tracing it if metrics or tracing are enabled."""
+        if self.metrics is None and self.tracing is None:
+            return await self._send_once(method, url, **kwargs)
+        with request_span(self.tracing, method, url) as span:
+            start = time.perf_counter()
+            response = await self._send_once(method, url, **kwargs)
+            elapsed = time.perf_counter() - start
+            if self.metrics is not None:
+                self.metrics.record_upstream(elapsed, len(response.content))
+            if span is not None:
+                record_response(span, response.status_code, response.headers, response.content)
+        return response
+
+    async def _send_once(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a single request, creating the pooled client if necessary."""
+        if not self.pooled:
+            async with httpx.AsyncClient() as client:
+                return await client.request(method, url, **kwargs)
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return await self._client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a PUT request."""
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a PATCH request."""
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a DELETE request."""
+        return await self.request("DELETE", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def _response_size(response: requests.Response, stream: bool) -> int:
+    """Size of a response body, without consuming streamed bodies."""
+    if stream:
+        return int(response.headers.get("Content-Length") or 0)
+    return len(response.content)
+
+
+def _retry_kwargs_after_unauthorized(
+    auth_manager: Optional[Any], kwargs: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the keyword arguments for retrying a request that was rejected with 401.
+
+    Args:
+        auth_manager: Auth manager that issued the request credentials.
+        kwargs: Keyword arguments of the rejected request.
+
+    Returns:
+        Optional[Dict[str, Any]]: Arguments with a refreshed Authorization header,
+        or None if the request should not be retried.
+    """
+    if auth_manager is None:
+        return None
+    headers = kwargs.get("headers") or {}
+    try:
+        authorization = auth_manager.handle_unauthorized(headers.get("Authorization"))
+    except ValueError as e:
+        logger.error(f"Failed to refresh credentials after 401: {e}")
+        return None
+    if authorization is None:
+        return None
+    return {**kwargs, "headers": {**headers, "Authorization": authorization}}
+
+
+def get_http_client(auth_manager: Any) -> Any:
+    """
+    Get the HTTP client to use for requests made on behalf of an auth manager.
+
+    Returns the pooled client attached to the auth manager by the server. Auth
+    managers created without one (e.g. by the standalone CLI scripts) fall back
+    to the module-level requests API.
+
+    Args:
+        auth_manager: Authentication manager passed to the tool.
+
+    Returns:
+        An object exposing the requests API (get, post, put, patch, delete).
+    """
+    client = getattr(auth_manager, "http_client", None)
+    if isinstance(client, ServiceNowHttpClient):
+        return client
+    return requests
+
+
+def order_auth_and_config(
+    auth_manager: Any, server_config: Any, strict: bool = False
+) -> Tuple[Any, Any]:
+    """
+    Put the arguments of a tool declared as ``(auth_manager, server_config, params)`` in order.
+
+    The server calls every tool as ``(config, auth_manager, params)``, while some
+    tool modules declare the first two the other way round and are also called
+    that way directly. Without reordering, such a tool would pass the server
+    configuration to get_http_client and bypass the pooled client.
+
+    Args:
+        auth_manager: What the tool received as its auth manager.
+        server_config: What the tool received as its server configuration.
+        strict: Raise if the arguments are not an auth manager and a server
+            configuration, instead of leaving that to the tool.
+
+    Returns:
+        Tuple[Any, Any]: The auth manager and the server configuration.
+
+    Raises:
+        ValueError: If strict and either argument is missing.
+    """
+    if isinstance(auth_manager, ServerConfig) and not isinstance(server_config, ServerConfig):
+        auth_manager, server_config = server_config, auth_manager
+    elif not hasattr(auth_manager, "get_headers") and hasattr(server_config, "get_headers"):
+        auth_manager, server_config = server_config, auth_manager
+    if not strict:
+        return auth_manager, server_config
+    if not hasattr(auth_manager, "get_headers"):
+        raise ValueError("Cannot find get_headers method in either auth_manager or server_config")
+    if not hasattr(server_config, "instance_url"):
+        raise ValueError(
+            "Cannot find instance_url attribute in either auth_manager or server_config"
+        )
+    return auth_manager, server_config
+
+
+def get_async_http_client(auth_manager: Any) -> AsyncServiceNowHttpClient:
+    """
+    Get the async HTTP client to use for requests made on behalf of an auth manager.
+
+    Returns the pooled async client attached to the auth manager by the server,
+    or an unpooled client if none is attached.
+
+    Args:
+        auth_manager: Authentication manager passed to the tool.
+
+    Returns:
+        AsyncServiceNowHttpClient: Client exposing awaitable get, post, put, patch, delete.
+    """
+    client = getattr(auth_manager, "async_http_client", None)
+    if isinstance(client, AsyncServiceNowHttpClient):
+        return client
+    return AsyncServiceNowHttpClient(pooled=False)
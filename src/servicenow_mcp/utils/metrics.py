@@ -0,0 +1,318 @@
+"""
+Per-tool instrumentation for the ServiceNow MCP server.
+
+When metrics are enabled, every tool call records its wall time, the time
+spent validating its arguments and serializing its result, the size of the
+result, and the ServiceNow requests it made: how many, how long they took and
+how many bytes they returned. Requests are attributed to the tool call through
+a context variable set by the server, which follows the call into the worker
+thread of synchronous tools. Requests made outside a tool call (mirror syncs,
+token refreshes) are counted as background requests.
+
+The figures are exported in the Prometheus text format, served at /metrics by
+the SSE server, and as a JSON snapshot returned by the get_server_metrics tool.
+When metrics are disabled no call is tracked and the HTTP clients skip timing.
+"""
+
+import bisect
+import threading
+import time
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from servicenow_mcp.utils.config import MetricsConfig
+
+# Pseudo tool name under which requests made outside any tool call are counted
+BACKGROUND = ""
+
+
+class ToolCall:
+    """Measurements of one tool call, filled in while it runs."""
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.started = time.perf_counter()
+        # "ok", "error" (the tool reported a failure), "cached" or "exception"
+        self.status = "ok"
+        self.validation_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.response_bytes = 0
+        self.upstream: List[Tuple[float, int]] = []
+        self._lock = threading.Lock()
+
+    def record_upstream(self, seconds: float, size: int) -> None:
+        """Record a ServiceNow request made by the call, possibly from another thread."""
+        with self._lock:
+            self.upstream.append((seconds, size))
+
+
+_current_call: ContextVar[Optional[ToolCall]] = ContextVar(
+    "servicenow_mcp_tool_call", default=None
+)
+
+
+def current_call() -> Optional[ToolCall]:
+    """Get the tool call running in the current context, if it is being measured."""
+    return _current_call.get()
+
+
+def bind_current_call(func: Callable) -> Callable:
+    """
+    Wrap a function so that the requests it makes count towards the current tool call.
+
+    Context variables, such as the call being measured and the current tracing
+    span, do not follow work submitted to a ThreadPoolExecutor, so tools that
+    fan out to their own threads wrap the submitted function. Each run gets its
+    own copy of the submitting context, so the wrapper can run concurrently.
+    """
+    context = copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
+
+
+class _Histogram:
+    """Per-bucket counts, sum and count of observed values, as in a Prometheus histogram."""
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+
+class _ToolStats:
+    """Totals of the calls of one tool."""
+
+    def __init__(self, bounds: List[float]):
+        self.statuses: Dict[str, int] = {}
+        self.duration = _Histogram(bounds)
+        self.upstream_duration = _Histogram(bounds)
+        self.validation_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.response_bytes = 0
+        self.upstream_bytes = 0
+
+
+class ServerMetrics:
+    """Aggregated tool call and upstream request metrics of one server."""
+
+    def __init__(
+        self,
+        config: Optional[MetricsConfig] = None,
+        cache_stats: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
+        """
+        Initialize the metrics.
+
+        Args:
+            config: Metrics configuration. Nothing is recorded if omitted.
+            cache_stats: Returns the hit and miss counters of the server caches,
+                as ``{"result_cache": {"hits": .., "misses": ..},
+                "reference_cache": {table: {"hits": .., "misses": ..}}}``.
+        """
+        self.config = config or MetricsConfig()
+        self.enabled = self.config.enabled
+        self.cache_stats = cache_stats
+        self.started_at = time.time()
+        self._bounds = sorted(self.config.duration_buckets)
+        self._lock = threading.Lock()
+        self._tools: Dict[str, _ToolStats] = {}
+
+    def _stats(self, tool: str) -> _ToolStats:
+        stats = self._tools.get(tool)
+        if stats is None:
+            stats = self._tools[tool] = _ToolStats(self._bounds)
+        return stats
+
+    def start(self, tool: str) -> Optional[ToolCall]:
+        """Start measuring a tool call. None if metrics are disabled."""
+        if not self.enabled:
+            return None
+        return ToolCall(tool)
+
+    def activate(self, call: ToolCall) -> Any:
+        """Make a call the current one, so its requests are attributed to it."""
+        return _current_call.set(call)
+
+    def deactivate(self, token: Any) -> None:
+        """Restore the call that was current before ``activate``."""
+        _current_call.reset(token)
+
+    def finish(self, call: ToolCall) -> None:
+        """Add a finished call to the totals of its tool."""
+        elapsed = time.perf_counter() - call.started
+        with self._lock:
+            stats = self._stats(call.tool)
+            stats.statuses[call.status] = stats.statuses.get(call.status, 0) + 1
+            stats.duration.observe(elapsed)
+            stats.validation_seconds += call.validation_seconds
+            stats.serialization_seconds += call.serialization_seconds
+            stats.response_bytes += call.response_bytes
+            for seconds, size in call.upstream:
+                stats.upstream_duration.observe(seconds)
+                stats.upstream_bytes += size
+
+    def record_upstream(self, seconds: float, size: int) -> None:
+        """Record a ServiceNow request, attributing it to the current tool call if any."""
+        call = _current_call.get()
+        if call is not None:
+            call.record_upstream(seconds, size)
+            return
+        with self._lock:
+            stats = self._stats(BACKGROUND)
+            stats.upstream_duration.observe(seconds)
+            stats.upstream_bytes += size
+
+    def reset(self) -> None:
+        """Drop all recorded totals."""
+        with self._lock:
+            self._tools.clear()
+            self.started_at = time.time()
+
+    def _caches(self) -> Dict[str, Any]:
+        return self.cache_stats() if self.cache_stats is not None else {}
+
+    def snapshot(self, tool: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Summarize the recorded metrics.
+
+        Args:
+            tool: Only report this tool.
+
+        Returns:
+            Dict[str, Any]: Per-tool call counts, average and maximum timings in
+            milliseconds, upstream requests and bytes, background requests and
+            the cache counters.
+        """
+        with self._lock:
+            tools = {}
+            for name, stats in sorted(self._tools.items()):
+                if name == BACKGROUND or (tool is not None and name != tool):
+                    continue
+                calls = stats.duration.count
+                upstream = stats.upstream_duration
+                tools[name] = {
+                    "calls": calls,
+                    "statuses": dict(stats.statuses),
+                    "avg_ms": _ms(stats.duration.sum / calls),
+                    "max_ms": _ms(stats.duration.max),
+                    "avg_validation_ms": _ms(stats.validation_seconds / calls),
+                    "avg_serialization_ms": _ms(stats.serialization_seconds / calls),
+                    "avg_response_bytes": round(stats.response_bytes / calls),
+                    "upstream_requests": upstream.count,
+                    "avg_upstream_requests": round(upstream.count / calls, 2),
+                    "avg_upstream_ms": _ms(upstream.sum / upstream.count) if upstream.count else 0,
+                    "max_upstream_ms": _ms(upstream.max),
+                    "upstream_bytes": stats.upstream_bytes,
+                }
+            background = self._tools.get(BACKGROUND)
+            summary: Dict[str, Any] = {
+                "enabled": self.enabled,
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "tools": tools,
+                "background_upstream_requests": (
+                    background.upstream_duration.count if background else 0
+                ),
+                "background_upstream_bytes": background.upstream_bytes if background else 0,
+            }
+        summary.update(self._caches())
+        return summary
+
+    def prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP servicenow_mcp_{name} {help_text}")
+            lines.append(f"# TYPE servicenow_mcp_{name} {kind}")
+
+        def sample(name: str, labels: Dict[str, str], value: Any) -> None:
+            rendered = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            lines.append(f"servicenow_mcp_{name}{{{rendered}}} {value}")
+
+        def histogram(name: str, labels: Dict[str, str], values: _Histogram) -> None:
+            cumulative = 0
+            for bound, count in zip(self._bounds + [float("inf")], values.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                sample(f"{name}_bucket", {**labels, "le": le}, cumulative)
+            sample(f"{name}_sum", labels, values.sum)
+            sample(f"{name}_count", labels, values.count)
+
+        with self._lock:
+            tools = sorted((name, stats) for name, stats in self._tools.items() if name)
+            background = self._tools.get(BACKGROUND)
+
+            family("tool_calls_total", "counter", "Tool calls by outcome.")
+            for name, stats in tools:
+                for status, count in sorted(stats.statuses.items()):
+                    sample("tool_calls_total", {"tool": name, "status": status}, count)
+            family("tool_duration_seconds", "histogram", "Wall time of tool calls.")
+            for name, stats in tools:
+                histogram("tool_duration_seconds", {"tool": name}, stats.duration)
+            for metric, attribute, help_text in (
+                (
+                    "tool_validation_seconds_total",
+                    "validation_seconds",
+                    "Time spent validating tool arguments.",
+                ),
+                (
+                    "tool_serialization_seconds_total",
+                    "serialization_seconds",
+                    "Time spent serializing tool results.",
+                ),
+                ("tool_response_bytes_total", "response_bytes", "Size of the tool results."),
+            ):
+                family(metric, "counter", help_text)
+                for name, stats in tools:
+                    sample(metric, {"tool": name}, getattr(stats, attribute))
+
+            upstream = tools + ([(BACKGROUND, background)] if background else [])
+            family(
+                "upstream_request_duration_seconds",
+                "histogram",
+                "Duration of ServiceNow requests, by the tool that made them "
+                '(tool="" outside tool calls).',
+            )
+            for name, stats in upstream:
+                histogram(
+                    "upstream_request_duration_seconds", {"tool": name}, stats.upstream_duration
+                )
+            family("upstream_response_bytes_total", "counter", "Bytes returned by ServiceNow.")
+            for name, stats in upstream:
+                sample("upstream_response_bytes_total", {"tool": name}, stats.upstream_bytes)
+
+        caches = self._caches()
+        result_cache = caches.get("result_cache")
+        if result_cache:
+            for outcome in ("hits", "misses"):
+                family(f"result_cache_{outcome}_total", "counter", f"Tool result cache {outcome}.")
+                lines.append(f"servicenow_mcp_result_cache_{outcome}_total {result_cache[outcome]}")
+        reference_cache = caches.get("reference_cache")
+        if reference_cache:
+            for outcome in ("hits", "misses"):
+                family(
+                    f"reference_cache_{outcome}_total", "counter", f"Reference cache {outcome}."
+                )
+                for table, counters in sorted(reference_cache.items()):
+                    sample(f"reference_cache_{outcome}_total", {"table": table}, counters[outcome])
+
+        return "\n".join(lines) + "\n"
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,500 @@
+"""
+Local SQLite mirror of ServiceNow tables.
+
+Read-heavy agent workloads ask for the same tables over and over. TableMirror
+keeps a copy of the configured tables in a SQLite file, kept up to date by
+polling for records with a ``sys_updated_on`` at or after the newest one seen
+(the watermark). Records are stored as returned with
+``sysparm_display_value=all``, so both raw and display values can be served.
+
+Read tools call read_from_mirror first. It answers from the mirror only if
+the table's last completed sync started at most ``max_staleness`` seconds ago,
+no write to the table happened since, and the encoded query can be evaluated
+locally; otherwise it returns None and the tool asks the instance.
+
+Deleted records do not show up in watermark polling, so every
+``reconcile_interval`` seconds the sys_ids of each table are compared with the
+instance and the records missing there are dropped.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from servicenow_mcp.utils.config import MirrorConfig, ServerConfig
+from servicenow_mcp.utils.encoded_query import UnsupportedQueryError, parse
+from servicenow_mcp.utils.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Fields that have their own column, so lookups by them use an index
+_INDEXED_FIELDS = ("sys_id", "number")
+
+
+def _raw(record: Dict[str, Any], field: str) -> Optional[str]:
+    value = record.get(field)
+    if isinstance(value, dict):
+        value = value.get("value")
+    return value
+
+
+def _json_value(field: str, key: str) -> str:
+    """SQL expression of a stored field's raw or display value."""
+    path = f'$."{field}"'
+    return (
+        f"CASE json_type(data, '{path}') WHEN 'object' "
+        f"THEN json_extract(data, '{path}.{key}') ELSE json_extract(data, '{path}') END"
+    )
+
+
+def render_record(record: Dict[str, Any], display_value: bool) -> Dict[str, Any]:
+    """Convert a mirrored record to the shape the Table API returns for display_value true/false."""
+    key = "display_value" if display_value else "value"
+    return {
+        field: value.get(key) if isinstance(value, dict) else value
+        for field, value in record.items()
+    }
+
+
+class TableMirror:
+    """SQLite copy of ServiceNow tables with per-table sync state."""
+
+    def __init__(self, config: MirrorConfig, instance_url: str = ""):
+        """
+        Initialize the mirror, creating the database if necessary.
+
+        Args:
+            config: Mirror configuration.
+            instance_url: Instance the mirrored records belong to.
+        """
+        self.config = config
+        self.instance_url = instance_url
+        self.path = os.path.expanduser(config.sqlite_path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Tables written through this process since, as time.time()
+        self._written_at: Dict[str, float] = {}
+        self._reconciled_at: Dict[str, float] = {}
+        self._connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "instance TEXT NOT NULL, tbl TEXT NOT NULL, sys_id TEXT NOT NULL, number TEXT, "
+                "sys_updated_on TEXT, data TEXT NOT NULL, PRIMARY KEY (instance, tbl, sys_id))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS records_number "
+                "ON records (instance, tbl, number COLLATE NOCASE)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "instance TEXT NOT NULL, tbl TEXT NOT NULL, watermark TEXT, synced_at REAL, "
+                "PRIMARY KEY (instance, tbl))"
+            )
+
+    @classmethod
+    def from_config(cls, config: ServerConfig) -> "TableMirror":
+        """Create the mirror described by the server configuration."""
+        return cls(config.mirror, config.instance_url)
+
+    def _state(self, table: str) -> Optional[tuple]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT watermark, synced_at FROM sync_state WHERE instance = ? AND tbl = ?",
+                (self.instance_url, table),
+            ).fetchone()
+
+    def _save_state(self, table: str, watermark: Optional[str], synced_at: Optional[float]):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO sync_state (instance, tbl, watermark, synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (instance, tbl) DO UPDATE SET watermark = excluded.watermark, "
+                "synced_at = COALESCE(excluded.synced_at, sync_state.synced_at)",
+                (self.instance_url, table, watermark, synced_at),
+            )
+
+    def _store(self, table: str, records: List[Dict[str, Any]]) -> None:
+        rows = [
+            (
+                self.instance_url,
+                table,
+                _raw(record, "sys_id"),
+                _raw(record, "number"),
+                _raw(record, "sys_updated_on"),
+                json.dumps(record),
+            )
+            for record in records
+            if _raw(record, "sys_id")
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO records "
+                "(instance, tbl, sys_id, number, sys_updated_on, data) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def sync_table(self, config: ServerConfig, auth_manager: Any, table: str) -> int:
+        """
+        Fetch the records of a table changed since the last sync.
+
+        Records are requested in sys_updated_on order starting at the watermark.
+        Those sharing the watermark's timestamp are re-read (and skipped by
+        offset within one sync), so none is missed when several records were
+        updated in the same second. The watermark is saved after every page,
+        so an interrupted sync resumes where it stopped.
+
+        Returns:
+            int: Number of records fetched.
+
+        Raises:
+            requests.RequestException: If a page cannot be fetched.
+        """
+        started_at = time.time()
+        state = self._state(table)
+        watermark = state[0] if state else None
+        # Records already fetched in this sync whose sys_updated_on equals the watermark
+        seen_at_watermark = 0
+        fetched = 0
+
+        while True:
+            conditions = [f"sys_updated_on>={watermark}"] if watermark else []
+            conditions += ["ORDERBYsys_updated_on", "ORDERBYsys_id"]
+            response = get_http_client(auth_manager).get(
+                f"{config.api_url}/table/{table}",
+                params={
+                    "sysparm_query": "^".join(conditions),
+                    "sysparm_limit": self.config.page_size,
+                    "sysparm_offset": seen_at_watermark,
+                    "sysparm_display_value": "all",
+                    "sysparm_exclude_reference_link": "true",
+                },
+                headers=auth_manager.get_headers(),
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+            records = response.json().get("result", [])
+
+            self._store(table, records)
+            fetched += len(records)
+            for record in records:
+                updated_on = _raw(record, "sys_updated_on")
+                if updated_on == watermark:
+                    seen_at_watermark += 1
+                elif updated_on:
+                    watermark, seen_at_watermark = updated_on, 1
+            self._save_state(table, watermark, None)
+
+            if len(records) < self.config.page_size:
+                break
+
+        self._save_state(table, watermark, started_at)
+        logger.debug(f"Mirror sync of {table}: {fetched} records, watermark {watermark}")
+        return fetched
+
+    def reconcile_table(self, config: ServerConfig, auth_manager: Any, table: str) -> int:
+        """
+        Drop mirrored records that no longer exist on the instance.
+
+        Returns:
+            int: Number of records dropped.
+
+        Raises:
+            requests.RequestException: If the sys_ids cannot be fetched.
+        """
+        remote = set(self._remote_sys_ids(config, auth_manager, table))
+        with self._lock, self._connection:
+            local = {
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT sys_id FROM records WHERE instance = ? AND tbl = ?",
+                    (self.instance_url, table),
+                )
+            }
+            deleted = local - remote
+            self._connection.executemany(
+                "DELETE FROM records WHERE instance = ? AND tbl = ? AND sys_id = ?",
+                [(self.instance_url, table, sys_id) for sys_id in deleted],
+            )
+        self._reconciled_at[table] = time.time()
+        return len(deleted)
+
+    def _remote_sys_ids(self, config: ServerConfig, auth_manager: Any, table: str) -> Iterator[str]:
+        """Page through the sys_ids of a table by keyset."""
+        last_sys_id = None
+        page_size = self.config.page_size * 10
+        while True:
+            conditions = [f"sys_id>{last_sys_id}"] if last_sys_id else []
+            response = get_http_client(auth_manager).get(
+                f"{config.api_url}/table/{table}",
+                params={
+                    "sysparm_query": "^".join(conditions + ["ORDERBYsys_id"]),
+                    "sysparm_fields": "sys_id",
+                    "sysparm_limit": page_size,
+                },
+                headers=auth_manager.get_headers(),
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+            records = response.json().get("result", [])
+            for record in records:
+                yield record["sys_id"]
+            if len(records) < page_size:
+                return
+            last_sys_id = records[-1]["sys_id"]
+
+    def sync_all(self, config: ServerConfig, auth_manager: Any) -> Dict[str, Any]:
+        """
+        Sync every configured table, reconciling deletions when they are due.
+
+        A table that fails to sync is logged and skipped; the others are still synced.
+
+        Returns:
+            Dict[str, Any]: Records fetched per table, or the error message of a failed table.
+        """
+        results: Dict[str, Any] = {}
+        for table in self.config.tables:
+            try:
+                results[table] = self.sync_table(config, auth_manager, table)
+                interval = self.config.reconcile_interval
+                if interval and time.time() - self._reconciled_at.get(table, 0) >= interval:
+                    self.reconcile_table(config, auth_manager, table)
+            except requests.RequestException as e:
+                logger.warning(f"Mirror sync of {table} failed: {e}")
+                results[table] = str(e)
+        return results
+
+    def age(self, table: str) -> Optional[float]:
+        """Seconds since the last completed sync of a table started, or None if never synced."""
+        state = self._state(table)
+        if not state or state[1] is None:
+            return None
+        return time.time() - state[1]
+
+    def is_fresh(self, table: str, max_staleness: Optional[float] = None) -> bool:
+        """Check whether reads of a table may be served from the mirror."""
+        if table not in self.config.tables:
+            return False
+        state = self._state(table)
+        if not state or state[1] is None:
+            return False
+        synced_at = state[1]
+        if max_staleness is None:
+            max_staleness = self.config.max_staleness
+        if time.time() - synced_at > max_staleness:
+            return False
+        # A sync that started before our last write may not include it
+        return synced_at > self._written_at.get(table, 0)
+
+    def mark_written(self, table: str) -> None:
+        """Record a write to a table, so reads go to the instance until the next sync."""
+        self._written_at[table] = time.time()
+
+    def query(
+        self,
+        table: str,
+        query: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the mirrored records of a table matching an encoded query.
+
+        Records are returned as stored (``display_value=all`` shape), ordered by
+        the query's ORDERBY fields, then by sys_id. The query is compiled to SQL,
+        so only the matching page of records is loaded.
+
+        Raises:
+            UnsupportedQueryError: If the query cannot be evaluated locally.
+        """
+        encoded_query = parse(query or "")
+
+        where = "instance = ? AND tbl = ?"
+        args: List[Any] = [self.instance_url, table]
+        with self._lock:
+            sample = self._connection.execute(
+                f"SELECT data FROM records WHERE {where} LIMIT 1", args
+            ).fetchone()
+        if sample is None:
+            return []
+        unknown = encoded_query.fields - set(json.loads(sample[0]))
+        if unknown:
+            raise UnsupportedQueryError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+        # Narrow single-value lookups by sys_id or number with the index
+        if len(encoded_query.branches) == 1:
+            for group in encoded_query.branches[0]:
+                condition = group[0]
+                if len(group) == 1 and condition.operator == "=" and (
+                    condition.field in _INDEXED_FIELDS
+                ):
+                    where += f" AND {condition.field} = ? COLLATE NOCASE"
+                    args.append(condition.value)
+
+        sql_query = encoded_query.to_sql(
+            lambda field: _json_value(field, "value"),
+            lambda field: _json_value(field, "display_value"),
+        )
+        sql = f"SELECT data FROM records WHERE {where} AND ({sql_query.where}) ORDER BY "
+        sql += f"{sql_query.order_by}, sys_id" if sql_query.order_by else "sys_id"
+        args.extend(sql_query.params)
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            args.extend([-1 if limit is None else limit, offset])
+
+        with self._lock:
+            rows = self._connection.execute(sql, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def reset(self, table: Optional[str] = None) -> None:
+        """Drop the mirrored records and sync state of a table, or of all tables."""
+        with self._lock, self._connection:
+            for sql_table in ("records", "sync_state"):
+                if table is None:
+                    self._connection.execute(
+                        f"DELETE FROM {sql_table} WHERE instance = ?", (self.instance_url,)
+                    )
+                else:
+                    self._connection.execute(
+                        f"DELETE FROM {sql_table} WHERE instance = ? AND tbl = ?",
+                        (self.instance_url, table),
+                    )
+
+
+class MirrorSyncer:
+    """Background thread that keeps a TableMirror up to date."""
+
+    def __init__(self, mirror: TableMirror, config: ServerConfig, auth_manager: Any):
+        """
+        Initialize the syncer.
+
+        Args:
+            mirror: The mirror to keep up to date.
+            config: Server configuration.
+            auth_manager: Authentication manager used for the sync requests.
+        """
+        self.mirror = mirror
+        self.config = config
+        self.auth_manager = auth_manager
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start syncing every ``sync_interval`` seconds, beginning immediately."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="mirror-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop syncing and wait for a sync in progress to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def sync(self) -> Dict[str, Any]:
+        """
+        Sync every configured table, then refresh the article index if kb_knowledge is mirrored.
+
+        The index is refreshed here rather than on the first search after a sync,
+        so that re-indexing changed articles stays off the request path.
+
+        Returns:
+            Dict[str, Any]: Records fetched per table, as returned by sync_all.
+        """
+        results = self.mirror.sync_all(self.config, self.auth_manager)
+        # Imported here: the article index module imports this one
+        from servicenow_mcp.utils.article_index import get_article_index
+
+        try:
+            index = get_article_index(self.config, self.auth_manager)
+            if index is not None:
+                index.refresh()
+        except sqlite3.Error as e:
+            logger.warning(f"Article index refresh failed: {e}")
+        return results
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                logger.error(f"Mirror sync failed: {e}", exc_info=True)
+            self._stop.wait(self.config.mirror.sync_interval)
+
+
+def get_mirror(config: ServerConfig, auth_manager: Any) -> Optional[TableMirror]:
+    """
+    Get the table mirror for requests made on behalf of an auth manager.
+
+    Like the reference cache, the mirror is created on first use and attached
+    to the auth manager. None if the mirror is disabled.
+    """
+    if not config.mirror.enabled:
+        return None
+    mirror = getattr(auth_manager, "mirror", None)
+    if not isinstance(mirror, TableMirror):
+        mirror = TableMirror.from_config(config)
+        try:
+            auth_manager.mirror = mirror
+        except AttributeError:
+            logger.debug("Cannot attach table mirror to %r", auth_manager)
+    return mirror
+
+
+def read_from_mirror(
+    config: ServerConfig,
+    auth_manager: Any,
+    table: str,
+    query_params: Dict[str, Any],
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Serve a Table API read from the mirror if it is fresh enough.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager passed to the tool.
+        table: Table to read.
+        query_params: The Table API query parameters of the read. sysparm_query,
+            sysparm_limit, sysparm_offset, sysparm_fields and sysparm_display_value
+            are honoured.
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: The records, shaped like the ``result`` of the
+        Table API response, or None if the read must go to the instance.
+    """
+    mirror = get_mirror(config, auth_manager)
+    if mirror is None or not mirror.is_fresh(table):
+        return None
+    fields = query_params.get("sysparm_fields")
+    if fields and "." in fields:
+        # Dot-walked fields are not mirrored
+        return None
+    limit = query_params.get("sysparm_limit")
+    try:
+        records = mirror.query(
+            table,
+            query_params.get("sysparm_query"),
+            limit=None if limit is None else int(limit),
+            offset=int(query_params.get("sysparm_offset") or 0),
+        )
+    except UnsupportedQueryError as e:
+        logger.debug(f"Reading {table} from the instance: {e}")
+        return None
+
+    display_value = str(query_params.get("sysparm_display_value", "false")).lower()
+    if display_value != "all":
+        records = [render_record(record, display_value == "true") for record in records]
+    if fields:
+        names = fields.split(",")
+        records = [{name: record[name] for name in names if name in record} for record in records]
+    return records
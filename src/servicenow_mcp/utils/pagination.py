@@ -0,0 +1,238 @@
+"""
+Cursor pagination of the list tools.
+
+With ``limit``/``offset`` paging, the instance scans and skips ``offset``
+records for every page, and a record inserted or deleted between two calls
+shifts the pages, so records are skipped or repeated. Every list tool
+therefore returns a ``next_cursor`` when its page is full, which it accepts
+back as ``cursor`` to return the following page.
+
+The cursor is opaque to callers: URL-safe base64 of the query the tool built
+and the sys_id of the last record returned. Pages of queries without their
+own ordering are sorted by sys_id and the next page asks for records after
+that sys_id (keyset pagination), which the instance answers from its index
+whatever the depth. Queries ordered by a single field are sorted by that
+field, then sys_id, and the next page asks for the records after the last
+(value, sys_id) pair. The instance has no tuple comparison, so that condition
+is an ``^NQ`` of whole queries: a value past the last one, or the same value
+and a sys_id past the last one.
+
+Other pages are positioned by offset: queries ordered by several fields or
+returning display values, pages whose requested fields leave out sys_id or
+the ordering field, and pages whose values are not in the order the keyset
+condition assumes (e.g. reference fields, sorted by display value). The
+offset of a page after a keyset page counts from that page's keyset position.
+Records added or removed between calls shift these pages, so list tools
+return ``cursor_stable: false`` with their cursors.
+
+A cursor is only valid for the query it was issued for, so passing it with
+different filters raises ValueError rather than returning a page of another
+result set. Tools whose query changes from one call to the next, such as
+relative date conditions, identify their result set by a key of their own.
+"""
+
+import base64
+import binascii
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+CURSOR_DESCRIPTION = (
+    "Cursor returned as next_cursor by the previous call with the same filters; "
+    "returns the page after it, ignoring offset"
+)
+
+# The ORDERBY or ORDERBYDESC term of an encoded query, with its field
+_ORDER_BY = re.compile(r"ORDERBY(DESC)?(.*)")
+_FIELD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode the state of a cursor."""
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor from encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(state, dict) or not isinstance(state.get("q"), str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return state
+
+
+class CursorPage:
+    """One page of a list tool's Table API query, positioned by an optional cursor."""
+
+    def __init__(
+        self,
+        query_params: Dict[str, Any],
+        cursor: Optional[str] = None,
+        key: Optional[str] = None,
+    ):
+        """
+        Position the query parameters of a list tool at its cursor.
+
+        Args:
+            query_params: Table API query parameters built by the tool. They are
+                updated in place: sysparm_query gets the keyset condition and
+                ordering, or sysparm_offset the offset of the cursor.
+            cursor: Cursor from the previous page, if any.
+            key: Identity of the result set cursors are checked against; the
+                query if omitted.
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for another query.
+        """
+        self.query_params = query_params
+        query = query_params.get("sysparm_query") or ""
+        self.key = query if key is None else key
+        self.offset = int(query_params.get("sysparm_offset") or 0)
+        # The (sys_id, value) pair the page starts after, if positioned by keyset
+        self.position: Dict[str, str] = {}
+
+        terms = query.split("^") if query else []
+        orders = [_ORDER_BY.fullmatch(term) for term in terms if term.startswith("ORDERBY")]
+        filters = "^".join(term for term in terms if not term.startswith("ORDERBY"))
+        # Keyset field and direction: sys_id for unordered queries
+        self.order_field = "sys_id"
+        self.descending = False
+        if orders:
+            self.order_field = orders[0].group(2)
+            self.descending = bool(orders[0].group(1))
+        display_value = str(query_params.get("sysparm_display_value", "false")).lower()
+        self.keyset = not orders or (
+            len(orders) == 1
+            and _FIELD.fullmatch(self.order_field) is not None
+            and display_value != "true"
+        )
+
+        state = decode_cursor(cursor) if cursor else None
+        if state is not None and state["q"] != self.key:
+            raise ValueError(
+                "The cursor was issued for another query; pass the same filters as "
+                "the call that returned it"
+            )
+
+        if self.keyset:
+            ordering = [f"ORDERBY{'DESC' if self.descending else ''}{self.order_field}"]
+            if self.order_field != "sys_id":
+                ordering.append("ORDERBYsys_id")
+            if state is not None and state.get("k"):
+                self.position = {"k": state["k"], "v": state.get("v", "")}
+                filters = self._after(filters, state["k"], state.get("v", ""))
+            query_params["sysparm_query"] = "^".join(filter(None, [filters, *ordering]))
+        if state is not None:
+            # Keyset cursors start after their sys_id, and at their offset from there
+            # if a later page fell back to offset; the others at their offset
+            self.offset = int(state.get("o", 0))
+            if self.offset or "sysparm_offset" in query_params:
+                query_params["sysparm_offset"] = self.offset
+
+    def next_cursor(self, records: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Get the cursor of the page after this one.
+
+        Args:
+            records: Raw records returned for this page.
+
+        Returns:
+            Optional[str]: The cursor, or None if this page was the last one.
+        """
+        limit = self.query_params.get("sysparm_limit")
+        if not isinstance(records, list) or not records:
+            return None
+        if limit is None or len(records) < int(limit):
+            return None
+        if self.keyset:
+            last = _raw(records[-1].get("sys_id"))
+            if self.order_field == "sys_id":
+                if last:
+                    return encode_cursor({"q": self.key, "k": last})
+            elif last and self._in_order(records):
+                return encode_cursor(
+                    {"q": self.key, "k": last, "v": _raw(records[-1][self.order_field])}
+                )
+        # Records without sys_id or the ordering field, e.g. of fields leaving
+        # them out, and records in another order are paged by offset, counted
+        # from the keyset position this page started after
+        return encode_cursor({"q": self.key, **self.position, "o": self.offset + len(records)})
+
+    def cursor_fields(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get the fields list tools return for the page after this one.
+
+        Args:
+            records: Raw records returned for this page.
+
+        Returns:
+            Dict[str, Any]: next_cursor, and cursor_stable set to False if the
+            cursor is an offset, which records added or removed meanwhile shift.
+        """
+        cursor = self.next_cursor(records)
+        fields: Dict[str, Any] = {"next_cursor": cursor}
+        if cursor is not None and "o" in decode_cursor(cursor):
+            fields["cursor_stable"] = False
+        return fields
+
+    def _after(self, filters: str, last_sys_id: str, last_value: str) -> str:
+        """Filters of the query restricted to the records after a (value, sys_id) pair."""
+        field = self.order_field
+        if field == "sys_id":
+            keysets = [[f"sys_id{'<' if self.descending else '>'}{last_sys_id}"]]
+        # Empty values sort first
+        elif last_value == "":
+            keysets = [[f"{field}ISEMPTY", f"sys_id>{last_sys_id}"]]
+            if not self.descending:
+                keysets.append([f"{field}ISNOTEMPTY"])
+        else:
+            keysets = [
+                [f"{field}{'<' if self.descending else '>'}{last_value}"],
+                [f"{field}={last_value}", f"sys_id>{last_sys_id}"],
+            ]
+            if self.descending:
+                keysets.append([f"{field}ISEMPTY"])
+        # Every branch of the filters gets every keyset branch
+        branches = filters.split("^NQ") if filters else [""]
+        return "^NQ".join(
+            "^".join(filter(None, [branch, *keyset])) for branch in branches for keyset in keysets
+        )
+
+    def _in_order(self, records: List[Dict[str, Any]]) -> bool:
+        """Whether records are in the order of the keyset condition on their ordering field."""
+        if any(self.order_field not in record for record in records):
+            return False
+        values = [_raw(record[self.order_field]) for record in records]
+        # A value the encoded query cannot hold
+        if "^" in values[-1]:
+            return False
+        keys = [_sort_key(value) for value in values]
+        if self.descending:
+            keys.reverse()
+        return all(before <= after for before, after in zip(keys, keys[1:]))
+
+
+def _raw(value: Any) -> str:
+    """Raw value of a record field, whether or not returned with its display value."""
+    if isinstance(value, dict):
+        value = value.get("value")
+    return "" if value is None else str(value)
+
+
+def _sort_key(value: str) -> Tuple[int, Any]:
+    """Sort key of a raw value: empty values first, then numbers, then strings."""
+    if value == "":
+        return (0, "")
+    if _NUMBER.fullmatch(value):
+        return (1, float(value))
+    return (2, value)
@@ -0,0 +1,153 @@
+"""
+Record number to sys_id resolution for the ServiceNow MCP server.
+
+Write tools accept record numbers (INC0010001, CHG0030001, STRY0001001) as
+well as sys_ids, but the Table API only addresses records by sys_id. A record
+never changes its number, so resolved mappings are cached for a long time
+(CacheConfig.number_ttl) and repeat writes to the same record cost a single
+request. Many numbers are resolved at once with one numberIN query.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from servicenow_mcp.utils.cache import get_reference_cache
+from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of record numbers in one numberIN query
+NUMBER_IN_CHUNK_SIZE = 100
+
+
+def is_sys_id(value: str) -> bool:
+    """Check whether a record identifier is a sys_id rather than a record number."""
+    return len(value) == 32 and all(c in "0123456789abcdef" for c in value)
+
+
+def resolve_sys_id(
+    config: ServerConfig,
+    auth_manager: Any,
+    table: str,
+    identifier: str,
+) -> Optional[str]:
+    """
+    Resolve a record number to its sys_id. sys_ids are returned unchanged.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        table: Table the record belongs to, e.g. incident.
+        identifier: Record number or sys_id.
+
+    Returns:
+        Optional[str]: The sys_id, or None if no record has that number.
+
+    Raises:
+        requests.RequestException: If the lookup request fails.
+    """
+    if is_sys_id(identifier):
+        return identifier
+    return resolve_sys_ids(config, auth_manager, table, [identifier]).get(identifier)
+
+
+def resolve_sys_ids(
+    config: ServerConfig,
+    auth_manager: Any,
+    table: str,
+    numbers: List[str],
+) -> Dict[str, str]:
+    """
+    Resolve many record numbers to sys_ids with as few requests as possible.
+
+    Cached mappings are used first; the remaining numbers are looked up with
+    one numberIN query per NUMBER_IN_CHUNK_SIZE numbers.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        table: Table the records belong to.
+        numbers: Record numbers to resolve.
+
+    Returns:
+        Dict[str, str]: sys_id per record number. Numbers without a record are omitted.
+
+    Raises:
+        requests.RequestException: If a lookup request fails.
+    """
+    cache = get_reference_cache(config, auth_manager)
+    # Kept apart from the table's own entries, which are invalidated on writes
+    cache_table = f"{table}.number"
+    ttl = config.cache.number_ttl
+
+    resolved: Dict[str, str] = {}
+    missing: List[str] = []
+    for number in dict.fromkeys(numbers):
+        sys_id = cache.get(cache_table, number, ttl=ttl)
+        if sys_id is None:
+            missing.append(number)
+        else:
+            resolved[number] = sys_id
+
+    api_url = f"{config.api_url}/table/{table}"
+    for start in range(0, len(missing), NUMBER_IN_CHUNK_SIZE):
+        chunk = missing[start : start + NUMBER_IN_CHUNK_SIZE]
+        response = get_http_client(auth_manager).get(
+            api_url,
+            params={
+                "sysparm_query": f"numberIN{','.join(chunk)}",
+                "sysparm_fields": "sys_id,number",
+                "sysparm_limit": len(chunk),
+            },
+            headers=auth_manager.get_headers(),
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+        # The instance matches numbers case-insensitively; map back to the caller's spelling
+        requested = {number.upper(): number for number in chunk}
+        for record in response.json().get("result", []):
+            number = requested.get((record.get("number") or "").upper())
+            sys_id = record.get("sys_id")
+            if number and sys_id:
+                resolved[number] = sys_id
+                cache.set(cache_table, number, sys_id, ttl=ttl)
+
+    return resolved
+
+
+def resolve_identifiers(
+    config: ServerConfig,
+    auth_manager: Any,
+    table: str,
+    identifiers: List[str],
+) -> Dict[str, Any]:
+    """
+    Resolve record identifiers given to a tool, which may be numbers or sys_ids.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        table: Table the records belong to.
+        identifiers: Record numbers or sys_ids.
+
+    Returns:
+        Dict[str, Any]: ``{"success": True, "sys_ids": [...]}`` with one sys_id per
+        identifier, in order, or ``{"success": False, "message": ...}``.
+    """
+    numbers = [identifier for identifier in identifiers if not is_sys_id(identifier)]
+    if not numbers:
+        return {"success": True, "sys_ids": list(identifiers)}
+
+    try:
+        resolved = resolve_sys_ids(config, auth_manager, table, numbers)
+    except requests.RequestException as e:
+        logger.error(f"Failed to resolve {table} numbers: {e}")
+        return {"success": False, "message": f"Failed to resolve {table} numbers: {str(e)}"}
+
+    missing = [number for number in numbers if number not in resolved]
+    if missing:
+        return {"success": False, "message": f"Record not found in {table}: {', '.join(missing)}"}
+    return {"success": True, "sys_ids": [resolved.get(i, i) for i in identifiers]}
@@ -0,0 +1,333 @@
+"""
+Response budget for the ServiceNow MCP server.
+
+Some tools can return megabytes: list tools with large limits, changeset
+details with every update XML payload, script includes with their full
+scripts. Everything a tool returns lands in the model's context, so the
+``response_budget`` section of the tool package configuration caps the size
+of each tool's result, in bytes or (approximate) tokens.
+
+Results within their budget are returned untouched. A result over its budget
+is shaped, in order, until it fits:
+
+1. low-value fields (``drop_fields``) are removed from every record and text
+   fields longer than ``max_field_chars`` are truncated;
+2. the largest list of the result is cut to the records that fit, and the
+   rest is kept in memory, as the tool returned it, for ``continuation_ttl``
+   seconds. The result then has a ``continuation`` entry whose cursor the
+   get_more_results tool takes to return the next records, within the same
+   budget. Those records are complete; only a record over the budget on its
+   own is trimmed as in step 1.
+
+Sizes are measured on compact JSON and scaled by the ratio of the result's
+serialized size to its compact size, so the budget also holds, approximately,
+for indented output. Results that are plain text rather than JSON are not
+shaped.
+"""
+
+import json
+import logging
+import secrets
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, ValidationError
+
+from servicenow_mcp.utils.cache import MemoryCacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Room left in a page for the continuation entry
+_CONTINUATION_BYTES = 256
+
+
+def _default_drop_fields() -> List[str]:
+    return [
+        "sys_tags",
+        "sys_mod_count",
+        "sys_domain",
+        "sys_domain_path",
+        "sys_overrides",
+        "sys_package",
+        "sys_policy",
+    ]
+
+
+class ToolBudgetConfig(BaseModel):
+    """Budget of one tool; unset fields take the section's defaults."""
+
+    max_bytes: Optional[int] = Field(None, ge=1024, description="Maximum size of a result")
+    max_tokens: Optional[int] = Field(None, ge=256, description="Maximum tokens of a result")
+    max_field_chars: Optional[int] = Field(
+        None, ge=16, description="Length text fields are truncated to when over budget"
+    )
+    drop_fields: Optional[List[str]] = Field(
+        None, description="Fields removed from records when over budget"
+    )
+
+
+class ResponseBudgetConfig(BaseModel):
+    """The ``response_budget`` section of the tool package configuration."""
+
+    max_bytes: Optional[int] = Field(
+        None, ge=1024, description="Maximum size of a result, for every tool"
+    )
+    max_tokens: Optional[int] = Field(
+        None, ge=256, description="Maximum tokens of a result, for every tool"
+    )
+    bytes_per_token: float = Field(
+        4.0, gt=0, description="Bytes per token assumed when converting token budgets"
+    )
+    max_field_chars: int = Field(
+        2000, ge=16, description="Length text fields are truncated to when over budget"
+    )
+    drop_fields: List[str] = Field(
+        default_factory=_default_drop_fields,
+        description="Fields removed from records when over budget",
+    )
+    continuation_ttl: int = Field(
+        600, ge=1, description="Seconds the records cut from a result can be fetched"
+    )
+    max_continuations: int = Field(
+        64, ge=1, description="Maximum cut results kept for get_more_results"
+    )
+    tools: Dict[str, ToolBudgetConfig] = Field(
+        default_factory=dict, description="Budget overrides per tool"
+    )
+
+
+class ToolBudget(BaseModel):
+    """Budget of one tool, with the defaults applied."""
+
+    max_bytes: int
+    max_field_chars: int
+    drop_fields: List[str]
+
+
+def _size(data: Any) -> int:
+    """Size of data as compact JSON, in bytes."""
+    return len(json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode())
+
+
+def _to_data(result: Any) -> Any:
+    """JSON data of a tool result, or None if it is not JSON."""
+    if isinstance(result, (dict, list)):
+        return result
+    if isinstance(result, str):
+        try:
+            return json.loads(result)
+        except json.JSONDecodeError:
+            return None
+    if hasattr(result, "model_dump"):
+        return result.model_dump(mode="json")
+    return None
+
+
+class ResponseBudget:
+    """Enforces the response budget of each tool and serves the records cut from results."""
+
+    def __init__(self, config: Optional[ResponseBudgetConfig] = None):
+        """
+        Initialize the response budget.
+
+        Args:
+            config: Budget configuration. No result is shaped if omitted.
+        """
+        self.config = config or ResponseBudgetConfig()
+        self._continuations = MemoryCacheBackend(self.config.max_continuations)
+
+    @classmethod
+    def from_package_config(cls, section: Any) -> "ResponseBudget":
+        """
+        Create a budget from the raw ``response_budget`` section of the package configuration.
+
+        Invalid sections are logged and result in no budget.
+        """
+        if not section:
+            return cls()
+        try:
+            return cls(ResponseBudgetConfig.model_validate(section))
+        except ValidationError as e:
+            logger.error(f"Invalid response_budget configuration, results are not shaped: {e}")
+            return cls()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any tool has a budget."""
+        return any(
+            config.max_bytes or config.max_tokens
+            for config in [self.config, *self.config.tools.values()]
+        )
+
+    def budget(self, tool_name: str) -> Optional[ToolBudget]:
+        """Get the budget of a tool, or None if its results are not limited."""
+        tool_config = self.config.tools.get(tool_name) or ToolBudgetConfig()
+        limits = []
+        for max_bytes, max_tokens in (
+            (tool_config.max_bytes, tool_config.max_tokens),
+            (self.config.max_bytes, self.config.max_tokens),
+        ):
+            if max_bytes:
+                limits.append(max_bytes)
+            if max_tokens:
+                limits.append(int(max_tokens * self.config.bytes_per_token))
+            if limits:
+                # A tool's own limits replace the defaults
+                break
+        if not limits:
+            return None
+        return ToolBudget(
+            max_bytes=min(limits),
+            max_field_chars=tool_config.max_field_chars or self.config.max_field_chars,
+            drop_fields=(
+                tool_config.drop_fields
+                if tool_config.drop_fields is not None
+                else self.config.drop_fields
+            ),
+        )
+
+    def shape(self, tool_name: str, result: Any, serialized_size: int) -> Optional[Any]:
+        """
+        Shape a result that is over its tool's budget.
+
+        Args:
+            tool_name: Name of the tool.
+            result: Raw result of the tool.
+            serialized_size: Size of the serialized result, in bytes.
+
+        Returns:
+            The shaped result, as JSON data, or None if the result is within its
+            budget or cannot be shaped.
+        """
+        budget = self.budget(tool_name)
+        if budget is None or serialized_size <= budget.max_bytes:
+            return None
+        data = _to_data(result)
+        if data is None:
+            return None
+
+        # The serializer may indent: scale the budget to compact JSON
+        limit = int(budget.max_bytes * _size(data) / serialized_size)
+        stats = {"dropped_fields": 0, "truncated_fields": 0}
+        untrimmed = _to_dict(data)
+        shaped = _to_dict(_trim(data, budget, stats))
+        shaped["response_budget"] = {"max_bytes": budget.max_bytes, **stats}
+        if _size(shaped) <= limit:
+            return shaped
+
+        field, items = _largest_list(shaped)
+        if field is None:
+            return shaped
+        base = _size({**shaped, field: []}) + _CONTINUATION_BYTES
+        count = _fitting(items, limit - base)
+        shaped[field] = items[:count]
+        if count < len(items):
+            cursor = secrets.token_urlsafe(12)
+            # The cut records are kept untrimmed, and trimmed when served only if needed
+            entry = {
+                "tool": tool_name,
+                "field": field,
+                "limit": limit,
+                "items": untrimmed[field],
+            }
+            self._continuations.set(
+                cursor, tool_name, json.dumps(entry), self.config.continuation_ttl
+            )
+            shaped["continuation"] = _continuation(cursor, count, len(items))
+        logger.info(
+            f"Shaped result of '{tool_name}' from {serialized_size} bytes: "
+            f"{count} of {len(items)} '{field}' returned"
+        )
+        return shaped
+
+    def next_page(self, cursor: str) -> Dict[str, Any]:
+        """
+        Get the next records cut from a result.
+
+        Args:
+            cursor: Cursor from the ``continuation`` entry of a result or page.
+
+        Returns:
+            Dict[str, Any]: The records, under the field they were cut from, and a
+            continuation entry if more remain. A record over the budget on its own
+            is trimmed, and the page then has a ``response_budget`` entry.
+        """
+        token, _, offset_text = (cursor or "").partition(".")
+        stored = self._continuations.get(token)
+        if stored is None or not offset_text.isdigit():
+            return {
+                "success": False,
+                "message": "Unknown or expired cursor; call the original tool again",
+            }
+        entry = json.loads(stored)
+        items = entry["items"]
+        offset = int(offset_text)
+        field = entry["field"]
+        base = _size({"success": True, "tool": entry["tool"], field: []}) + _CONTINUATION_BYTES
+        room = entry["limit"] - base
+        count = _fitting(items[offset:], room)
+        page: Dict[str, Any] = {
+            "success": True,
+            "tool": entry["tool"],
+            field: items[offset : offset + count],
+        }
+        budget = self.budget(entry["tool"])
+        if budget is not None and _size(page[field]) > room:
+            stats = {"dropped_fields": 0, "truncated_fields": 0}
+            page[field] = _trim(page[field], budget, stats)
+            page["response_budget"] = {"max_bytes": budget.max_bytes, **stats}
+        if offset + count < len(items):
+            page["continuation"] = _continuation(token, offset + count, len(items))
+        return page
+
+
+def _continuation(token: str, offset: int, total: int) -> Dict[str, Any]:
+    return {
+        "cursor": f"{token}.{offset}",
+        "returned": offset,
+        "remaining": total - offset,
+        "message": "Call get_more_results with this cursor for the remaining records",
+    }
+
+
+def _to_dict(data: Any) -> Dict[str, Any]:
+    """JSON data as a dict: lists go under ``items`` and other values under ``result``."""
+    if isinstance(data, list):
+        return {"items": data}
+    return dict(data) if isinstance(data, dict) else {"result": data}
+
+
+def _fitting(items: List[Any], room: int) -> int:
+    """Number of leading items fitting in some bytes; at least one, so that pages progress."""
+    used = 0
+    for count, item in enumerate(items):
+        used += _size(item) + 1
+        if used > room:
+            return max(count, 1)
+    return len(items)
+
+
+def _largest_list(data: Dict[str, Any]) -> Tuple[Optional[str], List[Any]]:
+    """The top-level list field of a result taking the most bytes."""
+    lists = [(key, value) for key, value in data.items() if isinstance(value, list) and value]
+    if not lists:
+        return None, []
+    return max(lists, key=lambda item: _size(item[1]))
+
+
+def _trim(data: Any, budget: ToolBudget, stats: Dict[str, int]) -> Any:
+    """Copy data without its low-value fields and with long text fields truncated."""
+    if isinstance(data, dict):
+        trimmed = {}
+        for key, value in data.items():
+            if key in budget.drop_fields:
+                stats["dropped_fields"] += 1
+                continue
+            trimmed[key] = _trim(value, budget, stats)
+        return trimmed
+    if isinstance(data, list):
+        return [_trim(item, budget, stats) for item in data]
+    if isinstance(data, str) and len(data) > budget.max_field_chars:
+        stats["truncated_fields"] += 1
+        cut = len(data) - budget.max_field_chars
+        return f"{data[: budget.max_field_chars]}... [{cut} more characters]"
+    return data
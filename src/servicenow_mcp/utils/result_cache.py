@@ -0,0 +1,132 @@
+"""
+Tool result cache for the ServiceNow MCP server.
+
+Agents often repeat the same read tool call several times in one
+conversation. Tools listed under ``result_cache`` in the tool package
+configuration have their serialized results kept for a per-tool TTL, keyed by
+tool name and canonicalised parameters. Cached results are dropped as soon as
+a write tool touches one of the tables the cached tool reads.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+from servicenow_mcp.utils.cache import MemoryCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class CachedToolConfig(BaseModel):
+    """Caching policy for one read tool."""
+
+    ttl: int = Field(..., ge=0, description="Seconds a result is reused; 0 disables caching")
+    tables: List[str] = Field(
+        default_factory=list, description="Tables the tool reads; writes to them drop its results"
+    )
+
+
+class ResultCacheConfig(BaseModel):
+    """The ``result_cache`` section of the tool package configuration."""
+
+    max_entries: int = Field(512, ge=1, description="Maximum cached results")
+    tools: Dict[str, CachedToolConfig] = Field(
+        default_factory=dict, description="Caching policy per read tool"
+    )
+    writes: Dict[str, List[str]] = Field(
+        default_factory=dict, description="Tables modified by each write tool"
+    )
+
+
+class ToolResultCache:
+    """In-memory cache of serialized tool results with write-through invalidation."""
+
+    def __init__(self, config: Optional[ResultCacheConfig] = None):
+        """
+        Initialize the result cache.
+
+        Args:
+            config: Caching policy. Nothing is cached if omitted.
+        """
+        self.config = config or ResultCacheConfig()
+        self._backend = MemoryCacheBackend(self.config.max_entries)
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so that reads started before a write
+        # do not store their (possibly stale) result afterwards
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_package_config(cls, section: Any) -> "ToolResultCache":
+        """
+        Create a cache from the raw ``result_cache`` section of the package configuration.
+
+        Invalid sections are logged and result in a cache that stores nothing.
+        """
+        if not section:
+            return cls()
+        try:
+            return cls(ResultCacheConfig.model_validate(section))
+        except ValidationError as e:
+            logger.error(f"Invalid result_cache configuration, tool results are not cached: {e}")
+            return cls()
+
+    def key(self, tool_name: str, params: BaseModel) -> str:
+        """Build the cache key for a tool call from its validated parameters."""
+        return json.dumps(
+            [tool_name, params.model_dump(mode="json")], sort_keys=True, separators=(",", ":")
+        )
+
+    def is_cached(self, tool_name: str) -> bool:
+        """Check whether results of a tool are cached."""
+        tool_config = self.config.tools.get(tool_name)
+        return tool_config is not None and tool_config.ttl > 0
+
+    def generation(self) -> int:
+        """Get the current invalidation generation, to be passed to set()."""
+        return self._generation
+
+    def get(self, tool_name: str, key: str) -> Optional[str]:
+        """Get a cached serialized result, or None."""
+        if not self.is_cached(tool_name):
+            return None
+        value = self._backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, tool_name: str, key: str, value: str, generation: int) -> None:
+        """
+        Store a serialized result.
+
+        Args:
+            tool_name: Name of the tool.
+            key: Cache key from key().
+            value: Serialized tool result.
+            generation: Value of generation() before the tool was run. The result
+                is discarded if a write invalidated the cache in the meantime.
+        """
+        if not self.is_cached(tool_name):
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._backend.set(key, tool_name, value, self.config.tools[tool_name].ttl)
+
+    def invalidate_for(self, write_tool_name: str) -> None:
+        """Drop cached results of every tool reading a table the write tool modifies."""
+        tables = set(self.config.writes.get(write_tool_name, []))
+        if not tables:
+            return
+        with self._lock:
+            self._generation += 1
+            for tool_name, tool_config in self.config.tools.items():
+                if tables.intersection(tool_config.tables):
+                    self._backend.invalidate(tool_name)
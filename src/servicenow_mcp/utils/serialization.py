@@ -0,0 +1,119 @@
+"""
+Serialization of tool results into the text returned to the client.
+
+By default results are serialized as JSON indented by two spaces, and results
+that are already strings are parsed and re-indented when they hold JSON. The
+indentation adds a sixth to the size of a list_incidents result, and more to
+more deeply nested results, all of which the model has to read, so the compact
+mode leaves it out:
+
+- dicts and lists are dumped without whitespace, with the standard library's
+  encoder or, with the ``orjson`` backend, with orjson (``pip install
+  servicenow-mcp[orjson]``), which is several times faster on large results;
+- Pydantic models are dumped by ``model_dump_json``, without going through a
+  dict;
+- strings are returned as they are, since tools returning strings have
+  already serialized them.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Optional
+
+from servicenow_mcp.utils.config import SerializationConfig
+
+logger = logging.getLogger(__name__)
+
+
+def _load_orjson() -> Any:
+    try:
+        import orjson
+    except ImportError as e:
+        raise ImportError(
+            "The orjson serialization backend requires orjson. "
+            "Install it with: pip install servicenow-mcp[orjson]"
+        ) from e
+    return orjson
+
+
+class ToolOutputSerializer:
+    """Serializes tool results as configured."""
+
+    def __init__(self, config: Optional[SerializationConfig] = None):
+        """
+        Initialize the serializer.
+
+        Args:
+            config: Serialization configuration. Results are indented if omitted.
+
+        Raises:
+            ImportError: If the orjson backend is selected and orjson is not installed.
+        """
+        self.config = config or SerializationConfig()
+        self._dump = self._json_dump
+        if self.config.backend == "orjson":
+            orjson = _load_orjson()
+            option = 0 if self.config.compact else orjson.OPT_INDENT_2
+            self._dump = self._orjson_dump(orjson, option)
+
+    def _json_dump(self, value: Any) -> str:
+        if self.config.compact:
+            return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        return json.dumps(value, indent=2)
+
+    def _orjson_dump(self, orjson: Any, option: int) -> Callable[[Any], str]:
+        def dump(value: Any) -> str:
+            try:
+                return orjson.dumps(value, option=option).decode()
+            except TypeError:
+                # Non-string keys, integers over 64 bits, ...: orjson is stricter than json
+                return self._json_dump(value)
+
+        return dump
+
+    def serialize(self, result: Any, tool_name: str) -> str:
+        """Serializes tool output to a string, preferably JSON."""
+        try:
+            if isinstance(result, str):
+                if self.config.compact:
+                    return result
+                # Try to parse/re-dump JSON for consistent formatting if it looks like JSON
+                try:
+                    return self._dump(json.loads(result))
+                except json.JSONDecodeError:
+                    return result  # Return as is if not valid JSON
+            elif isinstance(result, (dict, list)):
+                return self._dump(result)
+            elif hasattr(result, "model_dump_json"):  # Pydantic v2
+                if self.config.compact:
+                    return result.model_dump_json()
+                # The indent argument might not be supported by all versions/models
+                try:
+                    return result.model_dump_json(indent=2)
+                except TypeError:
+                    return self._dump(result.model_dump())
+            elif hasattr(result, "model_dump"):  # Pydantic v2 fallback
+                return self._dump(result.model_dump())
+            elif hasattr(result, "dict"):  # Pydantic v1
+                return self._dump(result.dict())
+            else:
+                # Absolute fallback: convert to string
+                logger.warning(
+                    f"Could not serialize result for tool '{tool_name}' to JSON, "
+                    f"falling back to str(). Type: {type(result)}"
+                )
+                return str(result)
+        except Exception as e:
+            logger.error(f"Error during serialization for tool '{tool_name}': {e}", exc_info=True)
+            # Return an error message string formatted as JSON
+            return self._json_dump(
+                {"error": f"Serialization failed for tool {tool_name}", "details": str(e)}
+            )
+
+
+_default_serializer = ToolOutputSerializer()
+
+
+def serialize_tool_output(result: Any, tool_name: str) -> str:
+    """Serializes tool output to a string, preferably JSON indented."""
+    return _default_serializer.serialize(result, tool_name)
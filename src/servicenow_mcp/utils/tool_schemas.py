@@ -0,0 +1,168 @@
+"""
+Precomputed JSON schemas of the tool parameters.
+
+Pydantic takes around a millisecond to generate the JSON schema of a tool's
+parameter model, which adds up to most of a list_tools call when done for
+every tool on every call. The server generates the schemas of its enabled
+tools once, at startup, and serves list_tools from the resulting Tool objects.
+
+With a schema cache file configured, startup loads the schemas from the file
+instead, and only generates (and stores) those missing from it. The cache is
+keyed by the package and Pydantic versions and by the source of the modules
+defining the parameter models, so an edited model is never served a stale
+schema. The file can also be produced at build time and shipped alongside the
+server:
+
+    python -m servicenow_mcp.utils.tool_schemas --output tool_schemas.json
+"""
+
+import argparse
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import sys
+import tempfile
+from typing import Any, Dict, Iterable, Optional, Type
+
+import pydantic
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the layout of the cache file changes
+_FORMAT = 1
+
+
+def _package_version() -> str:
+    try:
+        return importlib.metadata.version("servicenow-mcp")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def schema_cache_key(models: Iterable[Type[BaseModel]]) -> str:
+    """
+    Build the cache key of the schemas of some parameter models.
+
+    The key changes with the package version, the Pydantic version and the
+    content of any module defining one of the models.
+    """
+    digest = hashlib.sha256(f"{_FORMAT}:{_package_version()}:{pydantic.VERSION}".encode())
+    # Module names rather than paths, so that a file built elsewhere still matches
+    for module_name in sorted({model.__module__ for model in models}):
+        digest.update(module_name.encode())
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+        if path is None:
+            continue
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+class ToolSchemaCache:
+    """JSON file holding the parameter schemas of the tools, by tool name."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path of the cache file. Its directory is created when saving.
+        """
+        self.path = os.path.expanduser(path)
+
+    def load(self, key: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the cached schemas.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Schemas by tool name; empty if the file is
+            missing, unreadable or was written for another key.
+        """
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable tool schema cache {self.path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("key") != key:
+            logger.info(f"Tool schema cache {self.path} is out of date")
+            return {}
+        schemas = data.get("schemas")
+        return schemas if isinstance(schemas, dict) else {}
+
+    def save(self, key: str, schemas: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the cached schemas, atomically; failures are logged, not raised."""
+        directory = os.path.dirname(self.path) or "."
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"key": key, "schemas": schemas}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write tool schema cache {self.path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def generate_tool_schemas(
+    tool_definitions: Dict[str, Any],
+    tool_names: Iterable[str],
+    cache: Optional[ToolSchemaCache] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the parameter schemas of some tools, from the cache where possible.
+
+    Args:
+        tool_definitions: Tool definitions, as returned by get_tool_definitions.
+        tool_names: Tools to get the schemas of; unknown names are ignored.
+        cache: Cache to load the schemas from and store generated ones in.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Schemas by tool name. Tools whose schema cannot
+        be generated are left out.
+    """
+    models = {name: tool_definitions[name][1] for name in tool_names if name in tool_definitions}
+    key = schema_cache_key(models.values()) if cache is not None else ""
+    schemas = cache.load(key) if cache is not None else {}
+
+    generated = 0
+    for name, model in models.items():
+        if name in schemas:
+            continue
+        try:
+            schemas[name] = model.model_json_schema()
+            generated += 1
+        except Exception as e:
+            logger.error(f"Failed to generate schema for tool '{name}': {e}", exc_info=True)
+
+    if cache is not None and generated:
+        cache.save(key, schemas)
+    return {name: schemas[name] for name in models if name in schemas}
+
+
+def main() -> None:
+    """Write the schemas of every tool to a cache file, e.g. at build time."""
+    parser = argparse.ArgumentParser(description="Precompute the tool parameter schemas")
+    parser.add_argument("--output", required=True, help="Schema cache file to write")
+    args = parser.parse_args()
+
+    from servicenow_mcp.utils.tool_utils import get_tool_definitions
+
+    definitions = get_tool_definitions()
+    cache = ToolSchemaCache(args.output)
+    schemas = generate_tool_schemas(definitions, definitions, cache)
+    print(f"Wrote the schemas of {len(schemas)} tools to {cache.path}")
+
+
+if __name__ == "__main__":
+    main()
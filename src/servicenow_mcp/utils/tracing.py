@@ -0,0 +1,294 @@
+"""
+OpenTelemetry tracing for the ServiceNow MCP server.
+
+Tracing is optional and requires the OpenTelemetry SDK
+(``pip install servicenow-mcp[tracing]``). When enabled, every tool call gets
+a ``call_tool <name>`` span with child spans for argument validation, each
+request sent to the instance (OAuth token requests included) and the
+serialization of the result. Request spans carry the API, table, status code,
+response size and number of records returned, so a slow call shows whether the
+time went to the instance, to authentication or to the server itself.
+
+Spans are written, in batches, to one of:
+
+- ``otlp-file``: a file of OTLP/JSON lines, one export request per line, which
+  the OpenTelemetry Collector's ``otlpjsonfile`` receiver or ``jq`` can read
+  offline;
+- ``console``: human-readable JSON on stderr (stdout carries the stdio transport);
+- ``otlp``: an OTLP/HTTP collector, configured with the standard
+  ``OTEL_EXPORTER_OTLP_*`` variables unless an endpoint is given.
+
+Counting the records of a response parses it a second time, so tracing is
+meant for diagnosis rather than to be left on.
+"""
+
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+from servicenow_mcp.utils.config import TracingConfig
+
+logger = logging.getLogger(__name__)
+
+# /api/now/table/incident, /api/now/v1/batch, /api/now/stats/incident, ...
+_API_PATH = re.compile(r"/api/now/(?:v\d+/)?(\w+)(?:/(\w+))?")
+
+
+class Tracing:
+    """Creates the spans of one server, if tracing is enabled."""
+
+    def __init__(self, config: Optional[TracingConfig] = None):
+        """
+        Initialize tracing.
+
+        Args:
+            config: Tracing configuration. Nothing is traced if omitted.
+
+        Raises:
+            ImportError: If tracing is enabled and the OpenTelemetry SDK (or the
+                OTLP exporter, for the ``otlp`` exporter) is not installed.
+        """
+        self.config = config or TracingConfig()
+        self.tracer: Optional[Any] = None
+        self._provider: Optional[Any] = None
+        if self.config.enabled:
+            self._provider = _create_provider(self.config)
+            self.tracer = self._provider.get_tracer("servicenow_mcp")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return self.tracer is not None
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager:
+        """
+        Start a span as a child of the current one.
+
+        Returns:
+            A context manager yielding the span, or None when tracing is disabled.
+            Exceptions raised inside it are recorded on the span.
+        """
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+    @contextmanager
+    def request_span(self, method: str, url: str) -> Iterator[Any]:
+        """Start the span of a request to the instance; see ``record_response``."""
+        parts = urlsplit(url)
+        attributes: Dict[str, Any] = {
+            "http.request.method": method,
+            "server.address": parts.hostname or "",
+            "url.path": parts.path,
+        }
+        # Low-cardinality name, e.g. "GET table incident" or "POST oauth"
+        name = method
+        match = _API_PATH.search(parts.path)
+        if parts.path.endswith("/oauth_token.do"):
+            attributes["servicenow.api"] = "oauth"
+            name += " oauth"
+        elif match:
+            api, resource = match.groups()
+            attributes["servicenow.api"] = api
+            name += f" {api}"
+            if api in ("table", "stats") and resource:
+                attributes["servicenow.table"] = resource
+                name += f" {resource}"
+        with self.span(name, attributes) as span:
+            yield span
+
+    def shutdown(self) -> None:
+        """Export the spans still buffered and stop exporting."""
+        if self._provider is not None:
+            self._provider.shutdown()
+
+
+def request_span(tracing: Optional[Tracing], method: str, url: str) -> ContextManager:
+    """``tracing.request_span``, or a context yielding None if there is no tracing."""
+    if tracing is None:
+        return nullcontext()
+    return tracing.request_span(method, url)
+
+
+def record_response(span: Any, status_code: int, headers: Any, content: Optional[bytes]) -> None:
+    """
+    Annotate a request span with the response received.
+
+    Args:
+        span: Span from ``request_span``.
+        status_code: HTTP status of the response.
+        headers: Response headers.
+        content: Response body, or None if it was streamed and not read.
+    """
+    from opentelemetry.trace import Status, StatusCode
+
+    span.set_attribute("http.response.status_code", status_code)
+    if status_code >= 400:
+        span.set_status(Status(StatusCode.ERROR, f"HTTP {status_code}"))
+    total = headers.get("X-Total-Count")
+    if total is not None and total.isdigit():
+        span.set_attribute("servicenow.total_count", int(total))
+    if content is None:
+        return
+    span.set_attribute("http.response.body.size", len(content))
+    if "json" not in (headers.get("Content-Type") or ""):
+        return
+    try:
+        result = json.loads(content).get("result")
+    except (ValueError, AttributeError):
+        return
+    if isinstance(result, list):
+        span.set_attribute("servicenow.rows", len(result))
+    elif isinstance(result, dict):
+        span.set_attribute("servicenow.rows", 1)
+
+
+def _create_provider(config: TracingConfig) -> Any:
+    """Create a tracer provider exporting spans as configured."""
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    except ImportError as e:
+        raise ImportError(
+            "Tracing requires the OpenTelemetry SDK. "
+            "Install it with: pip install servicenow-mcp[tracing]"
+        ) from e
+
+    if config.exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            raise ImportError(
+                "The otlp trace exporter requires the OTLP/HTTP exporter. "
+                "Install it with: pip install servicenow-mcp[tracing]"
+            ) from e
+        exporter: Any = OTLPSpanExporter(endpoint=config.otlp_endpoint)
+    elif config.exporter == "console":
+        exporter = ConsoleSpanExporter(out=sys.stderr)
+    else:
+        exporter = OtlpJsonFileExporter(config.file_path)
+
+    provider = TracerProvider(resource=Resource.create({"service.name": config.service_name}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    logger.info(f"Tracing enabled, exporting spans with the {config.exporter} exporter")
+    return provider
+
+
+class OtlpJsonFileExporter:
+    """Span exporter appending OTLP/JSON export requests to a file, one per line."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: File the spans are appended to. Its directory is created if necessary.
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def export(self, spans: Sequence[Any]) -> Any:
+        """Write a batch of finished spans."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        line = json.dumps(encode_spans(spans), separators=(",", ":"))
+        try:
+            with self._lock:
+                self._file.write(line + "\n")
+                self._file.flush()
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to write spans to {self.path}: {e}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Spans are written as they are exported; nothing is buffered."""
+        return True
+
+    def shutdown(self) -> None:
+        """Close the file."""
+        with self._lock:
+            self._file.close()
+
+
+def encode_spans(spans: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Encode SDK spans as an OTLP/JSON ``ExportTraceServiceRequest``.
+
+    Follows the OTLP/JSON mapping: trace and span ids in hex, 64-bit integers
+    as strings and enums as integers.
+    """
+    resources: Dict[int, Dict[str, Any]] = {}
+    for span in spans:
+        resource = resources.setdefault(
+            id(span.resource),
+            {"resource": {"attributes": _attributes(span.resource.attributes)}, "scopes": {}},
+        )
+        scope = span.instrumentation_scope
+        scope_spans = resource["scopes"].setdefault(
+            (scope.name, scope.version) if scope else ("", None),
+            {
+                "scope": {"name": scope.name, "version": scope.version or ""} if scope else {},
+                "spans": [],
+            },
+        )
+        scope_spans["spans"].append(_encode_span(span))
+    return {
+        "resourceSpans": [
+            {"resource": resource["resource"], "scopeSpans": list(resource["scopes"].values())}
+            for resource in resources.values()
+        ]
+    }
+
+
+def _encode_span(span: Any) -> Dict[str, Any]:
+    encoded = {
+        "traceId": f"{span.context.trace_id:032x}",
+        "spanId": f"{span.context.span_id:016x}",
+        "parentSpanId": f"{span.parent.span_id:016x}" if span.parent else "",
+        "name": span.name,
+        # OTLP numbers span kinds from 1; 0 is SPAN_KIND_UNSPECIFIED
+        "kind": span.kind.value + 1,
+        "startTimeUnixNano": str(span.start_time),
+        "endTimeUnixNano": str(span.end_time),
+        "attributes": _attributes(span.attributes),
+        "events": [
+            {
+                "timeUnixNano": str(event.timestamp),
+                "name": event.name,
+                "attributes": _attributes(event.attributes),
+            }
+            for event in span.events
+        ],
+        "status": {"code": span.status.status_code.value},
+    }
+    if span.status.description:
+        encoded["status"]["message"] = span.status.description
+    return encoded
+
+
+def _attributes(attributes: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _any_value(value)} for key, value in (attributes or {}).items()]
+
+
+def _any_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_any_value(item) for item in value]}}
+    return {"stringValue": str(value)}
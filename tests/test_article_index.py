@@ -0,0 +1,218 @@
+"""
+Tests for the knowledge article index and the search_articles tool.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.knowledge_base import SearchArticlesParams, search_articles
+from servicenow_mcp.utils.article_index import get_article_index, html_to_text
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    MirrorConfig,
+    ServerConfig,
+)
+from servicenow_mcp.utils.mirror import MirrorSyncer, get_mirror
+
+
+def article(i, title, text, updated_on, keywords="", kb=("kb1", "IT"), state="published"):
+    """A kb_knowledge record as returned with sysparm_display_value=all."""
+    field = lambda value, display=None: {"value": value, "display_value": display or value}
+    return {
+        "sys_id": field(f"art{i}"),
+        "number": field(f"KB000{i}"),
+        "short_description": field(title),
+        "text": field(text),
+        "keywords": field(keywords),
+        "kb_knowledge_base": field(*kb),
+        "kb_category": field("cat1", "Network"),
+        "workflow_state": field(state, state.title()),
+        "sys_updated_on": field(updated_on),
+    }
+
+
+class FakeInstance:
+    """Serves articles for the watermark and keyset queries of the mirror."""
+
+    def __init__(self, records):
+        self.records = records
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        records = sorted(
+            self.records, key=lambda r: (r["sys_updated_on"]["value"], r["sys_id"]["value"])
+        )
+        for condition in params.get("sysparm_query", "").split("^"):
+            if condition.startswith("sys_updated_on>="):
+                since = condition[len("sys_updated_on>="):]
+                records = [r for r in records if r["sys_updated_on"]["value"] >= since]
+            elif condition.startswith("sys_id>"):
+                after = condition[len("sys_id>"):]
+                records = [r for r in records if r["sys_id"]["value"] > after]
+        offset = int(params.get("sysparm_offset", 0))
+        records = records[offset : offset + int(params["sysparm_limit"])]
+        if params.get("sysparm_fields") == "sys_id":
+            records = [{"sys_id": r["sys_id"]["value"]} for r in records]
+        response = MagicMock()
+        response.json.return_value = {"result": records}
+        return response
+
+
+class TestArticleIndex(unittest.TestCase):
+    """Tests for ArticleIndex and search_articles."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+            mirror=MirrorConfig(
+                enabled=True,
+                sqlite_path=os.path.join(directory.name, "mirror.sqlite"),
+                tables=["kb_knowledge"],
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth, self.config.instance_url)
+        self.mirror = get_mirror(self.config, self.auth_manager)
+        self.instance = FakeInstance([
+            article(1, "Reset your VPN password", "<p>Open the <b>VPN</b> portal.</p>",
+                    "2025-01-01 10:00:00"),
+            article(2, "Printer setup", "<p>Install the driver, then connect to the VPN "
+                    "if you work remotely.</p>", "2025-01-01 11:00:00", keywords="printing"),
+            article(3, "Email on mobile", "<p>Add the account &amp; sync.</p>",
+                    "2025-01-02 09:00:00", kb=("kb2", "HR")),
+            article(4, "Old VPN client", "<p>Retired.</p>", "2025-01-02 10:00:00",
+                    state="retired"),
+        ])
+
+    def sync(self, refresh=True):
+        with patch("requests.get", side_effect=self.instance.get):
+            self.mirror.sync_table(self.config, self.auth_manager, "kb_knowledge")
+            self.mirror.reconcile_table(self.config, self.auth_manager, "kb_knowledge")
+        if refresh:
+            get_article_index(self.config, self.auth_manager).refresh()
+
+    def search(self, query, **filters):
+        with patch("requests.get") as mock_get:
+            result = search_articles(
+                self.config, self.auth_manager, SearchArticlesParams(query=query, **filters)
+            )
+        mock_get.assert_not_called()
+        self.assertEqual(result["source"], "index")
+        return result["articles"]
+
+    def test_html_to_text(self):
+        """Markup is stripped and entities decoded."""
+        self.assertEqual(
+            html_to_text("<style>p {}</style><p>Tom &amp; Jerry</p>\n<br/>x"), "Tom & Jerry x"
+        )
+
+    def test_search_from_index(self):
+        """Searches are ranked by BM25, with snippets and filters, without the instance."""
+        self.sync()
+
+        results = self.search("vpn password")
+        self.assertEqual([a["number"] for a in results], ["KB0001", "KB0004", "KB0002"])
+        self.assertIn("**VPN**", results[0]["snippet"])
+        self.assertNotIn("text", results[0])
+        self.assertGreater(results[0]["score"], results[1]["score"])
+
+        self.assertEqual(
+            [a["number"] for a in self.search("VPN", workflow_state="published")],
+            ["KB0001", "KB0002"],
+        )
+        self.assertEqual([a["number"] for a in self.search("email", knowledge_base="hr")],
+                         ["KB0003"])
+        self.assertEqual(self.search("email", knowledge_base="kb1"), [])
+        self.assertEqual(self.search("printed")[0]["number"], "KB0002")  # stemmed keyword
+        self.assertEqual(self.search('"*)'), [])
+
+    def test_incremental_refresh(self):
+        """Updated articles are re-indexed and deleted ones dropped after the next sync."""
+        self.sync(refresh=False)
+        index = get_article_index(self.config, self.auth_manager)
+        self.assertEqual(index.refresh(), 4)
+        self.assertEqual(index.refresh(), 0)  # nothing synced since
+
+        self.instance.records[2] = article(
+            3, "Email on mobile", "<p>Use the Outlook app.</p>", "2025-01-03 08:00:00",
+            kb=("kb2", "HR"),
+        )
+        del self.instance.records[3]
+        self.sync(refresh=False)
+
+        self.assertEqual(index.refresh(), 2)  # the updated article and the deleted one
+        self.assertEqual([a["number"] for a in self.search("outlook")], ["KB0003"])
+        self.assertEqual(self.search("sync"), [])
+        self.assertEqual([a["number"] for a in self.search("client")], [])
+
+    def test_refreshed_by_syncer(self):
+        """The syncer refreshes the index after a sync; searches never re-index."""
+        with patch("requests.get", side_effect=self.instance.get):
+            MirrorSyncer(self.mirror, self.config, self.auth_manager).sync()
+        index = get_article_index(self.config, self.auth_manager)
+        self.assertEqual(index.refresh(), 0)  # nothing synced since the syncer's refresh
+
+        with patch.object(type(index), "refresh") as mock_refresh:
+            self.assertEqual(self.search("printer")[0]["number"], "KB0002")
+        mock_refresh.assert_not_called()
+
+    def test_unrefreshed_index_not_searched(self):
+        """Until the index is first refreshed, the instance is searched."""
+        self.sync(refresh=False)
+        response = MagicMock()
+        response.json.return_value = {"result": []}
+        with patch("requests.get", return_value=response) as mock_get:
+            result = search_articles(
+                self.config, self.auth_manager, SearchArticlesParams(query="vpn")
+            )
+        mock_get.assert_called_once()
+        self.assertEqual(result["source"], "instance")
+
+    def test_fallback_without_fts5(self):
+        """A SQLite built without FTS5 makes searches go to the instance."""
+        self.sync(refresh=False)
+        response = MagicMock()
+        response.json.return_value = {"result": [self.instance.records[0]]}
+        with patch(
+            "servicenow_mcp.utils.article_index.ArticleIndex.__init__",
+            side_effect=sqlite3.OperationalError("no such module: fts5"),
+        ), patch("requests.get", return_value=response):
+            result = search_articles(
+                self.config, self.auth_manager, SearchArticlesParams(query="vpn")
+            )
+            # The sync itself still completes
+            synced = MirrorSyncer(self.mirror, self.config, self.auth_manager).sync()
+        self.assertIsInstance(synced["kb_knowledge"], int)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["source"], "instance")
+        self.assertEqual(result["articles"][0]["title"], "Reset your VPN password")
+
+    def test_fallback_to_instance(self):
+        """Without a fresh index, the instance is searched without article bodies."""
+        response = MagicMock()
+        response.json.return_value = {"result": [self.instance.records[0]]}
+        with patch("requests.get", return_value=response) as mock_get:
+            result = search_articles(
+                self.config, self.auth_manager, SearchArticlesParams(query="vpn")
+            )
+
+        params = mock_get.call_args[1]["params"]
+        self.assertEqual(params["sysparm_query"], "short_descriptionLIKEvpn^ORtextLIKEvpn")
+        self.assertNotIn("text", params["sysparm_fields"].split(","))
+        self.assertEqual(result["source"], "instance")
+        self.assertEqual(result["articles"][0]["title"], "Reset your VPN password")
+        self.assertEqual(result["articles"][0]["knowledge_base"], "IT")
+
+
+if __name__ == "__main__":
+    unittest.main()
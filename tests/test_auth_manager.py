@@ -0,0 +1,234 @@
+"""
+Tests for the authentication manager.
+"""
+
+import base64
+import os
+import tempfile
+import threading
+import time
+import timeit
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, OAuthConfig
+from servicenow_mcp.utils.http_client import ServiceNowHttpClient
+
+
+def token_response(access_token, expires_in=1800):
+    """Build a mock token endpoint response."""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "access_token": access_token,
+        "token_type": "Bearer",
+        "expires_in": expires_in,
+    }
+    return response
+
+
+class TestAuthManagerOAuth(unittest.TestCase):
+    """Tests for OAuth token handling."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.oauth_config = OAuthConfig(
+            client_id="client",
+            client_secret="secret",
+            username="user",
+            password="pass",
+            token_url="https://dev12345.service-now.com/oauth_token.do",
+        )
+        self.auth_config = AuthConfig(type=AuthType.OAUTH, oauth=self.oauth_config)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @patch("requests.post")
+    def test_token_expiry_tracked(self, mock_post):
+        """An expired token is replaced on the next call."""
+        mock_post.side_effect = [token_response("first"), token_response("second")]
+        auth_manager = AuthManager(self.auth_config)
+
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer first")
+        self.assertAlmostEqual(auth_manager.token_expires_at, time.time() + 1800, delta=5)
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer first")
+
+        auth_manager.token_expires_at = time.time() - 1
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer second")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("requests.post")
+    def test_concurrent_fetch_single_flight(self, mock_post):
+        """Concurrent callers without a token share one token request."""
+
+        def slow_token(*args, **kwargs):
+            time.sleep(0.1)
+            return token_response("shared")
+
+        mock_post.side_effect = slow_token
+        auth_manager = AuthManager(self.auth_config)
+        results = []
+
+        def call():
+            results.append(auth_manager.get_headers()["Authorization"])
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(results, ["Bearer shared"] * 8)
+
+    @patch("requests.post")
+    def test_background_refresh_before_expiry(self, mock_post):
+        """A token close to expiry is used while a new one is fetched in the background."""
+        mock_post.side_effect = [token_response("old", expires_in=30), token_response("new")]
+        auth_manager = AuthManager(self.auth_config)
+
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer old")
+        # Within refresh_margin (60s): current token returned, refresh started
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer old")
+        auth_manager._refresh_thread.join(timeout=5)
+
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer new")
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_retry_once_on_401(self):
+        """A request rejected with 401 is retried once with a new token."""
+        client = ServiceNowHttpClient()
+        auth_manager = AuthManager(self.auth_config, http_client=client)
+        unauthorized = MagicMock(status_code=401)
+        ok = MagicMock(status_code=200)
+
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.side_effect = [
+                token_response("revoked"),
+                unauthorized,
+                token_response("fresh"),
+                ok,
+            ]
+            response = client.get(
+                "https://dev12345.service-now.com/api/now/table/incident",
+                headers=auth_manager.get_headers(),
+            )
+
+        self.assertIs(response, ok)
+        retried_headers = mock_request.call_args_list[3].kwargs["headers"]
+        self.assertEqual(retried_headers["Authorization"], "Bearer fresh")
+        self.assertEqual(retried_headers["Accept"], "application/json")
+
+    def test_basic_auth_401_not_retried(self):
+        """Basic auth failures are returned without a retry."""
+        client = ServiceNowHttpClient()
+        auth_manager = AuthManager(
+            AuthConfig(type=AuthType.BASIC, basic=BasicAuthConfig(username="u", password="p")),
+            http_client=client,
+        )
+        unauthorized = MagicMock(status_code=401)
+
+        with patch.object(requests.Session, "request", return_value=unauthorized) as mock_request:
+            response = client.get("https://example.com", headers=auth_manager.get_headers())
+
+        self.assertIs(response, unauthorized)
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("requests.post")
+    def test_encrypted_token_cache(self, mock_post):
+        """A cached token is reused by a new process and is not stored in plain text."""
+        cache_path = os.path.join(self.tmpdir.name, "token.json")
+        config = AuthConfig(
+            type=AuthType.OAUTH,
+            oauth=self.oauth_config.model_copy(update={"token_cache_path": cache_path}),
+        )
+        mock_post.return_value = token_response("cached-token")
+
+        self.assertEqual(AuthManager(config).get_headers()["Authorization"], "Bearer cached-token")
+        self.assertEqual(AuthManager(config).get_headers()["Authorization"], "Bearer cached-token")
+        self.assertEqual(mock_post.call_count, 1)
+
+        with open(cache_path) as f:
+            self.assertNotIn("cached-token", f.read())
+        self.assertEqual(os.stat(cache_path).st_mode & 0o777, 0o600)
+
+        # A different client secret cannot decrypt the cache
+        other = AuthConfig(
+            type=AuthType.OAUTH,
+            oauth=config.oauth.model_copy(update={"client_secret": "other"}),
+        )
+        mock_post.return_value = token_response("other-token")
+        self.assertEqual(AuthManager(other).get_headers()["Authorization"], "Bearer other-token")
+
+
+class TestAuthManagerHeaders(unittest.TestCase):
+    """Tests for precomputed authentication headers."""
+
+    def setUp(self):
+        self.basic_config = AuthConfig(
+            type=AuthType.BASIC, basic=BasicAuthConfig(username="user", password="pass")
+        )
+        self.oauth_config = AuthConfig(
+            type=AuthType.OAUTH,
+            oauth=OAuthConfig(
+                client_id="client",
+                client_secret="secret",
+                username="user",
+                password="pass",
+                token_url="https://dev12345.service-now.com/oauth_token.do",
+            ),
+        )
+
+    def test_basic_credentials_encoded_once(self):
+        """Basic credentials are base64-encoded once, not on every call."""
+        auth_manager = AuthManager(self.basic_config)
+        with patch(
+            "servicenow_mcp.auth.auth_manager.base64.b64encode", wraps=base64.b64encode
+        ) as enc:
+            first = auth_manager.get_headers()
+            for _ in range(100):
+                self.assertEqual(auth_manager.get_headers(), first)
+        self.assertEqual(enc.call_count, 1)
+        self.assertEqual(first["Authorization"], "Basic dXNlcjpwYXNz")
+
+    def test_headers_are_independent_copies(self):
+        """Callers can modify the returned headers without affecting later calls."""
+        auth_manager = AuthManager(self.basic_config)
+        headers = auth_manager.get_headers()
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+        headers["X-Extra"] = "1"
+        self.assertEqual(auth_manager.get_headers()["Content-Type"], "application/json")
+        self.assertNotIn("X-Extra", auth_manager.get_headers())
+
+    @patch("requests.post")
+    def test_headers_rebuilt_on_token_rotation(self, mock_post):
+        """OAuth headers are rebuilt only when the token changes."""
+        mock_post.side_effect = [token_response("first"), token_response("second")]
+        auth_manager = AuthManager(self.oauth_config)
+
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer first")
+        template = auth_manager._headers_template
+        auth_manager.get_headers()
+        self.assertIs(auth_manager._headers_template, template)
+
+        auth_manager.refresh_token()
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer second")
+        self.assertIsNot(auth_manager._headers_template, template)
+
+    def test_get_headers_per_call_cost(self):
+        """Micro-benchmark: get_headers stays a cheap dict copy."""
+        auth_manager = AuthManager(self.basic_config)
+        auth_manager.get_headers()
+        calls = 20000
+        per_call = min(timeit.repeat(auth_manager.get_headers, number=calls, repeat=3)) / calls
+        # A dict copy costs well under a microsecond; this bound only catches regressions
+        # such as re-encoding credentials or rebuilding the headers on every call.
+        self.assertLess(per_call, 5e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+"""
+Tests for the Batch API helper.
+"""
+
+import base64
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.catalog_tools import MoveCatalogItemsParams, move_catalog_items
+from servicenow_mcp.utils import batch
+from servicenow_mcp.utils.batch import BatchRequest, execute_batch
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    BatchConfig,
+    ServerConfig,
+)
+
+
+def encode(body):
+    """Base64-encode a JSON body the way the Batch API does."""
+    return base64.b64encode(json.dumps(body).encode()).decode()
+
+
+def batch_response(rest_requests, status_codes=None, serviced=None):
+    """Build a mock Batch API response for the given sub-requests."""
+    serviced_requests = []
+    for index, rest_request in enumerate(rest_requests):
+        if serviced is not None and index not in serviced:
+            continue
+        status_code = status_codes[index] if status_codes else 200
+        serviced_requests.append({
+            "id": rest_request["id"],
+            "status_code": status_code,
+            "status_text": "OK" if status_code == 200 else "Not Found",
+            "body": encode(
+                {"result": {"sys_id": rest_request["url"].rsplit("/", 1)[-1]}}
+                if status_code == 200
+                else {"error": {"message": "No Record found"}}
+            ),
+        })
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"batch_request_id": "1", "serviced_requests": serviced_requests}
+    return response
+
+
+class TestExecuteBatch(unittest.TestCase):
+    """Tests for execute_batch."""
+
+    def setUp(self):
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+            batch=BatchConfig(chunk_size=2, max_parallel=1),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+        self.requests = [
+            BatchRequest(
+                method="PATCH",
+                path=f"/api/now/table/sc_cat_item/item{i}",
+                body={"category": "cat1"},
+            )
+            for i in range(5)
+        ]
+        batch._batch_unavailable_instances.clear()
+
+    @patch("requests.post")
+    def test_requests_sent_in_chunks(self, mock_post):
+        """Requests are packed into one batch call per chunk."""
+        mock_post.side_effect = lambda url, json, **kwargs: batch_response(json["rest_requests"])
+
+        results = execute_batch(self.config, self.auth_manager, self.requests)
+
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(
+            [result.body["result"]["sys_id"] for result in results],
+            [f"item{i}" for i in range(5)],
+        )
+
+        url = mock_post.call_args_list[0].args[0]
+        self.assertEqual(url, "https://dev12345.service-now.com/api/now/v1/batch")
+        rest_request = mock_post.call_args_list[0].kwargs["json"]["rest_requests"][1]
+        self.assertEqual(rest_request["method"], "PATCH")
+        self.assertEqual(rest_request["url"], "/api/now/table/sc_cat_item/item1")
+        self.assertEqual(
+            json.loads(base64.b64decode(rest_request["body"])), {"category": "cat1"}
+        )
+
+    @patch("requests.post")
+    def test_failed_sub_request_reported(self, mock_post):
+        """A failed sub-request is reported with its status and error message."""
+        mock_post.side_effect = lambda url, json, **kwargs: batch_response(
+            json["rest_requests"], status_codes=[200, 404]
+        )
+
+        results = execute_batch(self.config, self.auth_manager, self.requests[:2])
+
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertEqual(results[1].status_code, 404)
+        self.assertEqual(results[1].error, "404 Not Found: No Record found")
+
+    @patch("requests.patch")
+    @patch("requests.post")
+    def test_unserviced_requests_retried_individually(self, mock_post, mock_patch):
+        """Sub-requests the instance did not service are sent individually."""
+        mock_post.side_effect = lambda url, json, **kwargs: batch_response(
+            json["rest_requests"], serviced={0}
+        )
+        mock_patch.return_value = MagicMock(status_code=200, content=b"")
+
+        results = execute_batch(self.config, self.auth_manager, self.requests[:2])
+
+        self.assertTrue(all(result.success for result in results))
+        mock_patch.assert_called_once()
+        self.assertEqual(
+            mock_patch.call_args.args[0],
+            "https://dev12345.service-now.com/api/now/table/sc_cat_item/item1",
+        )
+
+    @patch("requests.patch")
+    @patch("requests.post")
+    def test_fallback_when_batch_api_unavailable(self, mock_post, mock_patch):
+        """Without the Batch API, requests are sent individually and the instance is remembered."""
+        mock_post.return_value = MagicMock(status_code=404)
+        mock_patch.return_value = MagicMock(status_code=200, content=b"")
+
+        results = execute_batch(self.config, self.auth_manager, self.requests)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(mock_patch.call_count, 5)
+
+        # Later calls skip the batch endpoint
+        execute_batch(self.config, self.auth_manager, self.requests)
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(mock_patch.call_count, 10)
+
+    def assert_not_replayed(self, mock_post):
+        """Send three creates in chunks of two, the first batch call failing, and check them."""
+        creates = [
+            BatchRequest(method="POST", path="/api/now/table/sys_user_grmember", body={"user": u})
+            for u in ("u1", "u2", "u3")
+        ]
+
+        results = execute_batch(self.config, self.auth_manager, creates)
+
+        # Only the failed batch call was made: nothing was sent again, nor sent at all after it
+        mock_post.assert_called_once()
+        self.assertFalse(any(result.success for result in results))
+        self.assertIn("may have applied it", results[1].error)
+        self.assertIn("Not sent after a failed batch", results[2].error)
+        self.assertNotIn(self.config.instance_url, batch._batch_unavailable_instances)
+        return results
+
+    @patch("requests.post")
+    def test_batch_timeout_not_replayed(self, mock_post):
+        """A batch call timing out after it was sent is not replayed individually."""
+        mock_post.side_effect = requests.ReadTimeout("Read timed out")
+        self.assert_not_replayed(mock_post)
+
+    @patch("requests.post")
+    def test_batch_server_error_not_replayed(self, mock_post):
+        """A batch call failing with a 5xx is not replayed individually."""
+        response = MagicMock(status_code=500)
+        response.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
+        mock_post.return_value = response
+
+        results = self.assert_not_replayed(mock_post)
+        self.assertEqual(results[0].status_code, 500)
+
+    @patch("requests.post")
+    def test_fallback_when_batch_call_not_connected(self, mock_post):
+        """A batch call that could not connect is sent again as individual calls."""
+        refused = NewConnectionError(None, "Connection refused")
+        mock_post.side_effect = [
+            requests.ConnectionError(MaxRetryError(None, "/api/now/v1/batch", refused)),
+            MagicMock(status_code=201, content=b""),
+        ]
+        create = BatchRequest(method="POST", path="/api/now/table/incident", body={"a": 1})
+
+        results = execute_batch(self.config, self.auth_manager, [create])
+
+        self.assertTrue(results[0].success)
+        self.assertEqual(
+            mock_post.call_args.args[0], "https://dev12345.service-now.com/api/now/table/incident"
+        )
+
+    @patch("requests.post")
+    def test_move_catalog_items_single_round_trip(self, mock_post):
+        """Moving many catalog items costs one round trip per chunk."""
+        self.config.batch = BatchConfig(chunk_size=50)
+        mock_post.side_effect = lambda url, json, **kwargs: batch_response(json["rest_requests"])
+
+        params = MoveCatalogItemsParams(
+            item_ids=[f"item{i}" for i in range(20)], target_category_id="cat1"
+        )
+        result = move_catalog_items(self.config, self.auth_manager, params)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.data["moved_items_count"], 20)
+        mock_post.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+"""
+Tests for the reference data cache.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.incident_tools import (
+    AddCommentParams,
+    ResolveIncidentParams,
+    add_comment,
+    resolve_incident,
+)
+from servicenow_mcp.tools.meta_tools import GetFieldChoicesParams, get_field_choices
+from servicenow_mcp.tools.user_tools import ListGroupMembersParams, list_group_members
+from servicenow_mcp.utils.cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    ReferenceCache,
+    SQLiteCacheBackend,
+    get_reference_cache,
+)
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    CacheConfig,
+    ServerConfig,
+)
+
+
+def json_response(result):
+    """Build a mock Table API response."""
+    response = MagicMock()
+    response.json.return_value = {"result": result}
+    return response
+
+
+class TestCacheBackends(unittest.TestCase):
+    """Tests for the cache storage backends."""
+
+    def test_memory_backend_lru_and_ttl(self):
+        """The least recently used entry is evicted and expired entries are dropped."""
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", "t", "1", ttl=60)
+        backend.set("b", "t", "2", ttl=60)
+        backend.get("a")
+        backend.set("c", "t", "3", ttl=60)
+
+        self.assertEqual(backend.get("a"), "1")
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("c"), "3")
+
+        backend.set("d", "t", "4", ttl=0)
+        self.assertIsNone(backend.get("d"))
+
+    def test_backend_interface_is_abstract(self):
+        """Backends must implement get, set and invalidate."""
+        with self.assertRaises(TypeError):
+            CacheBackend()
+
+        class GetOnly(CacheBackend):
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnly()
+
+    def test_sqlite_backend_shared_between_instances(self):
+        """Entries written by one SQLite backend are read by another on the same file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.sqlite")
+            SQLiteCacheBackend(path).set("key", "sys_choice", '"value"', ttl=60)
+            other = SQLiteCacheBackend(path)
+            self.assertEqual(other.get("key"), '"value"')
+
+            other.invalidate("sys_choice")
+            self.assertIsNone(SQLiteCacheBackend(path).get("key"))
+
+
+class TestReferenceCache(unittest.TestCase):
+    """Tests for ReferenceCache."""
+
+    def setUp(self):
+        self.cache = ReferenceCache(
+            CacheConfig(table_ttls={"sys_choice": 60, "incident": 0}),
+            MemoryCacheBackend(),
+            "https://dev12345.service-now.com",
+        )
+
+    def test_read_through_with_counters(self):
+        """fetch is only called on a miss, and hits and misses are counted per table."""
+        fetch = MagicMock(return_value=[{"label": "New", "value": "1"}])
+
+        for _ in range(3):
+            value = self.cache.get_or_fetch("sys_choice", "name=incident", fetch, fields="label")
+
+        self.assertEqual(value, [{"label": "New", "value": "1"}])
+        fetch.assert_called_once()
+        self.assertEqual(self.cache.stats(), {"sys_choice": {"hits": 2, "misses": 1}})
+
+    def test_keys_include_query_and_fields(self):
+        """Different queries or fields are cached separately."""
+        self.cache.set("sys_choice", "q1", "a", fields="label")
+        self.assertIsNone(self.cache.get("sys_choice", "q2", fields="label"))
+        self.assertIsNone(self.cache.get("sys_choice", "q1", fields="value"))
+        self.assertEqual(self.cache.get("sys_choice", "q1", fields="label"), "a")
+
+    def test_zero_ttl_and_none_not_cached(self):
+        """Tables with a TTL of 0 and None results are never cached."""
+        self.cache.set("incident", "number=INC1", {"sys_id": "1"})
+        self.assertIsNone(self.cache.get("incident", "number=INC1"))
+
+        fetch = MagicMock(return_value=None)
+        self.cache.get_or_fetch("sys_choice", "missing", fetch)
+        self.cache.get_or_fetch("sys_choice", "missing", fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_invalidate_table(self):
+        """Invalidating a table only drops that table's entries."""
+        self.cache.set("sys_choice", "q", "a")
+        self.cache.set("sys_user_role", "q", "b")
+        self.cache.invalidate("sys_choice")
+        self.assertIsNone(self.cache.get("sys_choice", "q"))
+        self.assertEqual(self.cache.get("sys_user_role", "q"), "b")
+
+
+class TestCachedLookups(unittest.TestCase):
+    """Tests for tools that read reference data through the cache."""
+
+    def setUp(self):
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+
+    @patch("requests.get")
+    def test_field_choices_cached(self, mock_get):
+        """Repeated choice list lookups are served from the cache."""
+        mock_get.return_value = json_response([{"label": "New", "value": "1"}])
+        params = GetFieldChoicesParams(table_name="incident", field_name="state")
+
+        first = get_field_choices(self.config, self.auth_manager, params)
+        second = get_field_choices(self.config, self.auth_manager, params)
+
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+        stats = get_reference_cache(self.config, self.auth_manager).stats()
+        self.assertEqual(stats["sys_choice"], {"hits": 1, "misses": 1})
+
+    @patch("requests.get")
+    def test_group_name_resolution_cached(self, mock_get):
+        """A group name is resolved to its sys_id only once."""
+        group = {"sys_id": "a" * 32, "name": "Service Desk"}
+        members = [{"user": {"value": "u1", "display_value": "Alice"}}]
+
+        def get(url, params=None, **kwargs):
+            if url.endswith("/sys_user_group"):
+                return json_response([group])
+            return json_response(members)
+
+        mock_get.side_effect = get
+        params = ListGroupMembersParams(group_id="Service Desk")
+
+        for _ in range(2):
+            result = list_group_members(self.config, self.auth_manager, params)
+            self.assertEqual(result["members"][0]["user_sys_id"], "u1")
+
+        group_lookups = [c for c in mock_get.call_args_list if c.args[0].endswith("/sys_user_group")]
+        self.assertEqual(len(group_lookups), 1)
+
+    @patch("requests.put")
+    def test_incident_writes_invalidate_cached_incidents(self, mock_put):
+        """Comments and resolutions drop cached incidents, as updates do."""
+        mock_put.return_value = json_response({"sys_id": "a" * 32, "number": "INC0010001"})
+        cache = get_reference_cache(self.config, self.auth_manager)
+        writes = [
+            (add_comment, AddCommentParams(incident_id="a" * 32, comment="Looking into it")),
+            (
+                resolve_incident,
+                ResolveIncidentParams(
+                    incident_id="a" * 32, resolution_code="Solved", resolution_notes="Fixed"
+                ),
+            ),
+        ]
+        for tool, params in writes:
+            with self.subTest(tool=tool.__name__):
+                cache.set("incident", "number=INC0010001", {"state": "2"})
+                self.assertTrue(tool(self.config, self.auth_manager, params).success)
+                self.assertIsNone(cache.get("incident", "number=INC0010001"))
+
+    @patch("requests.get")
+    def test_cache_disabled(self, mock_get):
+        """With the cache disabled every lookup goes to the instance."""
+        self.config.cache = CacheConfig(enabled=False)
+        mock_get.return_value = json_response([])
+        params = GetFieldChoicesParams(table_name="incident", field_name="state")
+
+        get_field_choices(self.config, self.auth_manager, params)
+        get_field_choices(self.config, self.auth_manager, params)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
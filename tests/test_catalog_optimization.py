@@ -2,6 +2,7 @@
 Tests for the ServiceNow MCP catalog optimization tools.
 """
 
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -9,6 +10,7 @@ import requests
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.tools.catalog_optimization import (
+    ANALYSIS_DAYS,
     OptimizationRecommendationsParams,
     UpdateCatalogItemParams,
     _get_high_abandonment_items,
@@ -117,70 +119,121 @@ class TestCatalogOptimizationTools(unittest.TestCase):
         # Verify the results
         self.assertEqual(result, [])
 
-    @patch("requests.get")
-    @patch("random.sample")
-    @patch("random.randint")
-    def test_get_low_usage_items(self, mock_randint, mock_sample, mock_get):
-        """Test getting catalog items with low usage."""
-        # Mock the response from ServiceNow
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "result": [
-                {
-                    "sys_id": "item1",
-                    "name": "Rarely Used Laptop",
-                    "short_description": "Laptop model with low demand",
-                    "category": "hardware",
-                },
-                {
-                    "sys_id": "item2",
-                    "name": "Unpopular Software",
-                    "short_description": "Software with few users",
-                    "category": "software",
-                },
+    def _mock_instance(self, mock_get, items, orders=None, fulfilments=None, carts=None):
+        """Serve (sys_id, name, category) catalog items and per-item request and cart statistics."""
+
+        def groups(stats):
+            return [
                 {
-                    "sys_id": "item3",
-                    "name": "Niche Service",
-                    "short_description": "Specialized service with limited audience",
-                    "category": "services",
-                },
+                    "groupby_fields": [{"field": "cat_item", "value": sys_id}],
+                    "stats": {"count": str(count), "avg": {"calendar_duration": duration}},
+                }
+                for sys_id, (count, duration) in stats.items()
             ]
-        }
-        mock_get.return_value = mock_response
 
-        # Mock the random sample to return the first two items
-        mock_sample.return_value = [
-            {
-                "sys_id": "item1",
-                "name": "Rarely Used Laptop",
-                "short_description": "Laptop model with low demand",
-                "category": "hardware",
-            },
-            {
-                "sys_id": "item2",
-                "name": "Unpopular Software",
-                "short_description": "Software with few users",
-                "category": "software",
-            },
-        ]
+        def get(url, params=None, headers=None, timeout=None):
+            response = MagicMock()
+            if url.endswith("/table/sc_cat_item"):
+                body = [
+                    {"sys_id": sys_id, "name": name, "short_description": "", "category": category}
+                    for sys_id, name, category in items
+                ]
+            elif url.endswith("/stats/sc_cart_item"):
+                body = groups({k: (v, None) for k, v in (carts or {}).items()})
+            elif "closed_atISNOTEMPTY" in params["sysparm_query"]:
+                body = groups(fulfilments or {})
+            else:
+                body = groups({k: (v, None) for k, v in (orders or {}).items()})
+            response.json.return_value = {"result": body}
+            return response
+
+        mock_get.side_effect = get
 
-        # Mock the random order counts
-        mock_randint.return_value = 2
+    @patch("requests.get")
+    def test_get_low_usage_items(self, mock_get):
+        """Test getting catalog items with low usage."""
+        self._mock_instance(
+            mock_get,
+            [
+                ("item1", "Rarely Used Laptop", "hardware"),
+                ("item2", "Unpopular Software", "software"),
+                ("item3", "Popular Service", "services"),
+            ],
+            orders={"item1": 2, "item3": 40},
+        )
 
-        # Call the function
         result = _get_low_usage_items(self.config, self.auth_manager)
 
-        # Verify the results
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0]["name"], "Rarely Used Laptop")
-        self.assertEqual(result[0]["order_count"], 2)
-        self.assertEqual(result[1]["name"], "Unpopular Software")
-        self.assertEqual(result[1]["order_count"], 2)
+        # Fewest orders first; items without orders count as zero
+        self.assertEqual(
+            [item["name"] for item in result], ["Unpopular Software", "Rarely Used Laptop"]
+        )
+        self.assertEqual([item["order_count"] for item in result], [0, 2])
 
-        # Verify the API call
-        mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        self.assertEqual(kwargs["params"]["sysparm_query"], "active=true")
+        # One catalog fetch and one statistic per metric, whatever the number of items
+        catalog_url = "https://example.service-now.com/api/now/table/sc_cat_item"
+        urls = [call.args[0] for call in mock_get.call_args_list]
+        self.assertEqual(len(urls), 4)
+        self.assertEqual(urls.count(catalog_url), 1)
+        catalog_params = mock_get.call_args_list[urls.index(catalog_url)].kwargs["params"]
+        self.assertTrue(catalog_params["sysparm_query"].startswith("active=true^ORDERBYsys_id"))
+
+    @patch("requests.get")
+    def test_catalog_metrics_cached_per_category(self, mock_get):
+        """The analyses of one category share a single metrics fetch."""
+        self._mock_instance(
+            mock_get,
+            [("item1", "Laptop", "hardware")],
+        )
+
+        _get_low_usage_items(self.config, self.auth_manager, "hardware")
+        _get_high_abandonment_items(self.config, self.auth_manager, "hardware")
+        _get_slow_fulfillment_items(self.config, self.auth_manager, "hardware")
+        self.assertEqual(mock_get.call_count, 4)
+        for call in mock_get.call_args_list:
+            self.assertIn("category=hardware", call.kwargs["params"]["sysparm_query"])
+
+        _get_low_usage_items(self.config, self.auth_manager, "software")
+        self.assertEqual(mock_get.call_count, 8)
+
+    @patch("requests.get")
+    def test_orders_and_carts_share_a_window(self, mock_get):
+        """Orders and abandoned carts are counted over the same analysis window."""
+        self._mock_instance(mock_get, [("item1", "Laptop", "hardware")])
+
+        _get_high_abandonment_items(self.config, self.auth_manager)
+
+        queries = [call.kwargs["params"]["sysparm_query"] for call in mock_get.call_args_list]
+        window = f">=javascript:gs.daysAgoStart({ANALYSIS_DAYS})"
+        orders = next(query for query in queries if query.startswith("sys_created_on"))
+        carts = next(query for query in queries if query.startswith("sys_updated_on"))
+        self.assertEqual(orders, f"sys_created_on{window}")
+        self.assertEqual(
+            carts, f"sys_updated_on{window}^sys_updated_on<javascript:gs.daysAgoStart(1)"
+        )
+
+    @patch("requests.get")
+    def test_get_high_abandonment_items(self, mock_get):
+        """Test getting catalog items with high abandonment rates."""
+        self._mock_instance(
+            mock_get,
+            [
+                ("item1", "Complex Request", "hardware"),
+                ("item2", "Simple Request", "hardware"),
+                ("item3", "Rare Request", "hardware"),
+            ],
+            orders={"item1": 12, "item2": 50, "item3": 1},
+            carts={"item1": 18, "item2": 5, "item3": 2},
+        )
+
+        result = _get_high_abandonment_items(self.config, self.auth_manager)
+
+        # item2 is rarely abandoned and item3 has too few cart adds to judge
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["name"], "Complex Request")
+        self.assertEqual(result[0]["abandonment_rate"], 60)
+        self.assertEqual(result[0]["cart_adds"], 30)
+        self.assertEqual(result[0]["orders"], 12)
 
     def test_high_abandonment_items_format(self):
         """Test the expected format of high abandonment items."""
@@ -221,60 +274,37 @@ class TestCatalogOptimizationTools(unittest.TestCase):
         self.assertEqual(high_abandonment_items[1]["orders"], 8)
 
     @patch("requests.get")
-    @patch("random.sample")
-    @patch("random.uniform")
-    def test_get_slow_fulfillment_items(self, mock_uniform, mock_sample, mock_get):
+    def test_get_slow_fulfillment_items(self, mock_get):
         """Test getting catalog items with slow fulfillment times."""
-        # Mock the response from ServiceNow
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "result": [
-                {
-                    "sys_id": "item1",
-                    "name": "Custom Hardware",
-                    "short_description": "Specialized hardware request",
-                    "category": "hardware",
-                },
-                {
-                    "sys_id": "item2",
-                    "name": "Complex Software",
-                    "short_description": "Software with complex installation",
-                    "category": "software",
-                },
-            ]
-        }
-        mock_get.return_value = mock_response
-
-        # Mock the random sample to return all items
-        mock_sample.return_value = [
-            {
-                "sys_id": "item1",
-                "name": "Custom Hardware",
-                "short_description": "Specialized hardware request",
-                "category": "hardware",
-            },
-            {
-                "sys_id": "item2",
-                "name": "Complex Software",
-                "short_description": "Software with complex installation",
-                "category": "software",
+        self._mock_instance(
+            mock_get,
+            [
+                ("item1", "Custom Hardware", "hardware"),
+                ("item2", "Standard Laptop", "hardware"),
+                ("item3", "Complex Software", "software"),
+            ],
+            fulfilments={
+                "item1": (4, "1970-01-08 12:00:00"),  # 7.5 days
+                "item2": (14, "1970-01-02 00:00:00"),  # 1 day
+                "item3": (2, "1970-01-21 00:00:00"),  # 20 days, too few requests
             },
-        ]
-
-        # Mock the random uniform values for fulfillment times
-        mock_uniform.return_value = 7.5
+        )
 
-        # Call the function
         result = _get_slow_fulfillment_items(self.config, self.auth_manager)
 
-        # Verify the results
-        self.assertEqual(len(result), 2)
+        # Catalog average: (4 * 7.5 + 14 * 1 + 2 * 20) / 20 = 4.2 days
+        self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["name"], "Custom Hardware")
         self.assertEqual(result[0]["avg_fulfillment_time"], 7.5)
-        self.assertEqual(result[0]["avg_fulfillment_time_vs_catalog"], 3.0)  # 7.5 / 2.5 = 3.0
-        self.assertEqual(result[1]["name"], "Complex Software")
-        self.assertEqual(result[1]["avg_fulfillment_time"], 7.5)
-        self.assertEqual(result[1]["avg_fulfillment_time_vs_catalog"], 3.0)  # 7.5 / 2.5 = 3.0
+        self.assertEqual(result[0]["avg_fulfillment_time_vs_catalog"], 1.8)
+
+    @patch("requests.get")
+    def test_catalog_metrics_error(self, mock_get):
+        """A failed statistic yields no items instead of made-up ones."""
+        mock_get.side_effect = requests.exceptions.RequestException("Stats API unavailable")
+
+        self.assertEqual(_get_low_usage_items(self.config, self.auth_manager), [])
+        self.assertEqual(_get_slow_fulfillment_items(self.config, self.auth_manager), [])
 
     @patch("requests.get")
     def test_get_poor_description_items(self, mock_get):
@@ -473,6 +503,56 @@ class TestCatalogOptimizationTools(unittest.TestCase):
         self.assertNotIn("slow_fulfillment", recommendation_types)
         self.assertNotIn("description_quality", recommendation_types)
 
+    @patch("servicenow_mcp.tools.catalog_optimization._get_inactive_items")
+    @patch("servicenow_mcp.tools.catalog_optimization._get_low_usage_items")
+    def test_get_optimization_recommendations_concurrent(self, mock_low_usage, mock_inactive):
+        """Analyses run concurrently and report their duration."""
+        # Each analysis only returns once both have started
+        barrier = threading.Barrier(2, timeout=5)
+
+        def analysis(sys_id):
+            def run(*args):
+                barrier.wait()
+                return [{"sys_id": sys_id}]
+
+            return run
+
+        mock_inactive.side_effect = analysis("item1")
+        mock_low_usage.side_effect = analysis("item2")
+
+        params = OptimizationRecommendationsParams(
+            recommendation_types=["inactive_items", "low_usage"], timeout=10
+        )
+        result = get_optimization_recommendations(self.config, self.auth_manager, params)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            [rec["type"] for rec in result["recommendations"]], ["inactive_items", "low_usage"]
+        )
+        self.assertEqual(set(result["timings"]), {"inactive_items", "low_usage"})
+        self.assertEqual(result["timed_out"], [])
+
+    @patch("servicenow_mcp.tools.catalog_optimization._get_inactive_items")
+    @patch("servicenow_mcp.tools.catalog_optimization._get_low_usage_items")
+    def test_get_optimization_recommendations_deadline(self, mock_low_usage, mock_inactive):
+        """Analyses past the deadline are reported and the others returned."""
+        release = threading.Event()
+        mock_inactive.return_value = [{"sys_id": "item1", "name": "Old Laptop"}]
+        mock_low_usage.side_effect = lambda *args: release.wait(5) and [{"sys_id": "item2"}]
+
+        params = OptimizationRecommendationsParams(
+            recommendation_types=["inactive_items", "low_usage"], timeout=0.2
+        )
+        try:
+            result = get_optimization_recommendations(self.config, self.auth_manager, params)
+        finally:
+            release.set()
+
+        self.assertTrue(result["success"])
+        self.assertEqual([rec["type"] for rec in result["recommendations"]], ["inactive_items"])
+        self.assertEqual(list(result["timings"]), ["inactive_items"])
+        self.assertEqual(result["timed_out"], ["low_usage"])
+
     @patch("requests.patch")
     def test_update_catalog_item(self, mock_patch):
         """Test updating a catalog item."""
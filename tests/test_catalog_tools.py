@@ -23,7 +23,13 @@ from servicenow_mcp.tools.catalog_tools import (
     update_catalog_category,
     move_catalog_items,
 )
-from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    BatchConfig,
+    ServerConfig,
+)
 
 
 class TestCatalogTools(unittest.TestCase):
@@ -398,9 +404,12 @@ class TestCatalogTools(unittest.TestCase):
 
     @patch("requests.patch")
     def test_move_catalog_items(self, mock_patch):
-        """Test moving catalog items."""
+        """Test moving catalog items without the Batch API."""
+        self.config.batch = BatchConfig(enabled=False, max_parallel=1)
+
         # Mock response
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.json.return_value = {"result": {"sys_id": "item_id", "category": "target_category_id"}}
         mock_patch.return_value = mock_response
 
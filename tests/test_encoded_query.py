@@ -0,0 +1,234 @@
+"""
+Tests for the encoded query parser and compiler.
+"""
+
+import random
+import sqlite3
+import unittest
+from datetime import datetime
+
+from servicenow_mcp.utils.encoded_query import (
+    Condition,
+    UnsupportedQueryError,
+    parse,
+)
+
+NOW = datetime(2025, 3, 12, 15, 30, 45)  # a Wednesday
+
+
+class TestEncodedQuery(unittest.TestCase):
+    """Tests for parse and EncodedQuery."""
+
+    record = {
+        "active": "true",
+        "priority": "2",
+        "impact": "2",
+        "short_description": "Email server down",
+        "state": {"value": "1", "display_value": "New"},
+        "assigned_to": {"value": "", "display_value": ""},
+        "opened_at": {"value": "2025-03-11 08:00:00", "display_value": "11/03/2025 09:00:00"},
+    }
+
+    def test_parse(self):
+        """Conditions are grouped by ^OR and ^NQ, and ORDERBY terms collected."""
+        query = parse(
+            "active=true^priority<=2^ORstate=6^short_descriptionLIKEmail"
+            "^NQstateIN6,7^ORDERBYDESCnumber"
+        )
+        self.assertEqual(
+            query.branches,
+            [
+                [
+                    [Condition("active", "=", "true")],
+                    [Condition("priority", "<=", "2"), Condition("state", "=", "6")],
+                    [Condition("short_description", "LIKE", "mail")],
+                ],
+                [[Condition("state", "IN", "6,7")]],
+            ],
+        )
+        self.assertEqual(query.order_by, [("number", True)])
+        self.assertEqual(
+            query.fields, {"active", "priority", "state", "short_description", "number"}
+        )
+
+    def test_dates(self):
+        """Date operators and gs date functions are resolved against the current time."""
+        cases = {
+            "opened_at>javascript:gs.daysAgoStart(7)": (">", "2025-03-05 00:00:00"),
+            "opened_at<=javascript:gs.endOfLastMonth()": ("<=", "2025-02-28 23:59:59"),
+            "opened_at>=javascript:gs.beginningOfThisWeek()": (">=", "2025-03-10 00:00:00"),
+            "opened_at<javascript:gs.beginningOfNextQuarter()": ("<", "2025-04-01 00:00:00"),
+            "opened_at>javascript:gs.hoursAgo(2)": (">", "2025-03-12 13:30:45"),
+            "opened_atRELATIVEGT@month@ago@1": (">", "2025-02-12 15:30:45"),
+            "opened_atRELATIVELE@day@ahead@3": ("<=", "2025-03-15 15:30:45"),
+            "opened_atONToday@javascript:gs.beginningOfToday()@javascript:gs.endOfToday()": (
+                "BETWEEN",
+                "2025-03-12 00:00:00@2025-03-12 23:59:59",
+            ),
+            "opened_atNOTON2025-01-31": (
+                "NOT BETWEEN",
+                "2025-01-31 00:00:00@2025-01-31 23:59:59",
+            ),
+            "opened_atBETWEENjavascript:gs.dateGenerate('2025-01-01','start')"
+            "@javascript:gs.dateGenerate('2025-01-31','end')": (
+                "BETWEEN",
+                "2025-01-01 00:00:00@2025-01-31 23:59:59",
+            ),
+        }
+        for query, (operator, value) in cases.items():
+            with self.subTest(query=query):
+                self.assertEqual(
+                    parse(query, now=NOW).branches,
+                    [[[Condition("opened_at", operator, value)]]],
+                )
+
+    def test_matches(self):
+        """Conditions match raw or display values, case-insensitively."""
+        cases = {
+            "active=true^priority<=2": True,
+            "priority>2^ORstate=new": True,
+            "short_descriptionLIKEMAIL^stateIN1,2": True,
+            "short_descriptionSTARTSWITHserver": False,
+            "short_descriptionENDSWITHDOWN^assigned_toEMPTYSTRING": True,
+            "assigned_toISEMPTY^state!=2": True,
+            "priority>10": False,
+            "priority>10^NQactive=true": True,
+            "prioritySAMEASimpact^stateANYTHING": True,
+            "priorityNSAMEASimpact": False,
+            "priorityBETWEEN1@3": True,
+            "opened_atONYesterday@javascript:gs.beginningOfYesterday()"
+            "@javascript:gs.endOfYesterday()": True,
+            "opened_at>=javascript:gs.beginningOfToday()": False,
+            "": True,
+        }
+        for query, expected in cases.items():
+            with self.subTest(query=query):
+                self.assertEqual(parse(query, now=NOW).matches(self.record), expected)
+
+    def test_unsupported(self):
+        """Syntax outside the supported subset is rejected."""
+        for query in (
+            "caller_id.vip=true",
+            "sys_class_nameINSTANCEOFtask",
+            "short_descriptionLIKEjavascript:gs.getUserID()",
+            "assigned_to=javascript:gs.getUserID()",
+            "opened_atRELATIVEGT@fortnight@ago@1",
+            "priorityBETWEEN1",
+            "priorityDYNAMIC1234",
+        ):
+            with self.subTest(query=query):
+                with self.assertRaises(UnsupportedQueryError):
+                    parse(query)
+        with self.assertRaises(UnsupportedQueryError):
+            parse("u_missing=1").matches(self.record)
+
+
+# Small value pools, so that generated conditions often match and values often tie
+WORDS = ["Email", "email", "server", "Down", "VPN", "", "a", "1", "10", "-2", "2.5", "1a"]
+NUMBERS = ["1", "2", "10", "-3", "0.5", "007", "", "x", "1.2.3", "-", ".5"]
+DATES = ["2025-03-01 10:00:00", "2025-03-11 23:59:59", "2025-03-12 00:00:00", ""]
+FIELDS = ["priority", "impact", "short_description", "state", "opened_at"]
+OPERATORS = [
+    "=", "!=", "LIKE", "NOT LIKE", "STARTSWITH", "ENDSWITH", "IN", "NOT IN", "ISEMPTY",
+    "ISNOTEMPTY", "EMPTYSTRING", "ANYTHING", ">", ">=", "<", "<=", "BETWEEN", "SAMEAS", "NSAMEAS",
+]
+
+
+def random_record(rng, sys_id):
+    words = lambda: " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 3)))
+    return {
+        "sys_id": sys_id,
+        "priority": rng.choice(NUMBERS),
+        "impact": {"value": rng.choice(NUMBERS), "display_value": rng.choice(WORDS)},
+        "short_description": words(),
+        "state": {"value": rng.choice(NUMBERS), "display_value": rng.choice(WORDS)},
+        "opened_at": {"value": rng.choice(DATES), "display_value": rng.choice(DATES)},
+    }
+
+
+def random_value(rng):
+    return rng.choice([rng.choice(WORDS), rng.choice(NUMBERS), rng.choice(DATES)]).lower()
+
+
+def random_condition(rng):
+    field, operator = rng.choice(FIELDS), rng.choice(OPERATORS)
+    if operator in ("ISEMPTY", "ISNOTEMPTY", "EMPTYSTRING", "ANYTHING"):
+        value = ""
+    elif operator in ("SAMEAS", "NSAMEAS"):
+        value = rng.choice(FIELDS)
+    elif operator in ("IN", "NOT IN"):
+        value = ",".join(random_value(rng) for _ in range(rng.randint(1, 3)))
+    elif operator == "BETWEEN":
+        value = "@".join(sorted(rng.choice([NUMBERS, DATES])[:-1][:2]))
+    else:
+        value = random_value(rng)
+    return f"{field}{operator}{value}".replace("^", "")
+
+
+def random_query(rng):
+    terms = [random_condition(rng)]
+    for _ in range(rng.randint(0, 4)):
+        terms.append(rng.choice(["", "OR", "NQ"]) + random_condition(rng))
+    for _ in range(rng.randint(0, 2)):
+        terms.append(rng.choice(["ORDERBY", "ORDERBYDESC"]) + rng.choice(FIELDS))
+    return "^".join(terms)
+
+
+class TestSqlCompilation(unittest.TestCase):
+    """Property tests: compiled SQL selects and orders records as the predicate does."""
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.addCleanup(self.connection.close)
+        columns = ", ".join(f"{field}_value, {field}_display" for field in FIELDS)
+        self.connection.execute(f"CREATE TABLE records (sys_id, {columns})")
+
+    def load(self, records):
+        placeholders = ", ".join("?" * (1 + 2 * len(FIELDS)))
+        rows = []
+        for record in records:
+            row = [record["sys_id"]]
+            for field in FIELDS:
+                value = record[field]
+                if isinstance(value, dict):
+                    row.extend([value["value"], value["display_value"]])
+                else:
+                    row.extend([value, value])
+            rows.append(row)
+        self.connection.executemany(f"INSERT INTO records VALUES ({placeholders})", rows)
+
+    def select(self, query):
+        compiled = query.to_sql(lambda field: f"{field}_value", lambda field: f"{field}_display")
+        order_by = f"{compiled.order_by}, sys_id" if compiled.order_by else "sys_id"
+        sql = f"SELECT sys_id FROM records WHERE {compiled.where} ORDER BY {order_by}"
+        return [row[0] for row in self.connection.execute(sql, compiled.params)]
+
+    def test_sql_matches_predicate(self):
+        """Random queries over random records give the same records in the same order."""
+        rng = random.Random(20250312)
+        records = [random_record(rng, f"{i:04d}") for i in range(300)]
+        self.load(records)
+        for _ in range(400):
+            text = random_query(rng)
+            with self.subTest(query=text):
+                query = parse(text, now=NOW)
+                matches = query.predicate()
+                expected = query.sort([record for record in records if matches(record)])
+                self.assertEqual(self.select(query), [record["sys_id"] for record in expected])
+
+    def test_boolean_structure(self):
+        """^ is an and, ^OR an or of conditions, and ^NQ an or of whole queries."""
+        rng = random.Random(7)
+        records = [random_record(rng, f"{i:04d}") for i in range(200)]
+        self.load(records)
+        for _ in range(100):
+            a, b, c = (random_condition(rng) for _ in range(3))
+            select = lambda text: set(self.select(parse(text, now=NOW)))
+            with self.subTest(conditions=(a, b, c)):
+                self.assertEqual(select(f"{a}^{b}"), select(a) & select(b))
+                self.assertEqual(select(f"{a}^OR{b}"), select(a) | select(b))
+                self.assertEqual(select(f"{a}^{b}^NQ{c}"), select(f"{a}^{b}") | select(c))
+
+
+if __name__ == "__main__":
+    unittest.main()
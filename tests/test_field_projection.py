@@ -0,0 +1,206 @@
+"""
+Tests for field projection (sysparm_fields) in the list and get tools.
+
+The recorded Table API responses in tests/fixtures/table_api hold whole
+records, as returned without sysparm_fields.
+"""
+
+import json
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from pydantic import ValidationError
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.catalog_tools import (
+    GetCatalogItemParams,
+    ListCatalogCategoriesParams,
+    ListCatalogItemsParams,
+    get_catalog_item,
+    list_catalog_categories,
+    list_catalog_items,
+)
+from servicenow_mcp.tools.catalog_variables import (
+    ListCatalogItemVariablesParams,
+    list_catalog_item_variables,
+)
+from servicenow_mcp.tools.change_tools import list_change_requests
+from servicenow_mcp.tools.generic_tools import GetTableRecordParams, get_table_record
+from servicenow_mcp.tools.incident_tools import (
+    GetIncidentByNumberParams,
+    ListIncidentsParams,
+    get_incident_by_number,
+    list_incidents,
+)
+from servicenow_mcp.tools.knowledge_base import (
+    GetArticleParams,
+    ListArticlesParams,
+    ListCategoriesParams,
+    ListKnowledgeBasesParams,
+    get_article,
+    list_articles,
+    list_categories,
+    list_knowledge_bases,
+)
+from servicenow_mcp.tools.request_tools import ListRequestsParams, list_requests
+from servicenow_mcp.tools.script_include_tools import (
+    GetScriptIncludeParams,
+    ListScriptIncludesParams,
+    get_script_include,
+    list_script_includes,
+)
+from servicenow_mcp.tools.story_tools import list_stories
+from servicenow_mcp.tools.user_tools import ListGroupMembersParams, list_group_members
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.fields import TOOL_FIELDS, sysparm_fields
+
+FIXTURES = Path(__file__).parent / "fixtures" / "table_api"
+
+
+class RecordedInstance:
+    """Serves the recorded fixtures and applies sysparm_fields like the Table API."""
+
+    def __init__(self, honour_fields=True):
+        self.honour_fields = honour_fields
+        self.bytes_sent = 0
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(dict(params or {}))
+        path = url.split("/api/now/table/", 1)[1].split("/")
+        fixture = FIXTURES / f"{path[0]}.json"
+        records = json.loads(fixture.read_text())["result"] if fixture.exists() else []
+
+        fields = (params or {}).get("sysparm_fields")
+        if fields and self.honour_fields:
+            names = fields.split(",")
+            records = [{k: v for k, v in record.items() if k in names} for record in records]
+
+        # /table/<name>/<sys_id> returns a single record
+        body = {"result": records[0] if len(path) > 1 else records}
+        self.bytes_sent += len(json.dumps(body))
+
+        response = MagicMock()
+        response.json.return_value = body
+        response.status_code = 200
+        return response
+
+
+class TestFieldProjection(unittest.TestCase):
+    """Field projection against recorded Table API responses."""
+
+    def setUp(self):
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+
+    def call(self, tool, params, honour_fields=True, instance=None):
+        instance = instance or RecordedInstance(honour_fields)
+        with patch("requests.get", side_effect=instance.get):
+            if isinstance(params, dict):
+                result = tool(self.auth_manager, self.config, params)
+            else:
+                result = tool(self.config, self.auth_manager, params)
+        if not isinstance(result, dict):
+            result = result.model_dump()
+        return result, instance.bytes_sent
+
+    def test_manifest_covers_formatted_output(self):
+        """Formatting tools return the same result from projected records, with less transfer."""
+        cases = [
+            (list_incidents, ListIncidentsParams()),
+            (get_incident_by_number, GetIncidentByNumberParams(incident_number="INC0010001")),
+            (list_catalog_items, ListCatalogItemsParams()),
+            (get_catalog_item, GetCatalogItemParams(item_id="a" * 32)),
+            (list_catalog_categories, ListCatalogCategoriesParams()),
+            (list_knowledge_bases, ListKnowledgeBasesParams()),
+            (list_articles, ListArticlesParams()),
+            (get_article, GetArticleParams(article_id="a" * 32)),
+            (list_categories, ListCategoriesParams()),
+            (list_group_members, ListGroupMembersParams(group_id="a" * 32)),
+            (list_script_includes, ListScriptIncludesParams()),
+            (get_script_include, GetScriptIncludeParams(script_include_id="IncidentUtils0")),
+        ]
+        for tool, params in cases:
+            with self.subTest(tool=tool.__name__):
+                self.assertIn(tool.__name__, TOOL_FIELDS)
+                projected, projected_bytes = self.call(tool, params)
+                full, full_bytes = self.call(tool, params, honour_fields=False)
+
+                self.assertTrue(projected["success"], projected)
+                self.assertEqual(projected, full)
+                self.assertLess(projected_bytes, full_bytes)
+
+    def test_fields_parameter_returns_raw_fields(self):
+        """Requested fields replace the default summary of formatting tools."""
+        result, _ = self.call(
+            list_incidents, ListIncidentsParams(fields=["number", "caller_id", "impact"])
+        )
+        self.assertEqual(
+            [list(incident) for incident in result["incidents"]],
+            [["number", "caller_id", "impact"]] * 3,
+        )
+        self.assertEqual(result["incidents"][0]["caller_id"], "Abel Tuter")
+
+        result, _ = self.call(
+            get_incident_by_number,
+            GetIncidentByNumberParams(incident_number="INC0010001", fields=["number", "severity"]),
+        )
+        self.assertEqual(result["incident"], {"number": "INC0010001", "severity": "3 - Low"})
+
+    def test_raw_tools_fetch_requested_fields_only(self):
+        """Tools returning whole records keep doing so unless fields are requested."""
+        full, full_bytes = self.call(list_requests, ListRequestsParams())
+        self.assertGreater(len(full["requests"][0]), 50)
+
+        projected, projected_bytes = self.call(
+            list_requests, ListRequestsParams(fields=["number", "stage", "requested_for"])
+        )
+        self.assertEqual(set(projected["requests"][0]), {"number", "stage", "requested_for"})
+        self.assertLess(projected_bytes * 10, full_bytes)
+
+        for tool, key in ((list_change_requests, "change_requests"), (list_stories, "stories")):
+            with self.subTest(tool=tool.__name__):
+                result, _ = self.call(tool, {"fields": ["number", "state"]})
+                self.assertEqual([set(record) for record in result[key]], [{"number", "state"}] * 3)
+
+    def test_fields_of_record_and_variable_tools(self):
+        """get_table_record and list_catalog_item_variables fetch only requested fields."""
+        result, _ = self.call(
+            get_table_record,
+            GetTableRecordParams(
+                table_name="sys_user_grmember", sys_id="a" * 32, fields=["sys_id", "user"]
+            ),
+        )
+        self.assertEqual(set(result["record"]), {"sys_id", "user"})
+
+        instance = RecordedInstance()
+        self.call(
+            list_catalog_item_variables,
+            ListCatalogItemVariablesParams(catalog_item_id="a" * 32, fields=["name", "order"]),
+            instance=instance,
+        )
+        self.assertEqual(instance.requests[0]["sysparm_fields"], "name,order")
+
+    def test_sysparm_fields(self):
+        """Requested fields take precedence over the manifest and are deduplicated."""
+        self.assertEqual(sysparm_fields("list_incidents", ["number", "state", "number"]), "number,state")
+        self.assertEqual(sysparm_fields("list_group_members"), "sys_id,user")
+        self.assertIsNone(sysparm_fields("list_requests"))
+
+    def test_invalid_field_names_rejected(self):
+        """Field names cannot smuggle in other query parameters or conditions."""
+        for name in ("number,state", "number^ORactive=true", "", "assigned_to."):
+            with self.subTest(name=name):
+                with self.assertRaises(ValidationError):
+                    ListIncidentsParams(fields=[name])
+        ListIncidentsParams(fields=["assigned_to.email"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,283 @@
+"""
+Tests for the generic table tools.
+"""
+
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.generic_tools import (
+    AggregateTableParams,
+    QueryTableParams,
+    aggregate_table,
+    iter_table_records,
+    query_table,
+)
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+
+
+class FakeTable:
+    """Serves a table of n records, honouring limit, offset and keyset queries."""
+
+    def __init__(self, row_count):
+        self.records = [
+            {"sys_id": f"{i:032x}", "number": f"INC{i:07d}"} for i in range(row_count)
+        ]
+        self.calls = []
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append(dict(params))
+        records = self.records
+        query = params["sysparm_query"]
+        if "sys_id>" in query:
+            last = query.split("sys_id>")[1].split("^")[0]
+            records = [record for record in records if record["sys_id"] > last]
+        offset = params.get("sysparm_offset", 0)
+        page = records[offset : offset + params["sysparm_limit"]]
+        if "sysparm_fields" in params:
+            fields = params["sysparm_fields"].split(",")
+            page = [{field: record[field] for field in fields} for record in page]
+        body = json.dumps({"result": page}).encode()
+        response = MagicMock()
+        response.content = body
+        response.json.return_value = json.loads(body)
+        return response
+
+
+class TestQueryTable(unittest.TestCase):
+    """Tests for paginated table queries."""
+
+    def setUp(self):
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+
+    def query(self, table, **kwargs):
+        params = QueryTableParams(table_name="incident", query="active=true", **kwargs)
+        with patch("requests.get", side_effect=table.get):
+            return list(iter_table_records(self.config, self.auth_manager, params))
+
+    def test_offset_pagination(self):
+        """All pages are walked with sysparm_limit and sysparm_offset."""
+        table = FakeTable(25)
+        records = self.query(table, page_size=10)
+
+        self.assertEqual(records, table.records)
+        self.assertEqual([call["sysparm_offset"] for call in table.calls], [0, 10, 20])
+        self.assertTrue(all(call["sysparm_query"] == "active=true" for call in table.calls))
+
+    def test_keyset_pagination(self):
+        """Keyset pages resume after the last sys_id and always request sys_id."""
+        table = FakeTable(25)
+        records = self.query(table, page_size=10, pagination="keyset", fields=["number"])
+
+        self.assertEqual([record["number"] for record in records], [r["number"] for r in table.records])
+        self.assertEqual(table.calls[0]["sysparm_fields"], "number,sys_id")
+        self.assertEqual(table.calls[0]["sysparm_query"], "active=true^ORDERBYsys_id")
+        self.assertEqual(
+            table.calls[1]["sysparm_query"],
+            f"active=true^sys_id>{table.records[9]['sys_id']}^ORDERBYsys_id",
+        )
+
+    def test_keyset_pagination_of_instance_queries(self):
+        """Keyset pages bound every ^NQ branch and follow the query's own ORDERBY field."""
+        instance = MockInstance(MockInstanceConfig(incidents=120))
+        with serve_in_thread(instance) as url:
+            config = ServerConfig(
+                instance_url=url,
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+                ),
+            )
+            auth_manager = AuthManager(config.auth, config.instance_url)
+
+            def walk(query, **kwargs):
+                params = QueryTableParams(
+                    table_name="incident", query=query, page_size=10, pagination="keyset", **kwargs
+                )
+                return list(iter_table_records(config, auth_manager, params))
+
+            expected = {
+                record["sys_id"]["value"]
+                for record in instance.records("incident")
+                if record["priority"]["value"] in ("1", "2")
+            }
+            records = walk("priority=1^NQpriority=2")
+            self.assertEqual([record["sys_id"] for record in records], sorted(expected))
+
+            records = walk("priority=1^NQpriority=2^ORDERBYDESCcategory", fields=["number"])
+            self.assertEqual({record["sys_id"] for record in records}, expected)
+            self.assertEqual(len(records), len(expected))
+            categories = [record["category"] for record in records]
+            self.assertEqual(categories, sorted(categories, reverse=True))
+
+            with self.assertRaises(ValueError):
+                walk("ORDERBYcategory^ORDERBYpriority")
+            result = query_table(
+                config,
+                auth_manager,
+                QueryTableParams(
+                    table_name="incident",
+                    query="ORDERBYcategory^ORDERBYpriority",
+                    pagination="keyset",
+                ),
+            )
+            self.assertFalse(result["success"])
+
+    def test_max_rows(self):
+        """The last page only requests the rows still needed."""
+        table = FakeTable(100)
+        records = self.query(table, page_size=10, max_rows=25)
+
+        self.assertEqual(len(records), 25)
+        self.assertEqual([call["sysparm_limit"] for call in table.calls], [10, 10, 5])
+
+    def test_query_table_row_cap(self):
+        """query_table stops at 1000 rows unless max_rows is lifted."""
+        table = FakeTable(1500)
+        with patch("requests.get", side_effect=table.get):
+            capped = query_table(
+                self.config,
+                self.auth_manager,
+                QueryTableParams(table_name="incident", query="", page_size=400),
+            )
+        self.assertEqual(capped["count"], 1000)
+        self.assertEqual(len(self.query(table, page_size=400, max_rows=None)), 1500)
+
+    def test_max_bytes(self):
+        """No further pages are fetched once the byte budget is used up."""
+        table = FakeTable(100)
+        records = self.query(table, page_size=10, max_bytes=1)
+
+        self.assertEqual(len(records), 10)
+        self.assertEqual(len(table.calls), 1)
+
+    def test_pages_fetched_lazily(self):
+        """Pages are only requested as the iterator is consumed."""
+        table = FakeTable(100)
+        params = QueryTableParams(table_name="incident", query="", page_size=10)
+        with patch("requests.get", side_effect=table.get):
+            records = iter_table_records(self.config, self.auth_manager, params)
+            next(records)
+            self.assertEqual(len(table.calls), 1)
+
+    @patch("requests.get")
+    def test_query_table_error(self, mock_get):
+        """Errors are reported in the query_table result."""
+        mock_get.side_effect = requests.RequestException("boom")
+        params = QueryTableParams(table_name="incident", query="active=true")
+
+        result = query_table(self.config, self.auth_manager, params)
+
+        self.assertFalse(result["success"])
+        self.assertIn("boom", result["message"])
+
+
+class TestAggregateTable(unittest.TestCase):
+    """Tests for the Aggregate API tool."""
+
+    def setUp(self):
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+
+    @patch("requests.get")
+    def test_group_by_returns_compact_table(self, mock_get):
+        """Grouped aggregates come back as one row per group in a single request."""
+        mock_get.return_value.json.return_value = {
+            "result": [
+                {
+                    "stats": {"count": "12", "avg": {"reassignment_count": "1.5"}},
+                    "groupby_fields": [
+                        {"field": "assignment_group", "value": "a" * 32, "display_value": "Network"}
+                    ],
+                },
+                {
+                    "stats": {"count": "3", "avg": {"reassignment_count": "0"}},
+                    "groupby_fields": [
+                        {"field": "assignment_group", "value": "b" * 32, "display_value": "Software"}
+                    ],
+                },
+            ]
+        }
+        params = AggregateTableParams(
+            table_name="incident",
+            query="priority=1^active=true",
+            group_by=["assignment_group"],
+            avg_fields=["reassignment_count"],
+            having="count^*^>^2",
+        )
+
+        result = aggregate_table(self.config, self.auth_manager, params)
+
+        self.assertEqual(
+            result,
+            {
+                "success": True,
+                "columns": ["assignment_group", "count", "avg(reassignment_count)"],
+                "rows": [["Network", 12, 1.5], ["Software", 3, 0]],
+                "row_count": 2,
+            },
+        )
+        mock_get.assert_called_once()
+        self.assertEqual(
+            mock_get.call_args.args[0], "https://dev12345.service-now.com/api/now/stats/incident"
+        )
+        self.assertEqual(
+            mock_get.call_args.kwargs["params"],
+            {
+                "sysparm_count": "true",
+                "sysparm_display_value": "true",
+                "sysparm_query": "priority=1^active=true",
+                "sysparm_group_by": "assignment_group",
+                "sysparm_avg_fields": "reassignment_count",
+                "sysparm_having": "count^*^>^2",
+            },
+        )
+
+    @patch("requests.get")
+    def test_ungrouped_aggregates(self, mock_get):
+        """Without group_by the single stats object becomes one row."""
+        mock_get.return_value.json.return_value = {
+            "result": {
+                "stats": {
+                    "count": "40",
+                    "min": {"opened_at": "2024-01-02 08:00:00"},
+                    "sum": {"business_duration": "3600"},
+                }
+            }
+        }
+        params = AggregateTableParams(
+            table_name="incident", min_fields=["opened_at"], sum_fields=["business_duration"]
+        )
+
+        result = aggregate_table(self.config, self.auth_manager, params)
+
+        self.assertEqual(result["columns"], ["count", "sum(business_duration)", "min(opened_at)"])
+        self.assertEqual(result["rows"], [[40, 3600, "2024-01-02 08:00:00"]])
+
+    @patch("requests.get")
+    def test_aggregate_error(self, mock_get):
+        """Errors are reported in the result."""
+        mock_get.side_effect = requests.RequestException("boom")
+        result = aggregate_table(
+            self.config, self.auth_manager, AggregateTableParams(table_name="incident")
+        )
+        self.assertFalse(result["success"])
+        self.assertIn("boom", result["message"])
+
+
+if __name__ == "__main__":
+    unittest.main()
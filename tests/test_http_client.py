@@ -0,0 +1,120 @@
+"""
+Tests for the pooled HTTP client.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.incident_tools import GetIncidentByNumberParams, get_incident_by_number
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    HttpClientConfig,
+    ServerConfig,
+)
+from servicenow_mcp.utils.http_client import ServiceNowHttpClient, get_http_client
+
+
+class TestServiceNowHttpClient(unittest.TestCase):
+    """Tests for ServiceNowHttpClient."""
+
+    def setUp(self):
+        self.auth_config = AuthConfig(
+            type=AuthType.BASIC, basic=BasicAuthConfig(username="test", password="test")
+        )
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com", auth=self.auth_config
+        )
+
+    def test_pool_configuration_applied(self):
+        """The session adapters use the configured pool sizes."""
+        client = ServiceNowHttpClient(
+            HttpClientConfig(pool_connections=3, pool_maxsize=7, pool_block=True)
+        )
+        adapter = client.session.get_adapter("https://dev12345.service-now.com")
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertTrue(adapter._pool_block)
+
+    def test_session_reused(self):
+        """The same session is returned while it is in use."""
+        client = ServiceNowHttpClient()
+        self.assertIs(client.session, client.session)
+
+    @patch("servicenow_mcp.utils.http_client.time.monotonic")
+    def test_idle_session_recycled(self, mock_monotonic):
+        """A session idle for longer than idle_timeout is replaced."""
+        client = ServiceNowHttpClient(HttpClientConfig(idle_timeout=30))
+        mock_monotonic.return_value = 100.0
+        first = client.session
+        mock_monotonic.return_value = 120.0
+        self.assertIs(client.session, first)
+        mock_monotonic.return_value = 200.0
+        self.assertIsNot(client.session, first)
+
+    @patch("servicenow_mcp.utils.http_client.time.monotonic")
+    def test_session_kept_while_requests_in_flight(self, mock_monotonic):
+        """A request running longer than idle_timeout keeps its session open."""
+        client = ServiceNowHttpClient(HttpClientConfig(idle_timeout=30))
+        mock_monotonic.return_value = 100.0
+        sessions = []
+
+        def slow_request(method, url, **kwargs):
+            # Another thread asks for the session while this request is running
+            mock_monotonic.return_value = 200.0
+            sessions.append(client.session)
+            return MagicMock(status_code=200)
+
+        with patch.object(requests.Session, "request", side_effect=slow_request):
+            first = client.session
+            client.get("https://example.com/api")
+        self.assertEqual(sessions, [first])
+        mock_monotonic.return_value = 300.0
+        self.assertIsNot(client.session, first)
+
+    def test_request_delegates_to_session(self):
+        """HTTP verbs are sent through the pooled session."""
+        client = ServiceNowHttpClient()
+        with patch.object(requests.Session, "request") as mock_request:
+            client.patch("https://example.com/api", json={"a": 1}, timeout=5)
+        mock_request.assert_called_once_with(
+            "PATCH", "https://example.com/api", json={"a": 1}, timeout=5
+        )
+
+    def test_get_http_client_fallback(self):
+        """Auth managers without a pooled client fall back to requests."""
+        self.assertIs(get_http_client(AuthManager(self.auth_config)), requests)
+        self.assertIs(get_http_client(MagicMock(spec=AuthManager)), requests)
+
+        client = ServiceNowHttpClient()
+        auth_manager = AuthManager(self.auth_config, http_client=client)
+        self.assertIs(get_http_client(auth_manager), client)
+
+    def test_tool_uses_pooled_client(self):
+        """Tools route their requests through the auth manager's client."""
+        client = ServiceNowHttpClient()
+        auth_manager = AuthManager(
+            self.auth_config, self.config.instance_url, http_client=client
+        )
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"result": [{"number": "INC0010001"}]}
+
+        with patch.object(client, "request", return_value=mock_response) as mock_request, patch(
+            "requests.get"
+        ) as mock_module_get:
+            result = get_incident_by_number(
+                self.config, auth_manager, GetIncidentByNumberParams(incident_number="INC0010001")
+            )
+
+        self.assertTrue(result["success"])
+        mock_request.assert_called_once()
+        self.assertEqual(mock_request.call_args[0][0], "GET")
+        mock_module_get.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -473,7 +473,7 @@ class TestKnowledgeBaseTools(unittest.TestCase):
         self.assertEqual(10, kwargs["params"]["sysparm_limit"])
         self.assertEqual(0, kwargs["params"]["sysparm_offset"])
         self.assertEqual("true", kwargs["params"]["sysparm_display_value"])
-        self.assertEqual("active=true^titleLIKEIT^ORdescriptionLIKEIT", kwargs["params"]["sysparm_query"])
+        self.assertEqual("active=true^titleLIKEIT^ORdescriptionLIKEIT^ORDERBYsys_id", kwargs["params"]["sysparm_query"])
 
     @patch("servicenow_mcp.tools.knowledge_base.requests.get")
     def test_list_categories(self, mock_get):
@@ -0,0 +1,173 @@
+"""
+Tests for the per-tool metrics.
+"""
+
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.server_sse import create_starlette_app
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    MetricsConfig,
+    ServerConfig,
+)
+from servicenow_mcp.utils.metrics import ServerMetrics, ToolCall, bind_current_call
+
+
+class TestServerMetrics(unittest.TestCase):
+    """Tests for ServerMetrics on its own."""
+
+    def test_aggregation_and_exposition(self):
+        """Calls are totalled per tool and rendered as Prometheus histograms and counters."""
+        metrics = ServerMetrics(
+            MetricsConfig(enabled=True, duration_buckets=[0.1, 1.0]),
+            cache_stats=lambda: {
+                "result_cache": {"hits": 3, "misses": 1},
+                "reference_cache": {"sys_choice": {"hits": 2, "misses": 5}},
+            },
+        )
+        for status in ("ok", "ok", "error"):
+            call = ToolCall("list_incidents")
+            call.status = status
+            call.response_bytes = 100
+            call.record_upstream(0.05, 2000)
+            call.record_upstream(2.0, 1000)
+            metrics.finish(call)
+        metrics.record_upstream(0.5, 10)  # outside a tool call
+
+        snapshot = metrics.snapshot()
+        tool = snapshot["tools"]["list_incidents"]
+        self.assertEqual(tool["calls"], 3)
+        self.assertEqual(tool["statuses"], {"ok": 2, "error": 1})
+        self.assertEqual(tool["upstream_requests"], 6)
+        self.assertEqual(tool["avg_upstream_requests"], 2)
+        self.assertEqual(tool["upstream_bytes"], 9000)
+        self.assertEqual(tool["avg_response_bytes"], 100)
+        self.assertEqual(snapshot["background_upstream_requests"], 1)
+        self.assertEqual(snapshot["result_cache"], {"hits": 3, "misses": 1})
+
+        text = metrics.prometheus()
+        for line in (
+            'servicenow_mcp_tool_calls_total{tool="list_incidents",status="error"} 1',
+            'servicenow_mcp_tool_calls_total{tool="list_incidents",status="ok"} 2',
+            'servicenow_mcp_tool_duration_seconds_count{tool="list_incidents"} 3',
+            'servicenow_mcp_upstream_request_duration_seconds_bucket'
+            '{tool="list_incidents",le="0.1"} 3',
+            'servicenow_mcp_upstream_request_duration_seconds_bucket'
+            '{tool="list_incidents",le="1.0"} 3',
+            'servicenow_mcp_upstream_request_duration_seconds_bucket'
+            '{tool="list_incidents",le="+Inf"} 6',
+            'servicenow_mcp_upstream_request_duration_seconds_count{tool=""} 1',
+            'servicenow_mcp_upstream_response_bytes_total{tool="list_incidents"} 9000',
+            "servicenow_mcp_result_cache_hits_total 3",
+            'servicenow_mcp_reference_cache_misses_total{table="sys_choice"} 5',
+        ):
+            self.assertIn(line, text.splitlines())
+
+    def test_disabled(self):
+        """Disabled metrics track no calls."""
+        metrics = ServerMetrics()
+        self.assertIsNone(metrics.start("list_incidents"))
+        self.assertEqual(metrics.snapshot()["tools"], {})
+
+    def test_bind_current_call(self):
+        """Wrapped functions see the current call from executor threads."""
+        metrics = ServerMetrics(MetricsConfig(enabled=True))
+        call = metrics.start("update_catalog_item")
+        token = metrics.activate(call)
+        try:
+            wrapped = bind_current_call(lambda: metrics.record_upstream(0.1, 10))
+        finally:
+            metrics.deactivate(token)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [executor.submit(wrapped) for _ in range(4)]:
+                future.result()
+        self.assertEqual(len(call.upstream), 4)
+
+
+class TestServerInstrumentation(unittest.TestCase):
+    """Tests for the metrics recorded by the server against the mock instance."""
+
+    def setUp(self):
+        self.instance = MockInstance(MockInstanceConfig(incidents=50, articles=5))
+        serving = serve_in_thread(self.instance)
+        self.instance_url = serving.__enter__()
+        self.addCleanup(serving.__exit__, None, None, None)
+
+    def server(self, enabled):
+        return ServiceNowMCP(
+            ServerConfig(
+                instance_url=self.instance_url,
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+                ),
+                metrics=MetricsConfig(enabled=enabled),
+            )
+        )
+
+    def get(self, server, path):
+        app = create_starlette_app(server.mcp_server, metrics=server.metrics)
+
+        async def get():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get(path)
+
+        return asyncio.run(get())
+
+    def call(self, server, name, arguments):
+        return json.loads(asyncio.run(server._call_tool_impl(name, arguments))[0].text)
+
+    def test_upstream_requests_attributed_to_tools(self):
+        """Sync and async tools report the requests they make, as seen by the instance."""
+        server = self.server(enabled=True)
+        for name, arguments in (
+            ("list_incidents", {"limit": 5}),
+            ("create_incident", {"short_description": "Printer on fire"}),
+        ):
+            before = dict(self.instance.stats)
+            self.assertTrue(self.call(server, name, arguments)["success"])
+            tool = server.metrics.snapshot(name)["tools"][name]
+            self.assertEqual(
+                tool["upstream_requests"], self.instance.stats["requests"] - before["requests"]
+            )
+            self.assertEqual(
+                tool["upstream_bytes"], self.instance.stats["bytes_out"] - before["bytes_out"]
+            )
+            self.assertEqual(tool["statuses"], {"ok": 1})
+            self.assertGreater(tool["avg_response_bytes"], 0)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(server._call_tool_impl("list_incidents", {"limit": "many"}))
+        reported = self.call(server, "get_server_metrics", {"tool": "list_incidents"})
+        self.assertEqual(list(reported["tools"]), ["list_incidents"])
+        self.assertEqual(
+            reported["tools"]["list_incidents"]["statuses"], {"ok": 1, "exception": 1}
+        )
+
+        response = self.get(server, "/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'servicenow_mcp_tool_calls_total{tool="create_incident",status="ok"} 1',
+            response.text.splitlines(),
+        )
+
+    def test_disabled_server(self):
+        """Without metrics the HTTP clients are not instrumented and /metrics is not served."""
+        server = self.server(enabled=False)
+        self.assertIsNone(server.http_client.metrics)
+        self.call(server, "list_incidents", {"limit": 5})
+        self.assertEqual(self.call(server, "get_server_metrics", {})["tools"], {})
+        self.assertEqual(self.get(server, "/metrics").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
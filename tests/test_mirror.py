@@ -0,0 +1,202 @@
+"""
+Tests for the local table mirror.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.generic_tools import QueryTableParams, query_table
+from servicenow_mcp.tools.incident_tools import (
+    GetIncidentByNumberParams,
+    ListIncidentsParams,
+    get_incident_by_number,
+    list_incidents,
+)
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    MirrorConfig,
+    ServerConfig,
+)
+from servicenow_mcp.utils.mirror import get_mirror
+
+
+def incident(number, updated_on, state=("1", "New"), assigned_to=("u1", "Beth Anglin")):
+    """An incident as returned with sysparm_display_value=all."""
+    sys_id = f"sys{number[-4:]}"
+    return {
+        "sys_id": {"value": sys_id, "display_value": sys_id},
+        "number": {"value": number, "display_value": number},
+        "short_description": {"value": f"Issue {number}", "display_value": f"Issue {number}"},
+        "state": {"value": state[0], "display_value": state[1]},
+        "assigned_to": {"value": assigned_to[0], "display_value": assigned_to[1]},
+        "sys_updated_on": {"value": updated_on, "display_value": updated_on},
+    }
+
+
+class FakeInstance:
+    """Serves incidents for the watermark, keyset and list queries the mirror and tools make."""
+
+    def __init__(self, records):
+        self.records = records
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(params)
+        records = list(self.records)
+        query = params.get("sysparm_query", "")
+        for condition in query.split("^"):
+            if condition.startswith("sys_updated_on>="):
+                since = condition[len("sys_updated_on>="):]
+                records = [r for r in records if r["sys_updated_on"]["value"] >= since]
+            elif condition.startswith("sys_id>"):
+                after = condition[len("sys_id>"):]
+                records = [r for r in records if r["sys_id"]["value"] > after]
+        if "ORDERBYsys_updated_on" in query:
+            records.sort(key=lambda r: (r["sys_updated_on"]["value"], r["sys_id"]["value"]))
+        else:
+            records.sort(key=lambda r: r["sys_id"]["value"])
+
+        offset = int(params.get("sysparm_offset", 0))
+        records = records[offset : offset + int(params["sysparm_limit"])]
+        if params.get("sysparm_fields") == "sys_id":
+            records = [{"sys_id": r["sys_id"]["value"]} for r in records]
+
+        response = MagicMock()
+        response.json.return_value = {"result": records}
+        return response
+
+
+class TestTableMirror(unittest.TestCase):
+    """Tests for TableMirror and the tools reading from it."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+            mirror=MirrorConfig(
+                enabled=True,
+                sqlite_path=os.path.join(directory.name, "mirror.sqlite"),
+                tables=["incident"],
+                page_size=2,
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth, self.config.instance_url)
+        self.mirror = get_mirror(self.config, self.auth_manager)
+        self.instance = FakeInstance([
+            incident("INC0010001", "2025-01-01 10:00:00"),
+            incident("INC0010002", "2025-01-01 10:00:00", state=("2", "In Progress")),
+            incident("INC0010003", "2025-01-01 10:00:00"),
+            incident("INC0010004", "2025-01-02 09:00:00", assigned_to=("", "")),
+            incident("INC0010005", "2025-01-03 08:00:00"),
+        ])
+
+    def sync(self):
+        with patch("requests.get", side_effect=self.instance.get):
+            return self.mirror.sync_table(self.config, self.auth_manager, "incident")
+
+    def test_incremental_sync(self):
+        """Only records at or after the watermark are fetched again."""
+        self.assertEqual(self.sync(), 5)
+        self.assertEqual(len(self.mirror.query("incident")), 5)
+
+        # Three records share a timestamp across a page boundary; none is skipped
+        self.assertEqual(
+            [r["number"]["value"] for r in self.mirror.query("incident", "ORDERBYnumber")],
+            ["INC0010001", "INC0010002", "INC0010003", "INC0010004", "INC0010005"],
+        )
+
+        self.instance.records[1] = incident(
+            "INC0010002", "2025-01-04 12:00:00", state=("6", "Resolved")
+        )
+        self.instance.requests.clear()
+        self.assertEqual(self.sync(), 2)  # the record at the watermark and the updated one
+        self.assertTrue(self.instance.requests[0]["sysparm_query"].startswith(
+            "sys_updated_on>=2025-01-03 08:00:00^"
+        ))
+        updated = self.mirror.query("incident", "number=INC0010002")
+        self.assertEqual(updated[0]["state"]["display_value"], "Resolved")
+
+    def test_tools_served_from_fresh_mirror(self):
+        """Fresh mirrors answer list and get calls without contacting the instance."""
+        self.sync()
+        with patch("requests.get") as mock_get:
+            listed = list_incidents(
+                self.config, self.auth_manager, ListIncidentsParams(state="1", limit=2)
+            )
+            found = get_incident_by_number(
+                self.config,
+                self.auth_manager,
+                GetIncidentByNumberParams(incident_number="inc0010004"),
+            )
+            queried = query_table(
+                self.config,
+                self.auth_manager,
+                QueryTableParams(
+                    table_name="incident", query="assigned_toISEMPTY", fields=["number", "state"]
+                ),
+            )
+        mock_get.assert_not_called()
+
+        self.assertEqual([i["number"] for i in listed["incidents"]], ["INC0010001", "INC0010003"])
+        self.assertEqual(listed["incidents"][0]["state"], "New")
+        self.assertEqual(listed["incidents"][0]["assigned_to"], "Beth Anglin")
+        self.assertEqual(found["incident"]["number"], "INC0010004")
+        self.assertEqual(queried["records"], [{"number": "INC0010004", "state": "1"}])
+
+    def test_query_table_max_bytes_from_mirror(self):
+        """Mirror reads stop at the page reaching max_bytes, as instance walks do."""
+        self.sync()
+        with patch("requests.get") as mock_get:
+            queried = query_table(
+                self.config,
+                self.auth_manager,
+                QueryTableParams(table_name="incident", query="", page_size=2, max_bytes=1),
+            )
+        mock_get.assert_not_called()
+        self.assertEqual(queried["count"], 2)
+
+    def test_fallback_to_instance(self):
+        """Stale tables, recent writes and unsupported queries are read from the instance."""
+        params = ListIncidentsParams(state="1")
+        with patch("requests.get", side_effect=self.instance.get) as mock_get:
+            list_incidents(self.config, self.auth_manager, params)  # never synced
+            self.assertEqual(mock_get.call_count, 1)
+
+            self.mirror.sync_table(self.config, self.auth_manager, "incident")
+            calls = mock_get.call_count
+            list_incidents(self.config, self.auth_manager, params)
+            self.assertEqual(mock_get.call_count, calls)
+
+            list_incidents(
+                self.config, self.auth_manager, ListIncidentsParams(query="caller_id.vip=true")
+            )
+            self.assertEqual(mock_get.call_count, calls + 1)
+
+            self.mirror.mark_written("incident")
+            list_incidents(self.config, self.auth_manager, params)
+            self.assertEqual(mock_get.call_count, calls + 2)
+
+        self.assertFalse(self.mirror.is_fresh("incident", max_staleness=-1))
+
+    def test_reconcile_drops_deleted_records(self):
+        """Records deleted on the instance are removed by reconcile_table."""
+        self.sync()
+        del self.instance.records[2]
+        with patch("requests.get", side_effect=self.instance.get):
+            deleted = self.mirror.reconcile_table(self.config, self.auth_manager, "incident")
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(self.mirror.query("incident", "number=INC0010003"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
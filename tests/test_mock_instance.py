@@ -0,0 +1,159 @@
+"""
+Tests for the mock ServiceNow instance.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.tools.generic_tools import AggregateTableParams, aggregate_table
+from servicenow_mcp.tools.incident_tools import (
+    GetIncidentByNumberParams,
+    ListIncidentsParams,
+    get_incident_by_number,
+    list_incidents,
+)
+from servicenow_mcp.utils.batch import BatchRequest, execute_batch
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+
+SMALL = dict(users=20, groups=3, incidents=50, catalog_items=10, requested_items=20, articles=10)
+
+
+class TestMockInstance(unittest.TestCase):
+    """Tests for MockInstance, directly and through the tools over HTTP."""
+
+    def setUp(self):
+        self.instance = MockInstance(MockInstanceConfig(**SMALL))
+
+    def serve(self, instance=None):
+        """Serve an instance and return a config and auth manager pointing at it."""
+        context = serve_in_thread(instance or self.instance)
+        url = context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+        config = ServerConfig(
+            instance_url=url,
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+            ),
+        )
+        return config, AuthManager(config.auth, config.instance_url)
+
+    def test_generated_data_is_repeatable(self):
+        """The same seed generates the same records."""
+        other = MockInstance(MockInstanceConfig(**SMALL))
+        self.assertEqual(self.instance.records("incident"), other.records("incident"))
+        self.assertEqual(len(self.instance.records("kb_knowledge")), 10)
+
+    def test_relative_dates_follow_the_epoch(self):
+        """Relative dates are resolved against the instance's clock, not the current time."""
+        epoch = datetime(2020, 6, 1, tzinfo=timezone.utc)
+        instance = MockInstance(MockInstanceConfig(**SMALL, epoch=epoch))
+        created = instance.records("incident")[0]["sys_created_on"]["value"]
+        self.assertEqual(created, "2020-06-01 00:00:00")
+        self.assertLess(instance.now() - epoch, timedelta(minutes=1))
+
+        since = (epoch - timedelta(days=30)).strftime("%Y-%m-%d %H:%M:%S")
+        recent = [r for r in instance.records("incident") if r["opened_at"]["value"] >= since]
+        status, body, _ = instance.handle(
+            "GET",
+            "/api/now/table/incident",
+            {
+                "sysparm_query": "opened_at>=javascript:gs.daysAgoStart(30)",
+                "sysparm_fields": "number",
+            },
+        )
+        self.assertEqual(status, 200)
+        self.assertTrue(recent)
+        self.assertEqual(len(body["result"]), len(recent))
+
+    def test_table_api(self):
+        """Queries, paging, fields, display values and reference links follow the Table API."""
+        status, body, headers = self.instance.handle(
+            "GET",
+            "/api/now/table/incident",
+            {
+                "sysparm_query": "active=true^ORDERBYDESCnumber",
+                "sysparm_limit": "2",
+                "sysparm_offset": "1",
+                "sysparm_fields": "number,state,caller_id,caller_id.email",
+                "sysparm_display_value": "true",
+            },
+        )
+        active = [r for r in self.instance.records("incident") if r["active"]["value"] == "true"]
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["X-Total-Count"], str(len(active)))
+        first = body["result"][0]
+        self.assertEqual(first["number"], active[-2]["number"]["value"])
+        self.assertIn(first["state"], ("New", "In Progress", "On Hold"))
+        self.assertEqual(set(first["caller_id"]), {"display_value", "link"})
+        self.assertTrue(first["caller_id.email"].endswith("@example.com"))
+
+        status, body, _ = self.instance.handle("GET", "/api/now/table/incident/missing", {})
+        self.assertEqual((status, body["error"]["message"]), (404, "No Record found"))
+        status, body, _ = self.instance.handle(
+            "GET", "/api/now/table/incident", {"sysparm_query": "caller_id.name=x"}
+        )
+        self.assertEqual(status, 400)
+
+    def test_tools_over_http(self):
+        """Tools run against the served instance, with requests and bytes counted."""
+        config, auth_manager = self.serve()
+
+        listed = list_incidents(config, auth_manager, ListIncidentsParams(state="1", limit=5))
+        self.assertTrue(listed["success"])
+        self.assertTrue(all(i["state"] == "New" for i in listed["incidents"]))
+
+        number = self.instance.records("incident")[0]["number"]["value"]
+        found = get_incident_by_number(
+            config, auth_manager, GetIncidentByNumberParams(incident_number=number)
+        )
+        self.assertEqual(found["incident"]["number"], number)
+
+        counted = aggregate_table(
+            config,
+            auth_manager,
+            AggregateTableParams(table_name="incident", group_by=["state"]),
+        )
+        self.assertEqual(sum(row[1] for row in counted["rows"]), 50)
+
+        self.assertEqual(self.instance.stats["requests"], 3)
+        self.assertEqual(self.instance.stats["by_api"]["stats"]["requests"], 1)
+        self.assertGreater(self.instance.stats["bytes_out"], 0)
+
+    def test_batch_api(self):
+        """Batched writes are applied and answered per sub-request."""
+        config, auth_manager = self.serve()
+        sys_id = self.instance.records("incident")[0]["sys_id"]["value"]
+        results = execute_batch(
+            config,
+            auth_manager,
+            [
+                BatchRequest(
+                    method="POST", path="/api/now/table/incident", body={"short_description": "A"}
+                ),
+                BatchRequest(
+                    method="PATCH", path=f"/api/now/table/incident/{sys_id}", body={"state": "2"}
+                ),
+            ],
+        )
+        self.assertEqual([r.status_code for r in results], [201, 200])
+        self.assertEqual(results[0].body["result"]["number"], "INC0000051")
+        self.assertEqual(self.instance.tables["incident"][sys_id]["state"]["display_value"],
+                         "In Progress")
+        self.assertEqual(self.instance.stats["by_api"], {"batch": {
+            "requests": 1, "bytes_out": self.instance.stats["bytes_out"]
+        }})
+
+    def test_error_injection(self):
+        """Injected errors fail the request with the configured status."""
+        instance = MockInstance(MockInstanceConfig(**SMALL, error_rate=1, error_status=429))
+        config, auth_manager = self.serve(instance)
+        result = list_incidents(config, auth_manager, ListIncidentsParams())
+        self.assertFalse(result["success"])
+        self.assertIn("429", result["message"])
+        self.assertEqual(instance.stats["errors_injected"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+"""
+Tests for the cursor pagination of the list tools.
+"""
+
+import unittest
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.tools.incident_tools import ListIncidentsParams, list_incidents
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.pagination import CursorPage, decode_cursor, encode_cursor
+
+
+class TestCursorPage(unittest.TestCase):
+    """Tests for CursorPage on its own."""
+
+    def test_cursor_round_trip(self):
+        """Cursors decode to the state they were encoded from, and garbage is rejected."""
+        state = {"q": "active=true", "k": "a" * 32}
+        cursor = encode_cursor(state)
+        self.assertNotIn("=", cursor)
+        self.assertEqual(decode_cursor(cursor), state)
+        for cursor in ("not a cursor!", encode_cursor({"k": "abc"})):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+    def test_keyset_page(self):
+        """Unordered queries are ordered by sys_id and resume after the last sys_id."""
+        query_params = {"sysparm_query": "active=true", "sysparm_limit": 2, "sysparm_offset": 0}
+        page = CursorPage(query_params)
+        self.assertEqual(query_params["sysparm_query"], "active=true^ORDERBYsys_id")
+        self.assertIsNone(page.next_cursor([{"sys_id": "a"}]))
+        cursor = page.next_cursor([{"sys_id": "a"}, {"sys_id": {"value": "b"}}])
+
+        query_params = {"sysparm_query": "active=true", "sysparm_limit": 2, "sysparm_offset": 40}
+        CursorPage(query_params, cursor)
+        self.assertEqual(query_params["sysparm_query"], "active=true^sys_id>b^ORDERBYsys_id")
+        self.assertEqual(query_params["sysparm_offset"], 0)
+
+    def test_ordered_page(self):
+        """Queries ordered by one field resume after the last (value, sys_id) pair."""
+        query_params = {"sysparm_query": "active=true^ORDERBYnumber", "sysparm_limit": 2}
+        page = CursorPage(query_params)
+        self.assertEqual(
+            query_params["sysparm_query"], "active=true^ORDERBYnumber^ORDERBYsys_id"
+        )
+        fields = page.cursor_fields(
+            [{"sys_id": "b", "number": "INC1"}, {"sys_id": "a", "number": {"value": "INC2"}}]
+        )
+        self.assertNotIn("cursor_stable", fields)
+
+        query_params = {"sysparm_query": "active=true^ORDERBYnumber", "sysparm_limit": 2}
+        CursorPage(query_params, fields["next_cursor"])
+        self.assertEqual(
+            query_params["sysparm_query"],
+            "active=true^number>INC2^NQactive=true^number=INC2^sys_id>a"
+            "^ORDERBYnumber^ORDERBYsys_id",
+        )
+
+    def test_descending_and_empty_values(self):
+        """Descending orders and empty values, which sort first, get their own conditions."""
+        cases = [
+            ("ORDERBYDESCpriority", "2", "priority<2^NQpriority=2^sys_id>a^NQpriorityISEMPTY"),
+            ("ORDERBYDESCpriority", "", "priorityISEMPTY^sys_id>a"),
+            ("ORDERBYpriority", "", "priorityISEMPTY^sys_id>a^NQpriorityISNOTEMPTY"),
+            ("ORDERBYDESCsys_id", "", "sys_id<a"),
+        ]
+        for query, value, expected in cases:
+            with self.subTest(query=query, value=value):
+                cursor = encode_cursor({"q": f"a=1^NQb=2^{query}", "k": "a", "v": value})
+                query_params = {"sysparm_query": f"a=1^NQb=2^{query}", "sysparm_limit": 2}
+                page = CursorPage(query_params, cursor)
+                conditions = query_params["sysparm_query"].split("^ORDERBY")[0].split("^NQ")
+                # Every branch of the filters is combined with every keyset condition
+                branches = expected.split("^NQ")
+                self.assertEqual(
+                    conditions,
+                    [f"a=1^{branch}" for branch in branches]
+                    + [f"b=2^{branch}" for branch in branches],
+                )
+                self.assertIsNotNone(page.next_cursor([{"sys_id": "b", "priority": ""}] * 2))
+
+    def test_offset_fallback(self):
+        """Pages the keyset cannot position are paged by offset and say so."""
+        records = [{"sys_id": "a", "number": "INC2"}, {"sys_id": "b", "number": "INC1"}]
+        cases = [
+            ({"sysparm_query": "ORDERBYnumber^ORDERBYDESCsys_created_on"}, records),
+            ({"sysparm_query": "ORDERBYnumber", "sysparm_display_value": "true"}, records),
+            ({"sysparm_query": "ORDERBYnumber"}, records),
+            ({"sysparm_query": "ORDERBYnumber"}, [{"sys_id": "a"}, {"sys_id": "b"}]),
+            ({"sysparm_query": "ORDERBYnumber"}, [{"sys_id": "a", "number": "1^2"}] * 2),
+        ]
+        for query_params, page_records in cases:
+            with self.subTest(query_params=query_params, records=page_records):
+                query = query_params["sysparm_query"]
+                fields = CursorPage({**query_params, "sysparm_limit": 2}).cursor_fields(
+                    page_records
+                )
+                self.assertEqual(decode_cursor(fields["next_cursor"])["o"], 2)
+                self.assertIs(fields["cursor_stable"], False)
+
+                next_params = {**query_params, "sysparm_limit": 2}
+                CursorPage(next_params, fields["next_cursor"])
+                self.assertEqual(next_params["sysparm_offset"], 2)
+                self.assertTrue(next_params["sysparm_query"].startswith(query))
+
+    def test_offset_after_keyset(self):
+        """An offset cursor following a keyset page keeps that page's keyset position."""
+        query_params = {"sysparm_query": "ORDERBYname", "sysparm_limit": 2}
+        cursor = encode_cursor({"q": "ORDERBYname", "k": "b", "v": "banana"})
+        page = CursorPage(query_params, cursor)
+        # Not in raw string order, so the next cursor falls back to offset
+        state = decode_cursor(page.next_cursor([
+            {"sys_id": "c", "name": "cherry"}, {"sys_id": "d", "name": "Date"}
+        ]))
+        self.assertEqual(state, {"q": "ORDERBYname", "k": "b", "v": "banana", "o": 2})
+
+        query_params = {"sysparm_query": "ORDERBYname", "sysparm_limit": 2}
+        page = CursorPage(query_params, encode_cursor(state))
+        self.assertEqual(query_params["sysparm_offset"], 2)
+        self.assertTrue(query_params["sysparm_query"].startswith("name>banana^NQ"))
+        state = decode_cursor(page.next_cursor([{"sys_id": "e"}, {"sys_id": "f"}]))
+        self.assertEqual(state["o"], 4)
+        self.assertEqual(state["k"], "b")
+
+    def test_cursor_of_another_query(self):
+        """A cursor is rejected with filters other than those it was issued for."""
+        cursor = CursorPage({"sysparm_query": "active=true", "sysparm_limit": 1}).next_cursor(
+            [{"sys_id": "a"}]
+        )
+        with self.assertRaises(ValueError):
+            CursorPage({"sysparm_query": "active=false", "sysparm_limit": 1}, cursor)
+        # Tools whose query varies between calls check cursors against a key
+        query_params = {"sysparm_query": "start_date>now", "sysparm_limit": 1}
+        CursorPage(query_params, encode_cursor({"q": "upcoming", "k": "a"}), key="upcoming")
+        self.assertEqual(query_params["sysparm_query"], "start_date>now^sys_id>a^ORDERBYsys_id")
+
+
+class TestListToolCursors(unittest.TestCase):
+    """Tests for the cursors of a list tool against the mock instance."""
+
+    def test_list_incidents_cursor(self):
+        """Following next_cursor returns every incident once and stops at the last page."""
+        instance = MockInstance(MockInstanceConfig(incidents=95))
+        with serve_in_thread(instance) as url:
+            config = ServerConfig(
+                instance_url=url,
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+                ),
+            )
+            auth_manager = AuthManager(config.auth, config.instance_url)
+            numbers, cursors = [], [None]
+            while True:
+                result = list_incidents(
+                    config, auth_manager, ListIncidentsParams(limit=20, cursor=cursors[-1])
+                )
+                numbers.extend(incident["number"] for incident in result["incidents"])
+                if result["next_cursor"] is None:
+                    break
+                cursors.append(result["next_cursor"])
+
+            with self.assertRaises(ValueError):
+                list_incidents(
+                    config, auth_manager, ListIncidentsParams(limit=20, state="1", cursor=cursors[1])
+                )
+
+        self.assertEqual(len(cursors), 5)
+        self.assertEqual(len(numbers), 95)
+        self.assertEqual(len(set(numbers)), 95)
+
+    def test_ordered_list_incidents_cursor(self):
+        """Pages of an ordered query are not shifted by records inserted before them."""
+        instance = MockInstance(MockInstanceConfig(incidents=95))
+        with serve_in_thread(instance) as url:
+            config = ServerConfig(
+                instance_url=url,
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+                ),
+            )
+            auth_manager = AuthManager(config.auth, config.instance_url)
+            for query in ("ORDERBYpriority", "ORDERBYDESCpriority"):
+                with self.subTest(query=query):
+                    incidents, cursor = [], None
+                    while True:
+                        result = list_incidents(
+                            config,
+                            auth_manager,
+                            ListIncidentsParams(
+                                limit=20, query=query, display_value=False, cursor=cursor
+                            ),
+                        )
+                        self.assertNotIn("cursor_stable", result)
+                        incidents.extend(result["incidents"])
+                        cursor = result["next_cursor"]
+                        if cursor is None:
+                            break
+                        # Sorts before and after every page, in either order
+                        instance.insert("incident", {"priority": "1", "short_description": "New"})
+                        instance.insert("incident", {"priority": "5", "short_description": "New"})
+
+                    original = [i for i in incidents if i["short_description"] != "New"]
+                    self.assertEqual(len(original), 95)
+                    self.assertEqual(len({i["sys_id"] for i in incidents}), len(incidents))
+                    priorities = [i["priority"] for i in incidents]
+                    self.assertEqual(
+                        priorities, sorted(priorities, reverse=query.startswith("ORDERBYDESC"))
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Tests for record number to sys_id resolution.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.tools.incident_tools import UpdateIncidentParams, update_incident
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.resolver import (
+    resolve_identifiers,
+    resolve_sys_id,
+    resolve_sys_ids,
+)
+
+SYS_ID_1 = "a" * 32
+SYS_ID_2 = "b" * 32
+
+
+def json_response(result):
+    """Build a mock Table API response."""
+    response = MagicMock()
+    response.json.return_value = {"result": result}
+    return response
+
+
+class TestResolver(unittest.TestCase):
+    """Tests for the number resolver."""
+
+    def setUp(self):
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+
+    @patch("requests.get")
+    def test_bulk_resolution_single_query(self, mock_get):
+        """Many numbers are resolved with one numberIN query and then cached."""
+        mock_get.return_value = json_response([
+            {"number": "INC0000001", "sys_id": SYS_ID_1},
+            {"number": "INC0000002", "sys_id": SYS_ID_2},
+        ])
+
+        resolved = resolve_sys_ids(
+            self.config, self.auth_manager, "incident", ["INC0000001", "INC0000002", "INC0000003"]
+        )
+
+        self.assertEqual(resolved, {"INC0000001": SYS_ID_1, "INC0000002": SYS_ID_2})
+        params = mock_get.call_args.kwargs["params"]
+        self.assertEqual(params["sysparm_query"], "numberININC0000001,INC0000002,INC0000003")
+        self.assertEqual(params["sysparm_fields"], "sys_id,number")
+
+        # Cached numbers are not looked up again; unknown ones are
+        resolve_sys_ids(self.config, self.auth_manager, "incident", ["INC0000001", "INC0000003"])
+        self.assertEqual(
+            mock_get.call_args.kwargs["params"]["sysparm_query"], "numberININC0000003"
+        )
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.get")
+    def test_sys_id_passed_through(self, mock_get):
+        """sys_ids are returned without a request."""
+        self.assertEqual(resolve_sys_id(self.config, self.auth_manager, "incident", SYS_ID_1), SYS_ID_1)
+        mock_get.assert_not_called()
+
+    @patch("requests.get")
+    def test_case_insensitive_numbers(self, mock_get):
+        """Numbers are matched regardless of the caller's capitalisation."""
+        mock_get.return_value = json_response([{"number": "CHG0030001", "sys_id": SYS_ID_1}])
+        self.assertEqual(
+            resolve_sys_id(self.config, self.auth_manager, "change_request", "chg0030001"), SYS_ID_1
+        )
+
+    @patch("requests.get")
+    def test_resolve_identifiers_errors(self, mock_get):
+        """Unknown numbers and failed lookups are reported as tool errors."""
+        mock_get.return_value = json_response([])
+        result = resolve_identifiers(self.config, self.auth_manager, "rm_story", ["STRY0000001"])
+        self.assertFalse(result["success"])
+        self.assertIn("STRY0000001", result["message"])
+
+        mock_get.side_effect = requests.RequestException("boom")
+        result = resolve_identifiers(self.config, self.auth_manager, "rm_story", ["STRY0000002"])
+        self.assertFalse(result["success"])
+        self.assertIn("boom", result["message"])
+
+    @patch("requests.put")
+    @patch("requests.get")
+    def test_repeat_incident_writes_single_request(self, mock_get, mock_put):
+        """Only the first write to an incident number needs a lookup."""
+        mock_get.return_value = json_response([{"number": "INC0010001", "sys_id": SYS_ID_1}])
+        mock_put.return_value = json_response({"sys_id": SYS_ID_1, "number": "INC0010001"})
+
+        for state in ("2", "3"):
+            result = update_incident(
+                self.config,
+                self.auth_manager,
+                UpdateIncidentParams(incident_id="INC0010001", state=state),
+            )
+            self.assertTrue(result.success)
+
+        mock_get.assert_called_once()
+        self.assertEqual(mock_put.call_count, 2)
+        self.assertEqual(
+            mock_put.call_args.args[0],
+            f"https://dev12345.service-now.com/api/now/table/incident/{SYS_ID_1}",
+        )
+
+    def test_numbers_resolved_through_the_server(self):
+        """Tools called by the server with a record number update the record it names."""
+        instance = MockInstance(MockInstanceConfig(users=5, groups=1, incidents=0))
+        tools = (
+            ("update_change_request", "change_id", "change_request", "CHG0030001"),
+            ("update_epic", "epic_id", "rm_epic", "EPIC0001001"),
+            ("update_story", "story_id", "rm_story", "STRY0001001"),
+        )
+        records = {
+            table: instance.insert(table, {"number": number, "short_description": "Before"})
+            for _, _, table, number in tools
+        }
+        with serve_in_thread(instance) as url:
+            server = ServiceNowMCP(self.config.model_copy(update={"instance_url": url}))
+            for name, argument, table, number in tools:
+                with self.subTest(tool=name):
+                    result = asyncio.run(
+                        server._call_tool_impl(
+                            name, {argument: number, "short_description": "After"}
+                        )
+                    )
+                    self.assertTrue(json.loads(result[0].text)["success"])
+                    self.assertEqual(records[table]["short_description"]["value"], "After")
+                    self.assertEqual(len(instance.records(table)), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Tests for the response budget of tool results.
+"""
+
+import asyncio
+import json
+import unittest
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.response_budget import (
+    ResponseBudget,
+    ResponseBudgetConfig,
+    ToolBudgetConfig,
+)
+
+
+def records(count, script_chars=100):
+    return [
+        {"sys_id": f"{i:032x}", "name": f"Include{i}", "script": "x" * script_chars, "sys_tags": ""}
+        for i in range(count)
+    ]
+
+
+class TestResponseBudget(unittest.TestCase):
+    """Tests for ResponseBudget on its own."""
+
+    def setUp(self):
+        self.budget = ResponseBudget(
+            ResponseBudgetConfig(
+                max_tokens=1000,
+                max_field_chars=50,
+                tools={"list_script_includes": ToolBudgetConfig(max_bytes=8000)},
+            )
+        )
+
+    def shape(self, tool_name, result):
+        return self.budget.shape(tool_name, result, len(json.dumps(result, indent=2)))
+
+    def test_budgets(self):
+        """Token budgets are converted to bytes and tool budgets replace the defaults."""
+        self.assertEqual(self.budget.budget("list_incidents").max_bytes, 4000)
+        self.assertEqual(self.budget.budget("list_script_includes").max_bytes, 8000)
+        self.assertEqual(self.budget.budget("list_script_includes").max_field_chars, 50)
+        self.assertIsNone(ResponseBudget().budget("list_incidents"))
+        self.assertFalse(ResponseBudget().enabled)
+        self.assertTrue(self.budget.enabled)
+
+    def test_within_budget(self):
+        """Results within their budget are not shaped."""
+        self.assertIsNone(self.shape("list_script_includes", {"items": records(2)}))
+
+    def test_trimmed_to_fit(self):
+        """Low-value fields are dropped and long text truncated before cutting records."""
+        shaped = self.shape("list_incidents", {"success": True, "items": records(20)})
+        self.assertNotIn("continuation", shaped)
+        self.assertEqual(len(shaped["items"]), 20)
+        self.assertNotIn("sys_tags", shaped["items"][0])
+        self.assertTrue(shaped["items"][0]["script"].startswith("x" * 50 + "... [50 more"))
+        self.assertEqual(
+            shaped["response_budget"],
+            {"max_bytes": 4000, "dropped_fields": 20, "truncated_fields": 20},
+        )
+
+    def test_cut_and_continued(self):
+        """Records over the budget are returned page by page through the cursor."""
+        result = {"success": True, "total": 200, "items": records(200)}
+        shaped = self.shape("list_script_includes", result)
+        pages = [shaped]
+        while "continuation" in pages[-1]:
+            pages.append(self.budget.next_page(pages[-1]["continuation"]["cursor"]))
+        self.assertGreater(len(pages), 2)
+        self.assertEqual(shaped["total"], 200)
+        self.assertEqual(shaped["continuation"]["remaining"], 200 - len(shaped["items"]))
+        names = [item["name"] for page in pages for item in page["items"]]
+        self.assertEqual(names, [f"Include{i}" for i in range(200)])
+        for page in pages:
+            self.assertLessEqual(len(json.dumps(page, indent=2)), 8000)
+        # Only the first page is trimmed: the cut records are returned as the tool gave them
+        self.assertTrue(shaped["items"][0]["script"].startswith("x" * 50 + "..."))
+        continued = [item for page in pages[1:] for item in page["items"]]
+        self.assertEqual(continued, records(200)[len(shaped["items"]) :])
+        for page in pages[1:]:
+            self.assertNotIn("response_budget", page)
+
+        self.assertFalse(self.budget.next_page("unknown.10")["success"])
+        self.assertFalse(self.budget.next_page(shaped["continuation"]["cursor"] + "x")["success"])
+
+    def test_oversized_record_trimmed_when_continued(self):
+        """A cut record larger than the budget on its own is trimmed when it is served."""
+        items = records(100)
+        items[80]["script"] = "x" * 20000
+        shaped = self.shape("list_script_includes", {"items": items})
+        pages = [shaped]
+        while "continuation" in pages[-1]:
+            pages.append(self.budget.next_page(pages[-1]["continuation"]["cursor"]))
+        continued = {item["name"]: (page, item) for page in pages[1:] for item in page["items"]}
+        page, item = continued["Include80"]
+        self.assertEqual(page["items"], [item])
+        self.assertNotIn("sys_tags", item)
+        self.assertTrue(item["script"].startswith("x" * 50 + "... [19950 more"))
+        self.assertEqual(page["response_budget"]["truncated_fields"], 1)
+        self.assertEqual(continued["Include81"][1], records(100)[81])
+
+    def test_list_and_text_results(self):
+        """List results are wrapped to carry the continuation; plain text is left alone."""
+        shaped = self.shape("list_incidents", records(100))
+        self.assertIn("continuation", shaped)
+        self.assertLess(len(shaped["items"]), 100)
+        self.assertIsNone(self.budget.shape("list_incidents", "x" * 10000, 10000))
+
+    def test_invalid_section(self):
+        """An invalid configuration section disables the budget."""
+        self.assertFalse(ResponseBudget.from_package_config({"max_bytes": "lots"}).enabled)
+
+
+class TestServerResponseBudget(unittest.TestCase):
+    """Tests for the response budget applied by the server."""
+
+    def test_list_incidents_continued(self):
+        """A large list_incidents result is cut, and get_more_results returns the rest."""
+        instance = MockInstance(MockInstanceConfig(incidents=300))
+        with serve_in_thread(instance) as url:
+            server = ServiceNowMCP(
+                ServerConfig(
+                    instance_url=url,
+                    auth=AuthConfig(
+                        type=AuthType.BASIC,
+                        basic=BasicAuthConfig(username="admin", password="admin"),
+                    ),
+                )
+            )
+            # The shipped configuration sets no budget
+            self.assertFalse(server.response_budget.enabled)
+            self.assertNotIn("get_more_results", [tool.name for tool in server.tool_list])
+            server.response_budget = ResponseBudget(ResponseBudgetConfig(max_bytes=30000))
+
+            def call(name, arguments):
+                text = asyncio.run(server._call_tool_impl(name, arguments))[0].text
+                self.assertLessEqual(len(text.encode()), 30000)
+                return json.loads(text)
+
+            pages = [call("list_incidents", {"limit": 300})]
+            while "continuation" in pages[-1]:
+                cursor = pages[-1]["continuation"]["cursor"]
+                pages.append(call("get_more_results", {"cursor": cursor}))
+        numbers = [incident["number"] for page in pages for incident in page["incidents"]]
+        self.assertEqual(len(numbers), 300)
+        self.assertEqual(len(set(numbers)), 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
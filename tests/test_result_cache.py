@@ -0,0 +1,121 @@
+"""
+Tests for the tool result cache.
+"""
+
+import asyncio
+import json
+import unittest
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.tools.incident_tools import ListIncidentsParams
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.result_cache import ResultCacheConfig, ToolResultCache
+
+
+class TestToolResultCache(unittest.TestCase):
+    """Tests for ToolResultCache."""
+
+    def setUp(self):
+        self.cache = ToolResultCache.from_package_config({
+            "tools": {
+                "list_incidents": {"ttl": 30, "tables": ["incident"]},
+                "list_articles": {"ttl": 0, "tables": ["kb_knowledge"]},
+            },
+            "writes": {"update_incident": ["incident"]},
+        })
+
+    def test_key_canonicalises_params(self):
+        """Calls that only differ in explicit defaults share a key."""
+        self.assertEqual(
+            self.cache.key("list_incidents", ListIncidentsParams()),
+            self.cache.key("list_incidents", ListIncidentsParams(limit=10, offset=0)),
+        )
+        self.assertNotEqual(
+            self.cache.key("list_incidents", ListIncidentsParams()),
+            self.cache.key("list_incidents", ListIncidentsParams(limit=5)),
+        )
+
+    def test_only_listed_tools_cached(self):
+        """Tools without a policy or with a TTL of 0 are not cached."""
+        self.assertTrue(self.cache.is_cached("list_incidents"))
+        self.assertFalse(self.cache.is_cached("list_articles"))
+        self.assertFalse(self.cache.is_cached("get_user"))
+
+    def test_result_from_before_write_not_stored(self):
+        """A read that overlapped a write does not store its result."""
+        generation = self.cache.generation()
+        self.cache.invalidate_for("update_incident")
+        self.cache.set("list_incidents", "k", "stale", generation)
+        self.assertIsNone(self.cache.get("list_incidents", "k"))
+
+    def test_invalid_config_disables_cache(self):
+        """An invalid result_cache section caches nothing."""
+        cache = ToolResultCache.from_package_config({"tools": {"list_incidents": {"ttl": -1}}})
+        self.assertEqual(cache.config, ResultCacheConfig())
+
+
+class TestServerResultCache(unittest.TestCase):
+    """Tests for result caching in _call_tool_impl."""
+
+    def setUp(self):
+        self.server = ServiceNowMCP(
+            ServerConfig(
+                instance_url="https://dev12345.service-now.com",
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="test", password="test")
+                ),
+            )
+        )
+        self.calls = []
+
+        def list_incidents(config, auth_manager, params):
+            self.calls.append(("list_incidents", params.limit))
+            return {"success": True, "incidents": [], "call": len(self.calls)}
+
+        def update_incident(config, auth_manager, params):
+            self.calls.append(("update_incident", params.incident_id))
+            return {"success": True}
+
+        for name, func in (("list_incidents", list_incidents), ("update_incident", update_incident)):
+            self.server.tool_definitions[name] = (func,) + self.server.tool_definitions[name][1:]
+
+    def call(self, name, arguments):
+        result = asyncio.run(self.server._call_tool_impl(name, arguments))
+        return json.loads(result[0].text)
+
+    def test_repeated_call_served_from_cache(self):
+        """The second identical call does not run the tool."""
+        first = self.call("list_incidents", {"limit": 5})
+        second = self.call("list_incidents", {"limit": 5})
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, [("list_incidents", 5)])
+
+        self.call("list_incidents", {"limit": 6})
+        self.assertEqual(len(self.calls), 2)
+
+    def test_write_invalidates(self):
+        """A write to the incident table drops cached incident results."""
+        self.call("list_incidents", {"limit": 5})
+        self.call("update_incident", {"incident_id": "INC0010001", "state": "2"})
+        self.call("list_incidents", {"limit": 5})
+
+        self.assertEqual(
+            self.calls,
+            [("list_incidents", 5), ("update_incident", "INC0010001"), ("list_incidents", 5)],
+        )
+
+    def test_failures_not_cached(self):
+        """Failed results are not reused."""
+        definition = self.server.tool_definitions["list_incidents"]
+        self.server.tool_definitions["list_incidents"] = (
+            lambda config, auth_manager, params: self.calls.append(1) or {"success": False},
+        ) + definition[1:]
+
+        self.call("list_incidents", {})
+        self.call("list_incidents", {})
+        self.assertEqual(len(self.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
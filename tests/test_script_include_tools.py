@@ -98,7 +98,7 @@ class TestScriptIncludeTools(unittest.TestCase):
         self.assertEqual(self.auth_manager.get_headers(), kwargs["headers"])
         self.assertEqual(10, kwargs["params"]["sysparm_limit"])
         self.assertEqual(0, kwargs["params"]["sysparm_offset"])
-        self.assertEqual("active=true^client_callable=true^nameLIKETest", kwargs["params"]["sysparm_query"])
+        self.assertEqual("active=true^client_callable=true^nameLIKETest^ORDERBYsys_id", kwargs["params"]["sysparm_query"])
 
     @patch("servicenow_mcp.tools.script_include_tools.requests.get")
     def test_get_script_include(self, mock_get):
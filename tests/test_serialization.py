@@ -0,0 +1,125 @@
+"""
+Tests for the serialization of tool results.
+"""
+
+import asyncio
+import json
+import sys
+import unittest
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    SerializationConfig,
+    ServerConfig,
+)
+from servicenow_mcp.utils.serialization import ToolOutputSerializer, serialize_tool_output
+
+try:
+    import orjson  # noqa: F401
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+RESULT = {"success": True, "incidents": [{"number": "INC0010001", "short_description": "Café"}]}
+
+
+class Result(BaseModel):
+    success: bool
+    message: str
+
+
+class TestToolOutputSerializer(unittest.TestCase):
+    """Tests for ToolOutputSerializer in each mode."""
+
+    def test_indented(self):
+        """By default results are indented and JSON strings re-indented."""
+        self.assertEqual(serialize_tool_output(RESULT, "t"), json.dumps(RESULT, indent=2))
+        self.assertEqual(
+            serialize_tool_output(json.dumps(RESULT), "t"), json.dumps(RESULT, indent=2)
+        )
+        self.assertEqual(serialize_tool_output("not json", "t"), "not json")
+        self.assertEqual(serialize_tool_output([1, 2], "t"), "[\n  1,\n  2\n]")
+        model = Result(success=True, message="ok")
+        self.assertEqual(serialize_tool_output(model, "t"), model.model_dump_json(indent=2))
+
+    def test_compact(self):
+        """Compact results have no whitespace and strings are passed through."""
+        serializer = ToolOutputSerializer(SerializationConfig(compact=True))
+        text = serializer.serialize(RESULT, "t")
+        self.assertNotIn("\n", text)
+        self.assertNotIn(": ", text)
+        self.assertIn("Café", text)
+        self.assertEqual(json.loads(text), RESULT)
+
+        serialized = json.dumps(RESULT, indent=4)
+        self.assertIs(serializer.serialize(serialized, "t"), serialized)
+
+        model = Result(success=True, message="ok")
+        with patch.object(Result, "model_dump") as mock_dump:
+            self.assertEqual(serializer.serialize(model, "t"), model.model_dump_json())
+        mock_dump.assert_not_called()
+
+    def test_unserializable_result(self):
+        """A result that cannot be dumped is reported as an error."""
+        serializer = ToolOutputSerializer(SerializationConfig(compact=True))
+        error = json.loads(serializer.serialize({"value": object()}, "t"))
+        self.assertEqual(error["error"], "Serialization failed for tool t")
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_orjson_backend(self):
+        """orjson produces the same JSON as json, falling back to json where it cannot."""
+        indented = ToolOutputSerializer(SerializationConfig(backend="orjson"))
+        text = indented.serialize(RESULT, "t")
+        self.assertIn('\n  "success": true', text)
+        self.assertEqual(json.loads(text), RESULT)
+
+        # Compact output is the same text, as json keeps non-ASCII characters then too
+        json_backend = ToolOutputSerializer(SerializationConfig(compact=True))
+        orjson_backend = ToolOutputSerializer(SerializationConfig(compact=True, backend="orjson"))
+        self.assertEqual(orjson_backend.serialize(RESULT, "t"), json_backend.serialize(RESULT, "t"))
+        # Integer keys are rejected by orjson
+        self.assertEqual(orjson_backend.serialize({1: "a"}, "t"), '{"1":"a"}')
+
+    def test_orjson_missing(self):
+        """Selecting orjson without it installed fails when the serializer is created."""
+        with patch.dict(sys.modules, {"orjson": None}):
+            with self.assertRaises(ImportError) as raised:
+                ToolOutputSerializer(SerializationConfig(backend="orjson"))
+        self.assertIn("servicenow-mcp[orjson]", str(raised.exception))
+
+
+class TestServerSerialization(unittest.TestCase):
+    """Tests for the serialization of tool results by the server."""
+
+    def test_compact_server(self):
+        """A server configured for compact output returns unindented results."""
+        instance = MockInstance(MockInstanceConfig(incidents=20))
+        with serve_in_thread(instance) as url:
+            config = ServerConfig(
+                instance_url=url,
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+                ),
+            )
+            indented = ServiceNowMCP(config)
+            compact = ServiceNowMCP(
+                config.model_copy(update={"serialization": SerializationConfig(compact=True)})
+            )
+            arguments = {"limit": 5}
+            expected = asyncio.run(indented._call_tool_impl("list_incidents", arguments))[0].text
+            text = asyncio.run(compact._call_tool_impl("list_incidents", arguments))[0].text
+        self.assertEqual(json.loads(text), json.loads(expected))
+        self.assertNotIn("\n", text)
+        self.assertLess(len(text), len(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
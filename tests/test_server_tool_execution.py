@@ -0,0 +1,177 @@
+"""
+Tests for tool execution in the ServiceNow MCP server.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.tools.incident_tools import ListIncidentsParams, list_incidents_async
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.http_client import ServiceNowHttpClient
+
+
+class TestServerToolExecution(unittest.TestCase):
+    """Tests for running sync and async tools from _call_tool_impl."""
+
+    def setUp(self):
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="test", password="test")
+            ),
+            max_tool_threads=4,
+        )
+        self.server = ServiceNowMCP(self.config)
+
+    def _mock_instance(self, handler):
+        """Route the server's async HTTP client to an in-process handler."""
+        return patch.object(
+            self.server.async_http_client,
+            "_create_client",
+            return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    def test_sync_tools_run_concurrently(self):
+        """Slow synchronous tools overlap instead of blocking the event loop."""
+        threads = set()
+
+        def slow_tool(config, auth_manager, params):
+            threads.add(threading.get_ident())
+            time.sleep(0.2)
+            return {"success": True}
+
+        definition = self.server.tool_definitions["create_incident"]
+        self.server.tool_definitions["create_incident"] = (slow_tool,) + definition[1:]
+
+        async def run():
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    self.server._call_tool_impl("create_incident", {"short_description": "x"})
+                    for _ in range(4)
+                )
+            )
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+        self.assertLess(elapsed, 0.6)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_async_tool_awaited(self):
+        """Async tools are awaited on the event loop and use the async client."""
+
+        def handler(request):
+            self.assertEqual(request.url.path, "/api/now/table/incident")
+            self.assertEqual(request.url.params["sysparm_limit"], "5")
+            return httpx.Response(
+                200, json={"result": [{"sys_id": "abc", "number": "INC0010001"}]}
+            )
+
+        with self._mock_instance(handler):
+            result = asyncio.run(self.server._call_tool_impl("list_incidents", {"limit": 5}))
+
+        payload = json.loads(result[0].text)
+        self.assertTrue(payload["success"])
+        self.assertEqual(payload["incidents"][0]["number"], "INC0010001")
+
+    def test_async_tools_block_off_the_event_loop(self):
+        """Header (token) and mirror lookups of the async tools run in worker threads."""
+        threads = []
+
+        def get_headers():
+            threads.append(threading.get_ident())
+            return {"Authorization": "Basic x"}
+
+        def read_from_mirror(config, auth_manager, table, query_params):
+            threads.append(threading.get_ident())
+            return None
+
+        def handler(request):
+            return httpx.Response(200, json={"result": [{"sys_id": "abc", "number": "INC0010001"}]})
+
+        with self._mock_instance(handler), patch.object(
+            self.server.auth_manager, "get_headers", get_headers
+        ), patch("servicenow_mcp.tools.incident_tools.read_from_mirror", read_from_mirror):
+            for name, arguments in (
+                ("list_incidents", {"limit": 5}),
+                ("get_incident_by_number", {"incident_number": "INC0010001"}),
+            ):
+                result = asyncio.run(self.server._call_tool_impl(name, arguments))
+                self.assertTrue(json.loads(result[0].text)["success"])
+
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_list_incidents_async_error(self):
+        """HTTP errors from the async client are reported in the result."""
+
+        def handler(request):
+            return httpx.Response(500, json={"error": "boom"})
+
+        async def run():
+            with self._mock_instance(handler):
+                return await list_incidents_async(
+                    self.config, self.server.auth_manager, ListIncidentsParams()
+                )
+
+        result = asyncio.run(run())
+        self.assertFalse(result["success"])
+        self.assertEqual(result["incidents"], [])
+
+
+class TestServerHttpClient(unittest.TestCase):
+    """Tests that tools run by the server send their requests through the pooled client."""
+
+    # Tools declared as (auth_manager, server_config, params), one per module
+    TOOLS = {
+        "list_change_requests": "change_request",
+        "list_changesets": "sys_update_set",
+        "list_epics": "rm_epic",
+        "list_scrum_tasks": "rm_scrum_task",
+        "list_stories": "rm_story",
+    }
+
+    def test_swapped_argument_tools_use_the_pooled_client(self):
+        """Tools declaring their arguments in the other order still get the auth manager."""
+        pooled = []
+        send = ServiceNowHttpClient.request
+
+        def request(client, method, url, **kwargs):
+            pooled.append(url)
+            return send(client, method, url, **kwargs)
+
+        unpooled = AssertionError("Request sent without the pooled client")
+        instance = MockInstance(MockInstanceConfig(users=5, groups=1, incidents=0))
+        with serve_in_thread(instance) as url, patch.object(
+            ServiceNowHttpClient, "request", request
+        ), patch("requests.get", side_effect=unpooled), patch(
+            "requests.put", side_effect=unpooled
+        ):
+            server = ServiceNowMCP(
+                ServerConfig(
+                    instance_url=url,
+                    auth=AuthConfig(
+                        type=AuthType.BASIC,
+                        basic=BasicAuthConfig(username="admin", password="admin"),
+                    ),
+                )
+            )
+            for name, table in self.TOOLS.items():
+                with self.subTest(tool=name):
+                    pooled.clear()
+                    result = asyncio.run(server._call_tool_impl(name, {"limit": 5}))
+                    self.assertTrue(json.loads(result[0].text)["success"])
+                    self.assertEqual(len(pooled), 1)
+                    self.assertIn(f"/api/now/table/{table}", pooled[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for the server startup: only the tool modules of the active package are imported.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from servicenow_mcp.utils.tool_utils import TOOL_SPECS
+
+# Imports the server and starts it, printing the tool modules loaded at each step
+SCRIPT = """
+import json, sys
+
+def tool_modules():
+    return sorted(
+        name.rsplit(".", 1)[1] for name in sys.modules if name.startswith("servicenow_mcp.tools.")
+    )
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+imported = tool_modules()
+server = ServiceNowMCP(
+    ServerConfig(
+        instance_url="https://dev12345.service-now.com",
+        auth=AuthConfig(
+            type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+        ),
+    )
+)
+report = {"imported": imported, "started": tool_modules(), "tools": server.enabled_tool_names}
+print(json.dumps(report))
+"""
+
+
+def start_server(package):
+    """Start the server in a fresh interpreter; returns its report and -X importtime modules."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, MCP_TOOL_PACKAGE=package),
+        check=True,
+    )
+    report = json.loads(process.stdout.strip().splitlines()[-1])
+    imported = [
+        line.rsplit("|", 1)[1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:") and "imported package" not in line
+    ]
+    return report, imported
+
+
+class TestStartup(unittest.TestCase):
+    """Startup import tests, each in a fresh interpreter."""
+
+    def test_no_tool_module_imported_with_the_server(self):
+        """Importing the server imports no tool module."""
+        report, imported = start_server("none")
+        self.assertEqual(report["imported"], [])
+        tool_modules = [name for name in imported if name.startswith("servicenow_mcp.tools.")]
+        self.assertEqual(tool_modules, [])
+        self.assertIn("servicenow_mcp.server", imported)
+        self.assertEqual(report["started"], [])
+
+    def test_only_package_modules_imported(self):
+        """Starting with a package imports the modules of its tools and their dependencies."""
+        report, _imported = start_server("service_desk")
+        needed = {TOOL_SPECS[name][0] for name in report["tools"] if name in TOOL_SPECS}
+        self.assertEqual(
+            needed, {"incident_tools", "generic_tools", "user_tools", "knowledge_base"}
+        )
+        self.assertEqual(set(report["started"]), needed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for the precomputed tool schemas.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.tool_schemas import ToolSchemaCache, generate_tool_schemas
+
+
+class TestToolSchemas(unittest.TestCase):
+    """Tests for generate_tool_schemas, ToolSchemaCache and list_tools."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "schemas", "tools.json")
+
+    def server(self, **config):
+        return ServiceNowMCP(
+            ServerConfig(
+                instance_url="https://dev12345.service-now.com",
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+                ),
+                **config,
+            )
+        )
+
+    def test_list_tools_served_from_memory(self):
+        """Schemas are generated at startup and not again when listing tools."""
+        server = self.server()
+        with patch.object(BaseModel, "model_json_schema") as mock_schema:
+            tools = asyncio.run(server._list_tools_impl())
+            asyncio.run(server._list_tools_impl())
+        mock_schema.assert_not_called()
+
+        by_name = {tool.name: tool for tool in tools}
+        self.assertIn("list_tool_packages", by_name)
+        self.assertEqual(
+            by_name["list_incidents"].inputSchema,
+            server.tool_definitions["list_incidents"][1].model_json_schema(),
+        )
+        enabled = set(server.enabled_tool_names) & set(server.tool_definitions)
+        # With list_tool_packages and get_server_metrics; no response budget is configured
+        self.assertEqual(len(tools), len(enabled) + 2)
+
+    def test_schema_cache(self):
+        """A second server loads the schemas from the cache file without generating any."""
+        tools = asyncio.run(self.server(tool_schema_cache=self.path)._list_tools_impl())
+        with open(self.path) as f:
+            self.assertIn("list_incidents", json.load(f)["schemas"])
+
+        with patch.object(BaseModel, "model_json_schema") as mock_schema:
+            cached = asyncio.run(self.server(tool_schema_cache=self.path)._list_tools_impl())
+        mock_schema.assert_not_called()
+        self.assertEqual(
+            [tool.model_dump() for tool in cached], [tool.model_dump() for tool in tools]
+        )
+
+    def test_stale_or_unreadable_cache(self):
+        """Schemas cached under another key or in a corrupt file are regenerated."""
+        definitions = self.server().tool_definitions
+        cache = ToolSchemaCache(self.path)
+        cache.save("another-key", {"list_incidents": {"stale": True}})
+        schemas = generate_tool_schemas(definitions, ["list_incidents"], cache)
+        self.assertNotIn("stale", schemas["list_incidents"])
+
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        schemas = generate_tool_schemas(definitions, ["list_incidents", "unknown"], cache)
+        self.assertEqual(list(schemas), ["list_incidents"])
+
+
+if __name__ == "__main__":
+    unittest.main()
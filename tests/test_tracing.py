@@ -0,0 +1,127 @@
+"""
+Tests for the OpenTelemetry tracing of tool calls.
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.testing import MockInstance, MockInstanceConfig, serve_in_thread
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    ServerConfig,
+    TracingConfig,
+)
+from servicenow_mcp.utils.tracing import Tracing
+
+
+def attributes(span):
+    """Attributes of an OTLP/JSON span as a plain dict."""
+    return {
+        attribute["key"]: next(iter(attribute["value"].values()))
+        for attribute in span["attributes"]
+    }
+
+
+class TestTracingDisabled(unittest.TestCase):
+    """Tests for tracing when it is not enabled."""
+
+    def test_no_spans(self):
+        """Spans are no-op contexts and the HTTP clients are not traced."""
+        tracing = Tracing()
+        self.assertFalse(tracing.enabled)
+        with tracing.span("call_tool list_incidents") as span:
+            self.assertIsNone(span)
+
+        server = ServiceNowMCP(
+            ServerConfig(
+                instance_url="https://dev12345.service-now.com",
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+                ),
+            )
+        )
+        self.assertIsNone(server.http_client.tracing)
+        self.assertIsNone(server.async_http_client.tracing)
+
+
+@unittest.skipUnless(importlib.util.find_spec("opentelemetry.sdk"), "OpenTelemetry not installed")
+class TestTracing(unittest.TestCase):
+    """Tests for the spans recorded by the server against the mock instance."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "traces", "spans.jsonl")
+
+        serving = serve_in_thread(MockInstance(MockInstanceConfig(incidents=20, articles=5)))
+        instance_url = serving.__enter__()
+        self.addCleanup(serving.__exit__, None, None, None)
+
+        self.server = ServiceNowMCP(
+            ServerConfig(
+                instance_url=instance_url,
+                auth=AuthConfig(
+                    type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="admin")
+                ),
+                tracing=TracingConfig(enabled=True, file_path=self.path),
+            )
+        )
+
+    def spans(self):
+        """Flush the spans and read them back from the OTLP/JSON file."""
+        self.server.tracing.shutdown()
+        spans = []
+        with open(self.path) as f:
+            for line in f:
+                for resource in json.loads(line)["resourceSpans"]:
+                    for scope in resource["scopeSpans"]:
+                        spans.extend(scope["spans"])
+        return {span["name"]: span for span in spans}
+
+    def test_tool_and_request_spans(self):
+        """Tool calls have child spans for validation, requests and serialization."""
+        for name, arguments in (
+            ("list_incidents", {"limit": 5}),
+            ("create_incident", {"short_description": "Printer on fire"}),
+        ):
+            asyncio.run(self.server._call_tool_impl(name, arguments))
+        with self.assertRaises(ValueError):
+            asyncio.run(self.server._call_tool_impl("get_incident_by_number", {}))
+        spans = self.spans()
+
+        for tool, request in (
+            ("list_incidents", "GET table incident"),
+            ("create_incident", "POST table incident"),
+        ):
+            root = spans[f"call_tool {tool}"]
+            self.assertEqual(root["parentSpanId"], "")
+            self.assertEqual(attributes(root)["mcp.tool.status"], "ok")
+            self.assertEqual(spans[request]["parentSpanId"], root["spanId"])
+            self.assertEqual(spans[request]["traceId"], root["traceId"])
+            self.assertEqual(spans[request]["kind"], 1)
+
+        listed = attributes(spans["GET table incident"])
+        self.assertEqual(listed["servicenow.table"], "incident")
+        self.assertEqual(listed["http.response.status_code"], "200")
+        self.assertEqual(listed["servicenow.rows"], "5")
+        created = attributes(spans["POST table incident"])
+        self.assertEqual(created["http.response.status_code"], "201")
+        self.assertEqual(created["servicenow.rows"], "1")
+
+        for child in ("validate_params", "serialize_tool_output"):
+            self.assertIn(spans[child]["parentSpanId"], {s["spanId"] for s in spans.values()})
+
+        failed = spans["call_tool get_incident_by_number"]
+        self.assertEqual(failed["status"]["code"], 2)
+        self.assertIn("exception", [event["name"] for event in failed["events"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,7 +26,13 @@ from servicenow_mcp.tools.user_tools import (
     update_group,
     update_user,
 )
-from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    BatchConfig,
+    ServerConfig,
+)
 
 
 class TestUserTools(unittest.TestCase):
@@ -338,9 +344,12 @@ class TestUserTools(unittest.TestCase):
     @patch("servicenow_mcp.tools.user_tools.get_user")
     @patch("requests.post")
     def test_add_group_members(self, mock_post, mock_get_user):
-        """Test add_group_members function."""
+        """Test add_group_members function without the Batch API."""
+        self.config.batch = BatchConfig(enabled=False, max_parallel=1)
+
         # Configure mocks
         mock_post_response = MagicMock()
+        mock_post_response.status_code = 200
         mock_post_response.raise_for_status = MagicMock()
         mock_post.return_value = mock_post_response
         
@@ -377,9 +386,12 @@ class TestUserTools(unittest.TestCase):
     @patch("requests.get")
     @patch("requests.delete")
     def test_remove_group_members(self, mock_delete, mock_get, mock_get_user):
-        """Test remove_group_members function."""
+        """Test remove_group_members function without the Batch API."""
+        self.config.batch = BatchConfig(enabled=False, max_parallel=1)
+
         # Configure mocks
         mock_delete_response = MagicMock()
+        mock_delete_response.status_code = 200
         mock_delete_response.raise_for_status = MagicMock()
         mock_delete.return_value = mock_delete_response
         
@@ -428,7 +440,7 @@ class TestUserTools(unittest.TestCase):
         mock_get.assert_called_once()
         get_call_args = mock_get.call_args
         self.assertEqual(get_call_args[0][0], f"{self.config.api_url}/table/sys_user_grmember")
-        self.assertEqual(get_call_args[1]["params"]["sysparm_query"], "group=group123^user=user123")
+        self.assertEqual(get_call_args[1]["params"]["sysparm_query"], "group=group123^userINuser123")
         
         mock_delete.assert_called_once()
         delete_call_args = mock_delete.call_args
@@ -0,0 +1,120 @@
+"""
+Tests for the RITM variable tools.
+"""
+
+import math
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.tools.variable_tools import (
+    SYS_ID_IN_CHUNK_SIZE,
+    GetRITMVariablesParams,
+    get_ritm_variables,
+)
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+
+
+class FakeInstance:
+    """Serves sc_item_option_mtom and sc_item_option for a RITM with n variables."""
+
+    def __init__(self, variable_count):
+        self.options = {
+            f"opt{i}": {
+                "sys_id": f"opt{i}",
+                "value": f"value {i}",
+                "item_option_new": {"link": "...", "value": f"q{i}"},
+                "item_option_new.question_text": f"Question {i}?",
+            }
+            for i in range(variable_count)
+        }
+        self.round_trips = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.round_trips += 1
+        response = MagicMock()
+        query = params["sysparm_query"]
+        if url.endswith("/table/sc_item_option_mtom"):
+            result = [{"sc_item_option": {"value": sys_id}} for sys_id in self.options]
+        elif url.endswith("/table/sc_item_option"):
+            sys_ids = query[len("sys_idIN"):].split(",")
+            assert len(sys_ids) <= SYS_ID_IN_CHUNK_SIZE
+            result = [self.options[sys_id] for sys_id in sys_ids]
+        else:
+            raise AssertionError(f"Unexpected request: {url}")
+        response.json.return_value = {"result": result}
+        return response
+
+
+class TestGetRITMVariables(unittest.TestCase):
+    """Tests for get_ritm_variables."""
+
+    def setUp(self):
+        self.config = ServerConfig(
+            instance_url="https://dev12345.service-now.com",
+            auth=AuthConfig(
+                type=AuthType.BASIC, basic=BasicAuthConfig(username="admin", password="password")
+            ),
+        )
+        self.auth_manager = AuthManager(self.config.auth)
+        self.params = GetRITMVariablesParams(ritm_sys_id="ritm1")
+
+    def test_variables_returned_in_order(self):
+        """Questions are read through the dot-walked field, in mapping order."""
+        instance = FakeInstance(3)
+        with patch("requests.get", side_effect=instance.get) as mock_get:
+            result = get_ritm_variables(self.config, self.auth_manager, self.params)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            result["variables"],
+            [{"question": f"Question {i}?", "value": f"value {i}"} for i in range(3)],
+        )
+        option_params = mock_get.call_args_list[1].kwargs["params"]
+        self.assertEqual(option_params["sysparm_query"], "sys_idINopt0,opt1,opt2")
+        self.assertIn("item_option_new.question_text", option_params["sysparm_fields"])
+
+    def test_requested_fields(self):
+        """Requested fields replace the question and value of each variable."""
+        instance = FakeInstance(2)
+        params = GetRITMVariablesParams(ritm_sys_id="ritm1", fields=["value", "sys_id"])
+        with patch("requests.get", side_effect=instance.get) as mock_get:
+            result = get_ritm_variables(self.config, self.auth_manager, params)
+
+        self.assertEqual(
+            result["variables"],
+            [{"value": f"value {i}", "sys_id": f"opt{i}"} for i in range(2)],
+        )
+        option_params = mock_get.call_args_list[1].kwargs["params"]
+        self.assertEqual(option_params["sysparm_fields"], "sys_id,item_option_new,value")
+
+    def test_round_trips_do_not_grow_with_variable_count(self):
+        """Benchmark fixture: round trips are constant per chunk of variables."""
+        for variable_count in (1, 40, SYS_ID_IN_CHUNK_SIZE, 250):
+            instance = FakeInstance(variable_count)
+            with patch("requests.get", side_effect=instance.get):
+                result = get_ritm_variables(self.config, self.auth_manager, self.params)
+
+            self.assertEqual(len(result["variables"]), variable_count)
+            expected = 1 + math.ceil(variable_count / SYS_ID_IN_CHUNK_SIZE)
+            self.assertEqual(instance.round_trips, expected, f"{variable_count} variables")
+
+    @patch("requests.get")
+    def test_option_query_error(self, mock_get):
+        """A failed option query is reported instead of returning partial variables."""
+        instance = FakeInstance(2)
+        mock_get.side_effect = [
+            instance.get(f"{self.config.api_url}/table/sc_item_option_mtom", {"sysparm_query": ""}),
+            requests.RequestException("boom"),
+        ]
+
+        result = get_ritm_variables(self.config, self.auth_manager, self.params)
+
+        self.assertFalse(result["success"])
+        self.assertIn("boom", result["message"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,7 +24,13 @@ from servicenow_mcp.tools.workflow_tools import (
     delete_workflow_activity,
     reorder_workflow_activities,
 )
-from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
+from servicenow_mcp.utils.config import (
+    AuthConfig,
+    AuthType,
+    BasicAuthConfig,
+    BatchConfig,
+    ServerConfig,
+)
 
 
 class TestWorkflowTools(unittest.TestCase):
@@ -501,9 +507,12 @@ class TestWorkflowTools(unittest.TestCase):
 
     @patch("servicenow_mcp.tools.workflow_tools.requests.patch")
     def test_reorder_workflow_activities_success(self, mock_patch):
-        """Test reordering workflow activities successfully."""
+        """Test reordering workflow activities successfully without the Batch API."""
+        self.server_config.batch = BatchConfig(enabled=False, max_parallel=1)
+
         # Mock the response
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.json.return_value = {"result": {}}
         mock_response.raise_for_status = MagicMock()
         mock_patch.return_value = mock_response
@@ -3,8 +3,8 @@ from unittest.mock import MagicMock, patch
 
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.utils.config import ServerConfig
+from servicenow_mcp.utils.http_client import order_auth_and_config
 from servicenow_mcp.tools.workflow_tools import (
-    _get_auth_and_config,
     list_workflows,
     get_workflow_details,
     create_workflow,
@@ -23,20 +23,20 @@ class TestWorkflowToolsParams(unittest.TestCase):
         self.server_config = MagicMock(spec=ServerConfig)
         self.server_config.instance_url = "https://test-instance.service-now.com"
 
-    def test_get_auth_and_config_correct_order(self):
-        """Test _get_auth_and_config with parameters in the correct order."""
-        auth, config = _get_auth_and_config(self.auth_manager, self.server_config)
+    def test_order_auth_and_config_correct_order(self):
+        """Test order_auth_and_config with parameters in the correct order."""
+        auth, config = order_auth_and_config(self.auth_manager, self.server_config, strict=True)
         self.assertEqual(auth, self.auth_manager)
         self.assertEqual(config, self.server_config)
 
-    def test_get_auth_and_config_swapped_order(self):
-        """Test _get_auth_and_config with parameters in the swapped order."""
-        auth, config = _get_auth_and_config(self.server_config, self.auth_manager)
+    def test_order_auth_and_config_swapped_order(self):
+        """Test order_auth_and_config with parameters in the swapped order."""
+        auth, config = order_auth_and_config(self.server_config, self.auth_manager, strict=True)
         self.assertEqual(auth, self.auth_manager)
         self.assertEqual(config, self.server_config)
 
-    def test_get_auth_and_config_error_handling(self):
-        """Test _get_auth_and_config error handling with invalid parameters."""
+    def test_order_auth_and_config_error_handling(self):
+        """Test order_auth_and_config error handling with invalid parameters."""
         # Create objects that don't have the required attributes
         invalid_obj1 = MagicMock()
         # Explicitly remove attributes to ensure they don't exist
@@ -49,7 +49,7 @@ class TestWorkflowToolsParams(unittest.TestCase):
         del invalid_obj2.instance_url
         
         with self.assertRaises(ValueError):
-            _get_auth_and_config(invalid_obj1, invalid_obj2)
+            order_auth_and_config(invalid_obj1, invalid_obj2, strict=True)
 
     @patch('servicenow_mcp.tools.workflow_tools.requests.get')
     def test_list_workflows_correct_params(self, mock_get):